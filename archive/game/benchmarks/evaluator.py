@@ -0,0 +1,231 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management, random, time and data import:
+import argparse
+import json
+import random
+import time
+
+# NumPy import (evaluator requires it):
+import numpy
+
+# Collections import:
+from game.collections.state import Game_State, STATE_TYPE_COUNT
+from game.collections.evaluator import (
+    State_Evaluator,
+    Evaluator_Batch,
+    EVALUATOR_WEIGHT_LIST,
+    )
+
+# Variables import:
+from game.variables import CARD_ID_NOT_SET
+
+# Settings import:
+from game.settings import EVALUATOR_LOW_TYPE_THRESHOLD
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+POSITION EVALUATOR BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_POSITION_COUNT: int = 10_000
+BENCHMARK_SEED_DEFAULT: int = 0
+BENCHMARK_DECK_LOWEST_VALUE: int = 6
+BENCHMARK_MOVE_LIMIT: int = 2000
+BENCHMARK_BATCH_SIZE_LIST: tuple[int, ...] = (1, 32, 1024, 100_000)
+BENCHMARK_MEASURE_TIME: float = 0.5             # <- Seconds spent per batch size
+
+
+def collect_positions(position_count: int, random_seed: int) -> list[tuple[Game_State, int]]:
+    """
+    Plays random games and keeps every position, with a random evaluated player.
+
+    :param int position_count: ...
+    :param int random_seed: ...
+
+    :return list[tuple[Game_State, int]]: (state, evaluated player index) pairs.
+    """
+
+    # Playing games:
+    position_list: list[tuple[Game_State, int]] = []
+    game_seed: int = random_seed
+    while len(position_list) < position_count:
+        game_state: Game_State = Game_State.create_new(
+            deck_lowest_value = BENCHMARK_DECK_LOWEST_VALUE,
+            random_seed = game_seed,
+            )
+        game_random: random.Random = random.Random(game_seed)
+        game_seed += 1
+        for _ in range(BENCHMARK_MOVE_LIMIT):
+            if game_state.state_terminal or len(position_list) >= position_count:
+                break
+            position_list.append((game_state, game_random.randrange(2)))
+            game_state: Game_State = game_state.apply_move(
+                game_random.choice(game_state.legal_move_list())
+                )
+
+    # Returning:
+    return position_list
+
+
+def evaluate_reference(game_state: Game_State, player_index: int) -> float:
+    """
+    Same score as State_Evaluator, card by card in plain Python, reference for verifying.
+
+    :param Game_State game_state: ...
+    :param int player_index: ...
+
+    :return float: ...
+    """
+
+    # Collecting hand cards:
+    hand_id_list: list[int] = Game_State.iterate_mask(game_state.hand_mask_list[player_index])
+    trump_type_list: list[int] = [
+        card_id % STATE_TYPE_COUNT for card_id in hand_id_list
+        if card_id // STATE_TYPE_COUNT == game_state.deck_trump_index
+        ]
+    role: int = int(game_state.player_attacking == player_index)
+    endgame: bool = game_state.deck_count == 0
+
+    # Calculating features:
+    feature_list: list[float] = [
+        0 if endgame else len(hand_id_list),
+        len(hand_id_list) if endgame else 0,
+        game_state.hand_count(1 - player_index),
+        len(trump_type_list),
+        sum(trump_type_list),
+        sum(
+            max(EVALUATOR_LOW_TYPE_THRESHOLD - card_id % STATE_TYPE_COUNT, 0) for card_id in hand_id_list
+            if card_id // STATE_TYPE_COUNT != game_state.deck_trump_index
+            ),
+        len({card_id // STATE_TYPE_COUNT for card_id in hand_id_list}),
+        sum(
+            card_id != CARD_ID_NOT_SET for table_pair in game_state.table_list for card_id in table_pair
+            ) * (1 - role),
+        role,
+        ]
+
+    # Returning:
+    return sum(feature * weight for feature, weight in zip(feature_list, EVALUATOR_WEIGHT_LIST))
+
+
+def verify_evaluator(position_list: list[tuple[Game_State, int]]) -> int:
+    """
+    Compares batch scores with the plain Python reference.
+
+    :param list[tuple[Game_State, int]] position_list: ...
+
+    :raise AssertionError: on the first difference.
+
+    :return int: Positions verified.
+    """
+
+    # Evaluating:
+    state_evaluator: State_Evaluator = State_Evaluator()
+    score_array: Any = state_evaluator.evaluate_batch(
+        evaluator_batch = state_evaluator.encode_states(
+            game_state_list = [game_state for game_state, _ in position_list],
+            player_index = [player_index for _, player_index in position_list],
+            )
+        )
+
+    # Verifying:
+    for (game_state, player_index), batch_score in zip(position_list, score_array):
+        reference_score: float = evaluate_reference(game_state, player_index)
+        assert abs(batch_score - reference_score) < 1e-3, f"Score differs from reference ({game_state=})."
+
+    # Returning:
+    return len(position_list)
+
+
+def measure_throughput(evaluator_batch: Evaluator_Batch, batch_size: int) -> float:
+    """
+    Measures positions evaluated per second in batches of batch size (positions are repeated, if
+    batch is smaller than batch size).
+
+    :param Evaluator_Batch evaluator_batch: ...
+    :param int batch_size: ...
+
+    :return float: ...
+    """
+
+    # Resizing batch:
+    position_index_array: Any = numpy.arange(batch_size) % evaluator_batch.batch_size
+    evaluator_batch: Evaluator_Batch = Evaluator_Batch(
+        hand_mask = evaluator_batch.hand_mask[position_index_array],
+        opponent_mask = evaluator_batch.opponent_mask[position_index_array],
+        table_mask = evaluator_batch.table_mask[position_index_array],
+        trump_index = evaluator_batch.trump_index[position_index_array],
+        deck_count = evaluator_batch.deck_count[position_index_array],
+        role = evaluator_batch.role[position_index_array],
+        )
+
+    # Evaluating until measure time is spent:
+    state_evaluator: State_Evaluator = State_Evaluator()
+    position_count: int = 0
+    time_start: float = time.perf_counter()
+    while time.perf_counter() - time_start < BENCHMARK_MEASURE_TIME:
+        state_evaluator.evaluate_batch(evaluator_batch)
+        position_count += batch_size
+
+    # Returning:
+    return round(position_count / (time.perf_counter() - time_start))
+
+
+def run_benchmark() -> None:
+    """
+    Verifies batch scores against a plain Python reference on random positions, then measures
+    positions per second of encoding, the reference and batch evaluation by batch size.
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Position evaluator benchmark, random positions."
+        )
+    argument_parser.add_argument("--positions", type = int, default = BENCHMARK_POSITION_COUNT)
+    argument_parser.add_argument("--seed", type = int, default = BENCHMARK_SEED_DEFAULT)
+    argument_namespace: argparse.Namespace = argument_parser.parse_args()
+
+    # Verifying (raises on the first difference):
+    position_list: list[tuple[Game_State, int]] = collect_positions(
+        position_count = argument_namespace.positions,
+        random_seed = argument_namespace.seed,
+        )
+    verified_count: int = verify_evaluator(position_list)
+    print(f"verified {verified_count} positions, batch scores match reference")
+
+    # Measuring encoding and reference:
+    time_start: float = time.perf_counter()
+    evaluator_batch: Evaluator_Batch = State_Evaluator.encode_states(
+        game_state_list = [game_state for game_state, _ in position_list],
+        player_index = [player_index for _, player_index in position_list],
+        )
+    encode_time: float = time.perf_counter() - time_start
+    time_start: float = time.perf_counter()
+    for game_state, player_index in position_list:
+        evaluate_reference(game_state, player_index)
+    reference_time: float = time.perf_counter() - time_start
+
+    # Measuring batches:
+    benchmark_result: dict[str, int] = {
+        "encode": round(len(position_list) / encode_time),
+        "reference": round(len(position_list) / reference_time),
+        }
+    for batch_size in BENCHMARK_BATCH_SIZE_LIST:
+        benchmark_result[f"batch {batch_size}"] = measure_throughput(evaluator_batch, batch_size)
+
+    # Printing:
+    print(f"{'evaluator':<14}{'positions/s':>14}")
+    for result_label, result_value in benchmark_result.items():
+        print(f"{result_label:<14}{result_value:>14}")
+    print(json.dumps(benchmark_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
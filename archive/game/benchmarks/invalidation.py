@@ -0,0 +1,198 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any, Callable
+
+# System management, time and data import:
+import json
+import time
+
+# Controllers import:
+from game.controllers import card as card_module
+from game.controllers.card import Card_Object
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CACHE INVALIDATION BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_REPEAT: int = 5
+BENCHMARK_MOVE_COUNT: int = 10_000
+
+# Alternating move targets (default, slide), so every move changes every field:
+BENCHMARK_TARGET_LIST: tuple[tuple[tuple[int, int], tuple[int, int]], ...] = (
+    ((100, 100), (110, 120)),
+    ((200, 300), (210, 320)),
+    )
+
+
+def move_card_legacy(card_object: Card_Object,
+                     coordinates_default: tuple[int, int],
+                     coordinates_slide: tuple[int, int],
+                     reset_state: bool
+                     ) -> None:
+    """
+    Previous move sequence, kept for comparison: one setter per field, each clearing its own
+    cached properties (table add card, or hand position update without state reset).
+
+    :param Card_Object card_object: ...
+    :param tuple[int, int] coordinates_default: ...
+    :param tuple[int, int] coordinates_slide: ...
+    :param bool reset_state: ...
+    """
+
+    # Moving:
+    card_object.set_coordinates_default(set_container = coordinates_default, ignore_assertion = True)
+    card_object.set_coordinates_slide(set_container = coordinates_slide, ignore_assertion = True)
+    card_object.set_coordinates_current(set_container = coordinates_default, ignore_assertion = True)
+    card_object.reset_boundary()
+    if reset_state:
+        card_object.reset_state()
+
+
+def move_card_update(card_object: Card_Object,
+                     coordinates_default: tuple[int, int],
+                     coordinates_slide: tuple[int, int],
+                     reset_state: bool
+                     ) -> None:
+    """
+    Bulk update move, same fields, cached properties are cleared once.
+
+    :param Card_Object card_object: ...
+    :param tuple[int, int] coordinates_default: ...
+    :param tuple[int, int] coordinates_slide: ...
+    :param bool reset_state: ...
+    """
+
+    # Moving:
+    card_object.update(
+        coordinates_default = coordinates_default,
+        coordinates_slide = coordinates_slide,
+        coordinates_current = coordinates_default,
+        reset_boundary = True,
+        reset_state = reset_state,
+        ignore_assertion = True,
+        )
+
+
+def warm_card_cache(card_object: Card_Object) -> None:
+    """
+    Reads the cached properties a frame would read, so every move has something to invalidate.
+
+    :param Card_Object card_object: ...
+    """
+
+    # Reading:
+    card_object.state_arrived
+    card_object.state_selected
+    card_object.coordinate_x_default
+    card_object.coordinate_x_slide
+    card_object.coordinate_x_current
+    card_object.boundary_x_range
+    card_object.boundary_y_range
+
+
+def count_move_clears(move_function: Callable[..., None], reset_state: bool) -> dict[str, float]:
+    """
+    Counts cache clear calls (invalidation passes) and cleared property names per move, by
+    wrapping the card module's cache helpers.
+
+    :param Callable move_function: ...
+    :param bool reset_state: ...
+
+    :return dict[str, float]: ...
+    """
+
+    # Wrapping cache helpers:
+    clear_count: dict[str, int] = {"calls": 0, "names": 0}
+    clear_property: Callable = card_module.clear_cached_property
+    clear_property_list: Callable = card_module.clear_cached_property_list
+
+    def clear_property_counted(target_object: Any, target_attribute: str) -> None:
+        clear_count["calls"] += 1
+        clear_count["names"] += 1
+        clear_property(target_object = target_object, target_attribute = target_attribute)
+
+    def clear_property_list_counted(target_object: Any, target_attribute_list: tuple[str, ...]) -> None:
+        clear_count["calls"] += 1
+        clear_count["names"] += len(target_attribute_list)
+        clear_property_list(target_object = target_object, target_attribute_list = target_attribute_list)
+
+    # Moving:
+    card_object: Card_Object = Card_Object()
+    move_count: int = 100
+    card_module.clear_cached_property = clear_property_counted
+    card_module.clear_cached_property_list = clear_property_list_counted
+    try:
+        for move_index in range(move_count):
+            coordinates_default, coordinates_slide = BENCHMARK_TARGET_LIST[move_index % 2]
+            warm_card_cache(card_object)
+            move_function(card_object, coordinates_default, coordinates_slide, reset_state)
+    finally:
+        card_module.clear_cached_property = clear_property
+        card_module.clear_cached_property_list = clear_property_list
+
+    # Packing up:
+    benchmark_result: dict[str, float] = {
+        "clear_calls_per_move": clear_count["calls"] / move_count,
+        "cleared_names_per_move": clear_count["names"] / move_count,
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def measure_move_time(move_function: Callable[..., None], reset_state: bool) -> float:
+    """
+    Measures move time (microseconds per move, cache warmed before every move, best of repeats).
+
+    :param Callable move_function: ...
+    :param bool reset_state: ...
+
+    :return float: ...
+    """
+
+    # Measuring:
+    card_object: Card_Object = Card_Object()
+    move_time: float = float("inf")
+    for _ in range(BENCHMARK_REPEAT):
+        time_start: float = time.perf_counter()
+        for move_index in range(BENCHMARK_MOVE_COUNT):
+            coordinates_default, coordinates_slide = BENCHMARK_TARGET_LIST[move_index % 2]
+            warm_card_cache(card_object)
+            move_function(card_object, coordinates_default, coordinates_slide, reset_state)
+        move_time: float = min(move_time, time.perf_counter() - time_start)
+
+    # Returning:
+    return round(move_time / BENCHMARK_MOVE_COUNT * 1_000_000, 2)
+
+
+def run_benchmark() -> None:
+    """
+    Compares per-setter invalidation with bulk update for a table move (coordinates, boundary and
+    state reset) and a hand move (coordinates and boundary), and prints clears and time per move.
+    """
+
+    # Measuring:
+    benchmark_result: dict[str, Any] = {}
+    for move_label, reset_state in (("table", True), ("hand", False)):
+        for path_label, move_function in (("legacy", move_card_legacy), ("update", move_card_update)):
+            path_result: dict[str, float] = count_move_clears(move_function, reset_state)
+            path_result["us_per_move"] = measure_move_time(move_function, reset_state)
+            benchmark_result[f"{move_label}_{path_label}"] = path_result
+
+    # Printing:
+    print(f"{'move':<16}{'clear calls':>14}{'cleared names':>16}{'us/move':>10}")
+    for result_label, path_result in benchmark_result.items():
+        print(
+            f"{result_label:<16}{path_result['clear_calls_per_move']:>14.1f}"
+            f"{path_result['cleared_names_per_move']:>16.1f}{path_result['us_per_move']:>10.2f}"
+            )
+    print(json.dumps(benchmark_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
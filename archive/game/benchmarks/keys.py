@@ -0,0 +1,240 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management, time and data import:
+import argparse
+import json
+import random
+import time
+
+# Arcade library import:
+import arcade
+
+# Controllers import:
+from game.controllers.game import Game_Controller
+
+# Collections import:
+from game.collections.keyboard import Keyboard_Mapping
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+KEY STORM BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_REPEAT: int = 5
+BENCHMARK_EVENT_COUNT: int = 5_000
+BENCHMARK_SEED_DEFAULT: int = 0
+
+# Commands left out of the storm (they leave the round, or write files):
+BENCHMARK_COMMAND_EXCLUDED: tuple[str, ...] = (
+    "KEY_DEBUG_RESTART_GAME",
+    "KEY_DEBUG_TOGGLE_PROFILER",
+    )
+
+# Share of storm events that are unbound keys, held modifiers and key repeats:
+BENCHMARK_UNBOUND_RATE: float = 0.20
+BENCHMARK_MODIFIER_RATE: float = 0.10
+BENCHMARK_REPEAT_RATE: float = 0.20
+
+
+def create_storm(event_count: int, random_seed: int) -> list[list[int]]:
+    """
+    Generates a key storm: a seeded list of [key, modifiers, repeat] events, mixing user and debug
+    commands with unbound keys, held modifiers and repeats. Same seed, same storm.
+
+    :param int event_count: ...
+    :param int random_seed: ...
+
+    :return list[list[int]]: ...
+    """
+
+    # Preparing keys:
+    keyboard: Keyboard_Mapping = Keyboard_Mapping()
+    key_bound_list: list[int] = [
+        getattr(keyboard, key_command) for key_command in keyboard.key_command_list
+        if key_command not in BENCHMARK_COMMAND_EXCLUDED
+        ]
+    key_unbound_list: list[int] = [
+        key_pressed for key_pressed in range(arcade.key.A, arcade.key.Z + 1)
+        if key_pressed not in keyboard.key_list
+        ]
+
+    # Generating events:
+    storm_random: random.Random = random.Random(random_seed)
+    storm_event_list: list[list[int]] = []
+    for _ in range(event_count):
+        if storm_random.random() < BENCHMARK_UNBOUND_RATE:
+            key_pressed: int = storm_random.choice(key_unbound_list)
+        else:
+            key_pressed: int = storm_random.choice(key_bound_list)
+        key_modifiers: int = arcade.key.MOD_SHIFT if storm_random.random() < BENCHMARK_MODIFIER_RATE else 0
+        key_repeat: int = int(storm_random.random() < BENCHMARK_REPEAT_RATE)
+        storm_event_list.append([key_pressed, key_modifiers, key_repeat])
+
+    # Returning:
+    return storm_event_list
+
+
+def find_key_group_legacy(keyboard: Keyboard_Mapping, key_pressed: int) -> str | None:
+    """
+    Previous key resolution, kept for comparison: key list and debug list membership (shell), then
+    the chain of group membership tests (game controller).
+
+    :param Keyboard_Mapping keyboard: ...
+    :param int key_pressed: ...
+
+    :return str | None: ...
+    """
+
+    # Resolving:
+    key_group: str | None = None
+    if key_pressed in keyboard.key_list:
+        if key_pressed in keyboard.key_debug_list:
+            if key_pressed in keyboard.key_debug_texture_list:
+                key_group: str = "texture"
+            elif key_pressed in keyboard.key_debug_sort_list:
+                key_group: str = "sort"
+            elif key_pressed in keyboard.key_debug_draw_list:
+                key_group: str = "draw"
+            elif key_pressed in keyboard.key_debug_sweep_list:
+                key_group: str = "sweep"
+            elif key_pressed == keyboard.KEY_DEBUG_RESTART_GAME:
+                key_group: str = "restart"
+            elif key_pressed == keyboard.KEY_DEBUG_TOGGLE_PROFILER:
+                key_group: str = "profiler"
+        elif key_pressed in keyboard.key_user_list:
+            if key_pressed == keyboard.KEY_SORT:
+                key_group: str = "sort"
+
+    # Returning:
+    return key_group
+
+
+def measure_resolve(storm_event_list: list[list[int]]) -> dict[str, float]:
+    """
+    Measures key resolution only (events per second, best of repeats): legacy membership chain
+    against the dispatch map. Handlers are not called.
+
+    :param list[list[int]] storm_event_list: ...
+
+    :return dict[str, float]: ...
+    """
+
+    # Preparing game controller (dispatch map is built on first lookup):
+    game_controller: Game_Controller = Game_Controller()
+    keyboard: Keyboard_Mapping = game_controller.keyboard
+    game_controller.find_key_handler(arcade.key.A)
+
+    # Measuring legacy resolution:
+    legacy_time: float = float("inf")
+    for _ in range(BENCHMARK_REPEAT):
+        time_start: float = time.perf_counter()
+        for key_pressed, key_modifiers, key_repeat in storm_event_list:
+            find_key_group_legacy(keyboard, key_pressed)
+        legacy_time: float = min(legacy_time, time.perf_counter() - time_start)
+
+    # Measuring dispatch resolution:
+    dispatch_time: float = float("inf")
+    for _ in range(BENCHMARK_REPEAT):
+        time_start: float = time.perf_counter()
+        for key_pressed, key_modifiers, key_repeat in storm_event_list:
+            game_controller.find_key_handler(key_pressed, key_modifiers, key_repeat)
+        dispatch_time: float = min(dispatch_time, time.perf_counter() - time_start)
+
+    # Packing up:
+    event_count: int = len(storm_event_list)
+    benchmark_result: dict[str, float] = {
+        "legacy_events_per_second": round(event_count / legacy_time),
+        "dispatch_events_per_second": round(event_count / dispatch_time),
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def measure_replay(storm_event_list: list[list[int]]) -> dict[str, Any]:
+    """
+    Replays the storm through the game controller (handlers are called, no window needed).
+
+    :param list[list[int]] storm_event_list: ...
+
+    :return dict[str, Any]: ...
+    """
+
+    # Preparing game:
+    game_controller: Game_Controller = Game_Controller()
+    game_controller.create_game_default()
+
+    # Replaying:
+    command_count: int = 0
+    time_start: float = time.perf_counter()
+    for key_pressed, key_modifiers, key_repeat in storm_event_list:
+        command_count += game_controller.handle_key_pressed(
+            key_pressed = key_pressed,
+            key_modifiers = key_modifiers,
+            key_repeat = bool(key_repeat),
+            )
+    replay_time: float = time.perf_counter() - time_start
+
+    # Packing up:
+    benchmark_result: dict[str, Any] = {
+        "event_count": len(storm_event_list),
+        "command_count": command_count,
+        "replay_seconds": round(replay_time, 4),
+        "replay_events_per_second": round(len(storm_event_list) / replay_time),
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def run_benchmark() -> None:
+    """
+    Generates (or loads) a key storm, optionally saves it for replay, and prints resolution and
+    replay results.
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Key storm benchmark, key resolution and command replay."
+        )
+    argument_parser.add_argument("--events", type = int, default = BENCHMARK_EVENT_COUNT)
+    argument_parser.add_argument("--seed", type = int, default = BENCHMARK_SEED_DEFAULT)
+    argument_parser.add_argument("--record", type = str, default = None, help = "Save storm to JSON file.")
+    argument_parser.add_argument("--replay", type = str, default = None, help = "Load storm from JSON file.")
+    argument_namespace: argparse.Namespace = argument_parser.parse_args()
+
+    # Loading or generating storm:
+    if argument_namespace.replay is not None:
+        with open(argument_namespace.replay, "r", encoding = "utf-8") as storm_file:
+            storm_event_list: list[list[int]] = json.load(storm_file)
+    else:
+        storm_event_list: list[list[int]] = create_storm(
+            event_count = argument_namespace.events,
+            random_seed = argument_namespace.seed,
+            )
+    if argument_namespace.record is not None:
+        with open(argument_namespace.record, "w", encoding = "utf-8") as storm_file:
+            json.dump(storm_event_list, storm_file)
+
+    # Measuring:
+    resolve_result: dict[str, float] = measure_resolve(storm_event_list)
+    replay_result: dict[str, Any] = measure_replay(storm_event_list)
+
+    # Printing:
+    print(f"{'resolution':<28}{'events/s':>16}")
+    print(f"{'legacy membership chain':<28}{resolve_result['legacy_events_per_second']:>16,.0f}")
+    print(f"{'dispatch map':<28}{resolve_result['dispatch_events_per_second']:>16,.0f}")
+    print(
+        f"speedup {resolve_result['dispatch_events_per_second'] / resolve_result['legacy_events_per_second']:.1f}x"
+        )
+    print(json.dumps(replay_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,172 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any, Callable
+
+# System management, time and data import:
+import argparse
+import json
+import random
+import time
+
+# Controllers import:
+from game.controllers import game as game_module
+from game.controllers.hand import Hand_Controller
+
+# Server import (headless matches):
+from game.server import Match_Controller
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PLAYABLE STATE BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_MATCH_COUNT: int = 50
+BENCHMARK_SEED_DEFAULT: int = 0
+BENCHMARK_ACTION_LIMIT: int = 500               # <- Actions per match before it is left unfinished
+
+
+def play_match(random_seed: int, verify_enabled: bool) -> dict[str, int]:
+    """
+    Plays a headless match with random legal actions (same seed, same match).
+
+    :param int random_seed: ...
+    :param bool verify_enabled: Compares tracked playable state with a full scan after every task.
+
+    :return dict[str, int]: Actions applied and cards checked by the tracker.
+
+    :raise AssertionError: If verifying and tracked state differs from a full scan.
+    """
+
+    # Creating match:
+    random.seed(random_seed)
+    match_controller: Match_Controller = Match_Controller(match_id = random_seed)
+    match_controller.game.playable.set_verify_enabled(verify_enabled)
+    match_random: random.Random = random.Random(random_seed)
+
+    # Playing:
+    action_count: int = 0
+    while not match_controller.match_finished and action_count < BENCHMARK_ACTION_LIMIT:
+        player_seat: int = 0 if match_controller.game.player_one.state_active else 1
+        legal_action_list: list[dict[str, Any]] = match_controller.legal_action_list(
+            player_seat = player_seat
+            )
+        if not legal_action_list:
+            break
+        match_controller.apply_action(
+            player_seat = player_seat,
+            action_request = match_random.choice(legal_action_list),
+            )
+        action_count += 1
+
+    # Packing up:
+    match_result: dict[str, int] = {
+        "action_count": action_count,
+        "check_count": match_controller.game.playable.check_count,
+        }
+
+    # Returning:
+    return match_result
+
+
+def measure_matches(match_count: int,
+                    random_seed: int,
+                    tracker_enabled: bool,
+                    verify_enabled: bool = False
+                    ) -> dict[str, float]:
+    """
+    Plays matches with the playable tracker, or with full hand scans after every task (as before),
+    and counts cards checked per action. Full scans are counted by wrapping
+    Hand_Controller.update_hand_state.
+
+    :param int match_count: ...
+    :param int random_seed: ...
+    :param bool tracker_enabled: ...
+    :param bool verify_enabled: ...
+
+    :return dict[str, float]: ...
+    """
+
+    # Wrapping full scan:
+    scan_count: dict[str, int] = {"cards": 0}
+    update_hand_state: Callable = Hand_Controller.update_hand_state
+
+    def update_hand_state_counted(hand_controller: Hand_Controller, **kwargs: Any) -> None:
+        scan_count["cards"] += hand_controller.hand_count
+        update_hand_state(hand_controller, **kwargs)
+
+    # Playing:
+    tracker_enabled_previous: bool = game_module.PLAYABLE_TRACKER_ENABLE
+    game_module.PLAYABLE_TRACKER_ENABLE = tracker_enabled
+    Hand_Controller.update_hand_state = update_hand_state_counted
+    try:
+        action_count: int = 0
+        check_count: int = 0
+        time_start: float = time.perf_counter()
+        for match_index in range(match_count):
+            match_result: dict[str, int] = play_match(
+                random_seed = random_seed + match_index,
+                verify_enabled = verify_enabled,
+                )
+            action_count += match_result["action_count"]
+            check_count += match_result["check_count"]
+        match_time: float = time.perf_counter() - time_start
+    finally:
+        game_module.PLAYABLE_TRACKER_ENABLE = tracker_enabled_previous
+        Hand_Controller.update_hand_state = update_hand_state
+
+    # Packing up:
+    benchmark_result: dict[str, float] = {
+        "action_count": action_count,
+        "checked_cards_per_action": round((scan_count["cards"] + check_count) / max(action_count, 1), 2),
+        "ms_per_action": round(match_time / max(action_count, 1) * 1000, 4),
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def run_benchmark() -> None:
+    """
+    Verifies tracked playable state against full scans on random matches, then compares cards
+    checked and time per action with full hand scans.
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Playable state tracker benchmark, random headless matches."
+        )
+    argument_parser.add_argument("--matches", type = int, default = BENCHMARK_MATCH_COUNT)
+    argument_parser.add_argument("--seed", type = int, default = BENCHMARK_SEED_DEFAULT)
+    argument_namespace: argparse.Namespace = argument_parser.parse_args()
+
+    # Verifying (raises on the first difference):
+    verify_result: dict[str, float] = measure_matches(
+        match_count = argument_namespace.matches,
+        random_seed = argument_namespace.seed,
+        tracker_enabled = True,
+        verify_enabled = True,
+        )
+    print(f"verified {verify_result['action_count']} actions, tracked state matches full scans")
+
+    # Measuring:
+    benchmark_result: dict[str, Any] = {}
+    for result_label, tracker_enabled in (("full scan", False), ("tracker", True)):
+        benchmark_result[result_label] = measure_matches(
+            match_count = argument_namespace.matches,
+            random_seed = argument_namespace.seed,
+            tracker_enabled = tracker_enabled,
+            )
+
+    # Printing:
+    print(f"{'playable state':<16}{'checked cards/action':>22}{'ms/action':>12}")
+    for result_label, match_result in benchmark_result.items():
+        print(f"{result_label:<16}{match_result['checked_cards_per_action']:>22.2f}{match_result['ms_per_action']:>12.4f}")
+    print(json.dumps(benchmark_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,379 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management, time and data import:
+import argparse
+import json
+import os
+import random
+import time
+
+# Controllers import:
+from game.controllers.card import Card_Object
+from game.controllers.game import Game_Controller
+from game.controllers.player import Player_Controller
+
+# Settings import:
+from game.settings import (
+    HAND_CARD_COUNT_DEFAULT,
+    TABLE_STACK_BOTTOM_INDEX,
+    TABLE_STACK_TOP_INDEX,
+    HAND_PLAYER_TWO_COORDINATE_Y,
+    GAME_WINDOW_WIDTH,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SCALING BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_PLAYER_COUNT_LIST: tuple[int, ...] = (2, 4, 6)
+BENCHMARK_DECK_LIST: tuple[tuple[str, int, int], ...] = (   # <- Label, copy count, lowest value
+    ("36", 1, 6),
+    ("52", 1, 2),
+    ("104", 2, 2),
+    )
+BENCHMARK_MATCH_COUNT: int = 10
+BENCHMARK_SEED_DEFAULT: int = 0
+BENCHMARK_ACTION_LIMIT: int = 1000              # <- Actions per match before it is left unfinished
+BENCHMARK_FRAME_COUNT: int = 60
+BENCHMARK_FRAME_REPEAT: int = 3                 # <- Best of, first pass uploads new glyphs and textures
+
+
+def create_game(player_count: int, deck_copy_count: int, deck_lowest_value: int) -> Game_Controller:
+    """
+    Creates a headless game controller with a custom game of player count and deck.
+
+    :param int player_count: ...
+    :param int deck_copy_count: ...
+    :param int deck_lowest_value: ...
+
+    :return Game_Controller: ...
+    """
+
+    # Creating game:
+    game_controller: Game_Controller = Game_Controller()
+    game_controller.create_session()
+    configure_game(game_controller, player_count, deck_copy_count, deck_lowest_value)
+
+    # Returning:
+    return game_controller
+
+
+def configure_game(game_controller: Game_Controller,
+                   player_count: int,
+                   deck_copy_count: int,
+                   deck_lowest_value: int
+                   ) -> None:
+    """
+    Sets player count and deck of the session and creates a new custom game.
+
+    :param Game_Controller game_controller: ...
+    :param int player_count: ...
+    :param int deck_copy_count: ...
+    :param int deck_lowest_value: ...
+    """
+
+    # Creating game:
+    game_controller.session.player_count = player_count
+    game_controller.session.deck_copy_count = deck_copy_count
+    game_controller.session.deck_lowest_value = deck_lowest_value
+    game_controller.create_game_custom()
+
+
+def fill_hands(game_controller: Game_Controller) -> None:
+    """
+    Fills hands after a round, attackers first (in seat order from the attacker), defender last.
+
+    :param Game_Controller game_controller: ...
+    """
+
+    # Ordering players:
+    player_list: tuple[Player_Controller, ...] = game_controller.player_list
+    player_index_first: int = player_list.index(game_controller.player_attacking)
+    player_fill_list: list[Player_Controller] = [
+        player_list[(player_index_first + player_step) % len(player_list)]
+        for player_step in range(len(player_list))
+        if player_list[(player_index_first + player_step) % len(player_list)] is not game_controller.player_defending
+        ]
+    player_fill_list.append(game_controller.player_defending)
+
+    # Filling:
+    for player_controller in player_fill_list:
+        if player_controller.hand.hand_count < HAND_CARD_COUNT_DEFAULT:
+            game_controller.task_fill_hand(
+                player_controller = player_controller
+                )
+            game_controller.task_update_hand(
+                player_controller = player_controller,
+                update_position = True,
+                update_state = False,
+                )
+
+
+def apply_random_action(game_controller: Game_Controller, match_random: random.Random) -> bool:
+    """
+    Applies a random legal action of the active player: attacker plays a card or ends the round
+    (cards are discarded, defender's left neighbour attacks next), defender beats a card or takes
+    (defender is skipped, the next player attacks).
+
+    :param Game_Controller game_controller: ...
+    :param random.Random match_random: ...
+
+    :return bool: False, if the match is finished (fewer than two players have cards).
+    """
+
+    # Checking players still in game:
+    player_in_game_count: int = sum(
+        1 for player_controller in game_controller.player_list
+        if player_controller.hand.hand_count > 0
+        )
+    if player_in_game_count < 2 and game_controller.deck.deck_count == 0:
+        return False
+
+    # Collecting table state:
+    player_active: Player_Controller = game_controller.player_active
+    player_defending: Player_Controller = game_controller.player_defending
+    table_map: dict[int, list[Card_Object | None]] = game_controller.table.table_map
+    table_undefended_list: list[int] = [
+        position_index for position_index in table_map
+        if table_map[position_index][TABLE_STACK_BOTTOM_INDEX] is not None
+        and table_map[position_index][TABLE_STACK_TOP_INDEX] is None
+        ]
+    hand_playable: list[Card_Object] = player_active.hand.hand_playable
+
+    # Attacking (or ending the round):
+    if player_active is not player_defending:
+        position_index: int | None = game_controller.table.find_empty_position()
+        if (
+            hand_playable and
+            position_index is not None and
+            len(table_undefended_list) < player_defending.hand.hand_count
+            ):
+            game_controller.task_play_card(
+                card_object = match_random.choice(hand_playable),
+                player_controller = player_active,
+                position_index = position_index,
+                stack_index = TABLE_STACK_BOTTOM_INDEX,
+                )
+            game_controller.switch_players_active()
+        else:
+            if table_undefended_list:
+                game_controller.switch_players_active()
+                return True
+            game_controller.task_sweep_cards_discard()
+            fill_hands(game_controller)
+            game_controller.switch_players_focus(
+                player_step = 1
+                )
+            pass_turn_attacker(game_controller)
+
+    # Defending (or taking):
+    else:
+        defend_option_list: list[tuple[Card_Object, int]] = [
+            (card_object, position_index)
+            for card_object in hand_playable
+            for position_index in table_undefended_list
+            if card_object > table_map[position_index][TABLE_STACK_BOTTOM_INDEX]
+            ]
+        if defend_option_list:
+            card_object, position_index = match_random.choice(defend_option_list)
+            game_controller.task_play_card(
+                card_object = card_object,
+                player_controller = player_active,
+                position_index = position_index,
+                stack_index = TABLE_STACK_TOP_INDEX,
+                )
+            game_controller.switch_players_active()
+        else:
+            game_controller.task_sweep_cards_hand(
+                player_controller = player_defending
+                )
+            fill_hands(game_controller)
+            game_controller.switch_players_focus(
+                player_step = 2
+                )
+            pass_turn_attacker(game_controller)
+
+    # Returning:
+    return True
+
+
+def pass_turn_attacker(game_controller: Game_Controller) -> None:
+    """
+    Passes the turn to the lead attacker of the next round, if it is not theirs already.
+
+    :param Game_Controller game_controller: ...
+    """
+
+    # Switching:
+    if game_controller.player_active is not game_controller.player_attacking:
+        game_controller.switch_players_active()
+
+
+def play_match(game_controller: Game_Controller, random_seed: int, verify_enabled: bool) -> int:
+    """
+    Plays a headless match with random legal actions on a created game (same seed, same match).
+
+    :param Game_Controller game_controller: ...
+    :param int random_seed: ...
+    :param bool verify_enabled: Compares tracked playable state with a full scan after every task.
+
+    :return int: Actions applied.
+
+    :raise AssertionError: If verifying and tracked state differs from a full scan.
+    """
+
+    # Playing:
+    game_controller.playable.set_verify_enabled(verify_enabled)
+    match_random: random.Random = random.Random(random_seed)
+    action_count: int = 0
+    while action_count < BENCHMARK_ACTION_LIMIT and apply_random_action(game_controller, match_random):
+        action_count += 1
+
+    # Returning:
+    return action_count
+
+
+def measure_rules(player_count: int,
+                  deck_copy_count: int,
+                  deck_lowest_value: int,
+                  match_count: int,
+                  random_seed: int,
+                  verify_enabled: bool = False
+                  ) -> dict[str, float]:
+    """
+    Measures rules throughput (actions per second) of random matches, game creation and dealing
+    included.
+
+    :param int player_count: ...
+    :param int deck_copy_count: ...
+    :param int deck_lowest_value: ...
+    :param int match_count: ...
+    :param int random_seed: ...
+    :param bool verify_enabled: ...
+
+    :return dict[str, float]: ...
+    """
+
+    # Playing:
+    action_count: int = 0
+    time_start: float = time.perf_counter()
+    for match_index in range(match_count):
+        random.seed(random_seed + match_index)
+        game_controller: Game_Controller = create_game(player_count, deck_copy_count, deck_lowest_value)
+        action_count += play_match(
+            game_controller = game_controller,
+            random_seed = random_seed + match_index,
+            verify_enabled = verify_enabled,
+            )
+    match_time: float = time.perf_counter() - time_start
+
+    # Packing up:
+    benchmark_result: dict[str, float] = {
+        "action_count": action_count,
+        "actions_per_second": round(action_count / max(match_time, 1e-9), 1),
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def measure_frame(gameshell: Any, player_count: int, deck_copy_count: int, deck_lowest_value: int) -> float:
+    """
+    Measures frame time of a freshly dealt game (milliseconds per frame, best of repeats, mouse
+    moving over opponents' hands every frame, so hover hit-testing is included).
+
+    :param Gameshell gameshell: Headless window.
+    :param int player_count: ...
+    :param int deck_copy_count: ...
+    :param int deck_lowest_value: ...
+
+    :return float: ...
+    """
+
+    # Creating game:
+    configure_game(gameshell.game, player_count, deck_copy_count, deck_lowest_value)
+    gameshell.on_update(1 / 60)
+    gameshell.on_draw()
+
+    # Measuring:
+    frame_time: float = float("inf")
+    for _ in range(BENCHMARK_FRAME_REPEAT):
+        time_start: float = time.perf_counter()
+        for frame_index in range(BENCHMARK_FRAME_COUNT):
+            gameshell.on_mouse_motion(
+                (frame_index * 37) % GAME_WINDOW_WIDTH,
+                HAND_PLAYER_TWO_COORDINATE_Y,
+                0,
+                0,
+                )
+            gameshell.on_update(1 / 60)
+            gameshell.on_draw()
+        frame_time: float = min(frame_time, time.perf_counter() - time_start)
+
+    # Returning:
+    return round(frame_time / BENCHMARK_FRAME_COUNT * 1000, 3)
+
+
+def run_benchmark() -> None:
+    """
+    Verifies tracked playable state on random N-player matches, then prints rules throughput and
+    (windowed or headless) frame time for every player count and deck size.
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Player count and deck size scaling benchmark."
+        )
+    argument_parser.add_argument("--matches", type = int, default = BENCHMARK_MATCH_COUNT)
+    argument_parser.add_argument("--seed", type = int, default = BENCHMARK_SEED_DEFAULT)
+    argument_parser.add_argument("--no-frame", action = "store_true", help = "Skip frame time (no window).")
+    argument_namespace: argparse.Namespace = argument_parser.parse_args()
+
+    # Creating window (imported here, so rules are measured without one):
+    gameshell: Any = None
+    if not argument_namespace.no_frame:
+        os.environ.setdefault("ARCADE_HEADLESS", "1")
+        from game.gameshell import Gameshell
+        gameshell: Any = Gameshell()
+
+    # Measuring:
+    benchmark_result: dict[str, Any] = {}
+    for player_count in BENCHMARK_PLAYER_COUNT_LIST:
+        for deck_label, deck_copy_count, deck_lowest_value in BENCHMARK_DECK_LIST:
+            verify_result: dict[str, float] = measure_rules(
+                player_count, deck_copy_count, deck_lowest_value,
+                match_count = argument_namespace.matches,
+                random_seed = argument_namespace.seed,
+                verify_enabled = True,
+                )
+            config_result: dict[str, Any] = measure_rules(
+                player_count, deck_copy_count, deck_lowest_value,
+                match_count = argument_namespace.matches,
+                random_seed = argument_namespace.seed,
+                )
+            config_result["verified_action_count"] = verify_result["action_count"]
+            if gameshell is not None:
+                config_result["ms_per_frame"] = measure_frame(
+                    gameshell, player_count, deck_copy_count, deck_lowest_value
+                    )
+            benchmark_result[f"{player_count}p/{deck_label}"] = config_result
+
+    # Printing:
+    print(f"{'players/deck':<14}{'actions':>10}{'actions/s':>12}{'ms/frame':>10}")
+    for result_label, config_result in benchmark_result.items():
+        print(
+            f"{result_label:<14}{config_result['action_count']:>10}"
+            f"{config_result['actions_per_second']:>12.1f}{config_result.get('ms_per_frame', 0.0):>10.3f}"
+            )
+    print(json.dumps(benchmark_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,113 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# System management, time and data import:
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+# Variables import:
+from game.variables import (
+    SESSION_VALIDATION_ENVIRON,
+    SESSION_VALIDATION_MODE_DEBUG,
+    SESSION_VALIDATION_MODE_PRODUCTION,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SETTER BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_REPEAT: int = 5
+BENCHMARK_NUMBER: int = 20_000
+
+
+def measure_setters() -> dict[str, float]:
+    """
+    Measures setter throughput (sets per second) in the current validation mode. Every setter is
+    called twice per iteration, with alternating values, so each call updates the attribute.
+
+    :return dict[str, float]: ...
+    """
+
+    # Importing here, validation mode is read on import:
+    from game.controllers.card import Card_Object
+
+    # Preparing card object:
+    card_object: Card_Object = Card_Object()
+    setter_index: dict[str, tuple[str, str]] = {
+        "set_state_selected": (
+            "card_object.set_state_selected(set_value = True)",
+            "card_object.set_state_selected(set_value = False)",
+            ),
+        "set_position_deck": (
+            "card_object.set_position_deck(position_index = 1)",
+            "card_object.set_position_deck(position_index = 2)",
+            ),
+        "set_coordinate_x_current": (
+            "card_object.set_coordinate_x_current(set_value = 10)",
+            "card_object.set_coordinate_x_current(set_value = 20)",
+            ),
+        "set_coordinates_current": (
+            "card_object.set_coordinates_current(set_container = (10, 10))",
+            "card_object.set_coordinates_current(set_container = (20, 20))",
+            ),
+        }
+
+    # Measuring (best of repeats):
+    benchmark_result: dict[str, float] = {}
+    for setter_name, setter_statement_list in setter_index.items():
+        setter_time: float = min(
+            timeit.repeat(
+                stmt = "; ".join(setter_statement_list),
+                globals = {"card_object": card_object},
+                repeat = BENCHMARK_REPEAT,
+                number = BENCHMARK_NUMBER,
+                )
+            )
+        benchmark_result[setter_name] = round(BENCHMARK_NUMBER * 2 / setter_time)
+
+    # Returning:
+    return benchmark_result
+
+
+def run_benchmark() -> None:
+    """
+    Runs the benchmark in a subprocess per validation mode (mode is fixed at startup) and prints
+    a comparison table.
+    """
+
+    # Measuring in both modes:
+    benchmark_mode_index: dict[str, dict[str, float]] = {}
+    for validation_mode in (SESSION_VALIDATION_MODE_DEBUG, SESSION_VALIDATION_MODE_PRODUCTION):
+        process_environ: dict[str, str] = {**os.environ, SESSION_VALIDATION_ENVIRON: validation_mode}
+        process_result: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, "-m", "game.benchmarks.setters", "--measure"],
+            env = process_environ,
+            capture_output = True,
+            text = True,
+            check = True,
+            )
+        benchmark_mode_index[validation_mode] = json.loads(process_result.stdout.splitlines()[-1])
+
+    # Printing:
+    print(f"{'setter':<28}{'debug, sets/s':>16}{'production, sets/s':>22}{'speedup':>10}")
+    for setter_name, setter_rate_debug in benchmark_mode_index[SESSION_VALIDATION_MODE_DEBUG].items():
+        setter_rate_production: float = benchmark_mode_index[SESSION_VALIDATION_MODE_PRODUCTION][setter_name]
+        print(
+            f"{setter_name:<28}{setter_rate_debug:>16,.0f}{setter_rate_production:>22,.0f}"
+            f"{setter_rate_production / setter_rate_debug:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        print(json.dumps(measure_setters()))
+    else:
+        run_benchmark()
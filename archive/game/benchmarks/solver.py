@@ -0,0 +1,222 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management, random, time and data import:
+import argparse
+import json
+import random
+import statistics
+import time
+
+# Collections import:
+from game.collections.state import Game_State, State_Move, STATE_WINNER_DRAW
+from game.collections.solver import (
+    State_Solver,
+    SOLVER_SCORE_WIN,
+    SOLVER_SCORE_DRAW,
+    SOLVER_SCORE_LOSS,
+    )
+
+# Settings import:
+from game.settings import HAND_CARD_COUNT_DEFAULT
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ENDGAME SOLVER BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_ENDGAME_COUNT: int = 50
+BENCHMARK_VERIFY_HAND_MAX: int = 4              # <- Hand size of endgames checked with plain minimax
+BENCHMARK_SEED_DEFAULT: int = 0
+BENCHMARK_DECK_LOWEST_VALUE: int = 6
+BENCHMARK_MOVE_LIMIT: int = 2000
+
+
+def collect_endgames(endgame_count: int, hand_count_max: int, random_seed: int) -> list[Game_State]:
+    """
+    Plays random games until the deck is empty, and keeps a state from every game once both hands
+    are small enough (at a random move, so endgames start mid-round too).
+
+    :param int endgame_count: ...
+    :param int hand_count_max: ...
+    :param int random_seed: ...
+
+    :return list[Game_State]: ...
+    """
+
+    # Playing games:
+    endgame_list: list[Game_State] = []
+    game_seed: int = random_seed
+    while len(endgame_list) < endgame_count:
+        game_state: Game_State = Game_State.create_new(
+            deck_lowest_value = BENCHMARK_DECK_LOWEST_VALUE,
+            random_seed = game_seed,
+            )
+        game_random: random.Random = random.Random(game_seed)
+        game_seed += 1
+        for _ in range(BENCHMARK_MOVE_LIMIT):
+            if game_state.state_terminal:
+                break
+            endgame_found: bool = bool(
+                game_state.deck_count == 0 and
+                game_state.hand_count(0) <= hand_count_max and
+                game_state.hand_count(1) <= hand_count_max and
+                game_random.random() < 0.3
+                )
+            if endgame_found:
+                endgame_list.append(game_state)
+                break
+            game_state: Game_State = game_state.apply_move(
+                game_random.choice(game_state.legal_move_list())
+                )
+
+    # Returning:
+    return endgame_list
+
+
+def solve_minimax(game_state: Game_State) -> int:
+    """
+    Plain minimax over Game_State moves (no table, no hashing), reference for verifying.
+
+    :param Game_State game_state: ...
+
+    :return int: Score of the active player.
+    """
+
+    # Evaluating terminal state:
+    if game_state.state_terminal:
+        if game_state.winner == STATE_WINNER_DRAW:
+            return SOLVER_SCORE_DRAW
+        return SOLVER_SCORE_WIN if game_state.winner == game_state.player_active else SOLVER_SCORE_LOSS
+
+    # Searching (every move passes the turn):
+    best_score: int = SOLVER_SCORE_LOSS
+    for state_move in game_state.legal_move_list():
+        best_score: int = max(best_score, -solve_minimax(game_state.apply_move(state_move)))
+        if best_score == SOLVER_SCORE_WIN:
+            break
+
+    # Returning:
+    return best_score
+
+
+def verify_solver(endgame_list: list[Game_State]) -> int:
+    """
+    Compares solver scores with plain minimax, and checks that the move found is legal and keeps
+    the score.
+
+    :param list[Game_State] endgame_list: ...
+
+    :raise AssertionError: on the first difference.
+
+    :return int: Endgames verified.
+    """
+
+    # Verifying:
+    state_solver: State_Solver = State_Solver()
+    for game_state in endgame_list:
+        solve_score: int = state_solver.solve(game_state)
+        assert solve_score == solve_minimax(game_state), f"Solver score differs from minimax ({game_state=})."
+        state_move: State_Move | None = state_solver.find_move(game_state)
+        if state_move is not None:
+            assert state_move in game_state.legal_move_list(), f"Solver move is not legal ({state_move=})."
+            assert -solve_minimax(game_state.apply_move(state_move)) == solve_score, f"Solver move loses score ({state_move=})."
+
+    # Returning:
+    return len(endgame_list)
+
+
+def measure_solver(endgame_list: list[Game_State], table_size_power: int | None = None) -> dict[str, Any]:
+    """
+    Solves every endgame with a fresh solver (table is not shared between endgames) and collects
+    times and node counts.
+
+    :param list[Game_State] endgame_list: ...
+    :param int | None table_size_power: Transposition table size, default if None.
+
+    :return dict[str, Any]: ...
+    """
+
+    # Solving:
+    solve_time_list: list[float] = []
+    node_count: int = 0
+    table_hit_count: int = 0
+    aborted_count: int = 0
+    for game_state in endgame_list:
+        state_solver: State_Solver = State_Solver() if table_size_power is None else State_Solver(table_size_power)
+        time_start: float = time.perf_counter()
+        state_solver.find_move(game_state)
+        solve_time_list.append(time.perf_counter() - time_start)
+        node_count += state_solver.node_count
+        table_hit_count += state_solver.table_hit_count
+        aborted_count += state_solver.search_aborted
+
+    # Packing up:
+    solve_time_list.sort()
+    benchmark_result: dict[str, Any] = {
+        "endgames": len(endgame_list),
+        "aborted": aborted_count,
+        "ms_median": round(statistics.median(solve_time_list) * 1000, 2),
+        "ms_p90": round(solve_time_list[int(len(solve_time_list) * 0.9)] * 1000, 2),
+        "ms_max": round(solve_time_list[-1] * 1000, 2),
+        "nodes_average": round(node_count / max(len(endgame_list), 1)),
+        "nodes_per_second": round(node_count / max(sum(solve_time_list), 1e-9)),
+        "table_hit_rate": round(table_hit_count / max(node_count, 1), 3),
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def run_benchmark() -> None:
+    """
+    Verifies solver against plain minimax on small endgames, then measures solve time of endgames
+    up to six cards each, with the default transposition table and a single entry one.
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Endgame solver benchmark, random endgames."
+        )
+    argument_parser.add_argument("--endgames", type = int, default = BENCHMARK_ENDGAME_COUNT)
+    argument_parser.add_argument("--seed", type = int, default = BENCHMARK_SEED_DEFAULT)
+    argument_namespace: argparse.Namespace = argument_parser.parse_args()
+
+    # Verifying (raises on the first difference):
+    verified_count: int = verify_solver(
+        endgame_list = collect_endgames(
+            endgame_count = argument_namespace.endgames,
+            hand_count_max = BENCHMARK_VERIFY_HAND_MAX,
+            random_seed = argument_namespace.seed,
+            )
+        )
+    print(f"verified {verified_count} endgames, solver matches minimax")
+
+    # Measuring:
+    endgame_list: list[Game_State] = collect_endgames(
+        endgame_count = argument_namespace.endgames,
+        hand_count_max = HAND_CARD_COUNT_DEFAULT,
+        random_seed = argument_namespace.seed,
+        )
+    benchmark_result: dict[str, Any] = {
+        "table": measure_solver(endgame_list),
+        "1 entry": measure_solver(endgame_list, table_size_power = 0),
+        }
+
+    # Printing:
+    print(f"{'solver':<10}{'aborted':>9}{'ms median':>11}{'ms p90':>10}{'ms max':>10}{'nodes/s':>10}")
+    for result_label, solver_result in benchmark_result.items():
+        print(
+            f"{result_label:<10}{solver_result['aborted']:>9}{solver_result['ms_median']:>11.2f}"
+            f"{solver_result['ms_p90']:>10.2f}{solver_result['ms_max']:>10.2f}{solver_result['nodes_per_second']:>10}"
+            )
+    print(json.dumps(benchmark_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,107 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management, time and data import:
+import json
+import os
+import tempfile
+import time
+
+# Controllers import:
+from game.controllers.telemetry import Telemetry_Controller
+
+# Settings import:
+from game.settings import TELEMETRY_QUEUE_SIZE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TELEMETRY BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_REPEAT: int = 5
+BENCHMARK_RECORD_COUNT: int = TELEMETRY_QUEUE_SIZE // 2     # <- Per repeat, fits the buffer (nothing dropped)
+
+
+def measure_record(telemetry_running: bool, output_path: str) -> float:
+    """
+    Measures record call overhead on the game thread (microseconds per event, event data built per
+    call as game tasks do, best of repeats). Buffer is drained between repeats.
+
+    :param bool telemetry_running: ...
+    :param str output_path: ...
+
+    :return float: ...
+    """
+
+    # Measuring:
+    telemetry_controller: Telemetry_Controller = Telemetry_Controller()
+    record_time: float = float("inf")
+    for _ in range(BENCHMARK_REPEAT):
+        if telemetry_running:
+            telemetry_controller.start(output_path = output_path)
+        time_start: float = time.perf_counter()
+        for record_index in range(BENCHMARK_RECORD_COUNT):
+            telemetry_controller.record(
+                event_name = "play",
+                event_data = {"player": 0, "card": record_index % 36, "position": 1},
+                )
+        record_time: float = min(record_time, time.perf_counter() - time_start)
+        telemetry_controller.stop()
+
+    # Returning:
+    return round(record_time / BENCHMARK_RECORD_COUNT * 1_000_000, 3)
+
+
+def measure_overflow(output_path: str) -> dict[str, int]:
+    """
+    Records twice the buffer size at once (faster than the writer drains it), records over the
+    limit are dropped and counted.
+
+    :param str output_path: ...
+
+    :return dict[str, int]: Telemetry statistics.
+    """
+
+    # Recording burst:
+    telemetry_controller: Telemetry_Controller = Telemetry_Controller()
+    telemetry_controller.start(output_path = output_path)
+    for record_index in range(TELEMETRY_QUEUE_SIZE * 2):
+        telemetry_controller.record(
+            event_name = "turn",
+            event_data = {"player": record_index % 2},
+            )
+
+    # Returning:
+    return telemetry_controller.stop()
+
+
+def run_benchmark() -> None:
+    """
+    Prints record overhead with telemetry stopped and running, and drop counts of a burst.
+    """
+
+    # Measuring (output in a temporary directory):
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_path: str = os.path.join(output_dir, "telemetry.jsonl")
+        benchmark_result: dict[str, Any] = {
+            "record_us_stopped": measure_record(False, output_path),
+            "record_us_running": measure_record(True, output_path),
+            "overflow": measure_overflow(output_path),
+            }
+        with open(output_path, "r", encoding = "utf-8") as output_file:
+            benchmark_result["line_example"] = output_file.readline().strip()
+
+    # Printing:
+    print(f"{'record':<20}{'us/event':>10}")
+    print(f"{'telemetry stopped':<20}{benchmark_result['record_us_stopped']:>10.3f}")
+    print(f"{'telemetry running':<20}{benchmark_result['record_us_running']:>10.3f}")
+    print(json.dumps(benchmark_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,150 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# System management, time and data import:
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+# Directory variables import:
+from game.directory import DIR_TEXTURE_CACHE_PATH
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TEXTURE LOAD BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_REPEAT: int = 3
+BENCHMARK_WORKER_COUNT: int = 4
+
+
+def measure_texture_load(worker_count: int) -> dict[str, float]:
+    """
+    Measures texture load time in a fresh process: session packs are preloaded (read with worker
+    count threads), then every card face and back texture of the default light and dark packs is
+    created (textures are lazy, so front and back are read from each card), as rendering a new game
+    of each mode would load them.
+
+    :param int worker_count: Preload worker threads, 1 is serial.
+
+    :return dict[str, float]: ...
+    """
+
+    # Importing here, so import time is not measured:
+    from game.controllers.card import Card_Object
+    from game.controllers.game import Game_Controller
+    from game.scripts.texture import preload_texture_pack_list, TEXTURE_CACHE
+    from game.collections.texturepack import (
+        TEXTURE_PACK_FRONT_LIGHT_DEFAULT,
+        TEXTURE_PACK_FRONT_DARK_DEFAULT,
+        TEXTURE_PACK_BACK_LIGHT_DEFAULT,
+        TEXTURE_PACK_BACK_DARK_DEFAULT,
+        )
+    from game.variables import CARD_ID_SUIT_ORDER, CARD_ID_TYPE_ORDER
+
+    # Collecting session packs:
+    texture_pack_key_list: list[str] = Game_Controller().texture_pack_key_list
+
+    # Preloading and loading textures:
+    time_start: float = time.perf_counter()
+    preload_texture_pack_list(
+        pack_key_list = texture_pack_key_list,
+        worker_count = worker_count,
+        )
+    preload_time: float = time.perf_counter() - time_start
+    for texture_pack_front, texture_pack_back in (
+        (TEXTURE_PACK_FRONT_LIGHT_DEFAULT, TEXTURE_PACK_BACK_LIGHT_DEFAULT),
+        (TEXTURE_PACK_FRONT_DARK_DEFAULT, TEXTURE_PACK_BACK_DARK_DEFAULT),
+        ):
+        for card_suit in CARD_ID_SUIT_ORDER:
+            for card_type in CARD_ID_TYPE_ORDER:
+                card_object: Card_Object = Card_Object.create_card_object(
+                    init_type = card_type,
+                    init_suit = card_suit,
+                    texture_pack_front = texture_pack_front,
+                    texture_pack_back = texture_pack_back,
+                    )
+
+                # Reading textures (created on first read):
+                card_object.texture_front_object
+                card_object.texture_back_object
+    load_time: float = time.perf_counter() - time_start
+
+    # Packing up:
+    benchmark_result: dict[str, float] = {
+        "preload_ms": round(preload_time * 1000, 2),
+        "load_ms": round(load_time * 1000, 2),
+        "texture_count": len(TEXTURE_CACHE),
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def run_measure_process(worker_count: int) -> dict[str, float]:
+    """
+    TODO: Create a docstring.
+
+    :param int worker_count: ...
+
+    :return dict[str, float]: ...
+    """
+
+    # Measuring in a fresh process:
+    process_result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-m", "game.benchmarks.textures", "--measure", str(worker_count)],
+        capture_output = True,
+        text = True,
+        check = True,
+        )
+
+    # Returning:
+    return json.loads(process_result.stdout.splitlines()[-1])
+
+
+def run_benchmark() -> None:
+    """
+    Measures texture load with an empty decoded cache (PNG or atlas decode, cache is written) and
+    with a warm cache (memory-mapped raw buffers), packs read serially and in a thread pool, best of
+    repeats, and prints a comparison.
+    """
+
+    # Measuring:
+    load_result_index: dict[tuple[str, int], list[float]] = {}
+    texture_count: int = 0
+    for _ in range(BENCHMARK_REPEAT):
+        for worker_count in (1, BENCHMARK_WORKER_COUNT):
+            shutil.rmtree(DIR_TEXTURE_CACHE_PATH, ignore_errors = True)
+            for load_mode in ("cold", "warm"):
+                load_result: dict[str, float] = run_measure_process(worker_count)
+                load_result_index.setdefault((load_mode, worker_count), []).append(
+                    load_result["load_ms"]
+                    )
+                texture_count: int = load_result["texture_count"]
+
+    # Printing:
+    load_index: dict[tuple[str, int], float] = {
+        load_key: min(load_list) for load_key, load_list in load_result_index.items()
+        }
+    print(f"{'texture load':<28}{'serial ms':>12}{'parallel ms':>14}")
+    for load_mode, load_label in (("cold", "cold (decode, write cache)"), ("warm", "warm (memory-mapped cache)")):
+        load_serial: float = load_index[(load_mode, 1)]
+        load_parallel: float = load_index[(load_mode, BENCHMARK_WORKER_COUNT)]
+        print(f"{load_label:<28}{load_serial:>12.1f}{load_parallel:>14.1f}")
+    print(f"cache speedup {load_index[('cold', 1)] / load_index[('warm', 1)]:.1f}x")
+    print(f"cold start thread pool speedup {load_index[('cold', 1)] / load_index[('cold', BENCHMARK_WORKER_COUNT)]:.1f}x")
+    print(f"workers {BENCHMARK_WORKER_COUNT}, cpu count {os.cpu_count()}, textures created {texture_count}")
+
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        print(json.dumps(measure_texture_load(int(sys.argv[-1]))))
+    else:
+        run_benchmark()
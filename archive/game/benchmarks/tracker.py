@@ -0,0 +1,250 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management, time and data import:
+import argparse
+import json
+import random
+import time
+
+# Controllers import:
+from game.controllers.card import Card_Object
+from game.controllers.game import Game_Controller
+from game.controllers.player import Player_Controller
+
+# Server import (headless matches):
+from game.server import Match_Controller
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CARD TRACKER BENCHMARK BLOCK
+
+"""
+
+
+# Benchmark settings:
+BENCHMARK_MATCH_COUNT: int = 50
+BENCHMARK_SEED_DEFAULT: int = 0
+BENCHMARK_ACTION_LIMIT: int = 500               # <- Actions per match before it is left unfinished
+BENCHMARK_QUERY_REPEAT: int = 200
+
+
+def verify_probabilities(game_controller: Game_Controller) -> None:
+    """
+    Probabilities of every card being in a hand add up to its card count, from every player's point
+    of view.
+
+    :param Game_Controller game_controller: ...
+
+    :raise AssertionError: If probabilities do not add up.
+    """
+
+    # Checking every player from every other player's point of view:
+    card_count: int = len(game_controller.deck.deck_sealed)
+    for player_controller in game_controller.player_list:
+        for player_observer in game_controller.player_list:
+            probability_list: list[float] = game_controller.tracker.calculate_probability_list(
+                player_controller = player_controller,
+                player_observer = player_observer,
+                card_count = card_count,
+                )
+            probability_sum: float = sum(probability_list)
+            if abs(probability_sum - player_controller.hand.hand_count) > 1e-6:
+                error_message: str = f"Probabilities do not add up to hand size ({probability_sum=})."
+                raise AssertionError(error_message)
+
+
+def play_match(random_seed: int, verify_enabled: bool, tracker_enabled: bool = True) -> int:
+    """
+    Plays a headless match with random legal actions (same seed, same match).
+
+    :param int random_seed: ...
+    :param bool verify_enabled: Compares tracker with containers after every action.
+    :param bool tracker_enabled: Tracker is reset (idle) otherwise.
+
+    :return int: Actions applied.
+
+    :raise AssertionError: If verifying and tracker differs from containers.
+    """
+
+    # Creating match:
+    random.seed(random_seed)
+    match_controller: Match_Controller = Match_Controller(match_id = random_seed)
+    game_controller: Game_Controller = match_controller.game
+    if not tracker_enabled:
+        game_controller.tracker.reset()
+    match_random: random.Random = random.Random(random_seed)
+
+    # Playing:
+    action_count: int = 0
+    while not match_controller.match_finished and action_count < BENCHMARK_ACTION_LIMIT:
+        player_seat: int = 0 if game_controller.player_one.state_active else 1
+        legal_action_list: list[dict[str, Any]] = match_controller.legal_action_list(
+            player_seat = player_seat
+            )
+        if not legal_action_list:
+            break
+        match_controller.apply_action(
+            player_seat = player_seat,
+            action_request = match_random.choice(legal_action_list),
+            )
+        action_count += 1
+        if verify_enabled:
+            game_controller.tracker.verify_state(
+                deck_controller = game_controller.deck,
+                table_controller = game_controller.table,
+                )
+            verify_probabilities(game_controller)
+
+    # Returning:
+    return action_count
+
+
+def measure_matches(match_count: int, random_seed: int, tracker_enabled: bool) -> float:
+    """
+    Measures time per action of random matches, with the tracker handling events or idle.
+
+    :param int match_count: ...
+    :param int random_seed: ...
+    :param bool tracker_enabled: ...
+
+    :return float: Milliseconds per action.
+    """
+
+    # Playing:
+    action_count: int = 0
+    time_start: float = time.perf_counter()
+    for match_index in range(match_count):
+        action_count += play_match(
+            random_seed = random_seed + match_index,
+            verify_enabled = False,
+            tracker_enabled = tracker_enabled,
+            )
+    match_time: float = time.perf_counter() - time_start
+
+    # Returning:
+    return round(match_time / max(action_count, 1) * 1000, 4)
+
+
+def find_unknown_rescan(game_controller: Game_Controller, player_observer: Player_Controller) -> list[Card_Object]:
+    """
+    Cards observer cannot place, by rescanning containers (sealed deck without own hand, table,
+    discard and showcase card). Picked up cards are not known this way.
+
+    :param Game_Controller game_controller: ...
+    :param Player_Controller player_observer: ...
+
+    :return list[Card_Object]: ...
+    """
+
+    # Collecting public and own cards:
+    card_seen_set: set[int] = {card_object.card_uid for card_object in player_observer.hand.hand_container}
+    card_seen_set.update(card_object.card_uid for card_object in game_controller.table.table_container)
+    card_seen_set.update(card_object.card_uid for card_object in game_controller.discard.discard_container)
+    if game_controller.deck.deck_showcase_card is not None:
+        card_seen_set.add(game_controller.deck.deck_showcase_card.card_uid)
+
+    # Returning:
+    return [
+        card_object for card_object in game_controller.deck.deck_sealed
+        if card_object.card_uid not in card_seen_set
+        ]
+
+
+def measure_queries(random_seed: int) -> dict[str, float]:
+    """
+    Measures unknown cards and opponent's hand probability queries mid-match, tracker compared
+    with a container rescan.
+
+    :param int random_seed: ...
+
+    :return dict[str, float]: Microseconds per query.
+    """
+
+    # Playing match until a quarter of the deck is left:
+    random.seed(random_seed)
+    match_controller: Match_Controller = Match_Controller(match_id = random_seed)
+    game_controller: Game_Controller = match_controller.game
+    match_random: random.Random = random.Random(random_seed)
+    while game_controller.deck.deck_count > len(game_controller.deck.deck_sealed) // 4:
+        player_seat: int = 0 if game_controller.player_one.state_active else 1
+        match_controller.apply_action(
+            player_seat = player_seat,
+            action_request = match_random.choice(match_controller.legal_action_list(player_seat = player_seat)),
+            )
+    player_observer: Player_Controller = game_controller.player_one
+    player_opponent: Player_Controller = game_controller.player_two
+
+    # Measuring tracker:
+    time_start: float = time.perf_counter()
+    for _ in range(BENCHMARK_QUERY_REPEAT):
+        game_controller.tracker.find_unknown_mask(player_observer)
+    unknown_time_tracker: float = time.perf_counter() - time_start
+    time_start: float = time.perf_counter()
+    for card_object in game_controller.deck.deck_sealed * (BENCHMARK_QUERY_REPEAT // 10):
+        game_controller.tracker.calculate_card_probability(
+            card_uid = card_object.card_uid,
+            player_controller = player_opponent,
+            player_observer = player_observer,
+            )
+    probability_time_tracker: float = time.perf_counter() - time_start
+    probability_count: int = len(game_controller.deck.deck_sealed) * (BENCHMARK_QUERY_REPEAT // 10)
+
+    # Measuring rescan:
+    time_start: float = time.perf_counter()
+    for _ in range(BENCHMARK_QUERY_REPEAT):
+        find_unknown_rescan(game_controller, player_observer)
+    unknown_time_rescan: float = time.perf_counter() - time_start
+
+    # Packing up:
+    benchmark_result: dict[str, float] = {
+        "unknown_us_tracker": round(unknown_time_tracker / BENCHMARK_QUERY_REPEAT * 1_000_000, 3),
+        "unknown_us_rescan": round(unknown_time_rescan / BENCHMARK_QUERY_REPEAT * 1_000_000, 3),
+        "probability_us_tracker": round(probability_time_tracker / probability_count * 1_000_000, 3),
+        }
+
+    # Returning:
+    return benchmark_result
+
+
+def run_benchmark() -> None:
+    """
+    Verifies tracked cards and probabilities on random matches, then measures event overhead per
+    action and query times.
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Card tracker benchmark, random headless matches."
+        )
+    argument_parser.add_argument("--matches", type = int, default = BENCHMARK_MATCH_COUNT)
+    argument_parser.add_argument("--seed", type = int, default = BENCHMARK_SEED_DEFAULT)
+    argument_namespace: argparse.Namespace = argument_parser.parse_args()
+
+    # Verifying (raises on the first difference):
+    action_count: int = 0
+    for match_index in range(argument_namespace.matches):
+        action_count += play_match(
+            random_seed = argument_namespace.seed + match_index,
+            verify_enabled = True,
+            )
+    print(f"verified {action_count} actions, tracked cards match containers")
+
+    # Measuring:
+    benchmark_result: dict[str, Any] = {
+        "ms_per_action_idle": measure_matches(argument_namespace.matches, argument_namespace.seed, False),
+        "ms_per_action_tracking": measure_matches(argument_namespace.matches, argument_namespace.seed, True),
+        **measure_queries(argument_namespace.seed),
+        }
+
+    # Printing:
+    print(f"{'card tracker':<26}{'value':>10}")
+    for result_label, result_value in benchmark_result.items():
+        print(f"{result_label:<26}{result_value:>10.4f}")
+    print(json.dumps(benchmark_result))
+
+
+if __name__ == "__main__":
+    run_benchmark()
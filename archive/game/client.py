@@ -0,0 +1,230 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# Asynchronous library import:
+import asyncio
+
+# System management, random and data import:
+import itertools
+import json
+import random
+
+# Settings import:
+from game.settings import (
+    SERVER_HOST_DEFAULT,
+    SERVER_MESSAGE_SIZE_MAX,
+    )
+
+# Variables import:
+from game.variables import (
+    SERVER_REQUEST_CREATE,
+    SERVER_REQUEST_JOIN,
+    SERVER_REQUEST_ACTION,
+    SERVER_REQUEST_STATE,
+    SERVER_REQUEST_CLOSE,
+    SERVER_REQUEST_METRICS,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SERVER CLIENT CLASS OBJECT BLOCK
+
+"""
+
+
+class Server_Client:
+    """
+    Minimal asynchronous client for the game server. Requests are matched to responses by id, so
+    several requests can be in flight over a single connection.
+    """
+
+    def __init__(self) -> None:
+
+        # Streams:
+        self.__stream_reader: asyncio.StreamReader | None = None
+        self.__stream_writer: asyncio.StreamWriter | None = None
+
+        # Pending requests:
+        self.__request_id_counter: itertools.count = itertools.count()
+        self.__request_future_map: dict[int, asyncio.Future] = {}
+        self.__reader_task: asyncio.Task | None = None
+
+
+    async def connect(self, server_host: str, server_port: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str server_host: ...
+        :param int server_port: ...
+        """
+
+        # Opening connection:
+        self.__stream_reader, self.__stream_writer = await asyncio.open_connection(
+            host = server_host,
+            port = server_port,
+            limit = SERVER_MESSAGE_SIZE_MAX * 4,
+            )
+        self.__reader_task: asyncio.Task = asyncio.create_task(self.__read_responses())
+
+
+    async def close(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Closing connection:
+        if self.__reader_task is not None:
+            self.__reader_task.cancel()
+        if self.__stream_writer is not None:
+            self.__stream_writer.close()
+
+
+    async def __read_responses(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Resolving pending requests:
+        while True:
+            response_line: bytes = await self.__stream_reader.readline()
+            if not response_line:
+                break
+            response: dict[str, Any] = json.loads(response_line)
+            request_future: asyncio.Future | None = self.__request_future_map.pop(
+                response.get("id"), None
+                )
+            if request_future is not None and not request_future.done():
+                request_future.set_result(response)
+
+        # Failing requests left without a response:
+        for request_future in self.__request_future_map.values():
+            if not request_future.done():
+                request_future.set_exception(ConnectionError("Server closed the connection."))
+
+
+    async def request(self, request_type: str, **request_kwargs: Any) -> dict[str, Any]:
+        """
+        TODO: Create a docstring.
+
+        :param str request_type: ...
+
+        :return dict[str, Any]: ...
+        """
+
+        # Sending request:
+        request_id: int = next(self.__request_id_counter)
+        request_future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.__request_future_map[request_id] = request_future
+        request: dict[str, Any] = {"op": request_type, "id": request_id, **request_kwargs}
+        self.__stream_writer.write(json.dumps(request, separators = (",", ":")).encode() + b"\n")
+        await self.__stream_writer.drain()
+
+        # Awaiting response:
+        response: dict[str, Any] = await request_future
+
+        # Returning:
+        return response
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+LOOPBACK FUNCTION BLOCK
+
+"""
+
+
+async def play_random_match(server_client_list: list[Server_Client],
+                            action_count: int,
+                            random_seed: int
+                            ) -> None:
+    """
+    Plays a match with random legal actions for both seats (one client per seat).
+
+    :param list[Server_Client] server_client_list: Clients of seat one and seat two.
+    :param int action_count: Maximum number of actions.
+    :param int random_seed: ...
+    """
+
+    # Creating match and joining seats:
+    random_generator: random.Random = random.Random(random_seed)
+    response: dict[str, Any] = await server_client_list[0].request(SERVER_REQUEST_CREATE)
+    match_id: int = response["match"]
+    for player_seat, server_client in enumerate(server_client_list):
+        await server_client.request(
+            SERVER_REQUEST_JOIN,
+            match = match_id,
+            seat = player_seat,
+            )
+
+    # Playing (the seat with legal actions moves):
+    for _ in range(action_count):
+        action_client: Server_Client | None = None
+        action_list: list[dict[str, Any]] = []
+        for server_client in server_client_list:
+            response: dict[str, Any] = await server_client.request(SERVER_REQUEST_STATE)
+            if not response["ok"]:
+                break                       # <- Match closed (server closes finished matches)
+            if response["state"]["actions"]:
+                action_client: Server_Client = server_client
+                action_list: list[dict[str, Any]] = response["state"]["actions"]
+                break
+        if action_client is None:
+            break
+        await action_client.request(
+            SERVER_REQUEST_ACTION,
+            **random_generator.choice(action_list),
+            )
+
+    # Closing match (answered with an error, if server closed it already):
+    await server_client_list[0].request(SERVER_REQUEST_CLOSE)
+
+
+async def run_loopback(match_count: int, action_count: int) -> dict[str, Any]:
+    """
+    Starts a server on a free local port, plays given number of concurrent matches against it and
+    returns server metrics.
+
+    :param int match_count: ...
+    :param int action_count: Actions per match.
+
+    :return dict[str, Any]: ...
+    """
+
+    # Importing server here, client itself does not depend on game controllers:
+    from game.server import Game_Server
+
+    # Starting server:
+    game_server: Game_Server = Game_Server(
+        server_host = SERVER_HOST_DEFAULT,
+        server_port = 0,
+        )
+    await game_server.start()
+
+    # Playing concurrent matches (one connection per seat):
+    server_client_list: list[Server_Client] = []
+    for _ in range(match_count * 2):
+        server_client: Server_Client = Server_Client()
+        await server_client.connect(
+            server_host = SERVER_HOST_DEFAULT,
+            server_port = game_server.server_port,
+            )
+        server_client_list.append(server_client)
+    await asyncio.gather(*(
+        play_random_match(
+            server_client_list = server_client_list[match_index * 2:match_index * 2 + 2],
+            action_count = action_count,
+            random_seed = match_index,
+            )
+        for match_index in range(match_count)
+        ))
+
+    # Collecting metrics:
+    response: dict[str, Any] = await server_client_list[0].request(SERVER_REQUEST_METRICS)
+    for server_client in server_client_list:
+        await server_client.close()
+    await game_server.stop()
+
+    # Returning:
+    return response["metrics"]
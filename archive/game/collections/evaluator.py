@@ -0,0 +1,313 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# Dataclass import:
+from dataclasses import dataclass
+
+# NumPy import (optional, evaluator is not available without it):
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Variables import:
+from game.variables import (
+
+    # Card identifier variables:
+    CARD_ID_SUIT_ORDER,
+    CARD_ID_NOT_SET,
+    )
+
+# Settings import:
+from game.settings import (
+    EVALUATOR_WEIGHT_CARD,
+    EVALUATOR_WEIGHT_CARD_ENDGAME,
+    EVALUATOR_WEIGHT_OPPONENT_CARD,
+    EVALUATOR_WEIGHT_TRUMP,
+    EVALUATOR_WEIGHT_TRUMP_TYPE,
+    EVALUATOR_WEIGHT_LOW_BURDEN,
+    EVALUATOR_WEIGHT_SUIT_COVERAGE,
+    EVALUATOR_WEIGHT_TABLE_DEFENDING,
+    EVALUATOR_WEIGHT_ATTACKING,
+    EVALUATOR_LOW_TYPE_THRESHOLD,
+    )
+
+# Collections import:
+from game.collections.state import (
+    Game_State,
+    State_Move,
+    STATE_TYPE_COUNT,
+    STATE_WINNER_DRAW,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EVALUATOR SETTINGS BLOCK
+
+"""
+
+
+# Availability (NumPy is installed):
+EVALUATOR_AVAILABLE: bool = numpy is not None
+
+# Card layout:
+EVALUATOR_SUIT_COUNT: int = len(CARD_ID_SUIT_ORDER)
+EVALUATOR_CARD_COUNT: int = EVALUATOR_SUIT_COUNT * STATE_TYPE_COUNT
+
+# Feature weights (same order as feature columns, see evaluate_batch):
+EVALUATOR_WEIGHT_LIST: tuple[float, ...] = (
+    EVALUATOR_WEIGHT_CARD,
+    EVALUATOR_WEIGHT_CARD_ENDGAME,
+    EVALUATOR_WEIGHT_OPPONENT_CARD,
+    EVALUATOR_WEIGHT_TRUMP,
+    EVALUATOR_WEIGHT_TRUMP_TYPE,
+    EVALUATOR_WEIGHT_LOW_BURDEN,
+    EVALUATOR_WEIGHT_SUIT_COVERAGE,
+    EVALUATOR_WEIGHT_TABLE_DEFENDING,
+    EVALUATOR_WEIGHT_ATTACKING,
+    )
+
+# Terminal scores (always beat any heuristic score):
+EVALUATOR_SCORE_WIN: float = 1_000.0
+EVALUATOR_SCORE_DRAW: float = 0.0
+EVALUATOR_SCORE_LOSS: float = -1_000.0
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EVALUATOR BATCH DATACLASS OBJECT BLOCK
+
+"""
+
+
+@dataclass(frozen = True, slots = True)
+class Evaluator_Batch:
+    """
+    Encoded positions, one array element per position, from the point of view of the evaluated
+    player. Card masks are card id bitmasks (see Game_State).
+    """
+
+    # Cards:
+    hand_mask:     Any                              # <- uint64, evaluated player's hand
+    opponent_mask: Any                              # <- uint64, opponent's hand
+    table_mask:    Any                              # <- uint64, attacking and defending cards
+
+    # Game:
+    trump_index: Any                                # <- int8, suit index
+    deck_count:  Any                                # <- int16
+    role:        Any                                # <- int8, 1 if attacking, 0 if defending
+
+
+    @property
+    def batch_size(self) -> int:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return len(self.hand_mask)
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATE EVALUATOR CLASS OBJECT BLOCK
+
+"""
+
+
+class State_Evaluator:
+    """
+    Heuristic position evaluator for the computer player, scores a whole batch of positions in one
+    vectorized pass (NumPy):
+
+    - hand size (weighted more once the deck is empty) and opponent's hand size;
+    - trump count and trump strength;
+    - low-card burden (low non-trump cards are hard to get rid of);
+    - suit coverage (suits held);
+    - role (attacking, cards to cover on table while defending).
+
+    Card masks are unpacked into card bits once per batch, every feature is a sum over them.
+    Scores are weighted feature sums, higher is better for the evaluated player.
+    """
+
+    def __init__(self, weight_list: tuple[float, ...] = EVALUATOR_WEIGHT_LIST) -> None:
+
+        # Checking NumPy:
+        if not EVALUATOR_AVAILABLE:
+            error_message: str = "State evaluator requires NumPy, which is not installed."
+            raise ImportError(error_message)
+
+        # Feature weights:
+        self.__weight_array: Any = numpy.array(weight_list, dtype = numpy.float32)
+
+        # Per type values (type index, low-card burden):
+        type_index_array: Any = numpy.arange(STATE_TYPE_COUNT, dtype = numpy.int16)
+        self.__type_index_array: Any = type_index_array
+        self.__low_burden_array: Any = numpy.maximum(EVALUATOR_LOW_TYPE_THRESHOLD - type_index_array, 0)
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    ENCODING METHODS BLOCK
+
+    """
+
+
+    @staticmethod
+    def encode_states(game_state_list: list[Game_State], player_index: int | list[int]) -> Evaluator_Batch:
+        """
+        Encodes game states into a batch.
+
+        :param list[Game_State] game_state_list: ...
+        :param int | list[int] player_index: Evaluated player, for every state or per state.
+
+        :return Evaluator_Batch: ...
+        """
+
+        # Preparing player indexes:
+        player_index_list: list[int] = (
+            [player_index] * len(game_state_list) if isinstance(player_index, int) else player_index
+            )
+
+        # Collecting:
+        hand_mask_list: list[int] = []
+        opponent_mask_list: list[int] = []
+        table_mask_list: list[int] = []
+        for game_state, state_player_index in zip(game_state_list, player_index_list):
+            hand_mask_list.append(game_state.hand_mask_list[state_player_index])
+            opponent_mask_list.append(game_state.hand_mask_list[1 - state_player_index])
+            table_mask: int = 0
+            for table_pair in game_state.table_list:
+                for card_id in table_pair:
+                    if card_id != CARD_ID_NOT_SET:
+                        table_mask |= 1 << card_id
+            table_mask_list.append(table_mask)
+
+        # Packing up:
+        evaluator_batch: Evaluator_Batch = Evaluator_Batch(
+            hand_mask = numpy.array(hand_mask_list, dtype = numpy.uint64),
+            opponent_mask = numpy.array(opponent_mask_list, dtype = numpy.uint64),
+            table_mask = numpy.array(table_mask_list, dtype = numpy.uint64),
+            trump_index = numpy.array(
+                [game_state.deck_trump_index for game_state in game_state_list], dtype = numpy.int8
+                ),
+            deck_count = numpy.array(
+                [game_state.deck_count for game_state in game_state_list], dtype = numpy.int16
+                ),
+            role = numpy.array(
+                [
+                    game_state.player_attacking == state_player_index
+                    for game_state, state_player_index in zip(game_state_list, player_index_list)
+                    ],
+                dtype = numpy.int8,
+                ),
+            )
+
+        # Returning:
+        return evaluator_batch
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    EVALUATION METHODS BLOCK
+
+    """
+
+
+    def calculate_features(self, evaluator_batch: Evaluator_Batch) -> Any:
+        """
+        Calculates feature columns (same order as weights, see EVALUATOR_WEIGHT_LIST).
+
+        :param Evaluator_Batch evaluator_batch: ...
+
+        :return numpy.ndarray: float32, batch size by feature count.
+        """
+
+        # Unpacking card bits (hand, opponent, table masks; little-endian bytes, card id is bit index):
+        batch_size: int = evaluator_batch.batch_size
+        mask_array: Any = numpy.stack(
+            (evaluator_batch.hand_mask, evaluator_batch.opponent_mask, evaluator_batch.table_mask),
+            axis = 1,
+            ).astype("<u8", copy = False)
+        card_bits: Any = numpy.unpackbits(
+            mask_array.view(numpy.uint8).reshape(batch_size, 3, 8),
+            axis = 2,
+            bitorder = "little",
+            )[:, :, :EVALUATOR_CARD_COUNT]
+        card_count_array: Any = card_bits.sum(axis = 2, dtype = numpy.int16)
+
+        # Hand cards by suit and type, trump suit row:
+        hand_bits: Any = card_bits[:, 0].reshape(batch_size, EVALUATOR_SUIT_COUNT, STATE_TYPE_COUNT)
+        trump_bits: Any = hand_bits[numpy.arange(batch_size), evaluator_batch.trump_index]
+        type_bits: Any = hand_bits.sum(axis = 1, dtype = numpy.int16)
+
+        # Filling feature columns:
+        endgame_array: Any = evaluator_batch.deck_count == 0
+        role_array: Any = evaluator_batch.role
+        feature_array: Any = numpy.empty((batch_size, len(self.__weight_array)), dtype = numpy.float32)
+        feature_array[:, 0] = numpy.where(endgame_array, 0, card_count_array[:, 0])
+        feature_array[:, 1] = numpy.where(endgame_array, card_count_array[:, 0], 0)
+        feature_array[:, 2] = card_count_array[:, 1]
+        feature_array[:, 3] = trump_bits.sum(axis = 1, dtype = numpy.int16)
+        feature_array[:, 4] = trump_bits @ self.__type_index_array
+        feature_array[:, 5] = (type_bits - trump_bits) @ self.__low_burden_array
+        feature_array[:, 6] = hand_bits.any(axis = 2).sum(axis = 1)
+        feature_array[:, 7] = card_count_array[:, 2] * (1 - role_array)
+        feature_array[:, 8] = role_array
+
+        # Returning:
+        return feature_array
+
+
+    def evaluate_batch(self, evaluator_batch: Evaluator_Batch) -> Any:
+        """
+        Scores every position of the batch.
+
+        :param Evaluator_Batch evaluator_batch: ...
+
+        :return numpy.ndarray: float32 scores, higher is better for the evaluated player.
+        """
+
+        # Returning:
+        return self.calculate_features(evaluator_batch) @ self.__weight_array
+
+
+    def find_move(self, game_state: Game_State) -> State_Move | None:
+        """
+        Finds the best move of the active player by one move lookahead: every legal move is applied,
+        and resulting positions are evaluated in one batch (game ending positions score by winner).
+        Hands are not refilled after take and discard, so hidden deck order does not leak into scores.
+
+        :param Game_State game_state: ...
+
+        :return State_Move: ...
+        :return None: if state is terminal.
+        """
+
+        # Collecting moves:
+        legal_move_list: list[State_Move] = game_state.legal_move_list()
+        if len(legal_move_list) <= 1:
+            return legal_move_list[0] if legal_move_list else None
+
+        # Evaluating resulting positions:
+        player_index: int = game_state.player_active
+        game_state_list: list[Game_State] = [
+            game_state.apply_move(state_move, fill_hands = False) for state_move in legal_move_list
+            ]
+        score_array: Any = self.evaluate_batch(
+            evaluator_batch = self.encode_states(game_state_list, player_index)
+            )
+
+        # Scoring game ending positions:
+        for state_index, game_state_next in enumerate(game_state_list):
+            if game_state_next.state_terminal:
+                score_array[state_index] = EVALUATOR_SCORE_LOSS
+                if game_state_next.winner == STATE_WINNER_DRAW:
+                    score_array[state_index] = EVALUATOR_SCORE_DRAW
+                elif game_state_next.winner == player_index:
+                    score_array[state_index] = EVALUATOR_SCORE_WIN
+
+        # Returning (first one, if several are as good):
+        return legal_move_list[int(numpy.argmax(score_array))]
@@ -0,0 +1,27 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Dataclass import:
+from dataclasses import dataclass
+
+# Controllers import:
+from game.controllers.card import Card_Object
+from game.controllers.player import Player_Controller
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+GAME EVENT DATACLASS OBJECT BLOCK
+
+"""
+
+
+@dataclass(frozen = True, slots = True)
+class Game_Event:
+
+    # Event type (see EVENT variables):
+    event_type: str
+
+    # Affected card and player (not set by events without one, e.g. roles switched):
+    card_object:       Card_Object | None = None
+    player_controller: Player_Controller | None = None
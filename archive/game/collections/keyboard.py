@@ -1,5 +1,5 @@
 # Dataclass import:
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 
 # Cache tools:
 from functools import cached_property
@@ -7,6 +7,30 @@ from functools import cached_property
 # Arcade library import:
 import arcade
 
+# Scripts import:
+from game.scripts.cache import clear_cached_property_list
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+KEYBOARD MAPPING VARIABLES BLOCK
+
+"""
+
+
+# Command attribute prefix (all key mapping attributes start with it):
+KEY_COMMAND_PREFIX: str = "KEY_"
+KEY_COMMAND_DEBUG_TAG: str = "DEBUG"
+
+# Modifiers recognized in bindings (lock keys are ignored):
+KEY_MODIFIER_NONE: int = 0
+KEY_MODIFIER_MASK: int = (
+    arcade.key.MOD_SHIFT |
+    arcade.key.MOD_CTRL |
+    arcade.key.MOD_ALT |
+    arcade.key.MOD_COMMAND
+    )
+
 
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -40,6 +64,9 @@ class Keyboard_Mapping:
     KEY_DEBUG_SWEEP_TO_HAND_OPPONENT: int = arcade.key.NUM_2
     KEY_DEBUG_SWEEP_TO_DISCARD:       int = arcade.key.NUM_0
 
+    # DEBUG Profiler key mapping:
+    KEY_DEBUG_TOGGLE_PROFILER: int = arcade.key.P   # <- Starts profiler, or stops it and writes reports
+
     # Action key mapping:
     KEY_BACK:        int = arcade.key.ESCAPE    # <- Escape to menu, back to previous menu, exit game
     KEY_CONFIRM:     int = arcade.key.SPACE     # <- Confirm play, confirm prompt, selection
@@ -51,6 +78,12 @@ class Keyboard_Mapping:
     KEY_ARROW_UP:    int = arcade.key.UP
     KEY_ARROW_DOWN:  int = arcade.key.DOWN
 
+    # Modifiers required by command (commands not listed are bound without modifiers):
+    key_modifier_index: dict[str, int] = field(default_factory = dict)
+
+    # Incremented on every remap (dispatch tables built from this mapping compare it):
+    mapping_version: int = 0
+
 
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -69,9 +102,16 @@ class Keyboard_Mapping:
 
         # Generating cached property list:
         cached_property_list: tuple[str, ...] = (
+            "key_command_list",
             "key_list",
             "key_user_list",
             "key_debug_list",
+            "key_debug_texture_list",
+            "key_debug_sort_list",
+            "key_debug_draw_list",
+            "key_debug_sweep_list",
+            "key_repeat_list",
+            "key_binding_index",
             )
         
         # Returning:
@@ -85,6 +125,24 @@ class Keyboard_Mapping:
     """
 
 
+    @cached_property
+    def key_command_list(self) -> tuple[str, ...]:
+        """
+        Names of all key mapping attributes (commands), in declaration order.
+
+        :return tuple[str, ...]: ...
+        """
+
+        # Acquiring command names (instance dictionary is not iterated, cached properties live there):
+        key_command_list: tuple[str, ...] = tuple(
+            field_object.name for field_object in fields(self)
+            if field_object.name.startswith(KEY_COMMAND_PREFIX)
+            )
+        
+        # Returning:
+        return key_command_list
+
+
     @cached_property
     def key_list(self) -> tuple[int, ...]:
         """
@@ -93,8 +151,8 @@ class Keyboard_Mapping:
 
         # Acquiring all recognized keys:
         key_list: tuple[int, ...] = tuple(
-            key_stored for key_stored in self.__dict__.values()
-            if key_stored is not None
+            getattr(self, key_command) for key_command in self.key_command_list
+            if getattr(self, key_command) is not None
             )
         
         # Returning:
@@ -109,8 +167,8 @@ class Keyboard_Mapping:
 
         # Acquiring all recognized keys:
         key_list: tuple[int, ...] = tuple(
-            key_stored for attribute_name, key_stored in self.__dict__.items()
-            if key_stored in self.key_list and "DEBUG" not in attribute_name
+            getattr(self, key_command) for key_command in self.key_command_list
+            if getattr(self, key_command) is not None and KEY_COMMAND_DEBUG_TAG not in key_command
             )
         
         # Returning:
@@ -125,8 +183,8 @@ class Keyboard_Mapping:
 
         # Acquiring all recognized keys:
         key_list: tuple[int, ...] = tuple(
-            key_stored for attribute_name, key_stored in self.__dict__.items()
-            if key_stored in self.key_list and "DEBUG" in attribute_name
+            getattr(self, key_command) for key_command in self.key_command_list
+            if getattr(self, key_command) is not None and KEY_COMMAND_DEBUG_TAG in key_command
             )
         
         # Returning:
@@ -202,6 +260,28 @@ class Keyboard_Mapping:
         return key_list
     
 
+    @cached_property
+    def key_repeat_list(self) -> tuple[int, ...]:
+        """
+        Keys that repeat while held down (other keys run their command once per press).
+
+        :return tuple[int, ...]: ...
+        """
+
+        # Collecting key list:
+        key_list: tuple[int, ...] = (
+            self.KEY_DEBUG_DRAW_CARD_PLAYER,
+            self.KEY_DEBUG_DRAW_CARD_OPPONENT,
+            self.KEY_ARROW_LEFT,
+            self.KEY_ARROW_RIGHT,
+            self.KEY_ARROW_UP,
+            self.KEY_ARROW_DOWN,
+            )
+        
+        # Returning:
+        return key_list
+    
+
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
     NORMAL KEY LISTS PROPERTIES BLOCK
@@ -210,3 +290,88 @@ class Keyboard_Mapping:
 
     ...
 
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    BINDING METHODS AND PROPERTIES BLOCK
+    
+    """
+
+
+    @cached_property
+    def key_binding_index(self) -> dict[tuple[int, int], str]:
+        """
+        Binding index, (key, modifiers) to command name. Built once and rebuilt after a remap.
+
+        :return dict[tuple[int, int], str]: ...
+        """
+
+        # Generating index (if two commands share a binding, the first declared one wins):
+        binding_index: dict[tuple[int, int], str] = {}
+        for key_command in self.key_command_list:
+            key_stored: int | None = getattr(self, key_command)
+            if key_stored is not None:
+                key_modifiers: int = self.key_modifier_index.get(key_command, KEY_MODIFIER_NONE)
+                binding_index.setdefault((key_stored, key_modifiers), key_command)
+        
+        # Returning:
+        return binding_index
+    
+
+    def find_command(self, key_pressed: int, key_modifiers: int = KEY_MODIFIER_NONE) -> str | None:
+        """
+        Finds command bound to key and modifiers. If there is no binding with the modifiers held,
+        binding without modifiers is used (e.g. shift does not block a plain command).
+
+        :param int key_pressed: ...
+        :param int key_modifiers: ...
+
+        :return str | None: Command name, or None if key is not bound.
+        """
+
+        # Looking up binding:
+        key_modifiers: int = key_modifiers & KEY_MODIFIER_MASK
+        key_command: str | None = self.key_binding_index.get((key_pressed, key_modifiers))
+        if key_command is None and key_modifiers != KEY_MODIFIER_NONE:
+            key_command: str | None = self.key_binding_index.get((key_pressed, KEY_MODIFIER_NONE))
+
+        # Returning:
+        return key_command
+    
+
+    def remap_key(self, 
+                  key_command: str, 
+                  key_pressed: int | None, 
+                  key_modifiers: int = KEY_MODIFIER_NONE
+                  ) -> None:
+        """
+        Binds command to another key (None unbinds it). Cached key lists and binding index are
+        cleared, mapping version is incremented.
+
+        :param str key_command: Key mapping attribute name, e.g. "KEY_SORT".
+        :param int | None key_pressed: ...
+        :param int key_modifiers: ...
+
+        :raise ValueError: if command is not recognized.
+        """
+
+        # Validating command:
+        if key_command not in self.key_command_list:
+            error_message: str = f"Unknown key command ({key_command=})."
+            raise ValueError(error_message)
+
+        # Updating binding:
+        setattr(self, key_command, key_pressed)
+        key_modifiers: int = key_modifiers & KEY_MODIFIER_MASK
+        if key_modifiers != KEY_MODIFIER_NONE:
+            self.key_modifier_index[key_command] = key_modifiers
+        else:
+            self.key_modifier_index.pop(key_command, None)
+
+        # Clearing cache:
+        clear_cached_property_list(
+            target_object = self,
+            target_attribute_list = self.__cached_key_list_property_list
+            )
+        self.mapping_version += 1
+
@@ -0,0 +1,379 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Dataclass import:
+from dataclasses import dataclass, field
+
+# Binary data import:
+import struct
+
+# Variables import:
+from game.variables import (
+
+    # Card variables:
+    CARD_ID_SUIT_ORDER,
+    CARD_ID_TYPE_ORDER,
+    CARD_ID_NOT_SET,
+
+    # Hand sort method variables:
+    HAND_SORT_METHOD_BY_VALUE,
+    HAND_SORT_METHOD_BY_VALUE_DEFAULT,
+    HAND_SORT_METHOD_BY_TIME_ADDED,
+    HAND_SORT_METHOD_BY_SUIT,
+    )
+
+# Settings import:
+from game.settings import (
+    TABLE_POSITION_RANGE,
+    TABLE_STACK_RANGE,
+    DECK_COPY_COUNT_MAX,
+    )
+
+# Scripts import:
+from game.scripts.beats import CARD_ID_COUNT
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SNAPSHOT FORMAT BLOCK
+
+"""
+
+
+# Snapshot format identifiers:
+SNAPSHOT_MAGIC: bytes = b"FOOL"
+SNAPSHOT_VERSION: int = 2                       # <- 2 stores deck copy count
+
+# Snapshot header (little-endian, no padding):
+#   magic, version, player flags, session flags, sort method, deck lowest value, deck shift,
+#   deck copy count, trump suit, deck count, hand one count, hand two count, discard count,
+#   name one size, name two size
+SNAPSHOT_HEADER: struct.Struct = struct.Struct("<4s14B")
+
+# Player flags:
+SNAPSHOT_FLAG_PLAYER_ONE_ACTIVE: int = 1 << 0
+SNAPSHOT_FLAG_PLAYER_ONE_ATTACKING: int = 1 << 1
+
+# Session flags (order matches session controller's enable flags):
+SNAPSHOT_SESSION_FLAG_LIST: tuple[str, ...] = (
+    "enable_autosort",
+    "enable_force_slide",
+    "enable_hint_hand_value",
+    "enable_hint_discard_value",
+    "enable_hint_slide_playable",
+    )
+
+# Sort methods (stored as index, never reorder):
+SNAPSHOT_SORT_METHOD_LIST: tuple[str, ...] = (
+    HAND_SORT_METHOD_BY_VALUE,
+    HAND_SORT_METHOD_BY_VALUE_DEFAULT,
+    HAND_SORT_METHOD_BY_TIME_ADDED,
+    HAND_SORT_METHOD_BY_SUIT,
+    )
+
+# Table section size (one byte per position and stack index):
+SNAPSHOT_TABLE_SIZE: int = len(TABLE_POSITION_RANGE) * len(TABLE_STACK_RANGE)
+
+# Card type values (card id type index plus shift, two is the lowest):
+SNAPSHOT_TYPE_VALUE_SHIFT: int = 2
+SNAPSHOT_TYPE_VALUE_RANGE: range = range(SNAPSHOT_TYPE_VALUE_SHIFT, SNAPSHOT_TYPE_VALUE_SHIFT + len(CARD_ID_TYPE_ORDER))
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SNAPSHOT DATACLASS OBJECT BLOCK
+
+"""
+
+
+@dataclass(frozen = True)
+class Game_Snapshot:
+    """
+    Complete game state as plain values. Cards are stored as card uids (card ids, see
+    convert_card_to_id, shifted by deck copy in multi-deck games), table as a flat tuple of position
+    and stack slots (CARD_ID_NOT_SET, if empty). Two player games only.
+    """
+
+    # Deck:
+    deck_trump:        str
+    deck_lowest_value: int
+    deck_shift:        int
+    deck_copy_count:   int
+    deck_id_list:      tuple[int, ...]
+
+    # Hands, table and discard:
+    hand_one_id_list: tuple[int, ...]
+    hand_two_id_list: tuple[int, ...]
+    table_id_list:    tuple[int, ...]
+    discard_id_list:  tuple[int, ...]
+
+    # Players:
+    player_one_active:    bool
+    player_one_attacking: bool
+    player_one_name:      str = ""
+    player_two_name:      str = ""
+
+    # Session options:
+    sort_method:        str = HAND_SORT_METHOD_BY_VALUE_DEFAULT
+    session_flag_index: dict[str, bool] = field(default_factory = dict)
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    ENCODE/DECODE METHODS BLOCK
+
+    """
+
+
+    def encode(self) -> bytes:
+        """
+        Encodes snapshot into versioned bytes: fixed header, card id sections (one byte per card),
+        table slots and UTF-8 player names.
+
+        :raise ValueError: if a value does not fit the format.
+
+        :return bytes: ...
+        """
+
+        # Packing flags:
+        player_flags: int = 0
+        if self.player_one_active:
+            player_flags |= SNAPSHOT_FLAG_PLAYER_ONE_ACTIVE
+        if self.player_one_attacking:
+            player_flags |= SNAPSHOT_FLAG_PLAYER_ONE_ATTACKING
+        session_flags: int = 0
+        for flag_index, flag_name in enumerate(SNAPSHOT_SESSION_FLAG_LIST):
+            if self.session_flag_index.get(flag_name, False):
+                session_flags |= 1 << flag_index
+
+        # Encoding names:
+        player_one_name: bytes = self.player_one_name.encode("utf-8")
+        player_two_name: bytes = self.player_two_name.encode("utf-8")
+
+        # Checking table size:
+        if len(self.table_id_list) != SNAPSHOT_TABLE_SIZE:
+            error_message: str = f"Table section must contain {SNAPSHOT_TABLE_SIZE} slots."
+            raise ValueError(error_message)
+
+        # Packing up (struct.error is raised as ValueError):
+        try:
+            snapshot_header: bytes = SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                player_flags,
+                session_flags,
+                SNAPSHOT_SORT_METHOD_LIST.index(self.sort_method),
+                self.deck_lowest_value,
+                self.deck_shift,
+                self.deck_copy_count,
+                CARD_ID_SUIT_ORDER.index(self.deck_trump),
+                len(self.deck_id_list),
+                len(self.hand_one_id_list),
+                len(self.hand_two_id_list),
+                len(self.discard_id_list),
+                len(player_one_name),
+                len(player_two_name),
+                )
+            snapshot_bytes: bytes = b"".join((
+                snapshot_header,
+                bytes(self.deck_id_list),
+                bytes(self.hand_one_id_list),
+                bytes(self.hand_two_id_list),
+                bytes(self.discard_id_list),
+                bytes(self.table_id_list),
+                player_one_name,
+                player_two_name,
+                ))
+        except struct.error as snapshot_error:
+            error_message: str = f"Unable to encode snapshot ({snapshot_error})."
+            raise ValueError(error_message)
+
+        # Returning:
+        return snapshot_bytes
+
+
+    @staticmethod
+    def decode(snapshot_bytes: bytes) -> Game_Snapshot:
+        """
+        TODO: Create a docstring.
+
+        :param bytes snapshot_bytes: ...
+
+        :raise ValueError: if data is not a snapshot, its version is not supported, its trump or
+            sort method is out of range, or its cards do not form a deck (see validate).
+
+        :return Game_Snapshot: ...
+        """
+
+        # Unpacking header:
+        if len(snapshot_bytes) < SNAPSHOT_HEADER.size:
+            error_message: str = f"Snapshot is too short ({len(snapshot_bytes)} bytes)."
+            raise ValueError(error_message)
+        (
+            snapshot_magic,
+            snapshot_version,
+            player_flags,
+            session_flags,
+            sort_method_index,
+            deck_lowest_value,
+            deck_shift,
+            deck_copy_count,
+            deck_trump_index,
+            deck_count,
+            hand_one_count,
+            hand_two_count,
+            discard_count,
+            player_one_name_size,
+            player_two_name_size,
+            ) = SNAPSHOT_HEADER.unpack_from(snapshot_bytes)
+
+        # Checking format:
+        if snapshot_magic != SNAPSHOT_MAGIC:
+            error_message: str = f"Data is not a game snapshot ({snapshot_magic=})."
+            raise ValueError(error_message)
+        if snapshot_version != SNAPSHOT_VERSION:
+            error_message: str = f"Snapshot version is not supported ({snapshot_version=})."
+            raise ValueError(error_message)
+        snapshot_size: int = int(
+            SNAPSHOT_HEADER.size + deck_count + hand_one_count + hand_two_count +
+            discard_count + SNAPSHOT_TABLE_SIZE + player_one_name_size + player_two_name_size
+            )
+        if len(snapshot_bytes) != snapshot_size:
+            error_message: str = f"Snapshot size mismatch ({len(snapshot_bytes)} != {snapshot_size})."
+            raise ValueError(error_message)
+        if deck_trump_index >= len(CARD_ID_SUIT_ORDER):
+            error_message: str = f"Snapshot trump is not recognized ({deck_trump_index=})."
+            raise ValueError(error_message)
+        if sort_method_index >= len(SNAPSHOT_SORT_METHOD_LIST):
+            error_message: str = f"Snapshot sort method is not recognized ({sort_method_index=})."
+            raise ValueError(error_message)
+
+        # Slicing sections:
+        section_view: memoryview = memoryview(snapshot_bytes)
+        section_offset: int = SNAPSHOT_HEADER.size
+        section_list: list[bytes] = []
+        section_size_list: tuple[int, ...] = (
+            deck_count,
+            hand_one_count,
+            hand_two_count,
+            discard_count,
+            SNAPSHOT_TABLE_SIZE,
+            player_one_name_size,
+            player_two_name_size,
+            )
+        for section_size in section_size_list:
+            section_list.append(
+                section_view[section_offset:section_offset + section_size].tobytes()
+                )
+            section_offset += section_size
+
+        # Creating snapshot:
+        game_snapshot: Game_Snapshot = Game_Snapshot(
+            deck_trump = CARD_ID_SUIT_ORDER[deck_trump_index],
+            deck_lowest_value = deck_lowest_value,
+            deck_shift = deck_shift,
+            deck_copy_count = deck_copy_count,
+            deck_id_list = tuple(section_list[0]),
+            hand_one_id_list = tuple(section_list[1]),
+            hand_two_id_list = tuple(section_list[2]),
+            discard_id_list = tuple(section_list[3]),
+            table_id_list = tuple(section_list[4]),
+            player_one_active = bool(player_flags & SNAPSHOT_FLAG_PLAYER_ONE_ACTIVE),
+            player_one_attacking = bool(player_flags & SNAPSHOT_FLAG_PLAYER_ONE_ATTACKING),
+            player_one_name = section_list[5].decode("utf-8"),
+            player_two_name = section_list[6].decode("utf-8"),
+            sort_method = SNAPSHOT_SORT_METHOD_LIST[sort_method_index],
+            session_flag_index = {
+                flag_name: bool(session_flags & (1 << flag_index))
+                for flag_index, flag_name in enumerate(SNAPSHOT_SESSION_FLAG_LIST)
+                },
+            )
+        game_snapshot.validate()
+
+        # Returning:
+        return game_snapshot
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    VALIDATION METHODS BLOCK
+
+    """
+
+
+    def validate(self) -> None:
+        """
+        Checks that cards form exactly one deck: section total matches deck size of lowest value
+        times deck copy count, every card uid belongs to that deck, and no card is stored twice.
+
+        :raise ValueError: on the first problem found.
+        """
+
+        # Checking lowest value and deck copies:
+        if self.deck_lowest_value not in SNAPSHOT_TYPE_VALUE_RANGE:
+            error_message: str = f"Snapshot lowest value is out of range ({self.deck_lowest_value=})."
+            raise ValueError(error_message)
+        if self.deck_copy_count not in range(1, DECK_COPY_COUNT_MAX + 1):
+            error_message: str = f"Snapshot deck copy count is out of range ({self.deck_copy_count=})."
+            raise ValueError(error_message)
+
+        # Collecting cards (table slots may be empty):
+        card_uid_list: list[int] = [
+            *self.deck_id_list,
+            *self.hand_one_id_list,
+            *self.hand_two_id_list,
+            *self.discard_id_list,
+            *(card_uid for card_uid in self.table_id_list if card_uid != CARD_ID_NOT_SET),
+            ]
+
+        # Checking card count (every deck copy):
+        type_index_lowest: int = self.deck_lowest_value - SNAPSHOT_TYPE_VALUE_SHIFT
+        deck_size: int = len(CARD_ID_SUIT_ORDER) * (len(CARD_ID_TYPE_ORDER) - type_index_lowest)
+        if len(card_uid_list) != deck_size * self.deck_copy_count:
+            error_message: str = (
+                f"Snapshot card count does not match deck size "
+                f"({len(card_uid_list)=}, {deck_size=}, {self.deck_copy_count=})."
+                )
+            raise ValueError(error_message)
+
+        # Checking card uids (in range, in deck, once each):
+        card_uid_set: set[int] = set()
+        for card_uid in card_uid_list:
+            card_in_deck: bool = bool(
+                card_uid < CARD_ID_COUNT * self.deck_copy_count and
+                card_uid % len(CARD_ID_TYPE_ORDER) >= type_index_lowest
+                )
+            if not card_in_deck:
+                error_message: str = f"Snapshot card is not in deck ({card_uid=})."
+                raise ValueError(error_message)
+            if card_uid in card_uid_set:
+                error_message: str = f"Snapshot card is stored twice ({card_uid=})."
+                raise ValueError(error_message)
+            card_uid_set.add(card_uid)
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TABLE METHODS BLOCK
+
+    """
+
+
+    @property
+    def table_map_id(self) -> dict[int, dict[int, int | None]]:
+        """
+        Table slots in the same layout as table controller's table map.
+
+        :return dict[int, dict[int, int | None]]: ...
+        """
+
+        # Unflattening table slots:
+        table_map_id: dict[int, dict[int, int | None]] = {}
+        for position_index in TABLE_POSITION_RANGE:
+            table_map_id[position_index] = {}
+            for stack_index in TABLE_STACK_RANGE:
+                card_id: int = self.table_id_list[position_index * len(TABLE_STACK_RANGE) + stack_index]
+                table_map_id[position_index][stack_index] = None if card_id == CARD_ID_NOT_SET else card_id
+
+        # Returning:
+        return table_map_id
@@ -0,0 +1,683 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Random import (Zobrist keys):
+import random
+
+# Variables import:
+from game.variables import (
+
+    # Card identifier variables:
+    CARD_ID_SUIT_ORDER,
+    CARD_ID_NOT_SET,
+
+    # Action variables (shared with the server):
+    SERVER_ACTION_ATTACK,
+    SERVER_ACTION_DEFEND,
+    SERVER_ACTION_TAKE,
+    SERVER_ACTION_DISCARD,
+    )
+
+# Settings import:
+from game.settings import (
+    TABLE_POSITION_MAX,
+    TABLE_STACK_BOTTOM_INDEX,
+    TABLE_STACK_TOP_INDEX,
+    SOLVER_TABLE_SIZE_POWER,
+    SOLVER_NODE_LIMIT,
+    SOLVER_ZOBRIST_SEED,
+    )
+
+# Collections import:
+from game.collections.state import (
+    Game_State,
+    State_Move,
+    STATE_TYPE_COUNT,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SOLVER SETTINGS BLOCK
+
+"""
+
+
+# Score values (from the point of view of the player to move):
+SOLVER_SCORE_WIN: int = 1
+SOLVER_SCORE_DRAW: int = 0
+SOLVER_SCORE_LOSS: int = -1
+
+# Card masks:
+SOLVER_SUIT_COUNT: int = len(CARD_ID_SUIT_ORDER)
+SOLVER_CARD_COUNT: int = SOLVER_SUIT_COUNT * STATE_TYPE_COUNT
+SOLVER_TYPE_MASK: int = (1 << STATE_TYPE_COUNT) - 1
+SOLVER_TYPE_SPREAD: int = sum(1 << (suit_index * STATE_TYPE_COUNT) for suit_index in range(SOLVER_SUIT_COUNT))
+
+# Card location indexes (Zobrist key rows), hands are rows 0 and 1 (player index):
+SOLVER_LOCATION_OPEN: int = 2                   # <- Attacking card, not defended yet
+SOLVER_LOCATION_COVERED: int = 3                # <- Attacking card, defended
+SOLVER_LOCATION_TOP: int = 4                    # <- Defending card
+SOLVER_LOCATION_COUNT: int = 5
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATE SOLVER CLASS OBJECT BLOCK
+
+"""
+
+
+class State_Solver:
+    """
+    Exact endgame solver. Once the deck is empty, both hands are known (every card is either in a
+    hand, on the table or in discard), and the game can be solved to the end: alpha-beta (negamax,
+    every move passes the turn) over attack, defend, take and discard moves, with win, draw and
+    loss scores.
+
+    Positions are packed into card masks (hands, attacking cards open and covered, defending cards)
+    and hashed with Zobrist keys, updated incrementally by every move. Results are kept as score
+    bounds in a fixed-size transposition table (always replaced), keyed by the hash. Trump suit is a
+    part of the hash, so table entries stay valid between solves and games.
+
+    Discard is not a part of the position (with an empty deck it is every other card), pairs on the
+    table are not either (covered attacks only matter for attack types).
+    """
+
+    def __init__(self,
+                 table_size_power: int = SOLVER_TABLE_SIZE_POWER,
+                 node_limit: int = SOLVER_NODE_LIMIT
+                 ) -> None:
+
+        # Transposition table (entries are (hash, score lower bound, score upper bound, best move index)):
+        self.__table_mask: int = (1 << table_size_power) - 1
+        self.__table_entry_list: list[tuple[int, int, int, int] | None] = [None] * (1 << table_size_power)
+
+        # Zobrist keys (card per location, roles of player two, trump suit):
+        zobrist_random: random.Random = random.Random(SOLVER_ZOBRIST_SEED)
+        self.__zobrist_card_map: tuple[tuple[int, ...], ...] = tuple(
+            tuple(zobrist_random.getrandbits(64) for _ in range(SOLVER_CARD_COUNT))
+            for _ in range(SOLVER_LOCATION_COUNT)
+            )
+        self.__zobrist_attacking: int = zobrist_random.getrandbits(64)
+        self.__zobrist_active: int = zobrist_random.getrandbits(64)
+        self.__zobrist_trump_list: tuple[int, ...] = tuple(
+            zobrist_random.getrandbits(64) for _ in range(SOLVER_SUIT_COUNT)
+            )
+
+        # Trump (beats masks are rebuilt, if trump changes):
+        self.__trump_index: int | None = None
+        self.__trump_mask: int = 0
+        self.__beats_mask_list: list[int] = [0] * SOLVER_CARD_COUNT
+
+        # Search statistics (last solve):
+        self.__node_limit: int = node_limit
+        self.__node_count: int = 0
+        self.__table_hit_count: int = 0
+        self.__search_aborted: bool = False
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SOLVER PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def node_count(self) -> int:
+        """
+        Positions searched by the last solve.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__node_count
+
+
+    @property
+    def table_hit_count(self) -> int:
+        """
+        Transposition table entries found by the last solve.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__table_hit_count
+
+
+    @property
+    def search_aborted(self) -> bool:
+        """
+        Last solve reached the node limit (no result).
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return self.__search_aborted
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SOLVE METHODS BLOCK
+
+    """
+
+
+    def solve(self, game_state: Game_State) -> int | None:
+        """
+        Solves the position for the active player.
+
+        :param Game_State game_state: State with an empty deck.
+
+        :raise ValueError: if deck is not empty.
+
+        :return int: SOLVER_SCORE_WIN, SOLVER_SCORE_DRAW or SOLVER_SCORE_LOSS.
+        :return None: if node limit was reached.
+        """
+
+        # Solving:
+        solve_score, _ = self.__solve_root(game_state)
+
+        # Returning:
+        return solve_score
+
+
+    def find_move(self, game_state: Game_State) -> State_Move | None:
+        """
+        Finds the best move of the active player (first one found, if several are as good).
+
+        :param Game_State game_state: State with an empty deck.
+
+        :raise ValueError: if deck is not empty.
+
+        :return State_Move: ...
+        :return None: if state is terminal, or node limit was reached.
+        """
+
+        # Solving:
+        _, state_move = self.__solve_root(game_state)
+
+        # Returning:
+        return state_move
+
+
+    def clear_table(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Clearing entries:
+        self.__table_entry_list[:] = [None] * len(self.__table_entry_list)
+
+
+    def __solve_root(self, game_state: Game_State) -> tuple[int | None, State_Move | None]:
+        """
+        Searches root moves one by one (to keep the best one), first for a winning move, then for a
+        drawing one. Any move loses otherwise (first one is returned).
+
+        :param Game_State game_state: ...
+
+        :raise ValueError: if deck is not empty.
+
+        :return tuple[int | None, State_Move | None]: Score and move, both None if aborted.
+        """
+
+        # Validating deck:
+        if game_state.deck_count > 0:
+            error_message: str = f"Endgame solver expects an empty deck ({game_state.deck_count=})."
+            raise ValueError(error_message)
+
+        # Packing state:
+        self.__update_trump(game_state.deck_trump_index)
+        self.__node_count: int = 0
+        self.__table_hit_count: int = 0
+        self.__search_aborted: bool = False
+        root_position: tuple[int, ...] = self.__create_position(game_state)
+
+        # Evaluating terminal state:
+        solve_score: int | None = self.__evaluate_terminal(*root_position[:7])
+        state_move: State_Move | None = None
+        if solve_score is not None:
+            return solve_score, state_move
+
+        # Searching root moves with null windows (is there a winning move, is there a drawing one):
+        child_list: list[tuple[tuple[str, int, int], tuple[int, ...]]] = self.__create_child_list(*root_position)
+        solve_score: int = SOLVER_SCORE_LOSS
+        state_move: State_Move = self.__create_move(game_state, child_list[0][0])
+        for score_test in (SOLVER_SCORE_WIN, SOLVER_SCORE_DRAW):
+            for move_key, child_position in child_list:
+                child_score: int = -self.__search(*child_position, -score_test, 1 - score_test)
+                if self.__search_aborted:
+                    return None, None
+                if child_score >= score_test:
+                    solve_score: int = score_test
+                    state_move: State_Move = self.__create_move(game_state, move_key)
+                    break
+            if solve_score > SOLVER_SCORE_LOSS:
+                break
+
+        # Returning:
+        return solve_score, state_move
+
+
+    def __search(self,
+                 hand_mask_0: int,
+                 hand_mask_1: int,
+                 open_mask: int,
+                 covered_mask: int,
+                 top_mask: int,
+                 player_attacking: int,
+                 player_active: int,
+                 state_hash: int,
+                 score_alpha: int,
+                 score_beta: int
+                 ) -> int:
+        """
+        Alpha-beta search (negamax), score is from the point of view of the active player.
+
+        :return int: ...
+        """
+
+        # Counting nodes (giving up past the limit):
+        self.__node_count += 1
+        if self.__node_count > self.__node_limit:
+            self.__search_aborted: bool = True
+            return SOLVER_SCORE_DRAW
+
+        # Evaluating terminal position (see __evaluate_terminal, inlined):
+        if not (open_mask or covered_mask or top_mask) and not (hand_mask_0 and hand_mask_1):
+            if hand_mask_0 == hand_mask_1:
+                return SOLVER_SCORE_DRAW
+            if (hand_mask_0 if player_active == 0 else hand_mask_1) == 0:
+                return SOLVER_SCORE_WIN
+            return SOLVER_SCORE_LOSS
+
+        # Probing transposition table (narrowing the window):
+        entry_index: int = state_hash & self.__table_mask
+        table_entry: tuple[int, int, int, int] | None = self.__table_entry_list[entry_index]
+        score_lower: int = SOLVER_SCORE_LOSS
+        score_upper: int = SOLVER_SCORE_WIN
+        table_move_index: int = 0
+        if table_entry is not None and table_entry[0] == state_hash:
+            self.__table_hit_count += 1
+            _, score_lower, score_upper, table_move_index = table_entry
+            if score_lower >= score_beta:
+                return score_lower
+            if score_upper <= score_alpha:
+                return score_upper
+            score_alpha: int = max(score_alpha, score_lower)
+            score_beta: int = min(score_beta, score_upper)
+
+        # Ordering moves (best move found before goes first):
+        child_list: list[tuple[tuple[str, int, int], tuple[int, ...]]] = self.__create_child_list(
+            hand_mask_0, hand_mask_1, open_mask, covered_mask, top_mask,
+            player_attacking, player_active, state_hash
+            )
+        if table_move_index > 0:
+            child_list[0], child_list[table_move_index] = child_list[table_move_index], child_list[0]
+
+        # Searching moves (every move passes the turn to the other player):
+        window_alpha: int = score_alpha
+        best_score: int = SOLVER_SCORE_LOSS - 1
+        best_move_index: int = table_move_index
+        for child_index, (_, child_position) in enumerate(child_list):
+            child_score: int = -self.__search(*child_position, -score_beta, -score_alpha)
+            if self.__search_aborted:
+                return SOLVER_SCORE_DRAW
+            if child_score > best_score:
+                best_score: int = child_score
+                best_move_index: int = (        # <- Index in generated order (undoing the swap)
+                    table_move_index if child_index == 0 else 0 if child_index == table_move_index else child_index
+                    )
+                if best_score > score_alpha:
+                    score_alpha: int = best_score
+                    if score_alpha >= score_beta:
+                        break
+
+        # Stuck (never happens in positions reached by legal moves):
+        if best_score < SOLVER_SCORE_LOSS:
+            best_score: int = SOLVER_SCORE_DRAW
+
+        # Storing bounds (merged with the ones already known):
+        if best_score >= score_beta:
+            score_lower: int = max(score_lower, best_score)
+        elif best_score <= window_alpha:
+            score_upper: int = min(score_upper, best_score)
+        else:
+            score_lower: int = best_score
+            score_upper: int = best_score
+        self.__table_entry_list[entry_index] = (state_hash, score_lower, score_upper, best_move_index)
+
+        # Returning:
+        return best_score
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    POSITION METHODS BLOCK
+
+    """
+
+
+    def __update_trump(self, trump_index: int) -> None:
+        """
+        Rebuilds beats masks (cards beating a card) for a new trump suit.
+
+        :param int trump_index: ...
+        """
+
+        # Skipping, if trump has not changed:
+        if trump_index == self.__trump_index:
+            return
+
+        # Rebuilding masks (same rule as Game_State.card_beats):
+        self.__trump_index: int = trump_index
+        self.__trump_mask: int = SOLVER_TYPE_MASK << (trump_index * STATE_TYPE_COUNT)
+        for card_id in range(SOLVER_CARD_COUNT):
+            card_suit, card_type = divmod(card_id, STATE_TYPE_COUNT)
+            beats_mask: int = (SOLVER_TYPE_MASK << (card_type + 1)) & SOLVER_TYPE_MASK
+            beats_mask <<= card_suit * STATE_TYPE_COUNT
+            if card_suit != trump_index:
+                beats_mask |= self.__trump_mask
+            self.__beats_mask_list[card_id] = beats_mask
+
+
+    def __create_position(self, game_state: Game_State) -> tuple[int, ...]:
+        """
+        Packs game state into search arguments and hashes it from scratch.
+
+        :param Game_State game_state: ...
+
+        :return tuple[int, ...]: Hands, table masks, roles and hash.
+        """
+
+        # Packing table:
+        open_mask: int = 0
+        covered_mask: int = 0
+        top_mask: int = 0
+        for table_pair in game_state.table_list:
+            card_id_top: int = table_pair[TABLE_STACK_TOP_INDEX]
+            if card_id_top == CARD_ID_NOT_SET:
+                open_mask |= 1 << table_pair[TABLE_STACK_BOTTOM_INDEX]
+            else:
+                covered_mask |= 1 << table_pair[TABLE_STACK_BOTTOM_INDEX]
+                top_mask |= 1 << card_id_top
+
+        # Hashing:
+        state_hash: int = self.__zobrist_trump_list[game_state.deck_trump_index]
+        location_mask_list: tuple[int, ...] = (
+            game_state.hand_mask_list[0],
+            game_state.hand_mask_list[1],
+            open_mask,
+            covered_mask,
+            top_mask,
+            )
+        for location_index, location_mask in enumerate(location_mask_list):
+            state_hash ^= self.__hash_mask(location_index, location_mask)
+        if game_state.player_attacking == 1:
+            state_hash ^= self.__zobrist_attacking
+        if game_state.player_active == 1:
+            state_hash ^= self.__zobrist_active
+
+        # Packing up:
+        root_position: tuple[int, ...] = (
+            game_state.hand_mask_list[0],
+            game_state.hand_mask_list[1],
+            open_mask,
+            covered_mask,
+            top_mask,
+            game_state.player_attacking,
+            game_state.player_active,
+            state_hash,
+            )
+
+        # Returning:
+        return root_position
+
+
+    def __hash_mask(self, location_index: int, card_mask: int) -> int:
+        """
+        XOR of Zobrist keys of every card in mask, at location.
+
+        :param int location_index: ...
+        :param int card_mask: ...
+
+        :return int: ...
+        """
+
+        # Hashing set bits:
+        zobrist_card_list: tuple[int, ...] = self.__zobrist_card_map[location_index]
+        mask_hash: int = 0
+        while card_mask:
+            card_bit: int = card_mask & -card_mask
+            mask_hash ^= zobrist_card_list[card_bit.bit_length() - 1]
+            card_mask ^= card_bit
+
+        # Returning:
+        return mask_hash
+
+
+    @staticmethod
+    def __evaluate_terminal(hand_mask_0: int,
+                            hand_mask_1: int,
+                            open_mask: int,
+                            covered_mask: int,
+                            top_mask: int,
+                            player_attacking: int,
+                            player_active: int
+                            ) -> int | None:
+        """
+        Game ends when the table is empty and someone has no cards left (see Game_State.winner).
+
+        :return int: Score of the active player.
+        :return None: if position is not terminal.
+        """
+
+        # Evaluating:
+        terminal_score: int | None = None
+        if not (open_mask or covered_mask or top_mask) and not (hand_mask_0 and hand_mask_1):
+            if hand_mask_0 == hand_mask_1:
+                terminal_score: int = SOLVER_SCORE_DRAW
+            elif (hand_mask_0 if player_active == 0 else hand_mask_1) == 0:
+                terminal_score: int = SOLVER_SCORE_WIN
+            else:
+                terminal_score: int = SOLVER_SCORE_LOSS
+
+        # Returning:
+        return terminal_score
+
+
+    def __create_child_list(self,
+                            hand_mask_0: int,
+                            hand_mask_1: int,
+                            open_mask: int,
+                            covered_mask: int,
+                            top_mask: int,
+                            player_attacking: int,
+                            player_active: int,
+                            state_hash: int
+                            ) -> list[tuple[tuple[str, int, int], tuple[int, ...]]]:
+        """
+        Legal moves (same rules as Game_State.legal_move_list) with their positions. Ordered for
+        early cutoffs: discarding first, then cards from the cheapest (lowest types of other suits
+        before trumps), taking last.
+
+        :return list[tuple[tuple[str, int, int], tuple[int, ...]]]: Move keys (action, card id,
+            attacking card id) and positions.
+        """
+
+        # Preparing values:
+        child_list: list[tuple[tuple[str, int, int], tuple[int, ...]]] = []
+        zobrist_card_map: tuple[tuple[int, ...], ...] = self.__zobrist_card_map
+        zobrist_hand_list: tuple[int, ...] = zobrist_card_map[player_active]
+        hand_mask: int = hand_mask_0 if player_active == 0 else hand_mask_1
+        table_mask: int = open_mask | covered_mask | top_mask
+        player_other: int = 1 - player_active
+        state_hash_turn: int = state_hash ^ self.__zobrist_active
+        trump_mask: int = self.__trump_mask
+
+        # Attacking (any card on empty table, matching types otherwise):
+        if player_active == player_attacking:
+            hand_mask_defending: int = hand_mask_1 if player_active == 0 else hand_mask_0
+            attack_allowed: bool = bool(
+                (open_mask | covered_mask).bit_count() < TABLE_POSITION_MAX and
+                open_mask.bit_count() < hand_mask_defending.bit_count()
+                )
+            if attack_allowed:
+                attack_mask: int = hand_mask
+                if table_mask:
+                    table_type_mask: int = 0
+                    for suit_index in range(SOLVER_SUIT_COUNT):
+                        table_type_mask |= table_mask >> (suit_index * STATE_TYPE_COUNT)
+                    attack_mask &= (table_type_mask & SOLVER_TYPE_MASK) * SOLVER_TYPE_SPREAD
+                zobrist_open_list: tuple[int, ...] = zobrist_card_map[SOLVER_LOCATION_OPEN]
+                for card_mask_suit in (attack_mask & ~trump_mask, attack_mask & trump_mask):
+
+                    # Ordering by type (lowest first, across suits):
+                    type_mask: int = 0
+                    for suit_index in range(SOLVER_SUIT_COUNT):
+                        type_mask |= card_mask_suit >> (suit_index * STATE_TYPE_COUNT)
+                    type_mask &= SOLVER_TYPE_MASK
+                    while type_mask:
+                        type_bit: int = type_mask & -type_mask
+                        type_mask ^= type_bit
+                        card_mask: int = card_mask_suit & (type_bit * SOLVER_TYPE_SPREAD)
+                        while card_mask:
+                            card_bit: int = card_mask & -card_mask
+                            card_mask ^= card_bit
+                            card_id: int = card_bit.bit_length() - 1
+                            child_list.append((
+                                (SERVER_ACTION_ATTACK, card_id, CARD_ID_NOT_SET),
+                                (
+                                    hand_mask_0 ^ card_bit if player_active == 0 else hand_mask_0,
+                                    hand_mask_1 ^ card_bit if player_active == 1 else hand_mask_1,
+                                    open_mask | card_bit,
+                                    covered_mask,
+                                    top_mask,
+                                    player_attacking,
+                                    player_other,
+                                    state_hash_turn ^ zobrist_hand_list[card_id] ^ zobrist_open_list[card_id],
+                                    ),
+                                ))
+
+            # Ending the round (all attacks defended, defender attacks next), tried first:
+            if table_mask and not open_mask:
+                child_list.insert(0, (
+                    (SERVER_ACTION_DISCARD, CARD_ID_NOT_SET, CARD_ID_NOT_SET),
+                    (
+                        hand_mask_0,
+                        hand_mask_1,
+                        0,
+                        0,
+                        0,
+                        player_other,
+                        player_other,
+                        state_hash_turn ^ self.__zobrist_attacking ^ self.__hash_table(
+                            covered_mask, top_mask
+                            ),
+                        ),
+                    ))
+
+        # Defending:
+        elif open_mask:
+            zobrist_open_list: tuple[int, ...] = zobrist_card_map[SOLVER_LOCATION_OPEN]
+            zobrist_covered_list: tuple[int, ...] = zobrist_card_map[SOLVER_LOCATION_COVERED]
+            zobrist_top_list: tuple[int, ...] = zobrist_card_map[SOLVER_LOCATION_TOP]
+            open_mask_left: int = open_mask
+            while open_mask_left:
+                attack_bit: int = open_mask_left & -open_mask_left
+                open_mask_left ^= attack_bit
+                attack_id: int = attack_bit.bit_length() - 1
+                state_hash_attack: int = (
+                    state_hash_turn ^ zobrist_open_list[attack_id] ^ zobrist_covered_list[attack_id]
+                    )
+                defend_mask: int = hand_mask & self.__beats_mask_list[attack_id]
+                for card_mask in (defend_mask & ~trump_mask, defend_mask & trump_mask):
+                    while card_mask:
+                        card_bit: int = card_mask & -card_mask
+                        card_mask ^= card_bit
+                        card_id: int = card_bit.bit_length() - 1
+                        child_list.append((
+                            (SERVER_ACTION_DEFEND, card_id, attack_id),
+                            (
+                                hand_mask_0 ^ card_bit if player_active == 0 else hand_mask_0,
+                                hand_mask_1 ^ card_bit if player_active == 1 else hand_mask_1,
+                                open_mask ^ attack_bit,
+                                covered_mask | attack_bit,
+                                top_mask | card_bit,
+                                player_attacking,
+                                player_other,
+                                state_hash_attack ^ zobrist_hand_list[card_id] ^ zobrist_top_list[card_id],
+                                ),
+                            ))
+
+            # Taking (attacker keeps attacking):
+            child_list.append((
+                (SERVER_ACTION_TAKE, CARD_ID_NOT_SET, CARD_ID_NOT_SET),
+                (
+                    hand_mask_0 | table_mask if player_active == 0 else hand_mask_0,
+                    hand_mask_1 | table_mask if player_active == 1 else hand_mask_1,
+                    0,
+                    0,
+                    0,
+                    player_attacking,
+                    player_other,
+                    state_hash_turn ^ self.__hash_table(covered_mask, top_mask, open_mask) ^ self.__hash_mask(
+                        player_active, table_mask
+                        ),
+                    ),
+                ))
+
+        # Returning:
+        return child_list
+
+
+    def __hash_table(self, covered_mask: int, top_mask: int, open_mask: int = 0) -> int:
+        """
+        XOR of Zobrist keys of every card on the table.
+
+        :param int covered_mask: ...
+        :param int top_mask: ...
+        :param int open_mask: ...
+
+        :return int: ...
+        """
+
+        # Returning:
+        return (
+            self.__hash_mask(SOLVER_LOCATION_OPEN, open_mask) ^
+            self.__hash_mask(SOLVER_LOCATION_COVERED, covered_mask) ^
+            self.__hash_mask(SOLVER_LOCATION_TOP, top_mask)
+            )
+
+
+    @staticmethod
+    def __create_move(game_state: Game_State, move_key: tuple[str, int, int]) -> State_Move:
+        """
+        Converts a move key into a state move (defending move gets the attacking card position).
+
+        :param Game_State game_state: ...
+        :param tuple[str, int, int] move_key: ...
+
+        :return State_Move: ...
+        """
+
+        # Converting:
+        action, card_id, attack_id = move_key
+        if action == SERVER_ACTION_DEFEND:
+            position_index: int = next(
+                position_index for position_index, table_pair in enumerate(game_state.table_list)
+                if table_pair[TABLE_STACK_BOTTOM_INDEX] == attack_id
+                )
+            state_move: State_Move = State_Move(action, card_id, position_index)
+        elif action == SERVER_ACTION_ATTACK:
+            state_move: State_Move = State_Move(action, card_id)
+        else:
+            state_move: State_Move = State_Move(action)
+
+        # Returning:
+        return state_move
@@ -0,0 +1,615 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Dataclass import:
+from dataclasses import dataclass
+
+# Random import:
+import random
+
+# Variables import:
+from game.variables import (
+
+    # Card identifier variables:
+    CARD_ID_SUIT_ORDER,
+    CARD_ID_TYPE_ORDER,
+    CARD_ID_NOT_SET,
+
+    # Action variables (shared with the server):
+    SERVER_ACTION_ATTACK,
+    SERVER_ACTION_DEFEND,
+    SERVER_ACTION_TAKE,
+    SERVER_ACTION_DISCARD,
+    )
+
+# Settings import:
+from game.settings import (
+    HAND_CARD_COUNT_DEFAULT,
+    TABLE_POSITION_MAX,
+    TABLE_STACK_BOTTOM_INDEX,
+    TABLE_STACK_TOP_INDEX,
+    )
+
+# Collections import:
+from game.collections.snapshot import Game_Snapshot
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATE SETTINGS BLOCK
+
+"""
+
+
+# Card id layout (see convert_card_to_id):
+STATE_TYPE_COUNT: int = len(CARD_ID_TYPE_ORDER)
+STATE_TYPE_VALUE_SHIFT: int = 2                 # <- Value of the first type in order (two)
+
+# Winner values:
+STATE_WINNER_DRAW: int = -1
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STATE MOVE DATACLASS OBJECT BLOCK
+
+"""
+
+
+@dataclass(frozen = True, slots = True)
+class State_Move:
+
+    # Move attributes (card id and position are not used by take and discard):
+    action:         str
+    card_id:        int = CARD_ID_NOT_SET
+    position_index: int = -1
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+GAME STATE DATACLASS OBJECT BLOCK
+
+"""
+
+
+@dataclass(frozen = True, slots = True)
+class Game_State:
+    """
+    Immutable game state for lookahead. Cloning is free (states are never mutated), applying a move
+    creates a new state that shares everything it did not change with its parent:
+
+    - deck order is one shared tuple, drawing only advances deck_index;
+    - hands and discard are integer bitmasks of card ids;
+    - table is a tuple of (attacking card id, defending card id) pairs.
+
+    Players are referred to by index: 0 for player one, 1 for player two.
+    """
+
+    # Deck:
+    deck_trump_index: int
+    deck_id_list:     tuple[int, ...]
+    deck_index:       int
+
+    # Hands, table and discard:
+    hand_mask_list: tuple[int, int]
+    table_list:     tuple[tuple[int, int], ...]
+    discard_mask:   int
+
+    # Players:
+    player_attacking: int
+    player_active:    int
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CARD METHODS BLOCK
+
+    """
+
+
+    @staticmethod
+    def iterate_mask(card_mask: int) -> list[int]:
+        """
+        TODO: Create a docstring.
+
+        :param int card_mask: ...
+
+        :return list[int]: Card ids in ascending order.
+        """
+
+        # Collecting set bits:
+        card_id_list: list[int] = []
+        while card_mask:
+            card_bit: int = card_mask & -card_mask
+            card_id_list.append(card_bit.bit_length() - 1)
+            card_mask ^= card_bit
+
+        # Returning:
+        return card_id_list
+
+
+    def card_beats(self, card_id: int, card_id_table: int) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :param int card_id: Defending card.
+        :param int card_id_table: Attacking card.
+
+        :return bool: ...
+        """
+
+        # Comparing suits and types:
+        card_suit, card_type = divmod(card_id, STATE_TYPE_COUNT)
+        table_suit, table_type = divmod(card_id_table, STATE_TYPE_COUNT)
+        card_beats: bool = bool(
+            (card_suit == table_suit and card_type > table_type) or
+            (card_suit == self.deck_trump_index and table_suit != self.deck_trump_index)
+            )
+
+        # Returning:
+        return card_beats
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    STATE PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def deck_count(self) -> int:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return len(self.deck_id_list) - self.deck_index
+
+
+    @property
+    def player_defending(self) -> int:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return 1 - self.player_attacking
+
+
+    def hand_count(self, player_index: int) -> int:
+        """
+        TODO: Create a docstring.
+
+        :param int player_index: ...
+        """
+
+        # Returning:
+        return self.hand_mask_list[player_index].bit_count()
+
+
+    @property
+    def table_undefended_list(self) -> list[int]:
+        """
+        TODO: Create a docstring.
+
+        :return list[int]: Table positions with attacking card only.
+        """
+
+        # Returning:
+        return [
+            position_index for position_index, table_pair in enumerate(self.table_list)
+            if table_pair[TABLE_STACK_TOP_INDEX] == CARD_ID_NOT_SET
+            ]
+
+
+    @property
+    def table_type_mask(self) -> int:
+        """
+        Card types present on the table (bit per type index), attacks must match one of them.
+
+        :return int: ...
+        """
+
+        # Collecting types:
+        table_type_mask: int = 0
+        for table_pair in self.table_list:
+            for card_id in table_pair:
+                if card_id != CARD_ID_NOT_SET:
+                    table_type_mask |= 1 << (card_id % STATE_TYPE_COUNT)
+
+        # Returning:
+        return table_type_mask
+
+
+    @property
+    def state_terminal(self) -> bool:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Game ends when the deck and table are empty and someone has no cards left:
+        state_terminal: bool = bool(
+            self.deck_count == 0 and
+            len(self.table_list) == 0 and
+            (self.hand_mask_list[0] == 0 or self.hand_mask_list[1] == 0)
+            )
+
+        # Returning:
+        return state_terminal
+
+
+    @property
+    def winner(self) -> int | None:
+        """
+        TODO: Create a docstring.
+
+        :return int: Index of player without cards, or STATE_WINNER_DRAW.
+        :return None: if game is not finished.
+        """
+
+        # Selecting winner:
+        winner: int | None = None
+        if self.state_terminal:
+            if self.hand_mask_list[0] == 0 and self.hand_mask_list[1] == 0:
+                winner: int = STATE_WINNER_DRAW
+            elif self.hand_mask_list[0] == 0:
+                winner: int = 0
+            else:
+                winner: int = 1
+
+        # Returning:
+        return winner
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    MOVE METHODS BLOCK
+
+    """
+
+
+    def legal_move_list(self) -> list[State_Move]:
+        """
+        Moves available to the active player.
+
+        :return list[State_Move]: ...
+        """
+
+        # Preparing containers:
+        legal_move_list: list[State_Move] = []
+        if self.state_terminal:
+            return legal_move_list
+        hand_mask: int = self.hand_mask_list[self.player_active]
+        table_undefended_list: list[int] = self.table_undefended_list
+
+        # Attacking moves (any card on empty table, matching types otherwise):
+        if self.player_active == self.player_attacking:
+            attack_allowed: bool = bool(
+                len(self.table_list) < TABLE_POSITION_MAX and
+                len(table_undefended_list) < self.hand_count(self.player_defending)
+                )
+            if attack_allowed:
+                table_type_mask: int = self.table_type_mask
+                for card_id in self.iterate_mask(hand_mask):
+                    if table_type_mask == 0 or table_type_mask >> (card_id % STATE_TYPE_COUNT) & 1:
+                        legal_move_list.append(State_Move(SERVER_ACTION_ATTACK, card_id))
+
+            # Ending the round (all attacks defended):
+            if len(self.table_list) > 0 and len(table_undefended_list) == 0:
+                legal_move_list.append(State_Move(SERVER_ACTION_DISCARD))
+
+        # Defending moves:
+        elif len(table_undefended_list) > 0:
+            for position_index in table_undefended_list:
+                card_id_table: int = self.table_list[position_index][TABLE_STACK_BOTTOM_INDEX]
+                for card_id in self.iterate_mask(hand_mask):
+                    if self.card_beats(card_id, card_id_table):
+                        legal_move_list.append(
+                            State_Move(SERVER_ACTION_DEFEND, card_id, position_index)
+                            )
+            legal_move_list.append(State_Move(SERVER_ACTION_TAKE))
+
+        # Returning:
+        return legal_move_list
+
+
+    def apply_move(self, state_move: State_Move, fill_hands: bool = True) -> Game_State:
+        """
+        Returns a new state with the move applied. Move is expected to be legal.
+
+        :param State_Move state_move: ...
+        :param bool fill_hands: Hands draw from the deck after take and discard. Without it, the
+            state only holds what the active player can know (deck order stays hidden).
+
+        :raise ValueError: if action is not recognized.
+
+        :return Game_State: ...
+        """
+
+        # Preparing values:
+        player_active: int = self.player_active
+        hand_mask_list: list[int] = list(self.hand_mask_list)
+
+        # Attacking (new table pair, defender moves next):
+        if state_move.action == SERVER_ACTION_ATTACK:
+            hand_mask_list[player_active] &= ~(1 << state_move.card_id)
+            game_state: Game_State = Game_State(
+                self.deck_trump_index,
+                self.deck_id_list,
+                self.deck_index,
+                (hand_mask_list[0], hand_mask_list[1]),
+                self.table_list + ((state_move.card_id, CARD_ID_NOT_SET),),
+                self.discard_mask,
+                self.player_attacking,
+                1 - player_active,
+                )
+
+        # Defending (table pair is covered, attacker moves next):
+        elif state_move.action == SERVER_ACTION_DEFEND:
+            hand_mask_list[player_active] &= ~(1 << state_move.card_id)
+            table_list: list[tuple[int, int]] = list(self.table_list)
+            table_list[state_move.position_index] = (
+                table_list[state_move.position_index][TABLE_STACK_BOTTOM_INDEX],
+                state_move.card_id,
+                )
+            game_state: Game_State = Game_State(
+                self.deck_trump_index,
+                self.deck_id_list,
+                self.deck_index,
+                (hand_mask_list[0], hand_mask_list[1]),
+                tuple(table_list),
+                self.discard_mask,
+                self.player_attacking,
+                1 - player_active,
+                )
+
+        # Taking (defender takes the table, attacker keeps attacking):
+        elif state_move.action == SERVER_ACTION_TAKE:
+            for table_pair in self.table_list:
+                for card_id in table_pair:
+                    if card_id != CARD_ID_NOT_SET:
+                        hand_mask_list[player_active] |= 1 << card_id
+            deck_index: int = self.deck_index
+            if fill_hands:
+                deck_index: int = self.__fill_hands(
+                    hand_mask_list = hand_mask_list,
+                    player_attacking = self.player_attacking,
+                    )
+            game_state: Game_State = Game_State(
+                self.deck_trump_index,
+                self.deck_id_list,
+                deck_index,
+                (hand_mask_list[0], hand_mask_list[1]),
+                (),
+                self.discard_mask,
+                self.player_attacking,
+                self.player_attacking,
+                )
+
+        # Discarding (table goes to discard, defender becomes attacker):
+        elif state_move.action == SERVER_ACTION_DISCARD:
+            discard_mask: int = self.discard_mask
+            for table_pair in self.table_list:
+                for card_id in table_pair:
+                    discard_mask |= 1 << card_id
+            deck_index: int = self.deck_index
+            if fill_hands:
+                deck_index: int = self.__fill_hands(
+                    hand_mask_list = hand_mask_list,
+                    player_attacking = self.player_attacking,
+                    )
+            game_state: Game_State = Game_State(
+                self.deck_trump_index,
+                self.deck_id_list,
+                deck_index,
+                (hand_mask_list[0], hand_mask_list[1]),
+                (),
+                discard_mask,
+                self.player_defending,
+                self.player_defending,
+                )
+
+        # Raising error, if action is not recognized:
+        else:
+            error_message: str = f"Unknown move action ({state_move.action=})."
+            raise ValueError(error_message)
+
+        # Returning:
+        return game_state
+
+
+    def __fill_hands(self, hand_mask_list: list[int], player_attacking: int) -> int:
+        """
+        Draws up to default hand size, attacker first. Updates hand masks in place.
+
+        :param list[int] hand_mask_list: ...
+        :param int player_attacking: ...
+
+        :return int: New deck index.
+        """
+
+        # Drawing cards:
+        deck_index: int = self.deck_index
+        for player_index in (player_attacking, 1 - player_attacking):
+            hand_count: int = hand_mask_list[player_index].bit_count()
+            while hand_count < HAND_CARD_COUNT_DEFAULT and deck_index < len(self.deck_id_list):
+                hand_mask_list[player_index] |= 1 << self.deck_id_list[deck_index]
+                deck_index += 1
+                hand_count += 1
+
+        # Returning:
+        return deck_index
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CREATE METHODS BLOCK
+
+    """
+
+
+    @staticmethod
+    def create_new(deck_lowest_value: int, random_seed: int) -> Game_State:
+        """
+        Deals a new game without any controllers: shuffled deck (trump is the last card), six cards
+        each, and the player with the lowest trump attacks first (player one, if nobody has trumps).
+        Same seed always deals the same game.
+
+        :param int deck_lowest_value: ...
+        :param int random_seed: ...
+
+        :return Game_State: ...
+        """
+
+        # Shuffling deck:
+        type_index_lowest: int = deck_lowest_value - STATE_TYPE_VALUE_SHIFT
+        deck_id_list: list[int] = [
+            suit_index * STATE_TYPE_COUNT + type_index
+            for suit_index in range(len(CARD_ID_SUIT_ORDER))
+            for type_index in range(type_index_lowest, STATE_TYPE_COUNT)
+            ]
+        random.Random(random_seed).shuffle(deck_id_list)
+        deck_trump_index: int = deck_id_list[-1] // STATE_TYPE_COUNT
+
+        # Dealing (one player at a time, as hand controllers do):
+        hand_mask_list: list[int] = [0, 0]
+        deck_index: int = 0
+        for player_index in (0, 1):
+            for _ in range(HAND_CARD_COUNT_DEFAULT):
+                hand_mask_list[player_index] |= 1 << deck_id_list[deck_index]
+                deck_index += 1
+
+        # Selecting first attacker (lowest trump):
+        trump_mask: int = ((1 << STATE_TYPE_COUNT) - 1) << (deck_trump_index * STATE_TYPE_COUNT)
+        player_attacking: int = 0
+        trump_lowest: int | None = None
+        for player_index in (0, 1):
+            hand_trump_mask: int = hand_mask_list[player_index] & trump_mask
+            if hand_trump_mask:
+                card_id: int = (hand_trump_mask & -hand_trump_mask).bit_length() - 1
+                if trump_lowest is None or card_id < trump_lowest:
+                    trump_lowest: int = card_id
+                    player_attacking: int = player_index
+
+        # Creating state:
+        game_state: Game_State = Game_State(
+            deck_trump_index = deck_trump_index,
+            deck_id_list = tuple(deck_id_list),
+            deck_index = deck_index,
+            hand_mask_list = (hand_mask_list[0], hand_mask_list[1]),
+            table_list = (),
+            discard_mask = 0,
+            player_attacking = player_attacking,
+            player_active = player_attacking,
+            )
+
+        # Returning:
+        return game_state
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SNAPSHOT CONVERSION METHODS BLOCK
+
+    """
+
+
+    @staticmethod
+    def create_from_snapshot(game_snapshot: Game_Snapshot) -> Game_State:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Snapshot game_snapshot: ...
+
+        :raise ValueError: if snapshot is a multi-deck game (card masks hold one copy per card).
+
+        :return Game_State: ...
+        """
+
+        # Checking deck copies:
+        if game_snapshot.deck_copy_count > 1:
+            error_message: str = f"Game state supports single deck games only ({game_snapshot.deck_copy_count=})."
+            raise ValueError(error_message)
+
+        # Packing hands:
+        hand_mask_list: list[int] = [0, 0]
+        hand_id_map: tuple[tuple[int, ...], ...] = (
+            game_snapshot.hand_one_id_list,
+            game_snapshot.hand_two_id_list,
+            )
+        for player_index, hand_id_list in enumerate(hand_id_map):
+            for card_id in hand_id_list:
+                hand_mask_list[player_index] |= 1 << card_id
+
+        # Packing discard:
+        discard_mask: int = 0
+        for card_id in game_snapshot.discard_id_list:
+            discard_mask |= 1 << card_id
+
+        # Packing table (occupied positions only, in position order):
+        table_list: tuple[tuple[int, int], ...] = tuple(
+            (
+                stack_map[TABLE_STACK_BOTTOM_INDEX],
+                CARD_ID_NOT_SET if stack_map[TABLE_STACK_TOP_INDEX] is None else stack_map[TABLE_STACK_TOP_INDEX],
+                )
+            for stack_map in game_snapshot.table_map_id.values()
+            if stack_map[TABLE_STACK_BOTTOM_INDEX] is not None
+            )
+
+        # Creating state:
+        game_state: Game_State = Game_State(
+            deck_trump_index = CARD_ID_SUIT_ORDER.index(game_snapshot.deck_trump),
+            deck_id_list = game_snapshot.deck_id_list,
+            deck_index = 0,
+            hand_mask_list = (hand_mask_list[0], hand_mask_list[1]),
+            table_list = table_list,
+            discard_mask = discard_mask,
+            player_attacking = 0 if game_snapshot.player_one_attacking else 1,
+            player_active = 0 if game_snapshot.player_one_active else 1,
+            )
+
+        # Returning:
+        return game_state
+
+
+    def create_snapshot(self, template_snapshot: Game_Snapshot) -> Game_Snapshot:
+        """
+        Projects state onto a snapshot, which can be loaded into the live controllers. Values that
+        are not part of the state (session options, names, deck settings) come from template.
+        Hands and discard are stored in card id order.
+
+        :param Game_Snapshot template_snapshot: ...
+
+        :return Game_Snapshot: ...
+        """
+
+        # Flattening table (empty positions are filled up to table size):
+        table_id_list: list[int] = []
+        for position_index in range(TABLE_POSITION_MAX):
+            table_pair: tuple[int, int] = (CARD_ID_NOT_SET, CARD_ID_NOT_SET)
+            if position_index < len(self.table_list):
+                table_pair: tuple[int, int] = self.table_list[position_index]
+            table_id_list.extend(table_pair)
+
+        # Creating snapshot:
+        game_snapshot: Game_Snapshot = Game_Snapshot(
+            deck_trump = CARD_ID_SUIT_ORDER[self.deck_trump_index],
+            deck_lowest_value = template_snapshot.deck_lowest_value,
+            deck_shift = template_snapshot.deck_shift,
+            deck_copy_count = template_snapshot.deck_copy_count,
+            deck_id_list = self.deck_id_list[self.deck_index:],
+            hand_one_id_list = tuple(self.iterate_mask(self.hand_mask_list[0])),
+            hand_two_id_list = tuple(self.iterate_mask(self.hand_mask_list[1])),
+            table_id_list = tuple(table_id_list),
+            discard_id_list = tuple(self.iterate_mask(self.discard_mask)),
+            player_one_active = self.player_active == 0,
+            player_one_attacking = self.player_attacking == 0,
+            player_one_name = template_snapshot.player_one_name,
+            player_two_name = template_snapshot.player_two_name,
+            sort_method = template_snapshot.sort_method,
+            session_flag_index = template_snapshot.session_flag_index,
+            )
+
+        # Returning:
+        return game_snapshot
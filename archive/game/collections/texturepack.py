@@ -262,6 +262,51 @@ class Texture_Pack:
         # Returning:
         return pack_container
     
+
+    @property
+    def pack_key(self) -> str:
+        """
+        Pack key, texture pack folder relative to card textures ("front/light/duo_1", "back/white"),
+        same as atlas and texture cache keys.
+
+        :return str: ...
+        """
+
+        # Generating pack key:
+        if self.pack_type == TEXTURE_PACK_TYPE_FRONT:
+            pack_key: str = "front/{pack_style}/{pack_color}_{pack_index}".format(
+                pack_style = self.pack_style.lower(),
+                pack_color = self.pack_color.lower(),
+                pack_index = self.pack_index,
+                )
+        else:
+            pack_key: str = "back/{pack_color}".format(
+                pack_color = self.pack_color.lower(),
+                )
+
+        # Returning:
+        return pack_key
+    
+
+    def create_copy(self) -> Texture_Pack:
+        """
+        Creates an independent copy of the texture pack, so switching packs in one session does not
+        affect shared default packs (or other sessions).
+
+        :return Texture_Pack: ...
+        """
+
+        # Creating a copy:
+        texture_pack: Texture_Pack = Texture_Pack(
+            init_style = self.pack_style,
+            init_color = self.pack_color,
+            init_index = self.pack_index,
+            )
+        
+        # Returning:
+        return texture_pack
+    
+
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
     PACK SET METHODS BLOCK
@@ -6,8 +6,10 @@ from functools import cached_property
 
 # Arcade library import:
 import arcade
-from arcade import Rect, Text
-from arcade.types import Color
+from arcade import Rect
+
+# Controllers import:
+from game.controllers.text import Text_Controller
 
 # Card-related settings import:
 from game.settings import *
@@ -139,44 +141,42 @@ class Zone_XYWH:
         return render_rect
     
 
-    @cached_property
-    def __render_text(self) -> Text:
+    @property
+    def text_label_name(self) -> str:
         """
         TODO: Create a docstring.
         """
 
-        # Generating coordinates:
-        coordinate_shift: int = 4
-        coordinate_x: int = self.coordinate_x_left + coordinate_shift
-        coordinate_y: int = self.coordinate_y_top - coordinate_shift
-
-        # Other text variables:
-        text_formatted: str = self.name.upper()
-        text_color: Color = Color(15, 15, 15, 255)
-        text_font_name: str = "Verdana"
-        text_font_size: int = 10
-        text_anchor_x: str = "left"
-        text_anchor_y: str = "center"
-        text_rotation: int = 0
-
-        # Creating a Text object:
-        render_text: Text = Text(
-            text      = text_formatted,
-            x         = coordinate_x,
-            y         = coordinate_y,
-            color     = text_color,
-            font_name = text_font_name,
-            font_size = text_font_size,
-            anchor_x  = text_anchor_x,
-            anchor_y  = text_anchor_y,
-            rotation  = text_rotation,
+        # Generating label name:
+        text_label_name: str = "ZONE_{zone_name}".format(
+            zone_name = self.name.upper().replace(" ", "_")
             )
         
         # Returning:
-        return render_text
+        return text_label_name
+
+
+    def create_text_label(self, text_controller: Text_Controller) -> None:
+        """
+        Adds zone's name label to the shared text layer, instead of drawing its own text object.
+
+        :param Text_Controller text_controller: ...
+        """
+
+        # Generating coordinates:
+        coordinate_x: int = self.coordinate_x_left + TEXT_ZONE_LABEL_SHIFT
+        coordinate_y: int = self.coordinate_y_top - TEXT_ZONE_LABEL_SHIFT
+
+        # Creating a label within the shared text layer:
+        text_controller.create_label(
+            label_name   = self.text_label_name,
+            label_text   = self.name.upper(),
+            coordinate_x = coordinate_x,
+            coordinate_y = coordinate_y,
+            )
 
 
-    def render(self, render_text: bool = False) -> None:
+    def render(self) -> None:
         """
         TODO: Create a docstring.
         """
@@ -187,10 +187,6 @@ class Zone_XYWH:
             color      = self.color,
             tilt_angle = 0
             )
-        
-        # Rendering text, if required:
-        if render_text:
-            self.__render_text.draw()
     
 
 """
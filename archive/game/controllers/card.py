@@ -63,6 +63,10 @@ from game.variables import (
     CARD_LOCATION_DECK,
     CARD_LOCATION_DISCARD,
     CARD_LOCATION_TABLE,
+
+    # Beats table variables:
+    CARD_BEATS_FLAG_GREATER,
+    CARD_BEATS_FLAG_LESS,
     )
 
 # Card- and texture-related directory variables import:
@@ -89,6 +93,9 @@ from game.settings import (
     CARD_SLIDE_SPEED_MODIFIER_SLOW,
     CARD_SLIDE_SPEED_MODIFIER_FAST,
 
+    # Logic step settings:
+    GAME_LOGIC_SLIDE_MOD,
+
     # Table positions and stack index:
     TABLE_STACK_TOP_INDEX,
     TABLE_STACK_BOTTOM_INDEX,
@@ -102,7 +109,8 @@ from game.settings import (
     DECK_RENDER_ANGLE_SHOWCASE,
     DECK_RENDER_ANGLE_ADD_MIN,
     DECK_RENDER_ANGLE_ADD_MAX,
-    DECK_SIZE_MAX,
+    DECK_COPY_COUNT_MAX,
+    DECK_CARD_COUNT_MAX,
 
     )
 
@@ -125,12 +133,16 @@ from game.collections.texturepack import (
 from game.scripts.convert import (
     convert_attribute_to_repr,
     convert_value_to_integer,
+    convert_card_to_id,
     )
+from game.scripts.beats import CARD_ID_COUNT
+from game.scripts.texture import load_texture_cached
 from game.scripts.cache import (
     clear_cached_property, 
     clear_cached_property_list
     )
 from game.scripts.assertion import (
+    bind_setter_validation,
     assert_value_is_default,
     assert_value_is_positive,
     assert_value_is_valid_type,
@@ -225,6 +237,7 @@ class Card_Object:
         # Core attributes:
         self.__type: str = CARD_TYPE_NOT_SET
         self.__suit: str = CARD_SUIT_NOT_SET
+        self.__copy: int = 0                # <- Deck copy the card comes from (multi-deck games)
 
         # State attributes:
         self.__state_selected: bool = False
@@ -258,6 +271,12 @@ class Card_Object:
         self.__coordinate_x_slide:   int = 0
         self.__coordinate_y_slide:   int = 0
 
+        # Coordinates before the last logic step (render interpolation):
+        self.__coordinates_previous: tuple[int, int] = (0, 0)
+
+        # Beats table of the card's deck (set by deck with its trump, see set_beats_table):
+        self.__beats_table: bytearray | None = None
+
     
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -292,9 +311,18 @@ class Card_Object:
 
     def __gt__(self, card_object: Card_Object) -> bool:
         """
-        TODO: Create a docstring
+        Card is greater (beats the other card): suits match or card is a trump, and its value is
+        higher. Read from the beats table, if card's deck has set one.
         """
 
+        # Reading beats table (card id is only set for ready cards):
+        beats_table: bytearray | None = self.__beats_table
+        if beats_table is not None:
+            card_id: int | None = self.card_id
+            card_id_other: int | None = card_object.card_id
+            if card_id is not None and card_id_other is not None:
+                return beats_table[card_id * CARD_ID_COUNT + card_id_other] & CARD_BEATS_FLAG_GREATER != 0
+
         # Checking if suits are compatible:
         eval_result: bool = False
         eval_available: bool = bool(
@@ -313,9 +341,18 @@ class Card_Object:
 
     def __lt__(self, card_object: Card_Object) -> bool:
         """
-        TODO: Create a docstring
+        Card is less: suits match and its value is lower. Read from the beats table, if card's
+        deck has set one.
         """
 
+        # Reading beats table (card id is only set for ready cards):
+        beats_table: bytearray | None = self.__beats_table
+        if beats_table is not None:
+            card_id: int | None = self.card_id
+            card_id_other: int | None = card_object.card_id
+            if card_id is not None and card_id_other is not None:
+                return beats_table[card_id * CARD_ID_COUNT + card_id_other] & CARD_BEATS_FLAG_LESS != 0
+
         # Checking if suits are compatible:
         eval_result: bool = False
         eval_available: bool = bool(
@@ -344,6 +381,7 @@ class Card_Object:
                            init_suit: str, 
                            texture_pack_front: Optional[Texture_Pack] = None,
                            texture_pack_back: Optional[Texture_Pack] = None,
+                           init_copy: int = 0,
                            ) -> Card_Object:
         """
         TODO: Create a docstring.
@@ -359,6 +397,10 @@ class Card_Object:
         card_object.set_suit(
             set_value = init_suit
             )
+        if init_copy != 0:
+            card_object.set_copy(
+                set_value = init_copy
+                )
         
         # Selecting texture packs:
         texture_pack_front_selected: Texture_Pack = TEXTURE_PACK_FRONT_LIGHT_DEFAULT
@@ -400,6 +442,8 @@ class Card_Object:
             "suit_color",
             "suit_color_repr",
             "suit_ascii",
+            "card_id",
+            "card_uid",
             )
         
         # Returning:
@@ -419,6 +463,8 @@ class Card_Object:
             "type_value_default",
             "type_value",
             "type_ascii",
+            "card_id",
+            "card_uid",
             )
         
         # Returning:
@@ -488,10 +534,9 @@ class Card_Object:
         TODO: Create a docstring.
         """
 
-        # Generating cached property list:
+        # Generating cached property list (texture objects are kept until texture pack changes):
         cached_property_list: tuple[str, ...] = (
-            "texture_front_object",
-            "texture_back_object",
+            "render_texture_object",
             )
         
         # Returning:
@@ -666,34 +711,43 @@ class Card_Object:
         return suit_ascii
 
 
-    def set_suit(self, set_value: str, ignore_assertion: bool = False) -> None:
+    @staticmethod
+    def __validate_suit(set_value: str) -> None:
         """
         TODO: Create a docstring.
 
         :param str set_value: ...
-        :param bool ignore_assertion: ...
 
         :raise AssertionError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (str, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is default:
+        default_value_list: tuple[Any, ...] = Card_Object.CARD_SUIT_LIST
+        assert_value_is_default(
+            check_value = set_value,
+            check_list = default_value_list,
+            raise_error = True,
+            )
 
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (str, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is default:
-            default_value_list: tuple[Any, ...] = Card_Object.CARD_SUIT_LIST
-            assert_value_is_default(
-                check_value = set_value,
-                check_list = default_value_list,
-                raise_error = True,
-                )
+
+    @bind_setter_validation(__validate_suit)
+    def set_suit(self, set_value: str, ignore_assertion: bool = False) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str set_value: ...
+        :param bool ignore_assertion: ...
+
+        :raise AssertionError: ...
+        """
 
         # Updating attribute:
         if self.suit != set_value:
@@ -781,37 +835,131 @@ class Card_Object:
 
         # Returning:
         return type_ascii
+    
+
+    @cached_property
+    def card_id(self) -> int | None:
+        """
+        Stable card identifier (0 to 51), used by snapshots and headless game states.
 
+        :return int: ...
+        :return None: if suit or type is not set.
+        """
 
-    def set_type(self, set_value: str, ignore_assertion: bool = False) -> None:
+        # Converting suit and type:
+        card_id: int | None = None
+        if self.suit != CARD_SUIT_NOT_SET and self.type_f != CARD_TYPE_NOT_SET:
+            card_id: int = convert_card_to_id(
+                card_suit = self.suit,
+                card_type = self.type_f,
+                )
+
+        # Returning:
+        return card_id
+
+
+    @cached_property
+    def card_copy(self) -> int:
+        """
+        Deck copy the card comes from (0, unless several decks are shuffled together).
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__copy
+
+
+    @cached_property
+    def card_uid(self) -> int | None:
+        """
+        Card identifier that tells duplicates apart (card id plus copy times card id count), same
+        as card id in single deck games. Used by decks, snapshots and sealed deck lookups, while
+        card id (the face) is used by beats table.
+
+        :return int: ...
+        :return None: if suit or type is not set.
+        """
+
+        # Shifting card id by copy:
+        card_uid: int | None = None
+        if self.card_id is not None:
+            card_uid: int = self.card_id + self.__copy * CARD_ID_COUNT
+
+        # Returning:
+        return card_uid
+
+
+    def set_copy(self, set_value: int) -> None:
         """
         TODO: Create a docstring.
 
-        :param str set_value: ...
-        :param bool ignore_assertion: ...
+        :param int set_value: ...
 
         :raise AssertionError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (str, )
-            assert_value_is_valid_type(
+        # Assertion control:
+        if SESSION_ENABLE_ASSERTION:
+            assert_value_in_valid_range(
                 check_value = set_value,
-                check_type = default_type_list,
+                check_range = range(0, DECK_COPY_COUNT_MAX),
                 raise_error = True
                 )
-            
-            # Asserting value is default:
-            default_value_list: tuple[Any, ...] = Card_Object.CARD_TYPE_LIST
-            assert_value_is_default(
-                check_value = set_value,
-                check_list = default_value_list,
-                raise_error = True,
+
+        # Updating attribute:
+        if self.__copy != set_value:
+            self.__copy: int = set_value
+
+            # Clearing cache (property):
+            cached_property_list: tuple[str, ...] = (
+                "card_copy",
+                "card_uid",
+                )
+            clear_cached_property_list(
+                target_object = self,
+                target_attribute_list = cached_property_list
                 )
 
+
+    @staticmethod
+    def __validate_type(set_value: str) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (str, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is default:
+        default_value_list: tuple[Any, ...] = Card_Object.CARD_TYPE_LIST
+        assert_value_is_default(
+            check_value = set_value,
+            check_list = default_value_list,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_type)
+    def set_type(self, set_value: str, ignore_assertion: bool = False) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str set_value: ...
+        :param bool ignore_assertion: ...
+
+        :raise AssertionError: ...
+        """
+
         # Updating attribute:
         if self.type_f != set_value:
             self.__type: str = set_value
@@ -948,6 +1096,26 @@ class Card_Object:
         return self.__state_arrived
     
 
+    @staticmethod
+    def __validate_state_selected(set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_state_selected)
     def set_state_selected(self, set_value: bool, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -958,17 +1126,6 @@ class Card_Object:
         :raise AssertionError:
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-
         # Updating attribute:
         if self.state_selected != set_value:
             self.__state_selected: bool = set_value
@@ -988,6 +1145,26 @@ class Card_Object:
                 )
     
 
+    @staticmethod
+    def __validate_state_hovered(set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_state_hovered)
     def set_state_hovered(self, set_value: bool, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -998,17 +1175,6 @@ class Card_Object:
         :raise AssertionError:
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-
         # Updating attribute:
         if self.state_hovered != set_value:
             self.__state_hovered: bool = set_value
@@ -1030,6 +1196,26 @@ class Card_Object:
                     )
     
 
+    @staticmethod
+    def __validate_state_trump(set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_state_trump)
     def set_state_trump(self, set_value: bool, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1040,29 +1226,50 @@ class Card_Object:
         :raise AssertionError:
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-
         # Updating attribute:
         if self.state_trump != set_value:
             self.__state_trump: bool = set_value
 
-            # Clearing cache (property):
-            cached_property: str = "state_trump"
-            clear_cached_property(
+            # Clearing cache (property, value depends on trump state):
+            clear_cached_property_list(
                 target_object = self,
-                target_attribute = cached_property
+                target_attribute_list = ("state_trump", "type_value")
                 )
+
+
+    def set_beats_table(self, beats_table: bytearray | None) -> None:
+        """
+        Sets beats table of the card's deck (built once per game for its trump, see
+        Deck_Controller.deck_beats_table), comparison operators read it instead of comparing
+        suits, trump states and values. None removes the table.
+
+        :param bytearray | None beats_table: ...
+        """
+
+        # Updating attribute:
+        self.__beats_table: bytearray | None = beats_table
     
 
+    @staticmethod
+    def __validate_state_revealed(set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_state_revealed)
     def set_state_revealed(self, set_value: bool, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1073,17 +1280,6 @@ class Card_Object:
         :raise AssertionError:
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-
         # Updating attribute:
         if self.state_revealed != set_value:
             self.__state_revealed: bool = set_value
@@ -1107,6 +1303,26 @@ class Card_Object:
                 )
             
 
+    @staticmethod
+    def __validate_state_opponent(set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_state_opponent)
     def set_state_opponent(self, set_value: bool, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1117,17 +1333,6 @@ class Card_Object:
         :raise AssertionError:
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-
         # Updating attribute:
         if self.state_opponent != set_value:
             self.__state_opponent: bool = set_value
@@ -1147,6 +1352,26 @@ class Card_Object:
                 )
     
 
+    @staticmethod
+    def __validate_state_playable(set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_state_playable)
     def set_state_playable(self, set_value: bool, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1157,17 +1382,6 @@ class Card_Object:
         :raise AssertionError:
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-
         # Updating attribute:
         if self.state_playable != set_value:
             self.__state_playable: bool = set_value
@@ -1180,6 +1394,26 @@ class Card_Object:
                 )
             
     
+    @staticmethod
+    def __validate_state_showcase(set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_state_showcase)
     def set_state_showcase(self, set_value: bool, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1190,17 +1424,6 @@ class Card_Object:
         :raise AssertionError:
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-
         # Updating attribute:
         if self.state_showcase != set_value:
             self.__state_showcase: bool = set_value
@@ -1213,26 +1436,35 @@ class Card_Object:
                 )
             
     
-    def set_state_arrived(self, set_value: bool, ignore_assertion: bool = False) -> None:
+    @staticmethod
+    def __validate_state_arrived(set_value: bool) -> None:
         """
         TODO: Create a docstring.
 
         :param bool set_value: ...
-        :param bool ignore_assertion: ...
 
-        :raise AssertionError:
+        :raise AssertionError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (bool, )
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
 
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (bool, )
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
+
+    @bind_setter_validation(__validate_state_arrived)
+    def set_state_arrived(self, set_value: bool, ignore_assertion: bool = False) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+        :param bool ignore_assertion: ...
+
+        :raise AssertionError:
+        """
 
         # Updating attribute:
         if self.state_arrived != set_value:
@@ -1257,20 +1489,10 @@ class Card_Object:
         TODO: Create a docstring.
         """
 
-        # Resetting attributes:
-        self.__state_selected: bool = False
-        self.__state_hovered:  bool = False
-        self.__state_trump:    bool = False
-        self.__state_revealed: bool = False
-        self.__state_opponent: bool = False
-        self.__state_playable: bool = False
-        self.__state_showcase: bool = False
-        self.__state_arrived:  bool = False
-
-        # Clearing cache (state):
-        clear_cached_property_list(
-            target_object = self,
-            target_attribute_list = self.__cached_state_property_list,
+        # Resetting attributes (single cache clear):
+        self.update(
+            reset_state = True,
+            ignore_assertion = True,
             )
 
 
@@ -1341,6 +1563,34 @@ class Card_Object:
         return self.__position_index
     
 
+    @staticmethod
+    def __validate_position_hand(position_index: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int position_index: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = position_index,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value in valid range:
+        default_range: range = range(0, DECK_CARD_COUNT_MAX)
+        assert_value_in_valid_range(
+            check_value = position_index,
+            check_range = default_range,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_position_hand)
     def set_position_hand(self, position_index: int, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1352,25 +1602,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = position_index,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value in valid range:
-            default_range: range = range(0, DECK_SIZE_MAX)
-            assert_value_in_valid_range(
-                check_value = position_index,
-                check_range = default_range,
-                raise_error = True
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(position_index, float)
         position_index_f: float | int = position_index
@@ -1408,6 +1639,34 @@ class Card_Object:
                 )
             
 
+    @staticmethod
+    def __validate_position_added(position_index: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int position_index: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = position_index,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value in valid range:
+        default_range: range = range(0, DECK_CARD_COUNT_MAX)
+        assert_value_in_valid_range(
+            check_value = position_index,
+            check_range = default_range,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_position_added)
     def set_position_added(self, position_index: int, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1419,25 +1678,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = position_index,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value in valid range:
-            default_range: range = range(0, DECK_SIZE_MAX)
-            assert_value_in_valid_range(
-                check_value = position_index,
-                check_range = default_range,
-                raise_error = True
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(position_index, float)
         position_index_f: float | int = position_index
@@ -1469,6 +1709,32 @@ class Card_Object:
                 )
     
 
+    @staticmethod
+    def __validate_position_deck(position_index: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int position_index: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = position_index,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is positive:
+        assert_value_is_positive(
+            check_value = position_index,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_position_deck)
     def set_position_deck(self, position_index: int, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1480,23 +1746,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = position_index,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is positive:
-            assert_value_is_positive(
-                check_value = position_index,
-                raise_error = True,
-                )
-
         # Attempting to convert:
         convert_required: bool = isinstance(position_index, float)
         position_index_f: float | int = position_index
@@ -1535,6 +1784,34 @@ class Card_Object:
                 )
     
 
+    @staticmethod
+    def __validate_position_discard(position_index: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int position_index: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = position_index,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value in valid range:
+        default_range: range = range(0, DECK_CARD_COUNT_MAX)
+        assert_value_in_valid_range(
+            check_value = position_index,
+            check_range = default_range,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_position_discard)
     def set_position_discard(self, position_index: int, ignore_assertion: bool = False) -> None:
         """
         TODO: Create a docstring.
@@ -1546,25 +1823,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = position_index,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value in valid range:
-            default_range: range = range(0, DECK_SIZE_MAX)
-            assert_value_in_valid_range(
-                check_value = position_index,
-                check_range = default_range,
-                raise_error = True
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(position_index, float)
         position_index_f: float | int = position_index
@@ -1603,6 +1861,51 @@ class Card_Object:
                 )
         
 
+    @staticmethod
+    def __validate_position_table(position_index: int, stack_index: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int position_index: ...
+        :param int stack_index: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid (position):
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = position_index,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value in valid range (position):
+        default_range: range = TABLE_POSITION_RANGE
+        assert_value_in_valid_range(
+            check_value = position_index,
+            check_range = default_range,
+            raise_error = True
+            )
+        
+        # Asserting value type is valid (stack):
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = stack_index,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value in valid range (stack):
+        default_range: range = TABLE_STACK_RANGE
+        assert_value_in_valid_range(
+            check_value = stack_index,
+            check_range = default_range,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_position_table)
     def set_position_table(self, 
                            position_index: int,                 # <- 0 (left) to 5 (right)
                            stack_index: int,                    # <- 0 (bottom) to 1 (top)
@@ -1619,41 +1922,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid (position):
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = position_index,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value in valid range (position):
-            default_range: range = TABLE_POSITION_RANGE
-            assert_value_in_valid_range(
-                check_value = position_index,
-                check_range = default_range,
-                raise_error = True
-                )
-            
-            # Asserting value type is valid (stack):
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = stack_index,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value in valid range (stack):
-            default_range: range = TABLE_STACK_RANGE
-            assert_value_in_valid_range(
-                check_value = stack_index,
-                check_range = default_range,
-                raise_error = True
-                )
-        
         # Attempting to convert (position index):
         convert_required: bool = isinstance(position_index, float)
         position_index_f: float | int = position_index
@@ -1705,26 +1973,12 @@ class Card_Object:
         TODO: Create a docstring.
         """
 
-        # Resetting positions to None:
-        self.__position_hand:    int | None = None
-        self.__position_added:   int | None = None
-        self.__position_deck:    int | None = None
-        self.__position_discard: int | None = None
-        self.__position_table:   int | None = None
-        self.__position_index:   int | None = None
-
-        # Resetting state arrived:
-        self.set_state_arrived(
-            set_value = False,
+        # Resetting positions to None and state arrived (single cache clear):
+        self.update(
+            reset_position = True,
             ignore_assertion = True,
             )
 
-        # Clearing cache:
-        clear_cached_property_list(
-            target_object = self,
-            target_attribute_list = self.__cached_position_property_list,
-            )
-
 
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -1849,12 +2103,18 @@ class Card_Object:
         return texture_front_filepath
     
 
-    @cached_property
+    @property
     def texture_front_object(self) -> Texture:
         """
-        TODO: Create a docstring.
+        Front texture, loaded on first use (most cards are face-down most of the time).
         """
 
+        # Loading texture object (once per texture pack):
+        if self.__texture_front_object is None:
+            self.__texture_front_object: Texture = load_texture_cached(
+                file_path = self.texture_front_filepath
+                )
+
         # Returning:
         return self.__texture_front_object
     
@@ -1898,16 +2158,34 @@ class Card_Object:
         return texture_back_filepath
     
 
-    @cached_property
+    @property
     def texture_back_object(self) -> Texture:
         """
-        TODO: Create a docstring.
+        Back texture, loaded on first use.
         """
 
+        # Loading texture object (once per texture pack):
+        if self.__texture_back_object is None:
+            self.__texture_back_object: Texture = load_texture_cached(
+                file_path = self.texture_back_filepath
+                )
+
         # Returning:
         return self.__texture_back_object
     
 
+    @property
+    def texture_front_loaded(self) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return self.__texture_front_object is not None
+    
+
     def set_texture_pack_front(self, texture_pack: Texture_Pack, clear_cache: bool = True) -> None:
         """
         TODO: Create a docstring.
@@ -1937,16 +2215,9 @@ class Card_Object:
                 raise_error = True,
                 )
 
-        # Updating texture:
+        # Updating texture (texture object is loaded on first use, see texture_front_object):
         self.__texture_pack_front: Texture_Pack = texture_pack
-        
-        # Loading texture object:
-        texture_object: Texture = arcade.load_texture(
-            file_path = self.texture_front_filepath
-            )
-        
-        # Updating attribute:
-        self.__texture_front_object: Texture = texture_object
+        self.__texture_front_object: Texture = None
 
         # Clearing cache (texture):
         if clear_cache:
@@ -1985,16 +2256,9 @@ class Card_Object:
                 raise_error = True,
                 )
 
-        # Updating texture:
+        # Updating texture (texture object is loaded on first use, see texture_back_object):
         self.__texture_pack_back: Texture_Pack = texture_pack
-
-        # Loading texture object:
-        texture_object: Texture = arcade.load_texture(
-            file_path = self.texture_back_filepath
-            )
-        
-        # Updating attribute:
-        self.__texture_back_object: Texture = texture_object
+        self.__texture_back_object: Texture = None
 
         # Clearing cache (texture):
         if clear_cache:
@@ -2105,6 +2369,32 @@ class Card_Object:
         return self.__coordinate_y_slide
     
 
+    @staticmethod
+    def __validate_coordinate_x_current(set_value: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is positive:
+        assert_value_is_positive(
+            check_value = set_value,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_coordinate_x_current)
     def set_coordinate_x_current(self, 
                                  set_value: int, 
                                  clear_cache: bool = True, 
@@ -2121,23 +2411,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is positive:
-            assert_value_is_positive(
-                check_value = set_value,
-                raise_error = True,
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(set_value, float)
         set_value_f: float | int = set_value
@@ -2167,6 +2440,32 @@ class Card_Object:
                     )
 
 
+    @staticmethod
+    def __validate_coordinate_y_current(set_value: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is positive:
+        assert_value_is_positive(
+            check_value = set_value,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_coordinate_y_current)
     def set_coordinate_y_current(self, 
                                  set_value: int, 
                                  clear_cache: bool = True, 
@@ -2183,23 +2482,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is positive:
-            assert_value_is_positive(
-                check_value = set_value,
-                raise_error = True,
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(set_value, float)
         set_value_f: float | int = set_value
@@ -2229,6 +2511,32 @@ class Card_Object:
                     )
     
 
+    @staticmethod
+    def __validate_coordinate_x_default(set_value: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is positive:
+        assert_value_is_positive(
+            check_value = set_value,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_coordinate_x_default)
     def set_coordinate_x_default(self, 
                                  set_value: int, 
                                  clear_cache: bool = True, 
@@ -2245,23 +2553,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is positive:
-            assert_value_is_positive(
-                check_value = set_value,
-                raise_error = True,
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(set_value, float)
         set_value_f: float | int = set_value
@@ -2285,6 +2576,32 @@ class Card_Object:
                     )
     
 
+    @staticmethod
+    def __validate_coordinate_y_default(set_value: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is positive:
+        assert_value_is_positive(
+            check_value = set_value,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_coordinate_y_default)
     def set_coordinate_y_default(self, 
                                  set_value: int, 
                                  clear_cache: bool = True, 
@@ -2301,23 +2618,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is positive:
-            assert_value_is_positive(
-                check_value = set_value,
-                raise_error = True,
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(set_value, float)
         set_value_f: float | int = set_value
@@ -2348,6 +2648,32 @@ class Card_Object:
                     )
     
 
+    @staticmethod
+    def __validate_coordinate_x_slide(set_value: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is positive:
+        assert_value_is_positive(
+            check_value = set_value,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_coordinate_x_slide)
     def set_coordinate_x_slide(self, 
                                set_value: int, 
                                clear_cache: bool = True, 
@@ -2364,23 +2690,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is positive:
-            assert_value_is_positive(
-                check_value = set_value,
-                raise_error = True,
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(set_value, float)
         set_value_f: float | int = set_value
@@ -2402,6 +2711,32 @@ class Card_Object:
                     )
     
 
+    @staticmethod
+    def __validate_coordinate_y_slide(set_value: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int set_value: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (int, float)
+        assert_value_is_valid_type(
+            check_value = set_value,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value is positive:
+        assert_value_is_positive(
+            check_value = set_value,
+            raise_error = True,
+            )
+
+
+    @bind_setter_validation(__validate_coordinate_y_slide)
     def set_coordinate_y_slide(self, 
                                set_value: int, 
                                clear_cache: bool = True, 
@@ -2418,23 +2753,6 @@ class Card_Object:
         :raise ValueError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (int, float)
-            assert_value_is_valid_type(
-                check_value = set_value,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value is positive:
-            assert_value_is_positive(
-                check_value = set_value,
-                raise_error = True,
-                )
-        
         # Attempting to convert:
         convert_required: bool = isinstance(set_value, float)
         set_value_f: float | int = set_value
@@ -2456,38 +2774,50 @@ class Card_Object:
                     )
                 
     
+    @staticmethod
+    def __validate_coordinates_current(set_container: tuple[int, int]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int] set_container: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (tuple, list)
+        assert_value_is_valid_type(
+            check_value = set_container,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value (container) is valid size:
+        default_size: int = 2
+        assert_container_is_valid_size(
+            check_container = set_container,
+            check_size = default_size,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_coordinates_current)
     def set_coordinates_current(self, 
                                 set_container: tuple[int, int], 
+                                preserve_previous: bool = False,
                                 ignore_assertion: bool = False
                                 ) -> None:
         """
         TODO: Create a docstring.
 
         :param tuple[int, int] set_container: ...
+        :param bool preserve_previous: If False, card is rendered at new coordinates right away,
+            without interpolation (card was moved, not slid).
         :param bool ignore_assertion: ...
 
         :raise AssertionError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (tuple[int, int], list[int, int])
-            assert_value_is_valid_type(
-                check_value = set_container,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value (container) is valid size:
-            default_size: int = 2
-            assert_container_is_valid_size(
-                check_container = set_container,
-                check_size = default_size,
-                raise_error = True
-                )
-
         # Unpacking:
         set_coordinate_x, set_coordinate_y = set_container
         
@@ -2508,6 +2838,10 @@ class Card_Object:
                 ignore_assertion = ignore_assertion
                 )
 
+        # Moving without interpolation:
+        if not preserve_previous:
+            self.__coordinates_previous: tuple[int, int] = (set_coordinate_x, set_coordinate_y)
+
         # Post-update block:        
         if attribute_updated:
 
@@ -2540,6 +2874,34 @@ class Card_Object:
                         )
 
     
+    @staticmethod
+    def __validate_coordinates_default(set_container: tuple[int, int]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int] set_container: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (tuple, list)
+        assert_value_is_valid_type(
+            check_value = set_container,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value (container) is valid size:
+        default_size: int = 2
+        assert_container_is_valid_size(
+            check_container = set_container,
+            check_size = default_size,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_coordinates_default)
     def set_coordinates_default(self, 
                                 set_container: tuple[int, int], 
                                 ignore_assertion: bool = False
@@ -2553,25 +2915,6 @@ class Card_Object:
         :raise AssertionError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (tuple[int, int], list[int, int])
-            assert_value_is_valid_type(
-                check_value = set_container,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value (container) is valid size:
-            default_size: int = 2
-            assert_container_is_valid_size(
-                check_container = set_container,
-                check_size = default_size,
-                raise_error = True
-                )
-
         # Unpacking:
         set_coordinate_x, set_coordinate_y = set_container
         
@@ -2610,6 +2953,34 @@ class Card_Object:
                 )
 
 
+    @staticmethod
+    def __validate_coordinates_slide(set_container: tuple[int, int]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int] set_container: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Asserting value type is valid:
+        default_type_list: tuple[type, ...] = (tuple, )
+        assert_value_is_valid_type(
+            check_value = set_container,
+            check_type = default_type_list,
+            raise_error = True
+            )
+        
+        # Asserting value (container) is valid size:
+        default_size: int = 2
+        assert_container_is_valid_size(
+            check_container = set_container,
+            check_size = default_size,
+            raise_error = True
+            )
+
+
+    @bind_setter_validation(__validate_coordinates_slide)
     def set_coordinates_slide(self, 
                               set_container: tuple[int, int], 
                               ignore_assertion: bool = False
@@ -2623,25 +2994,6 @@ class Card_Object:
         :raise AssertionError: ...
         """
 
-        # Assertion control (if enabled):
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-
-            # Asserting value type is valid:
-            default_type_list: tuple[type, ...] = (tuple, )
-            assert_value_is_valid_type(
-                check_value = set_container,
-                check_type = default_type_list,
-                raise_error = True
-                )
-            
-            # Asserting value (container) is valid size:
-            default_size: int = 2
-            assert_container_is_valid_size(
-                check_container = set_container,
-                check_size = default_size,
-                raise_error = True
-                )
-
         # Unpacking:
         set_coordinate_x, set_coordinate_y = set_container
         
@@ -2849,6 +3201,196 @@ class Card_Object:
             )
     
 
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    BULK UPDATE METHODS BLOCK
+    
+    """
+
+
+    @staticmethod
+    def __convert_coordinates(set_container: tuple[int, int]) -> tuple[int, int]:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int] set_container: ...
+
+        :return tuple[int, int]: ...
+        """
+
+        # Skipping integer coordinates (tween and slide steps):
+        set_coordinate_x, set_coordinate_y = set_container
+        if type(set_coordinate_x) is int and type(set_coordinate_y) is int:
+            return (set_coordinate_x, set_coordinate_y)
+
+        # Converting (floats only, same as single coordinate setters):
+        coordinates_converted: tuple[int, int] = tuple(
+            convert_value_to_integer(convert_value = set_value) if isinstance(set_value, float) else set_value
+            for set_value in set_container
+            )
+
+        # Returning:
+        return coordinates_converted
+
+
+    def update(self,
+               coordinates_default: tuple[int, int] | None = None,
+               coordinates_slide: tuple[int, int] | None = None,
+               coordinates_current: tuple[int, int] | None = None,
+               state_selected: bool | None = None,
+               state_hovered: bool | None = None,
+               state_revealed: bool | None = None,
+               state_opponent: bool | None = None,
+               state_playable: bool | None = None,
+               state_showcase: bool | None = None,
+               reset_position: bool = False,
+               reset_boundary: bool = False,
+               reset_state: bool = False,
+               preserve_previous: bool = False,
+               move_step: bool = False,
+               ignore_assertion: bool = False
+               ) -> None:
+        """
+        Applies several field changes at once and clears dependent cached properties once, at the
+        end, instead of once per setter. Fields left as None are not changed. Order is the same as
+        calling the setters one by one: position reset, default, slide and current coordinates (with
+        arrival check), boundary reset, state reset, then explicit states.
+
+        :param tuple[int, int] | None coordinates_default: ...
+        :param tuple[int, int] | None coordinates_slide: ...
+        :param tuple[int, int] | None coordinates_current: ...
+        :param bool | None state_selected: ...
+        :param bool | None state_hovered: ...
+        :param bool | None state_revealed: ...
+        :param bool | None state_opponent: ...
+        :param bool | None state_playable: ...
+        :param bool | None state_showcase: ...
+        :param bool reset_position: ...
+        :param bool reset_boundary: ...
+        :param bool reset_state: ...
+        :param bool preserve_previous: See set_coordinates_current.
+        :param bool move_step: Coordinates before update are kept as previous ones (card moved by
+            one logic step, see move_coordinates_current).
+        :param bool ignore_assertion: ...
+
+        :raise AssertionError: ...
+        """
+
+        # Assertion control:
+        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
+            validate_list: tuple[tuple[Any, Any], ...] = (
+                (self.__validate_coordinates_default, coordinates_default),
+                (self.__validate_coordinates_slide,   coordinates_slide),
+                (self.__validate_coordinates_current, coordinates_current),
+                (self.__validate_state_selected,      state_selected),
+                (self.__validate_state_hovered,       state_hovered),
+                (self.__validate_state_revealed,      state_revealed),
+                (self.__validate_state_opponent,      state_opponent),
+                (self.__validate_state_playable,      state_playable),
+                (self.__validate_state_showcase,      state_showcase),
+                )
+            for validate_function, set_value in validate_list:
+                if set_value is not None:
+                    validate_function(set_value)
+
+        # Collecting cached properties to clear:
+        cached_property_set: set[str] = set()
+
+        # Resetting position:
+        if reset_position:
+            self.__position_hand:    int | None = None
+            self.__position_added:   int | None = None
+            self.__position_deck:    int | None = None
+            self.__position_discard: int | None = None
+            self.__position_table:   int | None = None
+            self.__position_index:   int | None = None
+            self.__state_arrived:    bool = False
+            cached_property_set.update(self.__cached_position_property_list)
+            cached_property_set.update(self.__cached_location_property_list)
+            cached_property_set.add("state_arrived")
+
+        # Updating default coordinates (card has to slide there again):
+        if coordinates_default is not None:
+            coordinates_default_f: tuple[int, int] = self.__convert_coordinates(coordinates_default)
+            if coordinates_default_f != (self.__coordinate_x_default, self.__coordinate_y_default):
+                self.__coordinate_x_default, self.__coordinate_y_default = coordinates_default_f
+                self.__state_arrived: bool = False
+                cached_property_set.update(("coordinate_x_default", "coordinate_y_default", "state_arrived"))
+
+        # Updating slide coordinates:
+        if coordinates_slide is not None:
+            coordinates_slide_f: tuple[int, int] = self.__convert_coordinates(coordinates_slide)
+            if coordinates_slide_f != (self.__coordinate_x_slide, self.__coordinate_y_slide):
+                self.__coordinate_x_slide, self.__coordinate_y_slide = coordinates_slide_f
+                cached_property_set.update(("coordinate_x_slide", "coordinate_y_slide"))
+
+        # Updating current coordinates:
+        if coordinates_current is not None:
+            coordinates_current_f: tuple[int, int] = self.__convert_coordinates(coordinates_current)
+            if move_step:
+                self.__coordinates_previous: tuple[int, int] = (self.__coordinate_x_current, self.__coordinate_y_current)
+            elif not preserve_previous:
+                self.__coordinates_previous: tuple[int, int] = coordinates_current_f
+            if coordinates_current_f != (self.__coordinate_x_current, self.__coordinate_y_current):
+                self.__coordinate_x_current, self.__coordinate_y_current = coordinates_current_f
+                cached_property_set.update(("coordinate_x_current", "coordinate_y_current"))
+                cached_property_set.update(self.__cached_boundary_property_list)
+
+                # Checking if the card arrived:
+                if not self.__state_arrived:
+                    if coordinates_current_f == (self.__coordinate_x_default, self.__coordinate_y_default):
+                        self.__state_arrived: bool = True
+                        cached_property_set.add("state_arrived")
+
+        # Resetting boundary:
+        if reset_boundary:
+            cached_property_set.update(self.__cached_boundary_property_list)
+
+        # Resetting state (opponent and showcase included, texture face may change):
+        if reset_state:
+            self.__state_selected: bool = False
+            self.__state_hovered:  bool = False
+            self.__state_trump:    bool = False
+            self.__state_revealed: bool = False
+            self.__state_opponent: bool = False
+            self.__state_playable: bool = False
+            self.__state_showcase: bool = False
+            self.__state_arrived:  bool = False
+            cached_property_set.update(self.__cached_state_property_list)
+            cached_property_set.update(("state_opponent", "state_showcase"))
+            cached_property_set.update(self.__cached_render_property_list)
+
+        # Updating states:
+        if state_selected is not None and state_selected != self.__state_selected:
+            self.__state_selected: bool = state_selected
+            cached_property_set.update(("state_selected", "render_angle_value"))
+        if state_hovered is not None and state_hovered != self.__state_hovered:
+            self.__state_hovered: bool = state_hovered
+            cached_property_set.add("state_hovered")
+            cached_property_set.update(self.__cached_boundary_property_list)
+        if state_revealed is not None and state_revealed != self.__state_revealed:
+            self.__state_revealed: bool = state_revealed
+            cached_property_set.add("state_revealed")
+            cached_property_set.update(self.__cached_render_property_list)
+            cached_property_set.update(self.__cached_texture_property_list)
+        if state_opponent is not None and state_opponent != self.__state_opponent:
+            self.__state_opponent: bool = state_opponent
+            cached_property_set.update(("state_opponent", "render_texture_object"))
+        if state_playable is not None and state_playable != self.__state_playable:
+            self.__state_playable: bool = state_playable
+            cached_property_set.add("state_playable")
+        if state_showcase is not None and state_showcase != self.__state_showcase:
+            self.__state_showcase: bool = state_showcase
+            cached_property_set.add("state_showcase")
+
+        # Clearing cache (once):
+        if cached_property_set:
+            clear_cached_property_list(
+                target_object = self,
+                target_attribute_list = tuple(cached_property_set)
+                )
+
+
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
     RENDER METHODS AND PROPERTIES BLOCK
@@ -2859,12 +3401,10 @@ class Card_Object:
     @cached_property
     def render_texture_object(self) -> Texture:
         """
-        TODO: Create a docstring.
+        Texture to render: front for revealed hand, showcase, table and discard cards, back
+        otherwise. Only the selected face is loaded.
         """
 
-        # Default (not revealed) texture:
-        texture_object: Texture = self.texture_back_object
-
         # Checking if front texture is forced:
         force_front: bool = bool(
             bool(self.location == CARD_LOCATION_HAND and 
@@ -2876,6 +3416,8 @@ class Card_Object:
             )
         if force_front:
             texture_object: Texture = self.texture_front_object
+        else:
+            texture_object: Texture = self.texture_back_object
 
         # Returning:
         return texture_object
@@ -3002,15 +3544,71 @@ class Card_Object:
         return render_rect
         
     
-    def render(self) -> None:
+    @property
+    def coordinates_previous(self) -> tuple[int, int]:
         """
         TODO: Create a docstring.
+
+        :return tuple[int, int]: ...
+        """
+
+        # Returning:
+        return self.__coordinates_previous
+
+
+    def create_render_rect_object(self, render_alpha: float) -> Rect:
+        """
+        Render rectangle between coordinates before and after the last logic step.
+
+        :param float render_alpha: 0.0 (previous coordinates) to 1.0 (current coordinates).
+
+        :return Rect: ...
+        """
+
+        # Interpolating coordinates:
+        coordinate_x_previous, coordinate_y_previous = self.__coordinates_previous
+        render_rect: Rect = arcade.XYWH(
+            x = coordinate_x_previous + (self.coordinate_x_current - coordinate_x_previous) * render_alpha,
+            y = coordinate_y_previous + (self.coordinate_y_current - coordinate_y_previous) * render_alpha,
+            width = self.render_width_value,
+            height = self.render_height_value
+            )
+
+        # Returning:
+        return render_rect
+        
+    
+    def find_render_rect(self, render_alpha: float = 1.0) -> Rect:
+        """
+        Selects render rectangle: interpolated only while card is sliding, cached otherwise.
+
+        :param float render_alpha: Logic step interpolation (see Clock_Controller.step_alpha).
+
+        :return Rect: ...
+        """
+
+        # Selecting render rectangle:
+        render_rect: Rect = self.render_rect_object
+        if render_alpha < 1.0 and self.__coordinates_previous != (self.coordinate_x_current, self.coordinate_y_current):
+            render_rect: Rect = self.create_render_rect_object(
+                render_alpha = render_alpha
+                )
+
+        # Returning:
+        return render_rect
+        
+    
+    def render(self, render_alpha: float = 1.0) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param float render_alpha: Logic step interpolation (see Clock_Controller.step_alpha).
         """
 
         # Rendering:
         arcade.draw_texture_rect(
             texture = self.render_texture_object,
-            rect = self.render_rect_object,
+            rect = self.find_render_rect(render_alpha),
             angle = self.render_angle_value,
             pixelated = True,
             )
@@ -3071,7 +3669,11 @@ class Card_Object:
 
         # Looping over target coordinates:
         set_coordinates: list[int] = []
-        for target_coordinate in target_coordinates:
+        coordinates_current: tuple[int, int] = (
+            self.coordinate_x_current, 
+            self.coordinate_y_current
+            )
+        for coordinate_index, target_coordinate in enumerate(target_coordinates):
 
             # Forcing next coordinate to be target coordinate:
             if force_instant:
@@ -3087,33 +3689,41 @@ class Card_Object:
                 slide_speed: int = int(
                     CARD_SLIDE_SPEED_DEFAULT * 
                     CARD_SLIDE_SPEED_THROTTLE * 
-                    slide_speed_modifier
-                    )
-
-                # Getting coordinate current:
-                coordinates_current: tuple[int, int] = (
-                    self.coordinate_x_current, 
-                    self.coordinate_y_current
+                    slide_speed_modifier *
+                    GAME_LOGIC_SLIDE_MOD
                     )
-                coordinate_index: int = target_coordinates.index(target_coordinate)
-                coordinate_current: int = coordinates_current[coordinate_index]
 
                 # Getting next coordinate:
                 coordinate_next: int = self.__calculate_coordinate_next(
                     slide_speed = slide_speed,
-                    current_coordinate = coordinate_current,
+                    current_coordinate = coordinates_current[coordinate_index],
                     target_coordinate = target_coordinate,
                     )
                 
-                # Adding coordinate to the list:
-                set_coordinates.append(
-                    coordinate_next
-                    )
+            # Adding coordinate to the list:
+            set_coordinates.append(
+                coordinate_next
+                )
         
         # Converting and updating coordinates:
         set_coordinates_conv: tuple[int, ...] = tuple(set_coordinates)
-        self.set_coordinates_current(
-            set_container = set_coordinates_conv,
+        self.move_coordinates_current(
+            set_container = set_coordinates_conv
+            )
+
+
+    def move_coordinates_current(self, set_container: tuple[int, int]) -> None:
+        """
+        Moves card by one logic step (slide or tween). Unlike set_coordinates_current, coordinates
+        before the step are kept, so card is rendered in between until the next step.
+
+        :param tuple[int, int] set_container: ...
+        """
+
+        # Storing previous coordinates and updating (single cache clear):
+        self.update(
+            coordinates_current = set_container,
+            move_step = True,
             ignore_assertion = True,
             )
 
@@ -0,0 +1,111 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Related settings import:
+from game.settings import (
+    GAME_LOGIC_UPDATE_RATE,
+    GAME_LOGIC_STEP_LIMIT,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CLOCK CLASS OBJECT BLOCK
+
+"""
+
+
+class Clock_Controller:
+    """
+    Fixed-step logic clock. Frame time is added to an accumulator and logic runs in whole steps of
+    step rate, so game timing does not depend on render rate or frame drops. Time left in the
+    accumulator (less than one step) is exposed as step alpha, for rendering between the last two
+    logic states.
+    """
+
+    def __init__(self,
+                 step_rate: float = GAME_LOGIC_UPDATE_RATE,
+                 step_limit: int = GAME_LOGIC_STEP_LIMIT
+                 ) -> None:
+
+        # Clock settings:
+        self.__step_rate: float = step_rate
+        self.__step_limit: int = step_limit
+
+        # Accumulated time (seconds not yet simulated):
+        self.__step_accumulator: float = 0.0
+
+        # Counters:
+        self.step_count: int = 0
+        self.step_dropped_count: int = 0
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CLOCK METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def step_rate(self) -> float:
+        """
+        TODO: Create a docstring.
+
+        :return float: Seconds per logic step.
+        """
+
+        # Returning:
+        return self.__step_rate
+
+
+    @property
+    def step_alpha(self) -> float:
+        """
+        Share of the next logic step already elapsed, from 0.0 (last logic state) to 1.0.
+
+        :return float: ...
+        """
+
+        # Calculating:
+        step_alpha: float = self.__step_accumulator / self.__step_rate
+
+        # Returning:
+        return step_alpha
+
+
+    def advance(self, delta_time: float) -> int:
+        """
+        Adds frame time and returns number of logic steps to run. If the clock falls behind by
+        more than step limit (e.g. window was dragged, or a long stall), backlog is dropped instead
+        of being simulated all at once.
+
+        :param float delta_time: Seconds since previous frame.
+
+        :return int: ...
+        """
+
+        # Accumulating time and counting whole steps:
+        self.__step_accumulator += max(delta_time, 0.0)
+        step_count: int = int(self.__step_accumulator // self.__step_rate)
+        self.__step_accumulator -= step_count * self.__step_rate
+
+        # Dropping backlog:
+        if step_count > self.__step_limit:
+            self.step_dropped_count += step_count - self.__step_limit
+            step_count: int = self.__step_limit
+
+        # Updating counter:
+        self.step_count += step_count
+
+        # Returning:
+        return step_count
+
+
+    def reset(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Resetting accumulator:
+        self.__step_accumulator: float = 0.0
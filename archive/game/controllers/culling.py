@@ -0,0 +1,434 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Math import:
+import math
+
+# Arcade library import:
+from arcade.types import Rect
+from arcade import XYWH
+
+# Related settings import:
+from game.settings import (
+    CULLING_ENABLE,
+    CULLING_CORNER_CHAMFER,
+    CULLING_AREA_EPSILON,
+    CULLING_PIECE_LIMIT,
+    CULLING_CACHE_SIZE,
+    )
+
+# Controllers import:
+from game.controllers.card import Card_Object
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CULLING CLASS OBJECT BLOCK
+
+"""
+
+
+class Culling_Controller:
+    """
+    Skips cards fully covered by cards drawn above them (discard pile, table stacks, overlapped
+    hands). Cards are rotated rectangles: opaque areas (rectangle with transparent corners cut) of
+    cards above are subtracted from a card's rectangle, card is hidden if nothing is left. Result
+    is conservative (slivers count as visible, too many pieces give up), so nothing visible is ever
+    skipped. Drawn and culled cards are counted per frame.
+    """
+
+    def __init__(self) -> None:
+
+        # Frame statistics (current frame, and the last completed one):
+        self.__frame_drawn_count:           int = 0
+        self.__frame_culled_count:          int = 0
+        self.__frame_drawn_count_previous:  int = 0
+        self.__frame_culled_count_previous: int = 0
+
+        # Hidden card positions by card layout (rects and angles of a container):
+        self.__cull_cache: dict[tuple, frozenset[int]] = {}
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    STATISTICS METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def frame_drawn_count(self) -> int:
+        """
+        Cards drawn in the last completed frame.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__frame_drawn_count_previous
+
+
+    @property
+    def frame_culled_count(self) -> int:
+        """
+        Cards culled in the last completed frame.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__frame_culled_count_previous
+
+
+    @property
+    def frame_stats(self) -> dict[str, int]:
+        """
+        TODO: Create a docstring.
+
+        :return dict[str, int]: ...
+        """
+
+        # Packing up:
+        frame_stats: dict[str, int] = {
+            "drawn": self.frame_drawn_count,
+            "culled": self.frame_culled_count,
+            }
+
+        # Returning:
+        return frame_stats
+
+
+    def start_frame(self) -> None:
+        """
+        Completes previous frame statistics and starts counting a new frame.
+        """
+
+        # Updating statistics:
+        self.__frame_drawn_count_previous: int = self.__frame_drawn_count
+        self.__frame_culled_count_previous: int = self.__frame_culled_count
+        self.__frame_drawn_count: int = 0
+        self.__frame_culled_count: int = 0
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CULLING METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @staticmethod
+    def __create_card_polygon(render_rect: Rect, render_angle: float, corner_chamfer: float = 0.0) -> list[tuple[float, float]]:
+        """
+        Creates card polygon as drawn: rectangle rotated clockwise around its center, points in
+        counter-clockwise order. With chamfer, corners are cut off (octagon).
+
+        :param Rect render_rect: ...
+        :param float render_angle: Degrees.
+        :param float corner_chamfer: Cut along both edges of every corner (transparent corners).
+
+        :return list[tuple[float, float]]: ...
+        """
+
+        # Calculating rotation:
+        angle_radians: float = math.radians(render_angle)
+        angle_cos: float = math.cos(angle_radians)
+        angle_sin: float = math.sin(angle_radians)
+        half_width: float = render_rect.width / 2
+        half_height: float = render_rect.height / 2
+
+        # Generating points (card frame):
+        if corner_chamfer > 0:
+            point_local_list: tuple[tuple[float, float], ...] = (
+                (-half_width + corner_chamfer, -half_height),
+                (half_width - corner_chamfer, -half_height),
+                (half_width, -half_height + corner_chamfer),
+                (half_width, half_height - corner_chamfer),
+                (half_width - corner_chamfer, half_height),
+                (-half_width + corner_chamfer, half_height),
+                (-half_width, half_height - corner_chamfer),
+                (-half_width, -half_height + corner_chamfer),
+                )
+        else:
+            point_local_list: tuple[tuple[float, float], ...] = (
+                (-half_width, -half_height),
+                (half_width, -half_height),
+                (half_width, half_height),
+                (-half_width, half_height),
+                )
+
+        # Rotating points:
+        card_polygon: list[tuple[float, float]] = [
+            (
+                render_rect.x + point_x * angle_cos + point_y * angle_sin,
+                render_rect.y - point_x * angle_sin + point_y * angle_cos,
+                )
+            for point_x, point_y in point_local_list
+            ]
+
+        # Returning:
+        return card_polygon
+
+
+    @staticmethod
+    def __clip_polygon(polygon: list[tuple[float, float]],
+                       edge_start: tuple[float, float],
+                       edge_end: tuple[float, float],
+                       keep_inside: bool
+                       ) -> list[tuple[float, float]]:
+        """
+        Clips convex polygon by an edge line (one Sutherland-Hodgman step). Inside is left of the
+        edge, as for counter-clockwise polygons.
+
+        :param list[tuple[float, float]] polygon: ...
+        :param tuple[float, float] edge_start: ...
+        :param tuple[float, float] edge_end: ...
+        :param bool keep_inside: Keeps part inside of the edge, otherwise part outside.
+
+        :return list[tuple[float, float]]: Empty, if nothing is left.
+        """
+
+        # Calculating side of every point (positive is inside):
+        edge_x: float = edge_end[0] - edge_start[0]
+        edge_y: float = edge_end[1] - edge_start[1]
+        side_sign: float = 1.0 if keep_inside else -1.0
+        side_list: list[float] = [
+            side_sign * (edge_x * (point_y - edge_start[1]) - edge_y * (point_x - edge_start[0]))
+            for point_x, point_y in polygon
+            ]
+
+        # Clipping:
+        polygon_clipped: list[tuple[float, float]] = []
+        point_previous: tuple[float, float] = polygon[-1]
+        side_previous: float = side_list[-1]
+        for point_current, side_current in zip(polygon, side_list):
+            if (side_current >= 0) != (side_previous >= 0):
+                side_ratio: float = side_previous / (side_previous - side_current)
+                polygon_clipped.append((
+                    point_previous[0] + (point_current[0] - point_previous[0]) * side_ratio,
+                    point_previous[1] + (point_current[1] - point_previous[1]) * side_ratio,
+                    ))
+            if side_current >= 0:
+                polygon_clipped.append(point_current)
+            point_previous, side_previous = point_current, side_current
+
+        # Returning:
+        return polygon_clipped
+
+
+    @staticmethod
+    def __calculate_polygon_area(polygon: list[tuple[float, float]]) -> float:
+        """
+        TODO: Create a docstring.
+
+        :param list[tuple[float, float]] polygon: ...
+
+        :return float: ...
+        """
+
+        # Calculating (shoelace formula):
+        polygon_area: float = 0.0
+        point_previous: tuple[float, float] = polygon[-1]
+        for point_current in polygon:
+            polygon_area += point_previous[0] * point_current[1] - point_current[0] * point_previous[1]
+            point_previous: tuple[float, float] = point_current
+
+        # Returning:
+        return abs(polygon_area) / 2
+
+
+    @staticmethod
+    def __subtract_polygon(polygon: list[tuple[float, float]],
+                           occluder_polygon: list[tuple[float, float]]
+                           ) -> list[list[tuple[float, float]]]:
+        """
+        Subtracts convex occluder from convex polygon: part outside of every occluder edge (and
+        inside of the edges before it) is one convex piece of what remains visible.
+
+        :param list[tuple[float, float]] polygon: ...
+        :param list[tuple[float, float]] occluder_polygon: ...
+
+        :return list[list[tuple[float, float]]]: Visible pieces, slivers below area limit dropped.
+        """
+
+        # Clipping by every occluder edge:
+        piece_list: list[list[tuple[float, float]]] = []
+        polygon_remaining: list[tuple[float, float]] = polygon
+        edge_start: tuple[float, float] = occluder_polygon[-1]
+        for edge_end in occluder_polygon:
+            piece_outside: list[tuple[float, float]] = Culling_Controller.__clip_polygon(
+                polygon_remaining, edge_start, edge_end, keep_inside = False,
+                )
+            if len(piece_outside) >= 3 and Culling_Controller.__calculate_polygon_area(piece_outside) > CULLING_AREA_EPSILON:
+                piece_list.append(piece_outside)
+            polygon_remaining: list[tuple[float, float]] = Culling_Controller.__clip_polygon(
+                polygon_remaining, edge_start, edge_end, keep_inside = True,
+                )
+            if len(polygon_remaining) < 3:
+                break
+            edge_start: tuple[float, float] = edge_end
+
+        # Returning:
+        return piece_list
+
+
+    @staticmethod
+    def __check_point_covered(point: tuple[float, float], occluder_polygon: list[tuple[float, float]]) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[float, float] point: ...
+        :param list[tuple[float, float]] occluder_polygon: Convex, counter-clockwise.
+
+        :return bool: ...
+        """
+
+        # Checking point is left of every edge:
+        point_x, point_y = point
+        edge_start: tuple[float, float] = occluder_polygon[-1]
+        for edge_end in occluder_polygon:
+            edge_side: float = (
+                (edge_end[0] - edge_start[0]) * (point_y - edge_start[1]) - 
+                (edge_end[1] - edge_start[1]) * (point_x - edge_start[0])
+                )
+            if edge_side < 0:
+                return False
+            edge_start: tuple[float, float] = edge_end
+
+        # Returning:
+        return True
+
+
+    @staticmethod
+    def __check_polygon_covered(polygon: list[tuple[float, float]],
+                                occluder_list: list[tuple[list[tuple[float, float]], tuple[float, float, float, float]]]
+                                ) -> bool:
+        """
+        Checks if polygon is covered by the union of occluders. Corner not under any occluder means
+        visible right away (most cards of a pile), otherwise occluders are subtracted one by one
+        (nearest first) until nothing is left. Gives up (not covered) over piece limit.
+
+        :param list[tuple[float, float]] polygon: ...
+        :param list occluder_list: Occluder polygons with their bounding boxes.
+
+        :return bool: ...
+        """
+
+        # Checking corners:
+        for point in polygon:
+            point_covered: bool = any(
+                Culling_Controller.__check_point_covered(point, occluder_polygon) 
+                for occluder_polygon, _ in occluder_list
+                )
+            if not point_covered:
+                return False
+
+        # Subtracting occluders:
+        piece_list: list[list[tuple[float, float]]] = [polygon]
+        for occluder_polygon, (box_left, box_bottom, box_right, box_top) in occluder_list:
+            piece_list_next: list[list[tuple[float, float]]] = []
+            for piece in piece_list:
+                piece_apart: bool = bool(
+                    max(point_x for point_x, _ in piece) <= box_left or
+                    min(point_x for point_x, _ in piece) >= box_right or
+                    max(point_y for _, point_y in piece) <= box_bottom or
+                    min(point_y for _, point_y in piece) >= box_top
+                    )
+                if piece_apart:
+                    piece_list_next.append(piece)
+                else:
+                    piece_list_next.extend(Culling_Controller.__subtract_polygon(piece, occluder_polygon))
+            piece_list: list[list[tuple[float, float]]] = piece_list_next
+            if not piece_list:
+                return True
+            if len(piece_list) > CULLING_PIECE_LIMIT:
+                return False
+
+        # Returning:
+        return False
+
+
+    def cull_card_list(self, card_list: list[Card_Object], render_alpha: float = 1.0) -> list[Card_Object]:
+        """
+        Culls cards covered by cards above them and counts the frame statistics. Result is reused
+        while card rects and angles stay the same (piles are still most of the time).
+
+        :param list[Card_Object] card_list: Cards in draw order (bottom first).
+        :param float render_alpha: Logic step interpolation (see Clock_Controller.step_alpha).
+
+        :return list[Card_Object]: Cards to draw, in draw order.
+        """
+
+        # Skipping culling (disabled, or nothing to cover):
+        if not CULLING_ENABLE or len(card_list) < 2:
+            self.__frame_drawn_count += len(card_list)
+            return card_list
+
+        # Collecting rects and angles, as drawn:
+        card_layout: tuple[tuple[float, float, float, float, float], ...] = tuple(
+            (*card_object.find_render_rect(render_alpha).xywh, card_object.render_angle_value)
+            for card_object in card_list
+            )
+
+        # Finding hidden cards (cached by layout):
+        card_hidden_set: frozenset[int] | None = self.__cull_cache.get(card_layout)
+        if card_hidden_set is None:
+            card_hidden_set: frozenset[int] = self.__find_hidden_set(card_layout)
+            if len(self.__cull_cache) >= CULLING_CACHE_SIZE:
+                self.__cull_cache.clear()
+            self.__cull_cache[card_layout] = card_hidden_set
+
+        # Counting:
+        self.__frame_drawn_count += len(card_list) - len(card_hidden_set)
+        self.__frame_culled_count += len(card_hidden_set)
+
+        # Returning:
+        if not card_hidden_set:
+            return card_list
+        card_visible_list: list[Card_Object] = [
+            card_object for card_position, card_object in enumerate(card_list)
+            if card_position not in card_hidden_set
+            ]
+        return card_visible_list
+
+
+    def __find_hidden_set(self, card_layout: tuple[tuple[float, float, float, float, float], ...]) -> frozenset[int]:
+        """
+        TODO: Create a docstring.
+
+        :param tuple card_layout: Center, size and angle of every card, in draw order.
+
+        :return frozenset[int]: Positions of hidden cards.
+        """
+
+        # Creating polygons (full card, and opaque area as occluder):
+        card_polygon_list: list[list[tuple[float, float]]] = []
+        occluder_list: list[tuple[list[tuple[float, float]], tuple[float, float, float, float]]] = []
+        for center_x, center_y, rect_width, rect_height, render_angle in card_layout:
+            render_rect: Rect = XYWH(center_x, center_y, rect_width, rect_height)
+            card_polygon_list.append(Culling_Controller.__create_card_polygon(render_rect, render_angle))
+            occluder_polygon: list[tuple[float, float]] = Culling_Controller.__create_card_polygon(
+                render_rect, render_angle, CULLING_CORNER_CHAMFER,
+                )
+            occluder_list.append((
+                occluder_polygon,
+                (
+                    min(point_x for point_x, _ in occluder_polygon),
+                    min(point_y for _, point_y in occluder_polygon),
+                    max(point_x for point_x, _ in occluder_polygon),
+                    max(point_y for _, point_y in occluder_polygon),
+                    ),
+                ))
+
+        # Checking every card against cards above it, nearest first (top card is always drawn):
+        card_hidden_list: list[int] = []
+        for card_position in range(len(card_layout) - 1):
+            card_covered: bool = Culling_Controller.__check_polygon_covered(
+                polygon = card_polygon_list[card_position],
+                occluder_list = occluder_list[card_position + 1:],
+                )
+            if card_covered:
+                card_hidden_list.append(card_position)
+
+        # Returning:
+        return frozenset(card_hidden_list)
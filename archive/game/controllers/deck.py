@@ -14,9 +14,9 @@ from game.settings import (
     # Deck render coordinates:
     DECK_RENDER_COORDINATE_X,
     DECK_RENDER_COORDINATE_Y,
-    DECK_RENDER_COORDINATE_SHIFT_X,
-    DECK_RENDER_COORDINATE_SHIFT_Y,
     DECK_RENDER_SHIFT_THRESHOLD_DEFAULT,
+    DECK_LOWEST_VALUE_DEFAULT,
+    DECK_COPY_COUNT_DEFAULT,
 
     # Card texture settings:
     CARD_TEXTURE_HEIGHT_SCALED,
@@ -38,6 +38,7 @@ from game.collections.texturepack import Texture_Pack
 
 # Controllers import:
 from game.controllers.card import Card_Object
+from game.controllers.stack import Deck_Stack_Controller
 from game.session import Session_Controller
 
 # Scripts import:
@@ -48,6 +49,7 @@ from game.scripts.cache import (
     clear_cached_property, 
     clear_cached_property_list
     )
+from game.scripts.beats import create_beats_table
 
 
 """
@@ -59,16 +61,23 @@ DECK CLASS OBJECT BLOCK
 
 class Deck_Controller:
 
-    def __init__(self) -> None:
+    def __init__(self, deck_copy_count: int = DECK_COPY_COUNT_DEFAULT) -> None:
         
+        # Deck copies (sealed deck holds every copy of every card):
+        self.__deck_copy_count: int = deck_copy_count
+
         # Deck lists:
         self.__deck_container: list[Card_Object] = []
-        self.__deck_render:    list[Card_Object] = []
+
+        # Deck render (single precomposed stack):
+        self.__deck_stack: Deck_Stack_Controller = Deck_Stack_Controller()
 
         # Additional attributes:
         self.__deck_trump: str = None
+        self.__deck_beats_table: bytearray | None = None    # <- Built for trump, see __update_deck_trump
         self.__deck_showcase_card: Card_Object | None = None
         self.__deck_shift: int = DECK_RENDER_SHIFT_THRESHOLD_DEFAULT
+        self.__deck_lowest_value: int = DECK_LOWEST_VALUE_DEFAULT
 
     
     """
@@ -122,7 +131,6 @@ class Deck_Controller:
             "deck_value",
             "deck_trump",
             "deck_trump_repr",
-            "deck_render"
             )
         
         # Returning:
@@ -146,18 +154,20 @@ class Deck_Controller:
         :return list[Card_Object]: ...
         """
         
-        # Creating card combinations list:
-        card_object_combination_list: tuple[str, str] = product(
+        # Creating card combinations list (per deck copy):
+        card_object_combination_list: tuple[int, str, str] = product(
+            range(self.__deck_copy_count),
             Card_Object.CARD_SUIT_LIST,
             Card_Object.CARD_TYPE_LIST
             )
         
         # Creating card objects and forming a list:
         card_object_list: list[Card_Object] = []
-        for card_suit, card_type in card_object_combination_list:
+        for card_copy, card_suit, card_type in card_object_combination_list:
             card_object: Card_Object = Card_Object.create_card_object(
                 init_suit = card_suit,
                 init_type = card_type,
+                init_copy = card_copy,
                 )
             
             # Updating card object's attributes:
@@ -182,15 +192,62 @@ class Deck_Controller:
 
 
     @cached_property
-    def deck_render(self) -> list[Card_Object]:
+    def deck_sealed_index(self) -> dict[int, Card_Object]:
         """
         TODO: Create a docstring.
 
-        :return list[Card_Object]: ...
+        Cached. Cannot be cleared.
+
+        :return dict[int, Card_Object]: ...
+        """
+
+        # Indexing sealed deck by card uid (card id, if single deck):
+        deck_sealed_index: dict[int, Card_Object] = {
+            card_object.card_uid: card_object
+            for card_object in self.deck_sealed
+            }
+
+        # Returning:
+        return deck_sealed_index
+
+
+    def find_card_sealed(self, card_uid: int) -> Card_Object:
+        """
+        TODO: Create a docstring.
+
+        :param int card_uid: Card uid, see Card_Object.card_uid (card id, if single deck).
+
+        :raise KeyError: if card uid is not recognized.
+
+        :return Card_Object: ...
         """
 
         # Returning:
-        return self.__deck_render
+        return self.deck_sealed_index[card_uid]
+
+
+    @property
+    def deck_copy_count(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__deck_copy_count
+
+
+    @property
+    def deck_stack(self) -> Deck_Stack_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Deck_Stack_Controller: ...
+        """
+
+        # Returning:
+        return self.__deck_stack
 
 
     @cached_property
@@ -250,6 +307,19 @@ class Deck_Controller:
         return self.__deck_trump
 
 
+    @property
+    def deck_beats_table(self) -> bytearray | None:
+        """
+        Beats table of this deck's trump (card id pairs, see create_beats_table), set on every
+        card of the sealed deck, so cards of different games never share a table.
+
+        :return bytearray | None: None before the deck is prepared.
+        """
+
+        # Returning:
+        return self.__deck_beats_table
+
+
     @cached_property
     def deck_trump_repr(self) -> str:
         """
@@ -268,6 +338,30 @@ class Deck_Controller:
         return deck_trump_repr
     
 
+    @property
+    def deck_shift(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__deck_shift
+
+
+    @property
+    def deck_lowest_value(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__deck_lowest_value
+    
+
     @cached_property
     def deck_showcase_card(self) -> Card_Object | None:
         """
@@ -293,8 +387,9 @@ class Deck_Controller:
         :raise AssertionError: ...
         """
 
-        # Updating deck shift:
+        # Updating deck shift and lowest value:
         self.__deck_shift: int = deck_shift
+        self.__deck_lowest_value: int = deck_lowest_value
 
         # Creating new deck container:
         self.__prepare_deck_container(
@@ -308,6 +403,58 @@ class Deck_Controller:
             )
 
 
+    def load_deck(self, 
+                  deck_shift: int, 
+                  deck_lowest_value: int,
+                  deck_trump: str, 
+                  card_id_list: list[int] | tuple[int, ...]
+                  ) -> None:
+        """
+        Restores deck in the given order (first card is drawn first, last one is showcased) instead
+        of shuffling a new one.
+
+        :param int deck_shift: ...
+        :param int deck_lowest_value: ...
+        :param str deck_trump: ...
+        :param list[int] card_id_list: Card uids (see Card_Object.card_uid).
+
+        :raise KeyError: if card uid is not recognized.
+        """
+
+        # Updating deck shift, lowest value and container:
+        self.__deck_shift: int = deck_shift
+        self.__deck_lowest_value: int = deck_lowest_value
+        self.__deck_container: list[Card_Object] = [
+            self.find_card_sealed(card_id) for card_id in card_id_list
+            ]
+
+        # Updating trump and card objects:
+        self.__update_deck_trump(
+            deck_trump = deck_trump
+            )
+
+        # Creating new deck render (empty, if there are no cards left):
+        if self.deck_count > 0:
+            card_trump: Card_Object = self.deck_container[-1]
+            self.__prepare_deck_render(
+                card_trump = card_trump,
+                )
+        else:
+            self.__deck_stack.create_stack(
+                stack_count = 0,
+                stack_shift = self.__deck_shift,
+                texture_pack_back = None,
+                )
+            self.__deck_showcase_card: Card_Object | None = None
+
+            # Clearing cache (property):
+            cached_property: str = "deck_showcase_card"
+            clear_cached_property(
+                target_object = self,
+                target_attribute = cached_property
+                )
+
+
     def update_render_texture(self, 
                               texture_pack_front: Texture_Pack, 
                               texture_pack_back: Texture_Pack,
@@ -327,12 +474,17 @@ class Deck_Controller:
         if SESSION_ENABLE_ASSERTION and not ignore_assertion:
             ...
     
-        # Updating texture packs per card object:
-        for card_object in self.deck_render:
-            card_object.update_texture(
+        # Updating showcase card's texture packs:
+        if self.deck_showcase_card is not None:
+            self.deck_showcase_card.update_texture(
                 texture_pack_front = texture_pack_front,
                 texture_pack_back = texture_pack_back,
                 )
+            
+        # Updating stack texture pack (precomposed texture is reused, if already generated):
+        self.__deck_stack.set_texture_pack_back(
+            texture_pack = texture_pack_back
+            )
 
 
     def __prepare_deck_container(self, deck_lowest_value: int) -> None:
@@ -363,16 +515,40 @@ class Deck_Controller:
         card_trump: Card_Object = self.__deck_container[-1]
         card_trump_suit: str = card_trump.suit
         
+        # Updating trump and card objects:
+        self.__update_deck_trump(
+            deck_trump = card_trump_suit
+            )
+
+
+    def __update_deck_trump(self, deck_trump: str) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str deck_trump: ...
+        """
+
         # Updating attribute:
-        self.__deck_trump: str = card_trump_suit
+        self.__deck_trump: str = deck_trump
+
+        # Updating trump state of every card (cards in hands, on table and discard come from here):
+        for card_object in self.deck_sealed:
+            card_object.set_state_trump(
+                set_value = card_object.suit == deck_trump
+                )
+
+        # Rebuilding beats table for the new trump and setting it on every card (card comparison):
+        self.__deck_beats_table: bytearray = create_beats_table(
+            deck_trump = deck_trump
+            )
+        for card_object in self.deck_sealed:
+            card_object.set_beats_table(
+                beats_table = self.__deck_beats_table
+                )
 
         # Updating card objects:
-        if self.deck_count > 0:
-            for card_object in self.deck_container:
-                if card_object.suit == card_trump_suit:
-                    card_object.set_state_trump(
-                        set_value = True
-                        )
+        if len(self.__deck_container) > 0:
+            for card_object in self.__deck_container:
                     
                 # Setting card coordinates current:
                 coordinates_current: tuple[int, int] = (
@@ -398,74 +574,13 @@ class Deck_Controller:
         :param Card_Object card_trump: ...
         """
 
-        # Preparing coordinate shift values:
-        coordinate_x_shift: int = 0
-        coordinate_y_shift: int = 0
-        
-        # Creating a render deck container:
-        deck_render: list[Card_Object] = []
-        deck_render_size: int = 0
-        deck_render_max_size: int = self.deck_count - 1
-        while deck_render_size < deck_render_max_size:
-
-            # Creating "fake" card:
-            suit_choice: str = Card_Object.CARD_SUIT_LIST[0]
-            type_choice: str = Card_Object.CARD_TYPE_LIST[0]
-            card_render: Card_Object = Card_Object.create_card_object(
-                init_suit = suit_choice,
-                init_type = type_choice,
-                texture_pack_front = card_trump.texture_pack_front,
-                texture_pack_back = card_trump.texture_pack_back,
-                )
-            
-            # Updating card object's attributes:
-            position_index: int = len(deck_render)
-            card_render.set_position_deck(
-                position_index = position_index
-                )
-            card_render.set_state_revealed(
-                set_value = False
-                )
-            
-            # Adding card to the list:
-            deck_render.append(
-                card_render
-                )
-            
-            # Updating size variable:
-            deck_render_size: int = len(deck_render)
-
-        # Setting coordinates in reversed order:
-        card_render_count: int = 0
-        for card_render in reversed(deck_render):
-            card_render_count += 1
-
-            # Checking if coordinate shift is required:      
-            shift_required: bool = bool(
-                card_render_count >= 1 and
-                card_render_count % self.__deck_shift == 0
-                )
-            if shift_required:
-                coordinate_x_shift += DECK_RENDER_COORDINATE_SHIFT_X
-                coordinate_y_shift += DECK_RENDER_COORDINATE_SHIFT_Y
-
-            # Calculating coordinates:
-            card_coordinate_x: int = DECK_RENDER_COORDINATE_X + coordinate_x_shift
-            card_coordinate_y: int = DECK_RENDER_COORDINATE_Y + coordinate_y_shift
-            card_coordinates: tuple[int, int] = (
-                card_coordinate_x,
-                card_coordinate_y
-                )
-
-            # Updating coordinates:
-            card_render.set_coordinates_default(
-                set_container = card_coordinates,
-                ignore_assertion = True,
-                )
-            card_render.set_coordinates_current(
-                set_container = card_coordinates,
-                ignore_assertion = True
-                )
+        # Creating a render stack (every card except the showcase one):
+        stack_count: int = self.deck_count - 1
+        self.__deck_stack.create_stack(
+            stack_count = stack_count,
+            stack_shift = self.__deck_shift,
+            texture_pack_back = card_trump.texture_pack_back,
+            )
 
         # Creating a showcase trump card:
         card_render_trump: Card_Object = Card_Object.create_card_object(
@@ -499,7 +614,7 @@ class Deck_Controller:
             )
         
         # Updating showcase trump card's attributes:
-        position_index: int = len(deck_render)
+        position_index: int = stack_count
         card_render_trump.set_position_deck(
             position_index = position_index
             )
@@ -510,22 +625,9 @@ class Deck_Controller:
             set_value = True
             )
         
-        # Adding card to the list:
-        deck_render.append(
-            card_render_trump
-            )
-        
         # Updating attribute:
-        self.__deck_render: list[Card_Object] = deck_render
         self.__deck_showcase_card: Card_Object | None = card_render_trump
         
-        # Clearing cache (render deck):
-        cached_property: str = "deck_render"
-        clear_cached_property(
-            target_object = self,
-            target_attribute = cached_property
-            )
-        
         # Clearing cache (showcase card):
         cached_property: str = "deck_showcase_card"
         clear_cached_property(
@@ -667,8 +769,9 @@ class Deck_Controller:
                 card_object
                 )
 
-            # Deck render update (removing one card from the container):
-            self.__deck_render.pop(0)
+            # Deck render update (removing one card from the stack):
+            if self.__deck_stack.stack_count > 0:
+                self.__deck_stack.remove_card()
 
             # Clearing cache (deck):
             if clear_cache:
@@ -685,26 +788,18 @@ class Deck_Controller:
     """
 
 
-    def render(self) -> None:
+    def render(self, render_alpha: float = 1.0) -> None:
         """
         TODO: Create a docstring.
-        """
 
-        # Cycling through cards in reversed order:
-        card_render_count: int = 0
-        for card_render in reversed(self.deck_render):
-            card_render_count += 1
+        :param float render_alpha: Logic step interpolation (see Clock_Controller.step_alpha).
+        """
 
-            # Checking if render is required:
-            render_required: bool = bool(
-                card_render_count > 0 and bool(
-                    card_render_count % self.__deck_shift == 0 or 
-                    card_render_count < self.__deck_shift or
-                    card_render_count == 1
-                    )
+        # Rendering showcase card (beneath the stack):
+        if self.deck_showcase_card is not None:
+            self.deck_showcase_card.render(
+                render_alpha = render_alpha
                 )
-            
-            # Rendering:
-            if render_required:
-                card_render.render()
 
+        # Rendering precomposed stack:
+        self.__deck_stack.render()
@@ -20,6 +20,7 @@ from game.settings import (
 
 # Controllers import:
 from game.controllers.card import Card_Object
+from game.controllers.culling import Culling_Controller
 
 # Scripts import:
 from game.scripts.convert import (
@@ -197,9 +198,12 @@ class Discard_Controller:
         # Checking if card does not exist in hand container:
         if card_object not in self.discard_container:
 
-            # Resetting card object's position and state:
-            card_object.reset_state()
-            card_object.reset_position()
+            # Resetting card object's position and state (single cache clear):
+            card_object.update(
+                reset_state = True,
+                reset_position = True,
+                ignore_assertion = True,
+                )
 
             # Updating card object's hand position:
             position_index: int = len(self.__discard_container)   # <- Using init container
@@ -291,12 +295,23 @@ class Discard_Controller:
     """
 
 
-    def render(self) -> None:
+    def render(self, card_culling: Culling_Controller | None = None) -> None:
         """
         TODO: Create a docstring.
+
+        :param Culling_Controller | None card_culling: Skips cards hidden under the pile.
         """
 
+        # Collecting cards in draw order (first discarded card on top):
+        card_render_list: list[Card_Object] = self.discard_container[::-1]
+
+        # Culling hidden cards:
+        if card_culling is not None:
+            card_render_list: list[Card_Object] = card_culling.cull_card_list(
+                card_list = card_render_list,
+                )
+
         # Cycling through cards and calling render method:
-        for card_object in reversed(self.discard_container):
+        for card_object in card_render_list:
             card_object.render()
 
@@ -0,0 +1,126 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Callable
+
+# Controllers import:
+from game.controllers.card import Card_Object
+from game.controllers.player import Player_Controller
+
+# Collections import:
+from game.collections.event import Game_Event
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EVENT CONTROLLER CLASS OBJECT BLOCK
+
+"""
+
+
+class Event_Controller:
+    """
+    Internal event bus of the game controller. Handlers subscribe to event types, a published event
+    is passed to its handlers right away, in subscription order (no queue, state changed by a
+    handler is visible to the next one).
+    """
+
+    def __init__(self) -> None:
+
+        # Handlers by event type:
+        self.__handler_index: dict[str, list[Callable[[Game_Event], None]]] = {}
+
+        # Statistics:
+        self.__publish_count: int = 0
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    STATISTICS PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def publish_count(self) -> int:
+        """
+        Events published since the controller was created.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__publish_count
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SUBSCRIPTION METHODS BLOCK
+
+    """
+
+
+    def subscribe(self, event_type: str, event_handler: Callable[[Game_Event], None]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str event_type: ...
+        :param Callable event_handler: Called with the published event.
+        """
+
+        # Adding handler (once):
+        handler_list: list[Callable[[Game_Event], None]] = self.__handler_index.setdefault(event_type, [])
+        if event_handler not in handler_list:
+            handler_list.append(
+                event_handler
+                )
+
+
+    def unsubscribe(self, event_type: str, event_handler: Callable[[Game_Event], None]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str event_type: ...
+        :param Callable event_handler: ...
+        """
+
+        # Removing handler, if subscribed:
+        handler_list: list[Callable[[Game_Event], None]] = self.__handler_index.get(event_type, [])
+        if event_handler in handler_list:
+            handler_list.remove(
+                event_handler
+                )
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    PUBLISH METHODS BLOCK
+
+    """
+
+
+    def publish(self,
+                event_type: str,
+                card_object: Card_Object | None = None,
+                player_controller: Player_Controller | None = None
+                ) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str event_type: ...
+        :param Card_Object | None card_object: ...
+        :param Player_Controller | None player_controller: ...
+        """
+
+        # Skipping events nobody listens to:
+        handler_list: list[Callable[[Game_Event], None]] | None = self.__handler_index.get(event_type)
+        if handler_list:
+
+            # Passing event to handlers:
+            game_event: Game_Event = Game_Event(
+                event_type = event_type,
+                card_object = card_object,
+                player_controller = player_controller,
+                )
+            for event_handler in handler_list:
+                event_handler(game_event)
+            self.__publish_count += 1
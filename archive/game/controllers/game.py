@@ -1,23 +1,42 @@
 # Typing library import:
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 # Random library:
 import random
 
 # Cache-related import:
-from functools import cached_property
+from functools import cached_property, partial
 
 # Controllers import:
 from game.session import Session_Controller
 from game.controllers.card import Card_Object
 from game.controllers.deck import Deck_Controller
+from game.controllers.stack import Deck_Stack_Controller
 from game.controllers.discard import Discard_Controller
 from game.controllers.table import Table_Controller
 from game.controllers.player import Player_Controller
+from game.controllers.profiler import Profiler_Controller
+from game.controllers.tween import Tween_Controller
+from game.controllers.culling import Culling_Controller
+from game.controllers.event import Event_Controller
+from game.controllers.playable import Playable_Controller
+from game.controllers.tracker import Tracker_Controller
+from game.controllers.telemetry import Telemetry_Controller
 
 # Collections import:
-from game.collections.keyboard import Keyboard_Mapping
+from game.collections.keyboard import (
+    Keyboard_Mapping,
+    KEY_MODIFIER_NONE,
+    KEY_MODIFIER_MASK,
+    )
 from game.collections.texturepack import Texture_Pack
+from game.collections.snapshot import (
+    Game_Snapshot,
+    SNAPSHOT_SESSION_FLAG_LIST,
+    )
+from game.collections.state import Game_State, State_Move
+from game.collections.solver import State_Solver
+from game.collections.evaluator import State_Evaluator, EVALUATOR_AVAILABLE
 from game.collections.zone import (
 
     # Zone class object:
@@ -45,6 +64,8 @@ from game.variables import (
     PLAYER_STATE_FOCUS_DEFENDING,
 
     # Texture-related variables:
+    TEXTURE_PACK_TYPE_FRONT,
+    TEXTURE_PACK_TYPE_BACK,
     TEXTURE_PACK_MODE_LIGHT,
     TEXTURE_PACK_MODE_DARK,
 
@@ -53,6 +74,17 @@ from game.variables import (
     HAND_SORT_METHOD_BY_VALUE_DEFAULT,
     HAND_SORT_METHOD_BY_TIME_ADDED,
     HAND_SORT_METHOD_BY_SUIT,
+
+    # Card identifier variables:
+    CARD_ID_NOT_SET,
+
+    # Game event variables:
+    EVENT_TABLE_CARD_ADDED,
+    EVENT_TABLE_CARD_REMOVED,
+    EVENT_HAND_CARD_ADDED,
+    EVENT_HAND_CARD_REMOVED,
+    EVENT_DISCARD_CARD_ADDED,
+    EVENT_ROLES_SWITCHED,
     )
 
 # Settings import:
@@ -64,18 +96,41 @@ from game.settings import (
     DECK_LOWEST_VALUE_DEFAULT,
     DECK_LOWEST_VALUE_EXTENDED,
 
-    # Hand size default:
+    # Hand size default and layout settings:
     HAND_CARD_COUNT_DEFAULT,
+    HAND_PLAYER_TWO_COORDINATE_Y,
+    HAND_OPPONENT_AREA_X_LEFT,
+    HAND_OPPONENT_AREA_WIDTH,
+    HAND_OPPONENT_SLOT_GAP,
+    CARD_TEXTURE_WIDTH_SCALED,
+
+    # Player count settings:
+    PLAYER_COUNT_MIN,
+    PLAYER_COUNT_MAX,
 
     # Table settings:
     TABLE_STACK_BOTTOM_INDEX,
     TABLE_STACK_TOP_INDEX,
+    TABLE_STACK_RANGE,
+    TABLE_POSITION_RANGE,
+
+    # Logic step and tween settings:
+    GAME_LOGIC_UPDATE_RATE,
+    TWEEN_DURATION_HAND,
+    TWEEN_DURATION_TABLE,
+    TWEEN_DURATION_DISCARD,
+    TWEEN_STAGGER_DELAY,
+    TEXTURE_WARMUP_CARD_COUNT,
+
+    # Playable state tracker settings:
+    PLAYABLE_TRACKER_ENABLE,
     )
 
 # Session global variables import:
 from game.session import (
     SESSION_ENABLE_ASSERTION,
     SESSION_ENABLE_ECHO,
+    SESSION_ENABLE_DEBUG,
     )
 
 # Scripts import:
@@ -86,6 +141,7 @@ from game.scripts.cache import (
     clear_cached_property, 
     clear_cached_property_list
     )
+from game.scripts.texture import preload_texture_pack_list
 
 
 """
@@ -99,16 +155,50 @@ class Game_Controller:
 
     def __init__(self) -> None:
 
-        # Controllers:
-        self.__player_one_controller: Player_Controller = None
-        self.__player_two_controller: Player_Controller = None
+        # Controllers (players are seated in a ring, player one first):
+        self.__player_ring:           list[Player_Controller] = []
         self.__table_controller:      Table_Controller = None
         self.__deck_controller:       Deck_Controller = None
         self.__discard_controller:    Discard_Controller = None
         self.__session_controller:    Session_Controller = None
 
-        # Keyboard mapping controller:
+        # Keyboard mapping controller (and mapping version dispatch map was built for):
         self.__keyboard_mapping:      Keyboard_Mapping = Keyboard_Mapping()
+        self.__keyboard_dispatch_version: int = self.__keyboard_mapping.mapping_version
+
+        # Memory profiler controller (idle until started):
+        self.__profiler_controller:   Profiler_Controller = Profiler_Controller()
+
+        # Telemetry controller (idle until started):
+        self.__telemetry_controller:  Telemetry_Controller = Telemetry_Controller()
+
+        # Endgame solver (created on first use, see find_endgame_move):
+        self.__state_solver:          State_Solver | None = None
+
+        # Position evaluator (created on first use, see find_computer_move):
+        self.__state_evaluator:       State_Evaluator | None = None
+
+        # Tween controller (card movement between containers):
+        self.__tween_controller:      Tween_Controller = Tween_Controller()
+
+        # Culling controller (hidden cards are not drawn):
+        self.__culling_controller:    Culling_Controller = Culling_Controller()
+
+        # Event controller (internal event bus) and playable state tracker subscribed to it:
+        self.__event_controller:      Event_Controller = Event_Controller()
+        self.__playable_controller:   Playable_Controller = Playable_Controller()
+        self.__playable_controller.subscribe(
+            event_controller = self.__event_controller
+            )
+
+        # Card tracker (public knowledge of cards) subscribed to event bus:
+        self.__tracker_controller:    Tracker_Controller = Tracker_Controller()
+        self.__tracker_controller.subscribe(
+            event_controller = self.__event_controller
+            )
+
+        # Cards with front textures to load ahead of use (while cards are moving):
+        self.__texture_warmup_list: list[Card_Object] = []
 
         # Related card objects:
         self.__card_selected: Card_Object | None = None
@@ -118,6 +208,10 @@ class Game_Controller:
         self.__zone_current_area:    Zone_XYWH | None = None
         self.__zone_current_section: Zone_XYWH | None = None
 
+        # Opponent hand slots (3+ players, opponents share player two zone):
+        self.__hand_slot_x_left: float = 0.0
+        self.__hand_slot_width:  float = 0.0
+
 
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -139,6 +233,7 @@ class Game_Controller:
             "player_one",
             "player_two",
             "player_list",
+            "player_count",
             "player_active",
             "player_inactive",
             "player_attacking",
@@ -257,8 +352,7 @@ class Game_Controller:
 
         # Asserting all controllers are set:
         controllers_list: tuple[Any, ...] = (
-            self.__player_one_controller,
-            self.__player_two_controller,
+            len(self.__player_ring) >= PLAYER_COUNT_MIN,
             self.__table_controller,
             self.__deck_controller,
             self.__discard_controller,
@@ -282,6 +376,17 @@ class Game_Controller:
         if self.session is None:
             self.create_session()
 
+        # Profiling, previous game ends here:
+        if self.__deck_controller is not None:
+            self.profiler.take_snapshot(
+                snapshot_label = "game_end"
+                )
+
+        # Stopping tweens from previous game, playable state and card tracking (rebuilt once dealt):
+        self.tween.clear_tweens()
+        self.playable.reset()
+        self.tracker.reset()
+
         # Creating various controllers:
         self.__create_deck(
             deck_shift = deck_shift,
@@ -290,11 +395,17 @@ class Game_Controller:
         self.__create_table()
         self.__create_discard()
 
-        # Checking if player controllers exist:
-        preserve_player_controllers: bool = bool(
-            self.__player_one_controller is not None and
-            self.__player_two_controller is not None
-            ) 
+        # Checking player count (every player is dealt a full hand):
+        player_count: int = self.session.player_count
+        if not PLAYER_COUNT_MIN <= player_count <= PLAYER_COUNT_MAX:
+            error_message: str = f"Player count is out of range ({player_count=})."
+            raise ValueError(error_message)
+        if player_count * HAND_CARD_COUNT_DEFAULT > self.deck.deck_count:
+            error_message: str = f"Deck is too small to deal {player_count} hands ({self.deck.deck_count=})."
+            raise ValueError(error_message)
+
+        # Checking if player controllers exist (same number of players):
+        preserve_player_controllers: bool = len(self.__player_ring) == player_count
         
         # Resetting or creating player controllers based on check:
         if preserve_player_controllers:
@@ -303,14 +414,27 @@ class Game_Controller:
         else:
             self.__create_player_controllers()
 
-        # Filling hands (initial):
+        # Filling hands (initial, texture warm-up of previous game is dropped):
+        self.__texture_warmup_list.clear()
         self.__fill_hands_initial()        
             
         # Getting player priority (who plays first):
         self.__update_player_priority()
-        self.player_active.hand.update_hand_state(
-            player_focus_state = PLAYER_STATE_FOCUS_ATTACKING,
-            table_map = self.table.table_map
+        if PLAYABLE_TRACKER_ENABLE:
+            self.playable.rebuild(
+                player_list = self.player_list,
+                table_controller = self.table,
+                )
+        else:
+            self.player_active.hand.update_hand_state(
+                player_focus_state = PLAYER_STATE_FOCUS_ATTACKING,
+                table_map = self.table.table_map
+                )
+        self.tracker.rebuild(
+            player_list = self.player_list,
+            deck_controller = self.deck,
+            table_controller = self.table,
+            discard_controller = self.discard,
             )
 
         # Clearing cache (player):
@@ -327,12 +451,31 @@ class Game_Controller:
         
         # Updating textures (from previous game):
         update_texture_pack: bool = bool(
-            self.session.texture_pack_front != self.session.texture_pack_front_default and
-            self.session.texture_pack_back != self.session.texture_pack_back_default
+            self.session.texture_pack_front.pack_container != 
+            self.session.texture_pack_front_default.pack_container or
+            self.session.texture_pack_back.pack_container != 
+            self.session.texture_pack_back_default.pack_container
             )
         if update_texture_pack:
             self.update_texture_pack()
 
+        # Profiling, new game starts here:
+        self.profiler.take_snapshot(
+            snapshot_label = "game_start"
+            )
+
+        # Recording telemetry:
+        if self.telemetry.telemetry_running:
+            self.telemetry.record(
+                event_name = "deal",
+                event_data = {
+                    "trump": self.deck.deck_trump,
+                    "deck": self.deck.deck_count,
+                    "hands": [player_controller.hand.hand_count for player_controller in self.player_list],
+                    "attacker": self.player_list.index(self.player_attacking),
+                    },
+                )
+
 
     def create_game_custom(self) -> None:
         """
@@ -453,17 +596,345 @@ class Game_Controller:
                     clear_cache = True
                     )
                 
-        # Updating hand positions and sorting:
+        # Updating hand positions and sorting (opponents' hands in the order cards were added):
         self.task_sort_hand_default(
             player_controller = self.player_one,
             reset_coordinates = True
             )
-        self.__task_sort_hand(
-            player_controller = self.player_two,
-            sort_method = HAND_SORT_METHOD_BY_TIME_ADDED,
-            reset_coordinates = True
+        for player_controller in self.player_list[1:]:
+            self.__task_sort_hand(
+                player_controller = player_controller,
+                sort_method = HAND_SORT_METHOD_BY_TIME_ADDED,
+                reset_coordinates = True
+                )
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SNAPSHOT METHODS BLOCK
+
+    """
+
+
+    def create_snapshot(self) -> Game_Snapshot:
+        """
+        Captures current game state (deck order, trump, hands, table, discard, player states and
+        session options). Use Game_Snapshot.encode to get bytes.
+
+        :raise ValueError: if there are more than two players (snapshot holds two hands).
+
+        :return Game_Snapshot: ...
+        """
+
+        # Checking player count:
+        if self.player_count != PLAYER_COUNT_MIN:
+            error_message: str = f"Snapshots support two player games only ({self.player_count=})."
+            raise ValueError(error_message)
+
+        # Flattening table map (position, then stack index):
+        table_id_list: list[int] = []
+        for position_index in TABLE_POSITION_RANGE:
+            for stack_index in TABLE_STACK_RANGE:
+                card_object: Card_Object | None = self.table.table_map[position_index][stack_index]
+                table_id_list.append(
+                    CARD_ID_NOT_SET if card_object is None else card_object.card_uid
+                    )
+
+        # Collecting snapshot values:
+        game_snapshot: Game_Snapshot = Game_Snapshot(
+            deck_trump = self.deck.deck_trump,
+            deck_lowest_value = self.deck.deck_lowest_value,
+            deck_shift = self.deck.deck_shift,
+            deck_copy_count = self.deck.deck_copy_count,
+            deck_id_list = tuple(card_object.card_uid for card_object in self.deck.deck_container),
+            hand_one_id_list = tuple(
+                card_object.card_uid for card_object 
+                in self.player_one.hand.hand_container
+                ),
+            hand_two_id_list = tuple(
+                card_object.card_uid for card_object 
+                in self.player_two.hand.hand_container
+                ),
+            table_id_list = tuple(table_id_list),
+            discard_id_list = tuple(
+                card_object.card_uid for card_object 
+                in self.discard.discard_container
+                ),
+            player_one_active = self.player_one.state_active,
+            player_one_attacking = self.player_one.state_attacking,
+            player_one_name = self.player_one.player_name,
+            player_two_name = self.player_two.player_name,
+            sort_method = self.session.sort_method,
+            session_flag_index = {
+                flag_name: getattr(self.session, flag_name) 
+                for flag_name in SNAPSHOT_SESSION_FLAG_LIST
+                },
+            )
+        
+        # Returning:
+        return game_snapshot
+
+
+    def load_snapshot(self, game_snapshot: Game_Snapshot) -> None:
+        """
+        Rebuilds every controller from the snapshot, replacing the current game.
+
+        :param Game_Snapshot game_snapshot: ...
+
+        :raise ValueError: if snapshot cards do not form a deck (see Game_Snapshot.validate).
+        """
+
+        # Checking cards before anything is replaced:
+        game_snapshot.validate()
+
+        # Checking if session exists and restoring session options:
+        if self.session is None:
+            self.create_session()
+        self.session.deck_lowest_value = game_snapshot.deck_lowest_value
+        self.session.sort_method = game_snapshot.sort_method
+        for flag_name, flag_value in game_snapshot.session_flag_index.items():
+            setattr(self.session, flag_name, flag_value)
+        if game_snapshot.player_one_name:
+            self.session.player_one_name = game_snapshot.player_one_name
+        if game_snapshot.player_two_name:
+            self.session.player_two_name = game_snapshot.player_two_name
+        self.session.player_count = PLAYER_COUNT_MIN
+        self.session.deck_copy_count = game_snapshot.deck_copy_count
+
+        # Stopping tweens and texture warm-up of replaced cards, playable state and card tracking
+        # (rebuilt once restored):
+        self.tween.clear_tweens()
+        self.__texture_warmup_list.clear()
+        self.playable.reset()
+        self.tracker.reset()
+
+        # Restoring deck (in stored order):
+        deck_controller: Deck_Controller = Deck_Controller(
+            deck_copy_count = game_snapshot.deck_copy_count
+            )
+        deck_controller.load_deck(
+            deck_shift = game_snapshot.deck_shift,
+            deck_lowest_value = game_snapshot.deck_lowest_value,
+            deck_trump = game_snapshot.deck_trump,
+            card_id_list = game_snapshot.deck_id_list,
+            )
+        deck_controller.update_render_texture(
+            texture_pack_front = self.session.texture_pack_front,
+            texture_pack_back = self.session.texture_pack_back,
+            ignore_assertion = True,
+            )
+        self.__deck_controller: Deck_Controller = deck_controller
+
+        # Creating empty table and discard:
+        self.__create_table(
+            clear_cache = False
+            )
+        self.__create_discard(
+            clear_cache = False
+            )
+
+        # Resetting or creating player controllers:
+        preserve_player_controllers: bool = len(self.__player_ring) == PLAYER_COUNT_MIN
+        if preserve_player_controllers:
+            for player_controller in self.__player_ring:
+                player_controller.reset_hand()
+            self.__player_ring[0].set_player_name(
+                set_value = self.session.player_one_name
+                )
+            self.__player_ring[1].set_player_name(
+                set_value = self.session.player_two_name
+                )
+        else:
+            self.__create_player_controllers()
+
+        # Clearing cache (player and controllers):
+        clear_cached_property_list(
+            target_object = self,
+            target_attribute_list = self.__cached_player_property_list
+            )
+        clear_cached_property_list(
+            target_object = self,
+            target_attribute_list = self.__cached_controller_property_list
+            )
+
+        # Restoring hands:
+        hand_id_map: tuple[tuple[Player_Controller, tuple[int, ...]], ...] = (
+            (self.player_one, game_snapshot.hand_one_id_list),
+            (self.player_two, game_snapshot.hand_two_id_list),
+            )
+        for player_controller, hand_id_list in hand_id_map:
+            card_list: list[Card_Object] = [
+                self.deck.find_card_sealed(card_id) for card_id in hand_id_list
+                ]
+            player_controller.hand.add_card_list(
+                card_list = card_list
+                )
+            if player_controller.player_type == PLAYER_TYPE_PLAYER:
+                player_controller.hand.update_hand_card_list(
+                    state_revealed = True,
+                    )
+
+        # Restoring table:
+        for position_index, stack_map in game_snapshot.table_map_id.items():
+            for stack_index, card_id in stack_map.items():
+                if card_id is not None:
+                    self.table.add_card(
+                        card_object = self.deck.find_card_sealed(card_id),
+                        position_index = position_index,
+                        stack_index = stack_index,
+                        reset_coordinates = True,
+                        ignore_assertion = True,
+                        )
+
+        # Restoring discard:
+        self.discard.add_card_list(
+            card_list = [
+                self.deck.find_card_sealed(card_id) 
+                for card_id in game_snapshot.discard_id_list
+                ]
+            )
+
+        # Restoring player states:
+        self.player_one.set_state_active(
+            set_value = game_snapshot.player_one_active
+            )
+        self.player_two.set_state_active(
+            set_value = not game_snapshot.player_one_active
+            )
+        if game_snapshot.player_one_attacking:
+            self.player_one.set_state_attacking(set_value = True)
+            self.player_two.set_state_defending(set_value = True)
+        else:
+            self.player_one.set_state_defending(set_value = True)
+            self.player_two.set_state_attacking(set_value = True)
+
+        # Clearing cache (player):
+        clear_cached_property_list(
+            target_object = self,
+            target_attribute_list = self.__cached_player_property_list
+            )
+
+        # Updating hands (positions are reset instantly):
+        for player_controller in self.player_list:
+            player_controller.hand.update_hand_position(
+                reset_coordinates = True
+                )
+            if not PLAYABLE_TRACKER_ENABLE:
+                player_controller.hand.update_hand_state(
+                    player_focus_state = player_controller.state_focus,
+                    table_map = self.table.table_map
+                    )
+        if PLAYABLE_TRACKER_ENABLE:
+            self.playable.rebuild(
+                player_list = self.player_list,
+                table_controller = self.table,
+                )
+        self.tracker.rebuild(
+            player_list = self.player_list,
+            deck_controller = self.deck,
+            table_controller = self.table,
+            discard_controller = self.discard,
+            )
+
+
+    def create_game_state(self) -> Game_State:
+        """
+        Creates an immutable game state for lookahead (search, hints), see Game_State.
+
+        :return Game_State: ...
+        """
+
+        # Converting through snapshot:
+        game_state: Game_State = Game_State.create_from_snapshot(
+            game_snapshot = self.create_snapshot()
+            )
+
+        # Returning:
+        return game_state
+
+
+    def load_game_state(self, game_state: Game_State) -> None:
+        """
+        Projects game state back onto the live controllers. Session options are preserved.
+
+        :param Game_State game_state: ...
+        """
+
+        # Converting through snapshot (current one is used as a template):
+        game_snapshot: Game_Snapshot = game_state.create_snapshot(
+            template_snapshot = self.create_snapshot()
+            )
+        self.load_snapshot(
+            game_snapshot = game_snapshot
+            )
+
+
+    def find_endgame_move(self) -> State_Move | None:
+        """
+        Finds the best move of the active player once the deck is empty (exact, see State_Solver),
+        for hints and the computer player.
+
+        :raise ValueError: if game is not a two player, single deck game (see create_game_state).
+
+        :return State_Move: ...
+        :return None: if deck is not empty, game is over, or solver gave up.
+        """
+
+        # Skipping, if deck is not empty:
+        if self.deck.deck_count > 0:
+            return None
+
+        # Creating solver, if not created yet:
+        if self.__state_solver is None:
+            self.__state_solver: State_Solver = State_Solver()
+
+        # Solving:
+        state_move: State_Move | None = self.__state_solver.find_move(
+            game_state = self.create_game_state()
+            )
+
+        # Returning:
+        return state_move
+
+
+    def find_computer_move(self) -> State_Move | None:
+        """
+        Finds a move for the active player, if it is computer-controlled: exact once the deck is
+        empty (see find_endgame_move), best evaluated position otherwise (see State_Evaluator).
+
+        :raise ValueError: if game is not a two player, single deck game (see create_game_state).
+
+        :return State_Move: ...
+        :return None: if active player is not a computer, game is over, or NumPy is not installed
+            (and deck is not empty).
+        """
+
+        # Skipping, if active player is not a computer:
+        if not self.player_active.player_computer:
+            return None
+
+        # Solving endgame:
+        if self.deck.deck_count == 0:
+            state_move: State_Move | None = self.find_endgame_move()
+            if state_move is not None:
+                return state_move
+
+        # Skipping, if evaluator is not available:
+        if not EVALUATOR_AVAILABLE:
+            return None
+
+        # Creating evaluator, if not created yet:
+        if self.__state_evaluator is None:
+            self.__state_evaluator: State_Evaluator = State_Evaluator()
+
+        # Evaluating:
+        state_move: State_Move | None = self.__state_evaluator.find_move(
+            game_state = self.create_game_state()
             )
 
+        # Returning:
+        return state_move
+
 
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -497,8 +968,10 @@ class Game_Controller:
         :param bool clear_cache: ...
         """
 
-        # Creating deck controller object:
-        deck_controller: Deck_Controller = Deck_Controller()
+        # Creating deck controller object (deck copies shuffled together, from session):
+        deck_controller: Deck_Controller = Deck_Controller(
+            deck_copy_count = self.__session_controller.deck_copy_count
+            )
 
         # Calling core methods:
         deck_controller.create_deck(
@@ -664,24 +1137,24 @@ class Game_Controller:
     """
 
     @cached_property
-    def player_one(self) -> Player_Controller:
+    def player_one(self) -> Player_Controller | None:
         """
         TODO: Create a docstring.
         """
 
-        # Returning:
-        return self.__player_one_controller
-    
+        # Returning (first seat of the ring):
+        return self.__player_ring[0] if self.__player_ring else None
+
 
     @cached_property
-    def player_two(self) -> Player_Controller:
+    def player_two(self) -> Player_Controller | None:
         """
         TODO: Create a docstring.
         """
 
-        # Returning:
-        return self.__player_two_controller
-    
+        # Returning (second seat of the ring):
+        return self.__player_ring[1] if len(self.__player_ring) > 1 else None
+
 
     @cached_property
     def player_active(self) -> Player_Controller:
@@ -690,106 +1163,152 @@ class Game_Controller:
         """
 
         # Selecting and returning with active state:
-        if self.player_one.state_active:
-            return self.player_one
-        elif self.player_two.state_active:
-            return self.player_two
+        for player_controller in self.player_list:
+            if player_controller.state_active:
+                return player_controller
+
+        # Raising error if no controller's state is active:
+        error_message: str = f"Every player controller appears to be inactive."
+        raise AttributeError(error_message)
 
-        # Raising error if neither controller's state is active:
-        else:
-            error_message: str = f"Both player controllers appear to be inactive."
-            raise AttributeError(error_message)
-        
 
     @cached_property
     def player_inactive(self) -> Player_Controller:
         """
-        TODO: Create a docstring.
+        Other player of the current exchange: defender, while attacker is active, attacker otherwise
+        (the only inactive player, if two are playing).
         """
 
-        # Selecting and returning controller with inactive state:
-        if self.player_one.state_inactive:
-            return self.player_one
-        elif self.player_two.state_inactive:
-            return self.player_two
+        # Selecting controller:
+        player_inactive: Player_Controller = self.player_attacking
+        if self.player_active is self.player_attacking:
+            player_inactive: Player_Controller = self.player_defending
+
+        # Returning:
+        return player_inactive
+
 
-        # Raising error if neither controller's state is active:
-        else:
-            error_message: str = f"Both player controllers appear to be active."
-            raise AttributeError(error_message)
-        
-    
     @cached_property
     def player_attacking(self) -> Player_Controller:
         """
-        TODO: Create a docstring.
+        Player leading the attack. Every player but the defender is attacking (3+ players may throw
+        cards in), lead attacker is the one seated right before the defender.
         """
 
-        # Selecting and returning controller with inactive state:
-        if self.player_one.state_attacking:
-            return self.player_one
-        elif self.player_two.state_attacking:
-            return self.player_two
+        # Collecting controllers with attacking state:
+        player_attacking_list: list[Player_Controller] = [
+            player_controller for player_controller
+            in self.player_list
+            if player_controller.state_attacking
+            ]
+
+        # Selecting the only attacking controller (two players):
+        if len(player_attacking_list) == 1:
+            return player_attacking_list[0]
 
-        # Raising error if neither controller's state is active:
+        # Selecting controller seated before the defender:
+        elif len(player_attacking_list) > 1:
+            return self.find_player_next(
+                player_controller = self.player_defending,
+                player_step = -1,
+                )
+
+        # Raising error if no controller's state is attacking:
         else:
-            error_message: str = f"Both player controllers appear to be defending."
+            error_message: str = f"Every player controller appears to be defending."
             raise AttributeError(error_message)
-        
-    
+
+
     @cached_property
-    def player_attacking(self) -> Player_Controller:
+    def player_defending(self) -> Player_Controller:
         """
         TODO: Create a docstring.
         """
 
-        # Selecting and returning controller with inactive state:
-        if self.player_one.state_defending:
-            return self.player_one
-        elif self.player_two.state_defending:
-            return self.player_two
+        # Selecting and returning controller with defending state:
+        for player_controller in self.player_list:
+            if player_controller.state_defending:
+                return player_controller
+
+        # Raising error if no controller's state is defending:
+        error_message: str = f"Every player controller appears to be attacking."
+        raise AttributeError(error_message)
 
-        # Raising error if neither controller's state is active:
-        else:
-            error_message: str = f"Both player controllers appear to be attacking."
-            raise AttributeError(error_message)
-    
 
     @cached_property
-    def player_list(self) -> tuple[Player_Controller, Player_Controller]:
+    def player_list(self) -> tuple[Player_Controller, ...]:
         """
-        TODO: Create a docstring.
+        Players in seating order (ring), player one first.
         """
 
         # Packing up:
-        player_list: tuple[Player_Controller, Player_Controller] = (
-            self.player_one,
-            self.player_two
-            )
-        
+        player_list: tuple[Player_Controller, ...] = tuple(self.__player_ring)
+
         # Returning:
         return player_list
-    
 
-    def set_player_one(self, 
-                       player_controller: Player_Controller, 
+
+    @cached_property
+    def player_count(self) -> int:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return len(self.__player_ring)
+
+
+    def find_player_next(self, player_controller: Player_Controller, player_step: int = 1) -> Player_Controller:
+        """
+        Finds player seated player step seats away along the ring (negative steps go backwards).
+        Players out of the game (no cards in hand, none left in deck) are skipped, while at least
+        two players are still in the game.
+
+        :param Player_Controller player_controller: ...
+        :param int player_step: ...
+
+        :return Player_Controller: ...
+        """
+
+        # Checking which seats are still in the game:
+        seat_in_game_list: list[bool] = [
+            player_seated.hand.hand_count > 0 or self.deck.deck_count > 0
+            for player_seated in self.__player_ring
+            ]
+        skip_enabled: bool = seat_in_game_list.count(True) >= PLAYER_COUNT_MIN
+
+        # Walking the ring a seat at a time:
+        ring_index: int = self.__player_ring.index(player_controller)
+        ring_direction: int = 1 if player_step >= 0 else -1
+        for _ in range(abs(player_step)):
+            for _ in range(self.player_count):
+                ring_index: int = (ring_index + ring_direction) % self.player_count
+                if seat_in_game_list[ring_index] or not skip_enabled:
+                    break
+
+        # Returning:
+        return self.__player_ring[ring_index]
+
+
+    def set_player_one(self,
+                       player_controller: Player_Controller,
                        set_default_state: bool = True
                        ) -> None:
         """
         TODO: Create a docstring.
         """
 
-        # Updating attribute:
+        # Updating attribute (first seat):
         if self.player_one != player_controller:
-            self.__player_one_controller: Player_Controller = player_controller
+            self.__player_ring[0:1] = [player_controller]
 
             # Setting default states to avoid conflicts:
             if set_default_state:
-                self.__player_one_controller.set_state_active(
+                player_controller.set_state_active(
                     set_value = True,
                     update_related = True,    # <- Switches related to False
                     )
-                self.__player_one_controller.set_state_attacking(
+                player_controller.set_state_attacking(
                     update_related = True,    # <- Switches related to False
                     )
 
@@ -798,26 +1317,26 @@ class Game_Controller:
                 target_object = self,
                 target_attribute_list = self.__cached_player_property_list
                 )
-    
 
-    def set_player_two(self, 
-                       player_controller: Player_Controller, 
+
+    def set_player_two(self,
+                       player_controller: Player_Controller,
                        set_default_state: bool = True
                        ) -> None:
         """
         TODO: Create a docstring.
         """
 
-        # Updating attribute:
+        # Updating attribute (second seat):
         if self.player_two != player_controller:
-            self.__player_two_controller: Player_Controller = player_controller
+            self.__player_ring[1:2] = [player_controller]
 
             # Setting default states to avoid conflicts:
             if set_default_state:
-                self.__player_two_controller.set_state_active(
+                player_controller.set_state_active(
                     set_value = False,
                     )
-                self.__player_two_controller.set_state_defending(
+                player_controller.set_state_defending(
                     set_value = True,
                     )
 
@@ -826,28 +1345,26 @@ class Game_Controller:
                 target_object = self,
                 target_attribute_list = self.__cached_player_property_list
                 )
-            
-    
+
+
     def switch_players_active(self) -> None:
         """
-        TODO: Create a docstring.
+        Passes the turn to the other player of the current exchange (see player_inactive), or to
+        the lead attacker, if active player is not a part of it (3+ players).
         """
 
-        # Cycling through player controllers:
-        for player_controller in self.player_list:
+        # Selecting player controllers:
+        player_active: Player_Controller = self.player_active
+        player_active_next: Player_Controller = self.player_inactive
+
+        # Switching active state:
+        player_active.set_state_active(
+            set_value = False,
+            )
+        player_active_next.set_state_active(
+            set_value = True,
+            )
 
-            # Setting player controller inactive:
-            if player_controller.state_active:
-                player_controller.set_state_inactive(
-                    set_value = True,
-                    )
-                
-            # Setting player controller active:
-            else:
-                player_controller.set_state_active(
-                    set_value = True,
-                    )
-        
         # Clearing cache (property):
         cached_property_list: tuple[str, ...] = (
             "player_active",
@@ -858,33 +1375,49 @@ class Game_Controller:
             target_attribute_list = cached_property_list
             )
 
+        # Recording telemetry (turn durations are differences of "t"):
+        if self.telemetry.telemetry_running:
+            self.telemetry.record(
+                event_name = "turn",
+                event_data = {
+                    "player": self.player_list.index(self.player_active),
+                    },
+                )
+
 
-    def switch_players_focus(self) -> None:
+    def switch_players_focus(self, player_step: int = 1) -> None:
         """
-        TODO: Create a docstring.
+        Moves defending state player step seats along the ring, every other player is attacking.
+        One seat after cards were beaten off (defender leads the next attack), two seats after
+        defender took the cards. Two players swap states on a single step.
+
+        :param int player_step: ...
         """
 
+        # Selecting the next defender:
+        player_defending_next: Player_Controller = self.find_player_next(
+            player_controller = self.player_defending,
+            player_step = player_step,
+            )
+
         # Cycling through player controllers:
         for player_controller in self.player_list:
 
             # Setting player controller state defending:
-            if player_controller.state_attacking:
+            if player_controller is player_defending_next:
                 player_controller.set_state_defending(
                     set_value = True,
-                    ignore_assertion = True,
-                    update_related = True,    # <- Switches related to False
                     )
-                
+
             # Setting player controller state attacking:
             else:
                 player_controller.set_state_attacking(
                     set_value = True,
-                    ignore_assertion = True,
-                    update_related = True,    # <- Switches related to False
                     )
-        
+
         # Clearing cache (property):
         cached_property_list: tuple[str, ...] = (
+            "player_inactive",
             "player_attacking",
             "player_defending",
             )
@@ -892,33 +1425,58 @@ class Game_Controller:
             target_object = self,
             target_attribute_list = cached_property_list
             )
-        
-    
+
+        # Publishing event:
+        self.events.publish(
+            event_type = EVENT_ROLES_SWITCHED,
+            )
+        self.playable.verify_state()
+
+        # Recording telemetry:
+        if self.telemetry.telemetry_running:
+            self.telemetry.record(
+                event_name = "roles",
+                event_data = {
+                    "attacker": self.player_list.index(self.player_attacking),
+                    },
+                )
+
+
     def __create_player_controllers(self) -> None:
         """
         TODO: Create a docstring.
         """
 
-        # Selecting player names if session controller exists:
+        # Selecting player names and count if session controller exists:
         player_one_name: str = PLAYER_ONE_NAME_DEFAULT
         player_two_name: str = PLAYER_TWO_NAME_DEFAULT
+        player_count: int = PLAYER_COUNT_MIN
         if self.session is not None:
             player_one_name: str = self.__session_controller.player_one_name
             player_two_name: str = self.__session_controller.player_two_name
+            player_count: int = self.__session_controller.player_count
+
+        # Preparing player controllers (computers past the second seat are named randomly):
+        player_ring: list[Player_Controller] = [
+            Player_Controller.create_player_controller(
+                init_type = PLAYER_TYPE_PLAYER,
+                init_name = player_one_name,
+                ),
+            Player_Controller.create_player_controller(
+                init_type = PLAYER_TYPE_COMPUTER,
+                init_name = player_two_name,
+                ),
+            ]
+        for _ in range(PLAYER_COUNT_MIN, player_count):
+            player_ring.append(
+                Player_Controller.create_player_controller(
+                    init_type = PLAYER_TYPE_COMPUTER,
+                    init_name = None,
+                    )
+                )
 
-        # Preparing player controller:
-        player_one_controller = Player_Controller.create_player_controller(
-            init_type = PLAYER_TYPE_PLAYER,
-            init_name = player_one_name,
-            )
-        player_two_controller = Player_Controller.create_player_controller(
-            init_type = PLAYER_TYPE_COMPUTER,
-            init_name = player_two_name,
-            )
-            
         # Updating controller attributes:
-        self.__player_one_controller: Player_Controller = player_one_controller
-        self.__player_two_controller: Player_Controller = player_two_controller
+        self.__player_ring: list[Player_Controller] = player_ring
 
         # Clearing cache (player):
         clear_cached_property_list(
@@ -926,7 +1484,68 @@ class Game_Controller:
             target_attribute_list = self.__cached_player_property_list
             )
 
-    
+        # Placing opponents' hands:
+        self.__update_hand_layout()
+
+
+    def __update_hand_layout(self) -> None:
+        """
+        Splits opponent area into a slot per opponent, if there are 3+ players (two players keep
+        default hand coordinates). Slots are also used to find the hand under cursor.
+        """
+
+        # Calculating slots:
+        opponent_count: int = self.player_count - 1
+        self.__hand_slot_x_left: float = HAND_OPPONENT_AREA_X_LEFT
+        self.__hand_slot_width: float = HAND_OPPONENT_AREA_WIDTH / opponent_count
+
+        # Placing hands (cards spread right from hand center, center is shifted left to fit):
+        if opponent_count > 1:
+            for slot_index, player_controller in enumerate(self.player_list[1:]):
+                slot_coordinate_x: float = self.__hand_slot_x_left + self.__hand_slot_width * (slot_index + 0.5)
+                player_controller.hand.set_hand_layout(
+                    coordinate_x_center = int(slot_coordinate_x - CARD_TEXTURE_WIDTH_SCALED / 2),
+                    coordinate_y_center = HAND_PLAYER_TWO_COORDINATE_Y,
+                    hand_width_allowed = int(
+                        self.__hand_slot_width -
+                        CARD_TEXTURE_WIDTH_SCALED -
+                        HAND_OPPONENT_SLOT_GAP
+                        ),
+                    )
+
+
+    def find_player_by_coordinates(self,
+                                   check_coordinates: tuple[int, int],
+                                   zone_section: Zone_XYWH | None
+                                   ) -> Player_Controller | None:
+        """
+        Finds player whose hand zone (opponent slot, if there are 3+ players) is under coordinates.
+        One slot lookup, however many players there are, no cards are checked here.
+
+        :param tuple[int, int] check_coordinates: ...
+        :param Zone_XYWH | None zone_section: Zone section coordinates are in.
+
+        :return Player_Controller | None: ...
+        """
+
+        # Selecting player controller by zone:
+        player_found: Player_Controller | None = None
+        if zone_section == ZONE_PLAYER_ONE:
+            player_found: Player_Controller = self.player_one
+        elif zone_section == ZONE_PLAYER_TWO:
+            player_found: Player_Controller = self.player_two
+
+            # Selecting opponent by slot:
+            if self.player_count > PLAYER_COUNT_MIN:
+                check_coordinate_x, _ = check_coordinates
+                slot_index: int = int((check_coordinate_x - self.__hand_slot_x_left) // self.__hand_slot_width)
+                slot_index: int = min(max(slot_index, 0), self.player_count - 2)
+                player_found: Player_Controller = self.player_list[slot_index + 1]
+
+        # Returning:
+        return player_found
+
+
     def __update_player_priority(self) -> None:
         """
         TODO: Create a docstring.
@@ -944,7 +1563,7 @@ class Game_Controller:
                 in player_controller.hand.hand_container
                 if card_object.state_trump
                 ]
-            
+
             # If player has trump cards, comparing values:
             card_trump_count: int = len(card_trump_list)
             if card_trump_count > 0:
@@ -960,40 +1579,39 @@ class Game_Controller:
                         if card_trump.type_value < card_trump_lowest_value:
                             card_trump_lowest_value: int = card_trump.type_value
                             player_priority: Player_Controller = player_priority
-        
-        # Assigning priority variables:
+
+        # Assigning priority variables (defender is seated next):
         if player_priority is not None:
-            if player_priority == self.player_one:
-                player_second: Player_Controller = self.player_two
-            else:
-                player_second: Player_Controller = self.player_one
-        
+            player_second: Player_Controller = self.find_player_next(
+                player_controller = player_priority
+                )
+
         # Assigning player one as player priority:
         player_priority: Player_Controller = self.player_one
-        player_second: Player_Controller = self.player_two
-
-        # Updating priority player states:
-        player_priority.set_state_active(
-            set_value = True,
-            )
-        player_priority.set_state_attacking(
-            set_value = True,
-            )
-        
-        # Updating second player states:
-        player_second.set_state_active(
-            set_value = False,
-            )
-        player_second.set_state_defending(
-            set_value = True,
+        player_second: Player_Controller = self.find_player_next(
+            player_controller = player_priority
             )
-        
+
+        # Updating player states (priority player is active, everyone but the defender attacks):
+        for player_controller in self.player_list:
+            player_controller.set_state_active(
+                set_value = player_controller is player_priority,
+                )
+            if player_controller is player_second:
+                player_controller.set_state_defending(
+                    set_value = True,
+                    )
+            else:
+                player_controller.set_state_attacking(
+                    set_value = True,
+                    )
+
         # Clearing cache (player):
         clear_cached_property_list(
             target_object = self,
             target_attribute_list = self.__cached_player_property_list
             )
-        
+
 
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -1022,6 +1640,118 @@ class Game_Controller:
         return self.__card_hovered
         
 
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TWEEN PROPERTIES BLOCK
+
+    """
+
+
+    @cached_property
+    def tween(self) -> Tween_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Tween_Controller: ...
+        """
+
+        # Returning:
+        return self.__tween_controller
+
+
+    @property
+    def culling(self) -> Culling_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Culling_Controller: ...
+        """
+
+        # Returning:
+        return self.__culling_controller
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    EVENT PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def events(self) -> Event_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Event_Controller: ...
+        """
+
+        # Returning:
+        return self.__event_controller
+
+
+    @property
+    def playable(self) -> Playable_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Playable_Controller: ...
+        """
+
+        # Returning:
+        return self.__playable_controller
+
+
+    @property
+    def tracker(self) -> Tracker_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Tracker_Controller: ...
+        """
+
+        # Returning:
+        return self.__tracker_controller
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    PROFILER PROPERTIES BLOCK
+
+    """
+
+
+    @cached_property
+    def profiler(self) -> Profiler_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Profiler_Controller: ...
+        """
+
+        # Returning:
+        return self.__profiler_controller
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TELEMETRY PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def telemetry(self) -> Telemetry_Controller:
+        """
+        TODO: Create a docstring.
+
+        :return Telemetry_Controller: ...
+        """
+
+        # Returning:
+        return self.__telemetry_controller
+        
+
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
     KEYBOARD MAPPING PROPERTIES BLOCK
@@ -1040,21 +1770,159 @@ class Game_Controller:
     
 
     @cached_property
-    def keyboard_sort_index(self) -> dict[int, str]:
+    def keyboard_command_index(self) -> dict[str, Callable[[], None]]:
+        """
+        Command index, key mapping command name to bound handler. Commands without a handler
+        (e.g. arrows, not implemented yet) are not listed. Debug commands only print a warning if
+        debug mode is disabled in session.
+
+        :return dict[str, Callable[[], None]]: ...
+        """
+
+        # Generating debug command index:
+        debug_command_index: dict[str, Callable[[], None]] = {
+
+            # Texture pack commands:
+            "KEY_DEBUG_SWITCH_TEXTURE_PACK_FRONT": partial(
+                self.__handle_debug_switch_texture_pack, 
+                texture_pack_type = TEXTURE_PACK_TYPE_FRONT
+                ),
+            "KEY_DEBUG_SWITCH_TEXTURE_PACK_BACK": partial(
+                self.__handle_debug_switch_texture_pack, 
+                texture_pack_type = TEXTURE_PACK_TYPE_BACK
+                ),
+            "KEY_DEBUG_SET_TEXTURE_PACK_DEFAULT_LIGHT": partial(
+                self.__handle_debug_set_texture_pack_default, 
+                texture_pack_mode = TEXTURE_PACK_MODE_LIGHT
+                ),
+            "KEY_DEBUG_SET_TEXTURE_PACK_DEFAULT_DARK": partial(
+                self.__handle_debug_set_texture_pack_default, 
+                texture_pack_mode = TEXTURE_PACK_MODE_DARK
+                ),
+
+            # Hand sorting commands:
+            "KEY_DEBUG_SORT_HAND_BY_VALUE": partial(
+                self.__handle_debug_sort_hand, 
+                sort_method = HAND_SORT_METHOD_BY_VALUE
+                ),
+            "KEY_DEBUG_SORT_HAND_BY_VALUE_DEFAULT": partial(
+                self.__handle_debug_sort_hand, 
+                sort_method = HAND_SORT_METHOD_BY_VALUE_DEFAULT
+                ),
+            "KEY_DEBUG_SORT_HAND_BY_TIME_ADDED": partial(
+                self.__handle_debug_sort_hand, 
+                sort_method = HAND_SORT_METHOD_BY_TIME_ADDED
+                ),
+            "KEY_DEBUG_SORT_HAND_BY_SUIT": partial(
+                self.__handle_debug_sort_hand, 
+                sort_method = HAND_SORT_METHOD_BY_SUIT
+                ),
+
+            # Draw commands:
+            "KEY_DEBUG_DRAW_CARD_PLAYER": partial(
+                self.__handle_debug_draw_card, 
+                player_index = 0
+                ),
+            "KEY_DEBUG_DRAW_CARD_OPPONENT": partial(
+                self.__handle_debug_draw_card, 
+                player_index = 1
+                ),
+
+            # Sweep commands:
+            "KEY_DEBUG_SWEEP_TO_HAND_PLAYER": partial(
+                self.__handle_debug_sweep_cards_hand, 
+                player_index = 0
+                ),
+            "KEY_DEBUG_SWEEP_TO_HAND_OPPONENT": partial(
+                self.__handle_debug_sweep_cards_hand, 
+                player_index = 1
+                ),
+            "KEY_DEBUG_SWEEP_TO_DISCARD": self.__handle_debug_sweep_cards_discard,
+
+            # Game and profiler commands:
+            "KEY_DEBUG_RESTART_GAME": self.create_game_default,
+            "KEY_DEBUG_TOGGLE_PROFILER": self.profiler.toggle,
+            }
+        
+        # Replacing debug handlers, if debug mode is disabled:
+        if not SESSION_ENABLE_DEBUG:
+            debug_command_index: dict[str, Callable[[], None]] = dict.fromkeys(
+                debug_command_index, 
+                self.__handle_debug_disabled
+                )
+
+        # Generating command index:
+        command_index: dict[str, Callable[[], None]] = {
+            **debug_command_index,
+            "KEY_SORT": self.__handle_sort_hand,
+            }
+        
+        # Returning:
+        return command_index
+    
+
+    @cached_property
+    def keyboard_dispatch_map(self) -> dict[tuple[int, int], tuple[Callable[[], None], bool]]:
         """
-        TODO: Create a docstring.
+        Dispatch map, (key, modifiers) to bound handler and whether the key repeats while held.
+        Built once from keyboard mapping, rebuilt after keyboard is remapped.
+
+        :return dict[tuple[int, int], tuple[Callable[[], None], bool]]: ...
         """
 
         # Generating:
-        sort_key_index: dict[int, str] = {
-            self.keyboard.KEY_DEBUG_SORT_HAND_BY_VALUE:         HAND_SORT_METHOD_BY_VALUE,
-            self.keyboard.KEY_DEBUG_SORT_HAND_BY_VALUE_DEFAULT: HAND_SORT_METHOD_BY_VALUE_DEFAULT,
-            self.keyboard.KEY_DEBUG_SORT_HAND_BY_TIME_ADDED:    HAND_SORT_METHOD_BY_TIME_ADDED,
-            self.keyboard.KEY_DEBUG_SORT_HAND_BY_SUIT:          HAND_SORT_METHOD_BY_SUIT,
+        command_index: dict[str, Callable[[], None]] = self.keyboard_command_index
+        key_repeat_list: tuple[int, ...] = self.keyboard.key_repeat_list
+        dispatch_map: dict[tuple[int, int], tuple[Callable[[], None], bool]] = {
+            key_binding: (command_index[key_command], key_binding[0] in key_repeat_list)
+            for key_binding, key_command in self.keyboard.key_binding_index.items()
+            if key_command in command_index
             }
         
         # Returning:
-        return sort_key_index
+        return dispatch_map
+    
+
+    def find_key_handler(self, 
+                         key_pressed: int, 
+                         key_modifiers: int = KEY_MODIFIER_NONE, 
+                         key_repeat: bool = False
+                         ) -> Callable[[], None] | None:
+        """
+        Finds handler bound to key (one dictionary lookup, two if modifiers are held and there is
+        no binding with them). Repeated presses only resolve for keys that repeat.
+
+        :param int key_pressed: ...
+        :param int key_modifiers: ...
+        :param bool key_repeat: True, if key is held down (not a new press).
+
+        :return Callable[[], None] | None: ...
+        """
+
+        # Rebuilding dispatch map after a remap:
+        if self.__keyboard_dispatch_version != self.keyboard.mapping_version:
+            self.__keyboard_dispatch_version: int = self.keyboard.mapping_version
+            clear_cached_property(
+                target_object = self,
+                target_attribute = "keyboard_dispatch_map"
+                )
+
+        # Looking up binding:
+        dispatch_map: dict[tuple[int, int], tuple[Callable[[], None], bool]] = self.keyboard_dispatch_map
+        key_modifiers: int = key_modifiers & KEY_MODIFIER_MASK
+        key_dispatch: tuple[Callable[[], None], bool] | None = dispatch_map.get((key_pressed, key_modifiers))
+        if key_dispatch is None and key_modifiers != KEY_MODIFIER_NONE:
+            key_dispatch: tuple[Callable[[], None], bool] | None = dispatch_map.get((key_pressed, KEY_MODIFIER_NONE))
+
+        # Checking if command is allowed:
+        key_handler: Callable[[], None] | None = None
+        if key_dispatch is not None:
+            key_handler, key_repeatable = key_dispatch
+            if key_repeat and not key_repeatable:
+                key_handler: Callable[[], None] | None = None
+
+        # Returning:
+        return key_handler
     
 
     """
@@ -1074,8 +1942,7 @@ class Game_Controller:
         card_container_list: tuple | None = None
         if self.game_ready:
             card_container_list: tuple[list[Card_Object], ...] = (
-                self.player_one.hand.hand_container,
-                self.player_two.hand.hand_container,
+                *(player_controller.hand.hand_container for player_controller in self.player_list),
                 self.deck.deck_container,
                 self.discard.discard_container,
                 self.table.table_container,
@@ -1112,6 +1979,60 @@ class Game_Controller:
                         texture_pack_front = texture_pack_front,
                         texture_pack_back = texture_pack_back,
                         )
+
+
+    @property
+    def texture_pack_key_list(self) -> list[str]:
+        """
+        Texture packs the session needs: selected front and back packs, and default packs of every
+        mode (light and dark), so switching mode does not load anything.
+
+        :return list[str]: Pack keys, without duplicates.
+        """
+
+        # Checking if session exists:
+        if self.session is None:
+            self.create_session()
+
+        # Collecting selected packs:
+        texture_pack_list: list[Texture_Pack] = [
+            self.session.texture_pack_front,
+            self.session.texture_pack_back,
+            ]
+
+        # Collecting default packs (copies, session packs are not changed):
+        for texture_pack_mode in (TEXTURE_PACK_MODE_LIGHT, TEXTURE_PACK_MODE_DARK):
+            for texture_pack in (self.session.texture_pack_front, self.session.texture_pack_back):
+                texture_pack_default: Texture_Pack = texture_pack.create_copy()
+                texture_pack_default.set_pack_default(
+                    pack_mode = texture_pack_mode
+                    )
+                texture_pack_list.append(texture_pack_default)
+
+        # Generating pack keys:
+        texture_pack_key_list: list[str] = list(dict.fromkeys(
+            texture_pack.pack_key for texture_pack in texture_pack_list
+            ))
+
+        # Returning:
+        return texture_pack_key_list
+
+
+    def preload_textures(self) -> int:
+        """
+        Reads every texture pack the session needs at once (packs are decoded in worker threads),
+        textures are still created by cards on first use.
+
+        :return int: Number of packs read.
+        """
+
+        # Preloading:
+        pack_count: int = preload_texture_pack_list(
+            pack_key_list = self.texture_pack_key_list,
+            )
+
+        # Returning:
+        return pack_count
                 
     
     """
@@ -1371,11 +2292,14 @@ class Game_Controller:
         player_controller.hand.remove_card(
             card_object = card_object
             )
+        self.events.publish(
+            event_type = EVENT_HAND_CARD_REMOVED,
+            card_object = card_object,
+            player_controller = player_controller,
+            )
 
-        # Attacking with the card:
-        if self.player_active.state_attacking:
-
-            # DEBUG:
+        # Playing the card (attacking or defending, based on stack index):
+        if position_index is not None:
             self.table.add_card(
                 card_object = card_object,
                 position_index = position_index,
@@ -1383,13 +2307,31 @@ class Game_Controller:
                 reset_coordinates = self.session.enable_force_slide,
                 ignore_assertion = SESSION_ENABLE_ASSERTION
                 )
+            self.events.publish(
+                event_type = EVENT_TABLE_CARD_ADDED,
+                card_object = card_object,
+                )
+
+            # Recording telemetry (attacking card is played, defending card beats):
+            if self.telemetry.telemetry_running:
+                self.telemetry.record(
+                    event_name = "play" if stack_index == TABLE_STACK_BOTTOM_INDEX else "beat",
+                    event_data = {
+                        "player": self.player_list.index(player_controller),
+                        "card": card_object.card_id,
+                        "position": position_index,
+                        },
+                    )
             
-        # Updating player controller's hand:
+        # Updating player controller's hand (playable state is tracked, if enabled):
         player_controller.hand.update_hand_position()
-        player_controller.hand.update_hand_state(
-            player_focus_state = player_controller.state_focus,
-            table_map = self.table.table_map
-            )
+        if self.playable.tracker_active:
+            self.playable.verify_state()
+        else:
+            player_controller.hand.update_hand_state(
+                player_focus_state = player_controller.state_focus,
+                table_map = self.table.table_map
+                )
             
 
 
@@ -1413,6 +2355,15 @@ class Game_Controller:
                 card_object = card_object,
                 clear_cache = True
                 )
+            self.events.publish(
+                event_type = EVENT_HAND_CARD_ADDED,
+                card_object = card_object,
+                player_controller = player_controller,
+                )
+            
+            # Queueing front texture (card is shown face-up once played):
+            if TEXTURE_WARMUP_CARD_COUNT > 0 and not card_object.texture_front_loaded:
+                self.__texture_warmup_list.append(card_object)
             
     
     def task_fill_hand(self, player_controller: Player_Controller) -> None:
@@ -1455,12 +2406,15 @@ class Game_Controller:
                 reset_coordinates = self.session.enable_force_slide
                 )
             
-        # Updating hand state (playable) based on table map:
+        # Updating hand state (playable) based on table map, unless tracked:
         if update_state and table_map is not None:
-            player_controller.hand.update_hand_state(
-                player_focus_state = player_controller.state_focus,
-                table_map = table_map
-                )
+            if self.playable.tracker_active:
+                self.playable.verify_state()
+            else:
+                player_controller.hand.update_hand_state(
+                    player_focus_state = player_controller.state_focus,
+                    table_map = table_map
+                    )
             
 
     def __task_sweep_cards(self) -> list[Card_Object]:
@@ -1482,6 +2436,10 @@ class Game_Controller:
                 card_object = card_object,
                 clear_cache = False
                 )
+            self.events.publish(
+                event_type = EVENT_TABLE_CARD_REMOVED,
+                card_object = card_object,
+                )
             
             # Adding card to sweep list:
             card_sweep_list.append(
@@ -1507,6 +2465,23 @@ class Game_Controller:
         player_controller.hand.add_card_list(
             card_list = card_sweep_list
             )
+        for card_object in card_sweep_list:
+            self.events.publish(
+                event_type = EVENT_HAND_CARD_ADDED,
+                card_object = card_object,
+                player_controller = player_controller,
+                )
+        self.playable.verify_state()
+
+        # Recording telemetry:
+        if self.telemetry.telemetry_running:
+            self.telemetry.record(
+                event_name = "pickup",
+                event_data = {
+                    "player": self.player_list.index(player_controller),
+                    "count": len(card_sweep_list),
+                    },
+                )
         self.task_update_hand(
             player_controller = player_controller,
             update_position = True,
@@ -1526,6 +2501,21 @@ class Game_Controller:
         self.discard.add_card_list(
             card_list = card_sweep_list
             )
+        for card_object in card_sweep_list:
+            self.events.publish(
+                event_type = EVENT_DISCARD_CARD_ADDED,
+                card_object = card_object,
+                )
+        self.playable.verify_state()
+
+        # Recording telemetry:
+        if self.telemetry.telemetry_running:
+            self.telemetry.record(
+                event_name = "discard",
+                event_data = {
+                    "count": len(card_sweep_list),
+                    },
+                )
             
 
     """
@@ -1535,121 +2525,122 @@ class Game_Controller:
     """
 
 
-    def handle_debug_key_pressed(self, key_pressed: Any) -> None:
+    @staticmethod
+    def __handle_debug_disabled() -> None:
         """
         TODO: Create a docstring.
         """
 
-        # Updating texture pack on call:
-        if key_pressed in self.keyboard.key_debug_texture_list:
+        # Warning debug mode was not enabled:
+        warning_message: str = "Unable to execute command. Enable debug mode in session."
+        print(warning_message)
 
-            # Switching texture packs:
-            if key_pressed == self.keyboard.KEY_DEBUG_SWITCH_TEXTURE_PACK_FRONT:
-                self.session.switch_texture_pack_front_next()
-            elif key_pressed == self.keyboard.KEY_DEBUG_SWITCH_TEXTURE_PACK_BACK:
-                self.session.switch_texture_pack_back_next()
 
-            # Setting default texture packs:
-            elif key_pressed == self.keyboard.KEY_DEBUG_SET_TEXTURE_PACK_DEFAULT_LIGHT:
-                self.session.set_texture_pack_default(
-                    texture_pack_mode = TEXTURE_PACK_MODE_LIGHT
-                    )
-            elif key_pressed == self.keyboard.KEY_DEBUG_SET_TEXTURE_PACK_DEFAULT_DARK:
-                self.session.set_texture_pack_default(
-                    texture_pack_mode = TEXTURE_PACK_MODE_DARK
-                    )
+    def __handle_debug_switch_texture_pack(self, texture_pack_type: str) -> None:
+        """
+        TODO: Create a docstring.
 
-            # Updating texture pack:
-            self.update_texture_pack()
+        :param str texture_pack_type: ...
+        """
 
-        # Sorting player's hand on call:
-        elif key_pressed in self.keyboard.key_debug_sort_list:
+        # Switching texture packs:
+        if texture_pack_type == TEXTURE_PACK_TYPE_FRONT:
+            self.session.switch_texture_pack_front_next()
+        elif texture_pack_type == TEXTURE_PACK_TYPE_BACK:
+            self.session.switch_texture_pack_back_next()
 
-            # Getting sort method from cached key index:
-            if key_pressed in self.keyboard_sort_index:
-                sort_method_selected: str = self.keyboard_sort_index[key_pressed]
+        # Updating texture pack:
+        self.update_texture_pack()
 
-            # Raising error on unrecognized or not implemented command call:
-            else:
-                error_message: str = f"Command call [{key_pressed=}] not implemented."
-                raise NotImplemented(error_message)
 
-            # Updating sort method:
-            self.session.sort_method = sort_method_selected
-            
-            # Sorting:
-            self.task_sort_hand(
-                player_controller = self.player_one,
-                reset_coordinates = False,
-                )
+    def __handle_debug_set_texture_pack_default(self, texture_pack_mode: str) -> None:
+        """
+        TODO: Create a docstring.
 
-        # Adding card to player or opponent:
-        elif key_pressed in self.keyboard.key_debug_draw_list:
+        :param str texture_pack_mode: ...
+        """
 
-            # Ensuring there are cards to draw:
-            if self.deck.deck_count > 0:
+        # Setting default texture packs:
+        self.session.set_texture_pack_default(
+            texture_pack_mode = texture_pack_mode
+            )
 
-                # Selecting player controller to draw cards for:
-                player_controller: Player_Controller | None = None
-                if key_pressed == self.keyboard.KEY_DEBUG_DRAW_CARD_PLAYER:
-                    player_controller: Player_Controller = self.player_one
-                elif key_pressed == self.keyboard.KEY_DEBUG_DRAW_CARD_OPPONENT:
-                    player_controller: Player_Controller = self.player_two
+        # Updating texture pack:
+        self.update_texture_pack()
 
-                # Raising error on unrecognized or not implemented command call:
-                else:
-                    error_message: str = f"Command call [{key_pressed=}] not implemented."
-                    raise NotImplemented(error_message)
 
-                # Drawing card for selected controller:
-                self.task_draw_card(
-                    player_controller = player_controller
-                    )
-                
-                # Automatically sorting, if enabled:
-                if self.session.enable_autosort:
-                    if player_controller == self.player_one:
-                        self.task_sort_hand_default(
-                            player_controller = player_controller,
-                            reset_coordinates = False
-                            )
+    def __handle_debug_sort_hand(self, sort_method: str) -> None:
+        """
+        TODO: Create a docstring.
 
-                # Updating hand position without sorting:
-                self.task_update_hand(
-                    player_controller = player_controller,
-                    update_position = True,
-                    update_state = True,
-                    table_map = self.table.table_map
-                    )
-                
-        # Sweeping cards:
-        elif key_pressed in self.keyboard.key_debug_sweep_list:
+        :param str sort_method: ...
+        """
 
-            # Asserting there are cards to sweep:
-            if self.table.table_container_count > 0:
+        # Updating sort method:
+        self.session.sort_method = sort_method
+        
+        # Sorting:
+        self.task_sort_hand(
+            player_controller = self.player_one,
+            reset_coordinates = False,
+            )
 
-                # Sweeping cards to player:
-                if key_pressed == self.keyboard.KEY_DEBUG_SWEEP_TO_HAND_PLAYER:
-                    self.task_sweep_cards_hand(
-                        player_controller = self.player_one
-                        )
-                
-                # Sweeping cards to opponent:
-                elif key_pressed == self.keyboard.KEY_DEBUG_SWEEP_TO_HAND_OPPONENT:
-                    self.task_sweep_cards_hand(
-                        player_controller = self.player_two
+
+    def __handle_debug_draw_card(self, player_index: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int player_index: Index in player list (0 is player, 1 is opponent).
+        """
+
+        # Ensuring there are cards to draw:
+        if self.deck.deck_count > 0:
+
+            # Drawing card for selected controller:
+            player_controller: Player_Controller = self.player_list[player_index]
+            self.task_draw_card(
+                player_controller = player_controller
+                )
+            
+            # Automatically sorting, if enabled:
+            if self.session.enable_autosort:
+                if player_controller == self.player_one:
+                    self.task_sort_hand_default(
+                        player_controller = player_controller,
+                        reset_coordinates = False
                         )
-                    
-                # Sweeping to discard:
-                elif key_pressed == self.keyboard.KEY_DEBUG_SWEEP_TO_DISCARD:
-                    self.task_sweep_cards_discard()
 
+            # Updating hand position without sorting:
+            self.task_update_hand(
+                player_controller = player_controller,
+                update_position = True,
+                update_state = True,
+                table_map = self.table.table_map
+                )
+            
+
+    def __handle_debug_sweep_cards_hand(self, player_index: int) -> None:
+        """
+        TODO: Create a docstring.
 
-        # RESTART GAME:
-        elif key_pressed == self.keyboard.KEY_DEBUG_RESTART_GAME:
-            self.create_game_default()
+        :param int player_index: Index in player list (0 is player, 1 is opponent).
+        """
 
-        
+        # Asserting there are cards to sweep:
+        if self.table.table_container_count > 0:
+            self.task_sweep_cards_hand(
+                player_controller = self.player_list[player_index]
+                )
+            
+
+    def __handle_debug_sweep_cards_discard(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Asserting there are cards to sweep:
+        if self.table.table_container_count > 0:
+            self.task_sweep_cards_discard()
 
 
     """
@@ -1659,64 +2650,144 @@ class Game_Controller:
     """
 
 
-    def handle_slide(self) -> None:
+    def __handle_tween_arrival(self, 
+                               card_container: list[Card_Object], 
+                               tween_duration: float,
+                               tween_stagger: int
+                               ) -> int:
         """
-        TODO: Create a docstring.
+        Starts tweens for cards that have not arrived to their default coordinates yet (dealt,
+        swept or played), arrived cards are slid as usual (hover). Cards already tweening are left
+        to the tween controller (it follows their default coordinates, if they change).
+
+        :param list[Card_Object] card_container: ...
+        :param float tween_duration: ...
+        :param int tween_stagger: Tweens started on this step so far.
+
+        :return int: Tweens started on this step (including previous containers).
         """
 
-        # Checking if slide is forced:
+        # Checking cards:
         force_instant: bool = self.session.enable_force_slide
-
-        # Handling slide in players' hand containers:
-        for player_controller in self.player_list:
-            for card_object in player_controller.hand.hand_container:
+        for card_object in card_container:
+            if card_object.state_arrived:
                 card_object.slide(
                     force_instant = force_instant
                     )
+            elif not self.tween.has_tween(card_object):
+                self.tween.add_tween(
+                    card_object = card_object,
+                    target_coordinates = (card_object.coordinate_x_default, card_object.coordinate_y_default),
+                    tween_duration = 0.0 if force_instant else tween_duration,
+                    tween_delay = 0.0 if force_instant else TWEEN_STAGGER_DELAY * tween_stagger,
+                    )
+                tween_stagger += 1
+
+        # Returning:
+        return tween_stagger
+
+
+    def handle_slide(self) -> None:
+        """
+        Runs one logic step of card movement: starts tweens for cards on their way to a container,
+        advances all tweens in one batch and slides arrived cards.
+        """
+
+        # Handling arrivals and slide in players' hand containers:
+        tween_stagger: int = 0
+        for player_controller in self.player_list:
+            tween_stagger: int = self.__handle_tween_arrival(
+                card_container = player_controller.hand.hand_container,
+                tween_duration = TWEEN_DURATION_HAND,
+                tween_stagger = tween_stagger,
+                )
                 
         # Handling slide in deck (showcase card):
         card_showcase: Card_Object | None = self.deck.deck_showcase_card
         if card_showcase is not None:
             card_showcase.slide(
-                force_instant = force_instant
+                force_instant = self.session.enable_force_slide
                 )
         
-        # Handling slide in table:
-        for card_object in self.table.table_container:
-            card_object.slide(
-                force_instant = force_instant
-                )
+        # Handling arrivals and slide in table:
+        tween_stagger: int = self.__handle_tween_arrival(
+            card_container = self.table.table_container,
+            tween_duration = TWEEN_DURATION_TABLE,
+            tween_stagger = tween_stagger,
+            )
             
-        # Handling slide in discard:
-        for card_object in self.discard.discard_container:
-            card_object.slide(
-                force_instant = force_instant
-                )
+        # Handling arrivals and slide in discard:
+        self.__handle_tween_arrival(
+            card_container = self.discard.discard_container,
+            tween_duration = TWEEN_DURATION_DISCARD,
+            tween_stagger = tween_stagger,
+            )
 
+        # Warming up front textures of dealt cards (a few per step, while cards are moving in):
+        if self.__texture_warmup_list:
+            self.__handle_texture_warmup()
 
-    def handle_key_pressed(self, key_pressed: int, ignore_assertion: bool = False) -> None:
+        # Advancing all tweens (one batch per step):
+        self.tween.update(
+            delta_time = GAME_LOGIC_UPDATE_RATE
+            )
+
+
+    def __handle_texture_warmup(self) -> None:
+        """
+        Loads a few queued front textures per logic step, so cards revealed later do not load them
+        on the frame they are first drawn face-up.
+        """
+
+        # Loading front textures:
+        warmup_count: int = 0
+        while self.__texture_warmup_list and warmup_count < TEXTURE_WARMUP_CARD_COUNT:
+            card_object: Card_Object = self.__texture_warmup_list.pop()
+            if not card_object.texture_front_loaded:
+                card_object.texture_front_object
+                warmup_count += 1
+
+
+    def __handle_sort_hand(self) -> None:
         """
         TODO: Create a docstring.
+        """
+
+        # Sorting:
+        self.task_sort_hand(
+            player_controller = self.player_one,
+            reset_coordinates = False,
+            )
+
+
+    def handle_key_pressed(self, 
+                           key_pressed: int, 
+                           key_modifiers: int = KEY_MODIFIER_NONE, 
+                           key_repeat: bool = False
+                           ) -> bool:
+        """
+        Runs command bound to key (user and debug commands alike).
 
         :param int key_pressed: ...
-        :param bool ignore_assertion: ...
+        :param int key_modifiers: ...
+        :param bool key_repeat: True, if key is held down (not a new press).
 
-        :raise AssertionError: ...
+        :return bool: True, if a command was executed.
         """
 
-        # Assertion control:
-        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
-            ...
+        # Finding handler:
+        key_handler: Callable[[], None] | None = self.find_key_handler(
+            key_pressed = key_pressed,
+            key_modifiers = key_modifiers,
+            key_repeat = key_repeat,
+            )
+        
+        # Executing command:
+        if key_handler is not None:
+            key_handler()
 
-        # Nothing to do, yet.
-        if key_pressed in self.keyboard.key_user_list:
-            
-            # Sort command:
-            if key_pressed == self.keyboard.KEY_SORT:
-                self.task_sort_hand(
-                    player_controller = self.player_one,
-                    reset_coordinates = False,
-                    )
+        # Returning:
+        return key_handler is not None
 
 
     def handle_mouse_click(self, click_coordinates: tuple[int, int]) -> None:
@@ -1800,13 +2871,14 @@ class Game_Controller:
                 zone_section = zone_selection_motion
                 )
             
-            # Handling motion in player one zone:
+            # Handling motion in player zones:
             if zone_selection_motion in (ZONE_PLAYER_ONE, ZONE_PLAYER_TWO):
 
-                # Selecting player controller:
-                player_controller: Player_Controller = self.player_one
-                if zone_selection_motion == ZONE_PLAYER_TWO:
-                    player_controller: Player_Controller = self.player_two
+                # Selecting player controller (opponent slot lookup, if there are 3+ players):
+                player_controller: Player_Controller = self.find_player_by_coordinates(
+                    check_coordinates = motion_coordinates,
+                    zone_section = zone_selection_motion,
+                    )
 
                 # Asserting there are playable cards:
                 if player_controller.hand.hand_playable_count > 0:
@@ -1881,25 +2953,29 @@ class Game_Controller:
                     card_showcase: Card_Object | None = self.deck.deck_showcase_card
                     if card_showcase is not None:
 
-                        # Checking if showcase card is hovered:
-                        for card_render in self.deck.deck_render:
-                            card_hovered: bool = bool(
-                                motion_coordinate_x in card_render.boundary_x_range and
-                                motion_coordinate_y in card_render.boundary_y_range
+                        # Checking if showcase card or the stack above it is hovered:
+                        deck_stack: Deck_Stack_Controller = self.deck.deck_stack
+                        card_hovered: bool = bool(
+                            bool(
+                                motion_coordinate_x in card_showcase.boundary_x_range and
+                                motion_coordinate_y in card_showcase.boundary_y_range
+                                ) or 
+                            bool(
+                                motion_coordinate_x in deck_stack.boundary_x_range and
+                                motion_coordinate_y in deck_stack.boundary_y_range
                                 )
-                            if card_hovered:
-
-                                # Handling hover and dehover logic:
-                                if self.card_hovered is not card_render:
-                                    self.task_hover_card(
-                                        card_object = card_showcase
-                                        )
-                                    break
-                            
-                            # Dehovering the only card possible:
-                            else:
-                                if card_showcase is not None:
-                                    self.task_dehover_card()
+                            )
+                        if card_hovered:
+
+                            # Handling hover and dehover logic:
+                            if self.card_hovered is not card_showcase:
+                                self.task_hover_card(
+                                    card_object = card_showcase
+                                    )
+                        
+                        # Dehovering the only card possible:
+                        else:
+                            self.task_dehover_card()
     
 
     """
@@ -5,6 +5,9 @@ from typing import Any
 # Cache-related import:
 from functools import cached_property
 
+# Math library import:
+import math
+
 # Controller-related variables import:
 from game.variables import (
 
@@ -45,10 +48,14 @@ from game.settings import (
     CARD_SLIDE_DISTANCE_AXIS_PLAYER,
     CARD_SLIDE_DISTANCE_AXIS_COMPUTER,
 
+    # Deck settings:
+    DECK_CARD_COUNT_MAX,
+
     )
 
 # Controllers import:
 from game.controllers.card import Card_Object
+from game.controllers.culling import Culling_Controller
 
 # Scripts import:
 from game.scripts.convert import (
@@ -73,6 +80,7 @@ class Hand_Controller:
         # Coordinates attribute:
         self.__coordinate_x_center: int = 0
         self.__coordinate_y_center: int = 0
+        self.__hand_width_allowed:  int = HAND_WIDTH_ALLOWED
 
     
     """
@@ -275,8 +283,21 @@ class Hand_Controller:
             hand_overlap_current
             )
         
+        # Estimating overlap iterations first (narrow opponent slots would take hundreds of them):
+        if hand_width_current > self.__hand_width_allowed:
+            overlap_iteration_count: int = max(0, math.ceil(
+                math.log((self.__hand_width_allowed + 1) / (self.hand_count * CARD_TEXTURE_WIDTH_SCALED * hand_overlap_current)) /
+                math.log(HAND_CARD_OVERLAP_ITER)
+                ) - 1)
+            hand_overlap_current *= HAND_CARD_OVERLAP_ITER ** overlap_iteration_count
+            hand_width_current: int = int(
+                self.hand_count * 
+                CARD_TEXTURE_WIDTH_SCALED * 
+                hand_overlap_current
+                )
+
         # Recalculating if width value is larger than expected
-        while hand_width_current > HAND_WIDTH_ALLOWED:
+        while hand_width_current > self.__hand_width_allowed:
             hand_overlap_current *= HAND_CARD_OVERLAP_ITER
             hand_width_current: int = int(
                 self.hand_count * 
@@ -420,8 +441,13 @@ class Hand_Controller:
         # Checking if card does not exist in hand container:
         if card_object not in self.hand_container:
 
-            # Resetting card object's position and state:
-            card_object.reset_position()
+            # Resetting card object's position, removing showcase and changing opponent flag:
+            card_object.update(
+                reset_position = True,
+                state_showcase = False,
+                state_opponent = True if self.hand_owner == PLAYER_TYPE_COMPUTER else None,
+                ignore_assertion = True,
+                )
 
             # Updating card object's hand position:
             position_hand_index: int = len(self.__hand_container)
@@ -429,20 +455,9 @@ class Hand_Controller:
                 position_index = position_hand_index
                 )
             
-            # Removing showcase, if applicable:
-            if card_object.state_showcase:
-                card_object.set_state_showcase(
-                    set_value = False,
-                    )
-            
-            # Changing opponent flag:
-            if self.hand_owner == PLAYER_TYPE_COMPUTER:
-                card_object.set_state_opponent(
-                    set_value = True,
-                    ignore_assertion = True,
-                    )
-            
-            # Updating card object's added position:
+            # Updating card object's added position (renumbering hand, if counter reaches card count):
+            if self.__hand_added + 1 >= DECK_CARD_COUNT_MAX:
+                self.__renumber_hand_added()
             self.adjust_hand_added(
                 adjust_value = 1
                 )
@@ -463,6 +478,28 @@ class Hand_Controller:
                     )
     
 
+    def __renumber_hand_added(self) -> None:
+        """
+        Renumbers added positions of cards in hand from 1 in the same order, counter continues from
+        hand size (counter only counts up, long games with pickups would run past card count).
+        """
+
+        # Renumbering cards (oldest first):
+        hand_sorted: list[Card_Object] = sorted(
+            self.__hand_container,
+            key = lambda card_object: card_object.position_added,
+            )
+        for position_added, card_object in enumerate(hand_sorted, start = 1):
+            card_object.set_position_added(
+                position_index = position_added
+                )
+
+        # Updating counter:
+        self.set_hand_added(
+            set_value = len(hand_sorted)
+            )
+
+
     def add_card_list(self, card_list: list[Card_Object]) -> None:
         """
         TODO: Create a docstring.
@@ -539,17 +576,6 @@ class Hand_Controller:
             position_index: int = card_object.position_hand
             hand_coordinates: tuple[int, int] = self.hand_position_index[position_index]
 
-            # Updating default coordinates:
-            card_object.set_coordinates_default(
-                set_container = hand_coordinates,
-                ignore_assertion = True
-                )
-            if reset_coordinates:
-                card_object.set_coordinates_current(
-                    set_container = hand_coordinates,
-                    ignore_assertion = True,
-                    )
-            
             # Calculating slide coordinates:
             hand_coordinate_x, hand_coordinate_y = hand_coordinates
             slide_axis: int = CARD_SLIDE_DISTANCE_AXIS_PLAYER 
@@ -557,21 +583,154 @@ class Hand_Controller:
                 slide_axis: int = CARD_SLIDE_DISTANCE_AXIS_COMPUTER
             slide_coordinate_x: int = hand_coordinate_x + CARD_SLIDE_DISTANCE_HAND_X
             slide_coordinate_y: int = int(hand_coordinate_y + CARD_SLIDE_DISTANCE_HAND_Y * slide_axis)
-
-            # Updating slide coordinates:
             slide_coordinates: tuple[int, int] = (
                 slide_coordinate_x,
                 slide_coordinate_y
                 )
-            card_object.set_coordinates_slide(
-                set_container = slide_coordinates,
-                ignore_assertion = False,
+
+            # Updating coordinates and resetting boundaries (single cache clear):
+            card_object.update(
+                coordinates_default = hand_coordinates,
+                coordinates_slide = slide_coordinates,
+                coordinates_current = hand_coordinates if reset_coordinates else None,
+                reset_boundary = True,
+                ignore_assertion = True,
+                )
+
+
+    def update_hand_card_list(self, 
+                              state_revealed: bool | None = None,
+                              state_opponent: bool | None = None,
+                              state_playable: bool | None = None,
+                              reset_boundary: bool = False,
+                              ignore_assertion: bool = False
+                              ) -> None:
+        """
+        Applies the same bulk update to every card in hand (see Card_Object.update), each card
+        clears its cache once.
+
+        :param bool | None state_revealed: ...
+        :param bool | None state_opponent: ...
+        :param bool | None state_playable: ...
+        :param bool reset_boundary: ...
+        :param bool ignore_assertion: ...
+        """
+
+        # Updating cards:
+        for card_object in self.hand_container:
+            card_object.update(
+                state_revealed = state_revealed,
+                state_opponent = state_opponent,
+                state_playable = state_playable,
+                reset_boundary = reset_boundary,
+                ignore_assertion = ignore_assertion,
+                )
+
+        # Clearing cache (playable):
+        if state_playable is not None:
+            cached_property_list: tuple[str, ...] = (
+                "hand_playable",
+                "hand_playable_count",
+                )
+            clear_cached_property_list(
+                target_object = self,
+                target_attribute_list = cached_property_list
                 )
             
-            # Resetting boundaries:
-            card_object.reset_boundary()
+
+    def find_hand_playable(self, 
+                           player_focus_state: str,
+                           table_map: dict[int, dict[int, Card_Object | None]]
+                           ) -> list[Card_Object]:
+        """
+        Finds cards in hand that can be played (full scan of hand and table), states are not
+        changed. Attacking: any card on empty table, otherwise cards with a type already on table.
+        Defending: cards that beat any card on table.
+
+        :param str player_focus_state: ...
+        :param dict table_map: ...
+
+        :return list[Card_Object]: ...
+
+        :raise ValueError: If focus state is not recognized.
+        """
+
+        # Collecting playable cards:
+        hand_playable_list: list[Card_Object] = []
             
+        # Collecting cards on the table:
+        table_container: list[Card_Object] = []
+        for position_index in table_map:
+            for stack_index in table_map[position_index]:
+
+                # Adding card object to the list:
+                card_object_table: Card_Object | None = table_map[position_index][stack_index]
+                if card_object_table is not None:
+                    table_container.append(
+                        card_object_table
+                        )
+        
+        # Counting cards on table:
+        table_count: int = len(table_container)
+        
+        # Updating hand state based on attacking focus:
+        if player_focus_state == PLAYER_STATE_FOCUS_ATTACKING:
+
+            # Setting all cards as playable, if no cards have been played yet:
+            if table_count == 0:
+                for card_object_hand in self.hand_container:
+                    hand_playable_list.append(
+                        card_object_hand
+                        )
+                    
+            # Checking card types played:
+            else:
+
+                # Collecting card types played:
+                card_type_list: list[str] = []
+                for card_object_table in table_container:
+                    if card_object_table.type_f not in card_type_list:
+                        card_type: str = card_object_table.type_f
+                        card_type_list.append(
+                            card_type
+                            )
+                
+                # Checking if there are any cards in hand with the same type:
+                for card_object_hand in self.hand_container:
+                    if card_object_hand.type_f in card_type_list:
+                        hand_playable_list.append(
+                            card_object_hand
+                            )
+
+        # Updating hand state based on defending focus:
+        elif player_focus_state == PLAYER_STATE_FOCUS_DEFENDING:
             
+            # Skipping, if no cards have been played yet:
+            if table_count == 0:
+                pass
+
+            # Comparing card values, if cards have been played:
+            else:
+                for card_object_hand in self.hand_container:
+                    for card_object_table in table_container:
+
+                        # Comarping cards based on values:
+                        if card_object_hand > card_object_table:
+                            hand_playable_list.append(
+                                card_object_hand
+                                )
+                            break
+                
+
+        # Raising error if state is not recognized:
+        else:
+            error_message: str = f"Unknown player focus state: ({player_focus_state=})."
+            raise ValueError(error_message)
+
+        # Returning:
+        return hand_playable_list
+
+
     def update_hand_state(self, 
                           player_focus_state: str,      # <- Default var (attacking or defending)
                           table_map: dict[int, dict[int, Card_Object | None]]
@@ -583,81 +742,19 @@ class Hand_Controller:
         # Asserting there are cards in hand to update:
         if self.hand_count > 0:
 
-            # Resetting playable state prior to further checks:
+            # Collecting playable cards (states are updated once, after checks):
+            hand_playable_list: list[Card_Object] = self.find_hand_playable(
+                player_focus_state = player_focus_state,
+                table_map = table_map
+                )
+
+            # Updating playable state:
             for card_object_hand in self.hand_container:
-                card_object_hand.set_state_playable(
-                    set_value = False
+                card_object_hand.update(
+                    state_playable = card_object_hand in hand_playable_list,
+                    ignore_assertion = True,
                     )
-                
-            # Collecting cards on the table:
-            table_container: list[Card_Object] = []
-            for position_index in table_map:
-                for stack_index in table_map[position_index]:
-
-                    # Adding card object to the list:
-                    card_object_table: Card_Object | None = table_map[position_index][stack_index]
-                    if card_object_table is not None:
-                        table_container.append(
-                            card_object_table
-                            )
-            
-            # Counting cards on table:
-            table_count: int = len(table_container)
-            
-            # Updating hand state based on attacking focus:
-            if player_focus_state == PLAYER_STATE_FOCUS_ATTACKING:
-
-                # Setting all cards as playable, if no cards have been played yet:
-                if table_count == 0:
-                    for card_object_hand in self.hand_container:
-                        card_object_hand.set_state_playable(
-                            set_value = True,
-                            )
-                        
-                # Checking card types played:
-                else:
-
-                    # Collecting card types played:
-                    card_type_list: list[str] = []
-                    for card_object_table in table_container:
-                        if card_object_table.type_f not in card_type_list:
-                            card_type: str = card_object_table.type_f
-                            card_type_list.append(
-                                card_type
-                                )
-                    
-                    # Checking if there are any cards in hand with the same type:
-                    for card_object_hand in self.hand_container:
-                        if card_object_hand.type_f in card_type_list:
-                            card_object_hand.set_state_playable(
-                                set_value = True
-                                )
 
-            # Updating hand state based on defending focus:
-            elif player_focus_state == PLAYER_STATE_FOCUS_DEFENDING:
-                
-                # Skipping, if no cards have been played yet:
-                if table_count == 0:
-                    pass
-
-                # Comparing card values, if cards have been played:
-                else:
-                    for card_object_hand in self.hand_container:
-                        for card_object_table in table_container:
-
-                            # Comarping cards based on values:
-                            if card_object_hand > card_object_table:
-                                card_object_hand.set_state_playable(
-                                    set_value = True,
-                                    )
-                                break
-                    
-
-            # Raising error if state is not recognized:
-            else:
-                error_message: str = f"Unknown player focus state: ({player_focus_state=})."
-                raise ValueError(error_message)
-            
             # Clearing cache:
             cached_property_list: tuple[str, ...] = (
                 "hand_playable",
@@ -785,6 +882,39 @@ class Hand_Controller:
             self.__coordinate_y_center: int = set_value
 
 
+    def set_hand_layout(self, 
+                        coordinate_x_center: int, 
+                        coordinate_y_center: int, 
+                        hand_width_allowed: int = HAND_WIDTH_ALLOWED
+                        ) -> None:
+        """
+        Places hand elsewhere than its owner's default (e.g. opponent slots of 3+ player games).
+        Card positions are recalculated on the next hand position update.
+
+        :param int coordinate_x_center: ...
+        :param int coordinate_y_center: ...
+        :param int hand_width_allowed: Cards overlap more to fit, at least 1 pixel.
+        """
+
+        # Updating coordinates and width:
+        self.__set_coordinate_x_center(
+            set_value = coordinate_x_center,
+            ignore_assertion = True,
+            )
+        self.__set_coordinate_y_center(
+            set_value = coordinate_y_center,
+            ignore_assertion = True,
+            )
+        self.__hand_width_allowed: int = max(1, hand_width_allowed)
+
+        # Clearing cache (property):
+        cached_property: str = "hand_position_index"
+        clear_cached_property(
+            target_object = self,
+            target_attribute = cached_property
+            )
+
+
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
     RENDER METHODS AND PROPERTIES BLOCK
@@ -792,12 +922,25 @@ class Hand_Controller:
     """
 
 
-    def render(self) -> None:
+    def render(self, render_alpha: float = 1.0, card_culling: Culling_Controller | None = None) -> None:
         """
         TODO: Create a docstring.
+
+        :param float render_alpha: Logic step interpolation (see Clock_Controller.step_alpha).
+        :param Culling_Controller | None card_culling: Skips cards hidden under overlapping cards.
         """
+
+        # Culling hidden cards:
+        card_render_list: list[Card_Object] = self.hand_container
+        if card_culling is not None:
+            card_render_list: list[Card_Object] = card_culling.cull_card_list(
+                card_list = card_render_list,
+                render_alpha = render_alpha,
+                )
         
         # Rendering each card object via own native render method:
-        for card_object in self.hand_container:
-            card_object.render()
+        for card_object in card_render_list:
+            card_object.render(
+                render_alpha = render_alpha
+                )
 
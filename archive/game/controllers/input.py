@@ -0,0 +1,270 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any, Callable
+
+# Time and data import:
+import collections
+import time
+
+# Related settings import:
+from game.settings import (
+    INPUT_LATENCY_SAMPLE_SIZE,
+    INPUT_KEY_REPEAT_DELAY,
+    INPUT_KEY_REPEAT_INTERVAL,
+    )
+
+# Variables import:
+from game.variables import (
+    INPUT_EVENT_MOTION,
+    INPUT_EVENT_CLICK,
+    INPUT_EVENT_KEY,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+INPUT CLASS OBJECT BLOCK
+
+"""
+
+
+class Input_Controller:
+    """
+    Per-frame input queue. Window events are only recorded when they arrive and are handled once per
+    frame, in the order they came in. Consecutive motion events are merged into one (latest position
+    wins), clicks and key presses are never merged and keep motion on either side of them apart, so
+    hover state is always up to date when a click is handled. Held keys (if registered as held)
+    are queued again as repeats, after a delay, while they are down.
+    """
+
+    def __init__(self, event_handler_map: dict[str, Callable[[Any], None]]) -> None:
+
+        # Event handlers (by event type):
+        self.__event_handler_map: dict[str, Callable[[Any], None]] = event_handler_map
+
+        # Event queue, each entry is [event type, event payload, time received]:
+        self.__event_queue: collections.deque[list] = collections.deque()
+
+        # Latency samples, seconds from the (earliest) motion event to its hover update (bounded):
+        self.__latency_sample_list: collections.deque[float] = collections.deque(
+            maxlen = INPUT_LATENCY_SAMPLE_SIZE
+            )
+
+        # Held keys, key to [modifiers, seconds until next repeat]:
+        self.__key_held_map: dict[int, list] = {}
+
+        # Counters:
+        self.event_received_count: int = 0
+        self.event_coalesced_count: int = 0
+        self.event_processed_count: int = 0
+        self.frame_count: int = 0
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    QUEUE METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def event_queue_count(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Calculating:
+        event_queue_count: int = len(self.__event_queue)
+
+        # Returning:
+        return event_queue_count
+
+
+    def push_motion(self, motion_coordinates: tuple[int, int]) -> None:
+        """
+        Queues mouse motion. If the last queued event is motion too, its position is replaced and the
+        original time received is kept, so latency is measured from the first event of the batch.
+
+        :param tuple[int, int] motion_coordinates: ...
+        """
+
+        # Coalescing with the previous motion event:
+        self.event_received_count += 1
+        if self.__event_queue and self.__event_queue[-1][0] == INPUT_EVENT_MOTION:
+            self.__event_queue[-1][1] = motion_coordinates
+            self.event_coalesced_count += 1
+
+        # Otherwise, queueing:
+        else:
+            self.__event_queue.append([INPUT_EVENT_MOTION, motion_coordinates, time.perf_counter()])
+
+
+    def push_click(self, click_coordinates: tuple[int, int]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int] click_coordinates: ...
+        """
+
+        # Queueing:
+        self.event_received_count += 1
+        self.__event_queue.append([INPUT_EVENT_CLICK, click_coordinates, time.perf_counter()])
+
+
+    def push_key(self, key_pressed: int, key_modifiers: int = 0, key_repeat: bool = False) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int key_pressed: ...
+        :param int key_modifiers: ...
+        :param bool key_repeat: True, if queued by a held key.
+        """
+
+        # Queueing:
+        self.event_received_count += 1
+        self.__event_queue.append([INPUT_EVENT_KEY, (key_pressed, key_modifiers, key_repeat), time.perf_counter()])
+
+
+    def hold_key(self, key_pressed: int, key_modifiers: int = 0) -> None:
+        """
+        Registers key as held, it will be repeated until released.
+
+        :param int key_pressed: ...
+        :param int key_modifiers: ...
+        """
+
+        # Registering:
+        self.__key_held_map[key_pressed] = [key_modifiers, INPUT_KEY_REPEAT_DELAY]
+
+
+    def release_key(self, key_pressed: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int key_pressed: ...
+        """
+
+        # Unregistering:
+        self.__key_held_map.pop(key_pressed, None)
+
+
+    def update_key_repeat(self, delta_time: float) -> int:
+        """
+        Queues repeats for held keys that are due. A long frame queues one repeat per key, not a
+        burst.
+
+        :param float delta_time: Seconds since previous update.
+
+        :return int: Number of repeats queued.
+        """
+
+        # Counting down held keys:
+        repeat_count: int = 0
+        for key_pressed, key_held in self.__key_held_map.items():
+            key_held[1] -= delta_time
+            if key_held[1] <= 0:
+                key_held[1] = max(key_held[1] + INPUT_KEY_REPEAT_INTERVAL, 0.0)
+                self.push_key(
+                    key_pressed = key_pressed,
+                    key_modifiers = key_held[0],
+                    key_repeat = True,
+                    )
+                repeat_count += 1
+
+        # Returning:
+        return repeat_count
+
+
+    def process_events(self) -> int:
+        """
+        Handles every queued event in order. Called once per frame.
+
+        :return int: Number of events handled.
+        """
+
+        # Draining queue (events pushed by handlers are left for the next frame):
+        event_count: int = len(self.__event_queue)
+        for _ in range(event_count):
+            event_type, event_payload, event_time = self.__event_queue.popleft()
+            self.__event_handler_map[event_type](event_payload)
+            if event_type == INPUT_EVENT_MOTION:
+                self.__latency_sample_list.append(time.perf_counter() - event_time)
+
+        # Updating counters:
+        self.event_processed_count += event_count
+        self.frame_count += 1
+
+        # Returning:
+        return event_count
+
+
+    def clear_events(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Clearing queue and held keys:
+        self.__event_queue.clear()
+        self.__key_held_map.clear()
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    METRICS METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @staticmethod
+    def __calculate_percentile(sample_list: collections.deque[float], percentile: float) -> float:
+        """
+        TODO: Create a docstring.
+
+        :param deque[float] sample_list: ...
+        :param float percentile: 0.0 to 1.0.
+
+        :return float: ...
+        """
+
+        # Calculating nearest-rank percentile:
+        percentile_value: float = 0.0
+        if len(sample_list) > 0:
+            sample_sorted: list[float] = sorted(sample_list)
+            sample_index: int = min(
+                len(sample_sorted) - 1,
+                int(percentile * len(sample_sorted))
+                )
+            percentile_value: float = sample_sorted[sample_index]
+
+        # Returning:
+        return percentile_value
+
+
+    def create_report(self) -> dict[str, Any]:
+        """
+        TODO: Create a docstring.
+
+        :return dict[str, Any]: ...
+        """
+
+        # Packing up:
+        input_report: dict[str, Any] = {
+            "frame_count": self.frame_count,
+            "event_received_count": self.event_received_count,
+            "event_coalesced_count": self.event_coalesced_count,
+            "event_processed_count": self.event_processed_count,
+            "hover_latency_p50_ms": round(
+                self.__calculate_percentile(self.__latency_sample_list, 0.50) * 1000, 3
+                ),
+            "hover_latency_p99_ms": round(
+                self.__calculate_percentile(self.__latency_sample_list, 0.99) * 1000, 3
+                ),
+            "hover_latency_max_ms": round(
+                max(self.__latency_sample_list, default = 0.0) * 1000, 3
+                ),
+            }
+
+        # Returning:
+        return input_report
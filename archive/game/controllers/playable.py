@@ -0,0 +1,495 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Variables import:
+from game.variables import (
+    PLAYER_STATE_FOCUS_ATTACKING,
+    PLAYER_STATE_FOCUS_DEFENDING,
+    EVENT_TABLE_CARD_ADDED,
+    EVENT_TABLE_CARD_REMOVED,
+    EVENT_HAND_CARD_ADDED,
+    EVENT_HAND_CARD_REMOVED,
+    EVENT_ROLES_SWITCHED,
+    )
+
+# Related settings import:
+from game.settings import PLAYABLE_TRACKER_VERIFY
+
+# Controllers import:
+from game.controllers.card import Card_Object
+from game.controllers.player import Player_Controller
+from game.controllers.table import Table_Controller
+from game.controllers.event import Event_Controller
+
+# Collections import:
+from game.collections.event import Game_Event
+
+# Scripts import:
+from game.scripts.cache import clear_cached_property_list
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PLAYABLE CONTROLLER CLASS OBJECT BLOCK
+
+"""
+
+
+class Playable_Controller:
+    """
+    Keeps cards' playable state up to date from game events, instead of rescanning whole hands
+    after every task. Only affected cards are checked: a card played to the table marks cards of
+    its type in the attacker's hand (all of them stop being playable on the first card) and cards
+    that beat it in the defender's hand, a card added to a hand is checked alone. Roles switching
+    changes every card, so both hands are checked.
+
+    Tracker is idle (events are ignored) until rebuilt for a game. Verification compares tracked
+    state with a full scan (see Hand_Controller.find_hand_playable).
+    """
+
+    def __init__(self, verify_enabled: bool = PLAYABLE_TRACKER_VERIFY) -> None:
+
+        # Tracked game (set on rebuild):
+        self.__player_list:      tuple[Player_Controller, ...] = ()
+        self.__table_controller: Table_Controller | None = None
+
+        # Table index (cards and count of cards per type):
+        self.__table_card_list:  list[Card_Object] = []
+        self.__table_type_count: dict[str, int] = {}
+
+        # Verification and statistics:
+        self.__verify_enabled: bool = verify_enabled
+        self.__check_count:    int = 0
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    STATE PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def tracker_active(self) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return self.__table_controller is not None
+
+
+    @property
+    def verify_enabled(self) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return self.__verify_enabled
+
+
+    def set_verify_enabled(self, set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param bool set_value: ...
+        """
+
+        # Updating attribute:
+        self.__verify_enabled: bool = set_value
+
+
+    @property
+    def check_count(self) -> int:
+        """
+        Cards checked since the controller was created (full scans not included).
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__check_count
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SETUP METHODS BLOCK
+
+    """
+
+
+    def subscribe(self, event_controller: Event_Controller) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Event_Controller event_controller: ...
+        """
+
+        # Subscribing handlers:
+        handler_map: tuple[tuple[str, object], ...] = (
+            (EVENT_TABLE_CARD_ADDED,   self.__handle_table_card_added),
+            (EVENT_TABLE_CARD_REMOVED, self.__handle_table_card_removed),
+            (EVENT_HAND_CARD_ADDED,    self.__handle_hand_card_added),
+            (EVENT_HAND_CARD_REMOVED,  self.__handle_hand_card_removed),
+            (EVENT_ROLES_SWITCHED,     self.__handle_roles_switched),
+            )
+        for event_type, event_handler in handler_map:
+            event_controller.subscribe(
+                event_type = event_type,
+                event_handler = event_handler,
+                )
+
+
+    def reset(self) -> None:
+        """
+        Stops tracking (game is being created or restored), events are ignored until rebuilt.
+        """
+
+        # Resetting attributes:
+        self.__player_list: tuple[Player_Controller, ...] = ()
+        self.__table_controller: Table_Controller | None = None
+        self.__table_card_list.clear()
+        self.__table_type_count.clear()
+
+
+    def rebuild(self, player_list: list[Player_Controller], table_controller: Table_Controller) -> None:
+        """
+        Starts tracking a game: table index is collected and every hand is checked.
+
+        :param list[Player_Controller] player_list: ...
+        :param Table_Controller table_controller: ...
+        """
+
+        # Updating attributes:
+        self.reset()
+        self.__player_list: tuple[Player_Controller, ...] = tuple(player_list)
+        self.__table_controller: Table_Controller = table_controller
+
+        # Collecting table index:
+        for stack_map in table_controller.table_map.values():
+            for card_object in stack_map.values():
+                if card_object is not None:
+                    self.__add_table_card(card_object)
+
+        # Checking every hand:
+        for player_controller in self.__player_list:
+            self.__update_hand(
+                player_controller = player_controller,
+                )
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TABLE INDEX METHODS BLOCK
+
+    """
+
+
+    def __add_table_card(self, card_object: Card_Object) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Card_Object card_object: ...
+        """
+
+        # Updating index:
+        self.__table_card_list.append(card_object)
+        self.__table_type_count[card_object.type_f] = self.__table_type_count.get(card_object.type_f, 0) + 1
+
+
+    def __remove_table_card(self, card_object: Card_Object) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Card_Object card_object: ...
+        """
+
+        # Updating index:
+        self.__table_card_list.remove(card_object)
+        self.__table_type_count[card_object.type_f] -= 1
+        if self.__table_type_count[card_object.type_f] == 0:
+            del self.__table_type_count[card_object.type_f]
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CHECK METHODS BLOCK
+
+    """
+
+
+    def __check_card_playable(self, card_object: Card_Object, player_focus_state: str | None) -> bool:
+        """
+        Checks a single card against the table index, same rules as a full scan. Players without a
+        focus state have nothing to play.
+
+        :param Card_Object card_object: ...
+        :param str | None player_focus_state: ...
+
+        :return bool: ...
+        """
+
+        # Checking:
+        self.__check_count += 1
+        card_playable: bool = False
+        if player_focus_state == PLAYER_STATE_FOCUS_ATTACKING:
+            card_playable: bool = bool(
+                len(self.__table_card_list) == 0 or
+                card_object.type_f in self.__table_type_count
+                )
+        elif player_focus_state == PLAYER_STATE_FOCUS_DEFENDING:
+            card_playable: bool = any(
+                card_object > card_object_table for card_object_table in self.__table_card_list
+                )
+
+        # Returning:
+        return card_playable
+
+
+    def __update_hand(self,
+                      player_controller: Player_Controller,
+                      card_list: list[Card_Object] | None = None
+                      ) -> None:
+        """
+        Checks listed cards (whole hand, if not set) and updates their playable state.
+
+        :param Player_Controller player_controller: ...
+        :param list[Card_Object] | None card_list: ...
+        """
+
+        # Checking cards:
+        if card_list is None:
+            card_list: list[Card_Object] = player_controller.hand.hand_container
+        hand_updated: bool = False
+        for card_object in card_list:
+            card_playable: bool = self.__check_card_playable(
+                card_object = card_object,
+                player_focus_state = player_controller.state_focus,
+                )
+            if card_object.state_playable != card_playable:
+                card_object.update(
+                    state_playable = card_playable,
+                    ignore_assertion = True,
+                    )
+                hand_updated: bool = True
+
+        # Clearing cache (hand):
+        if hand_updated:
+            self.__clear_hand_cache(player_controller)
+
+
+    @staticmethod
+    def __clear_hand_cache(player_controller: Player_Controller) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Player_Controller player_controller: ...
+        """
+
+        # Clearing cache (playable):
+        cached_property_list: tuple[str, ...] = (
+            "hand_playable",
+            "hand_playable_count",
+            )
+        clear_cached_property_list(
+            target_object = player_controller.hand,
+            target_attribute_list = cached_property_list
+            )
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    EVENT HANDLERS BLOCK
+
+    """
+
+
+    def __handle_table_card_added(self, game_event: Game_Event) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Skipping, if idle:
+        if not self.tracker_active:
+            return
+
+        # Updating index:
+        card_object: Card_Object = game_event.card_object
+        table_empty_previous: bool = len(self.__table_card_list) == 0
+        self.__add_table_card(card_object)
+        type_added: bool = self.__table_type_count[card_object.type_f] == 1
+
+        # Updating hands:
+        for player_controller in self.__player_list:
+
+            # Attacker (first card limits the hand to its type, a new type adds its cards):
+            if player_controller.state_attacking:
+                if table_empty_previous:
+                    self.__update_hand(
+                        player_controller = player_controller,
+                        )
+                elif type_added:
+                    self.__update_hand(
+                        player_controller = player_controller,
+                        card_list = [
+                            card_object_hand for card_object_hand in player_controller.hand.hand_container
+                            if card_object_hand.type_f == card_object.type_f
+                            ],
+                        )
+
+            # Defender (only cards not playable yet can change):
+            elif player_controller.state_defending:
+                self.__update_hand(
+                    player_controller = player_controller,
+                    card_list = [
+                        card_object_hand for card_object_hand in player_controller.hand.hand_container
+                        if not card_object_hand.state_playable and card_object_hand > card_object
+                        ],
+                    )
+
+
+    def __handle_table_card_removed(self, game_event: Game_Event) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Skipping, if idle or card is not indexed:
+        card_object: Card_Object = game_event.card_object
+        if not self.tracker_active or card_object not in self.__table_card_list:
+            return
+
+        # Updating index:
+        self.__remove_table_card(card_object)
+        table_empty: bool = len(self.__table_card_list) == 0
+        type_removed: bool = card_object.type_f not in self.__table_type_count
+
+        # Updating hands:
+        for player_controller in self.__player_list:
+
+            # Attacker (empty table frees the hand, a removed type drops its cards):
+            if player_controller.state_attacking:
+                if table_empty:
+                    self.__update_hand(
+                        player_controller = player_controller,
+                        )
+                elif type_removed:
+                    self.__update_hand(
+                        player_controller = player_controller,
+                        card_list = [
+                            card_object_hand for card_object_hand in player_controller.hand.hand_container
+                            if card_object_hand.type_f == card_object.type_f
+                            ],
+                        )
+
+            # Defender (only playable cards that beat the removed card can change):
+            elif player_controller.state_defending:
+                self.__update_hand(
+                    player_controller = player_controller,
+                    card_list = [
+                        card_object_hand for card_object_hand in player_controller.hand.hand_container
+                        if card_object_hand.state_playable and card_object_hand > card_object
+                        ],
+                    )
+
+
+    def __handle_hand_card_added(self, game_event: Game_Event) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Checking added card only:
+        if self.tracker_active and game_event.player_controller in self.__player_list:
+            self.__update_hand(
+                player_controller = game_event.player_controller,
+                card_list = [game_event.card_object],
+                )
+
+
+    def __handle_hand_card_removed(self, game_event: Game_Event) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Card out of hand is not playable:
+        card_object: Card_Object = game_event.card_object
+        if self.tracker_active and card_object.state_playable:
+            card_object.update(
+                state_playable = False,
+                ignore_assertion = True,
+                )
+            self.__clear_hand_cache(game_event.player_controller)
+
+
+    def __handle_roles_switched(self, game_event: Game_Event) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Checking every hand:
+        if self.tracker_active:
+            for player_controller in self.__player_list:
+                self.__update_hand(
+                    player_controller = player_controller,
+                    )
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    VERIFICATION METHODS BLOCK
+
+    """
+
+
+    def verify_state(self) -> None:
+        """
+        Compares table index and tracked playable state with a full scan, if verification is
+        enabled (and tracker is active).
+
+        :raise AssertionError: If tracked state differs from a full scan.
+        """
+
+        # Skipping, if not verifying:
+        if not self.__verify_enabled or not self.tracker_active:
+            return
+
+        # Comparing table index:
+        table_map: dict[int, dict[int, Card_Object | None]] = self.__table_controller.table_map
+        table_id_set: set[int] = {
+            id(card_object) for stack_map in table_map.values()
+            for card_object in stack_map.values() if card_object is not None
+            }
+        if table_id_set != {id(card_object) for card_object in self.__table_card_list}:
+            error_message: str = "Playable tracker's table index differs from table."
+            raise AssertionError(error_message)
+
+        # Comparing hands:
+        for player_controller in self.__player_list:
+            if player_controller.state_focus is None:
+                continue
+            hand_playable_list: list[Card_Object] = player_controller.hand.find_hand_playable(
+                player_focus_state = player_controller.state_focus,
+                table_map = table_map,
+                )
+            for card_object in player_controller.hand.hand_container:
+                card_playable: bool = card_object in hand_playable_list
+                if card_object.state_playable != card_playable:
+                    error_message: str = (
+                        f"Tracked playable state differs from full scan: ({card_object=}, "
+                        f"{card_object.state_playable=}, {card_playable=}, {player_controller.state_focus=})."
+                        )
+                    raise AssertionError(error_message)
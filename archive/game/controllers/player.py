@@ -417,12 +417,11 @@ class Player_Controller:
         # Asserting there are cards in hand:
         if self.hand.hand_count > 0:
 
-            # Resetting playable state:
-            for card_stored in self.hand.hand_container:
-                card_stored.set_state_playable(
-                    set_value = False,
-                    ignore_assertion = True,
-                    )
+            # Resetting playable state (hand-wide update):
+            self.hand.update_hand_card_list(
+                state_playable = False,
+                ignore_assertion = True,
+                )
                 
             # Scanning table map and aquiring a card container
             table_container: list[Card_Object] = []
@@ -0,0 +1,438 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# Memory tracing, syntax tree and data import:
+import ast
+import bisect
+import json
+import os
+import tracemalloc
+
+# Related settings import:
+from game.settings import (
+    PROFILER_FRAME_INTERVAL,
+    PROFILER_TRACEBACK_DEPTH,
+    PROFILER_TOP_COUNT,
+    PROFILER_OUTPUT_PATH_DEFAULT,
+    )
+
+# Session-related import:
+from game.session import SESSION_ENABLE_ECHO
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PROFILER SETTINGS BLOCK
+
+"""
+
+
+# Package root (allocations are grouped by dotted module name inside of it):
+PROFILER_PACKAGE_ROOT: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Frames excluded from statistics (profiler itself anywhere in traceback, its parser and import
+# machinery):
+PROFILER_FILTER_LIST: tuple[tracemalloc.Filter, ...] = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, os.path.abspath(__file__), all_frames = True),
+    tracemalloc.Filter(False, ast.__file__),   # <- Function names are parsed on demand
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PROFILER CLASS OBJECT BLOCK
+
+"""
+
+
+class Profiler_Controller:
+    """
+    Opt-in allocation profiler based on tracemalloc. Every report is a difference between two
+    snapshots: game snapshots (start and end of a game) are compared to the previous game snapshot,
+    frame snapshots are taken every PROFILER_FRAME_INTERVAL frames and compared to the previous frame
+    snapshot. Allocations are grouped by module and function of the innermost frame inside of the
+    package (e.g. the property read, not functools.cached_property), reports are written to a JSON
+    file when profiler stops.
+
+    Only memory still alive at snapshot time is attributed, short-lived allocations (e.g. per frame
+    tuples) show up in traced peak instead. Tracing slows everything down, frame times are not
+    representative while profiler is running.
+    """
+
+    def __init__(self) -> None:
+
+        # Snapshots compared against:
+        self.__snapshot_game: tracemalloc.Snapshot | None = None
+        self.__snapshot_frame: tracemalloc.Snapshot | None = None
+
+        # Tracing was started by this profiler (and is stopped by it):
+        self.__tracing_owned: bool = False
+
+        # Frame counter (since start):
+        self.__frame_count: int = 0
+
+        # Reports collected since start:
+        self.__report_list: list[dict[str, Any]] = []
+
+        # Function lookup cache (file name to sorted function line ranges):
+        self.__function_range_map: dict[str, tuple[list[int], list[tuple[int, int, str]]]] = {}
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    STATE METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def profiler_running(self) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return self.__snapshot_game is not None
+
+
+    @property
+    def report_list(self) -> tuple[dict[str, Any], ...]:
+        """
+        TODO: Create a docstring.
+
+        :return tuple[dict[str, Any], ...]: ...
+        """
+
+        # Returning:
+        return tuple(self.__report_list)
+
+
+    def start(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Starting tracing (if not started elsewhere already) and taking baseline snapshots:
+        if not self.profiler_running:
+            self.__tracing_owned: bool = not tracemalloc.is_tracing()
+            if self.__tracing_owned:
+                tracemalloc.start(PROFILER_TRACEBACK_DEPTH)
+            self.__frame_count: int = 0
+            self.__report_list.clear()
+            self.__snapshot_game: tracemalloc.Snapshot = self.__take_snapshot()
+            self.__snapshot_frame: tracemalloc.Snapshot = self.__snapshot_game
+
+            # Echoing:
+            if SESSION_ENABLE_ECHO:
+                print("Memory profiler started.")
+
+
+    def stop(self, output_path: str = PROFILER_OUTPUT_PATH_DEFAULT) -> str | None:
+        """
+        Takes a final snapshot, stops tracing (only if profiler started it) and writes reports to file.
+
+        :param str output_path: ...
+
+        :return str: Output path.
+        :return None: if profiler was not running.
+        """
+
+        # Checking if running:
+        if not self.profiler_running:
+            return None
+
+        # Taking final snapshot and stopping:
+        self.take_snapshot(
+            snapshot_label = "profiler_stop"
+            )
+        if self.__tracing_owned:
+            tracemalloc.stop()
+            self.__tracing_owned: bool = False
+        self.__snapshot_game: tracemalloc.Snapshot | None = None
+        self.__snapshot_frame: tracemalloc.Snapshot | None = None
+
+        # Writing reports:
+        self.dump_report(
+            output_path = output_path
+            )
+
+        # Echoing:
+        if SESSION_ENABLE_ECHO:
+            print(f"Memory profiler stopped, {len(self.__report_list)} reports written to {output_path}.")
+
+        # Returning:
+        return output_path
+
+
+    def toggle(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Switching state:
+        if self.profiler_running:
+            self.stop()
+        else:
+            self.start()
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SNAPSHOT METHODS BLOCK
+
+    """
+
+
+    @staticmethod
+    def __take_snapshot() -> tracemalloc.Snapshot:
+        """
+        TODO: Create a docstring.
+
+        :return tracemalloc.Snapshot: ...
+        """
+
+        # Taking snapshot without profiler's own frames:
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot().filter_traces(PROFILER_FILTER_LIST)
+
+        # Returning:
+        return snapshot
+
+
+    def take_snapshot(self, snapshot_label: str) -> dict[str, Any] | None:
+        """
+        Takes a game snapshot (e.g. "game_start", "game_end") and reports allocations since the
+        previous one.
+
+        :param str snapshot_label: ...
+
+        :return dict[str, Any]: Report.
+        :return None: if profiler is not running.
+        """
+
+        # Checking if running:
+        if not self.profiler_running:
+            return None
+
+        # Comparing snapshots:
+        snapshot: tracemalloc.Snapshot = self.__take_snapshot()
+        profiler_report: dict[str, Any] = self.__create_report(
+            report_label = snapshot_label,
+            snapshot_current = snapshot,
+            snapshot_previous = self.__snapshot_game,
+            frame_count = 1,
+            )
+        self.__snapshot_game: tracemalloc.Snapshot = snapshot
+
+        # Returning:
+        return profiler_report
+
+
+    def update_frame(self) -> dict[str, Any] | None:
+        """
+        Counts a rendered frame. Every PROFILER_FRAME_INTERVAL frames allocations since previous
+        frame snapshot are reported, sizes and counts are averaged per frame.
+
+        :return dict[str, Any]: Report, if one was created on this frame.
+        :return None: otherwise.
+        """
+
+        # Checking if running:
+        if not self.profiler_running:
+            return None
+
+        # Counting frame:
+        self.__frame_count += 1
+        if self.__frame_count % PROFILER_FRAME_INTERVAL != 0:
+            return None
+
+        # Comparing snapshots:
+        snapshot: tracemalloc.Snapshot = self.__take_snapshot()
+        profiler_report: dict[str, Any] = self.__create_report(
+            report_label = f"frame_{self.__frame_count - PROFILER_FRAME_INTERVAL}_{self.__frame_count}",
+            snapshot_current = snapshot,
+            snapshot_previous = self.__snapshot_frame,
+            frame_count = PROFILER_FRAME_INTERVAL,
+            )
+        self.__snapshot_frame: tracemalloc.Snapshot = snapshot
+
+        # Returning:
+        return profiler_report
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    REPORT METHODS BLOCK
+
+    """
+
+
+    def __find_module_name(self, file_name: str) -> str:
+        """
+        Dotted module name for files inside of the package, file name otherwise.
+
+        :param str file_name: ...
+
+        :return str: ...
+        """
+
+        # Converting path:
+        module_name: str = os.path.basename(file_name)
+        if file_name.startswith(PROFILER_PACKAGE_ROOT + os.sep):
+            module_path: str = os.path.relpath(file_name, PROFILER_PACKAGE_ROOT)
+            module_name: str = os.path.splitext(module_path)[0].replace(os.sep, ".")
+
+        # Returning:
+        return module_name
+
+
+    def __find_function_name(self, file_name: str, line_number: int) -> str:
+        """
+        Innermost function (or class) around given line. Line ranges are parsed once per file.
+
+        :param str file_name: ...
+        :param int line_number: ...
+
+        :return str: Qualified name, or "<module>".
+        """
+
+        # Parsing file (once):
+        if file_name not in self.__function_range_map:
+            function_range_list: list[tuple[int, int, str]] = []
+            try:
+                with open(file_name, encoding = "utf-8") as source_file:
+                    source_tree: ast.Module = ast.parse(source_file.read())
+            except (OSError, SyntaxError, ValueError):
+                source_tree: ast.Module = ast.Module(body = [], type_ignores = [])
+            node_stack: list[tuple[ast.AST, str]] = [(source_tree, "")]
+            while node_stack:
+                parent_node, parent_name = node_stack.pop()
+                for child_node in ast.iter_child_nodes(parent_node):
+                    child_name: str = parent_name
+                    if isinstance(child_node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                        child_name: str = f"{parent_name}.{child_node.name}" if parent_name else child_node.name
+                        function_range_list.append((child_node.lineno, child_node.end_lineno, child_name))
+                    node_stack.append((child_node, child_name))
+            function_range_list.sort()
+            self.__function_range_map[file_name] = (
+                [function_range[0] for function_range in function_range_list],
+                function_range_list,
+                )
+
+        # Searching innermost range (latest start containing the line):
+        function_name: str = "<module>"
+        line_start_list, function_range_list = self.__function_range_map[file_name]
+        range_index: int = bisect.bisect_right(line_start_list, line_number) - 1
+        while range_index >= 0:
+            line_start, line_end, range_name = function_range_list[range_index]
+            if line_start <= line_number <= line_end:
+                function_name: str = range_name
+                break
+            range_index -= 1
+
+        # Returning:
+        return function_name
+
+
+    @staticmethod
+    def __find_package_frame(trace_traceback: tracemalloc.Traceback) -> tracemalloc.Frame:
+        """
+        Innermost frame inside of the package (standard library and dependency frames are skipped,
+        so allocations are attributed to the game code that caused them).
+
+        :param tracemalloc.Traceback trace_traceback: Frames from the oldest to the most recent.
+
+        :return tracemalloc.Frame: Most recent frame, if no frame is inside of the package.
+        """
+
+        # Searching from the most recent frame:
+        for trace_frame in reversed(trace_traceback):
+            if trace_frame.filename.startswith(PROFILER_PACKAGE_ROOT + os.sep):
+                return trace_frame
+
+        # Returning:
+        return trace_traceback[-1]
+
+
+    def __create_report(self,
+                        report_label: str,
+                        snapshot_current: tracemalloc.Snapshot,
+                        snapshot_previous: tracemalloc.Snapshot,
+                        frame_count: int
+                        ) -> dict[str, Any]:
+        """
+        TODO: Create a docstring.
+
+        :param str report_label: ...
+        :param tracemalloc.Snapshot snapshot_current: ...
+        :param tracemalloc.Snapshot snapshot_previous: ...
+        :param int frame_count: Sizes and counts are divided by it.
+
+        :return dict[str, Any]: ...
+        """
+
+        # Grouping traceback differences by module and function (of the innermost package frame):
+        group_map: dict[tuple[str, str], list[int]] = {}
+        for statistic_diff in snapshot_current.compare_to(snapshot_previous, "traceback"):
+            if statistic_diff.size_diff == 0 and statistic_diff.count_diff == 0:
+                continue
+            trace_frame: tracemalloc.Frame = self.__find_package_frame(
+                trace_traceback = statistic_diff.traceback
+                )
+            group_key: tuple[str, str] = (
+                self.__find_module_name(trace_frame.filename),
+                self.__find_function_name(trace_frame.filename, trace_frame.lineno),
+                )
+            group_value: list[int] = group_map.setdefault(group_key, [0, 0])
+            group_value[0] += statistic_diff.size_diff
+            group_value[1] += statistic_diff.count_diff
+
+        # Selecting top allocators (by size allocated):
+        group_sorted: list[tuple[tuple[str, str], list[int]]] = sorted(
+            group_map.items(),
+            key = lambda group_item: group_item[1][0],
+            reverse = True,
+            )
+        profiler_report: dict[str, Any] = {
+            "label": report_label,
+            "frame_count": frame_count,
+            "size_diff": round(sum(group_value[0] for group_value in group_map.values()) / frame_count, 1),
+            "count_diff": round(sum(group_value[1] for group_value in group_map.values()) / frame_count, 1),
+            "traced_current": tracemalloc.get_traced_memory()[0],
+            "traced_peak": tracemalloc.get_traced_memory()[1],
+            "top": [
+                {
+                    "module": module_name,
+                    "function": function_name,
+                    "size_diff": round(size_diff / frame_count, 1),
+                    "count_diff": round(count_diff / frame_count, 1),
+                    }
+                for (module_name, function_name), (size_diff, count_diff)
+                in group_sorted[:PROFILER_TOP_COUNT]
+                ],
+            }
+
+        # Updating container and peak (next report shows peak since this one):
+        self.__report_list.append(profiler_report)
+        tracemalloc.reset_peak()
+
+        # Returning:
+        return profiler_report
+
+
+    def dump_report(self, output_path: str = PROFILER_OUTPUT_PATH_DEFAULT) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str output_path: ...
+        """
+
+        # Writing reports:
+        with open(output_path, "w", encoding = "utf-8") as output_file:
+            json.dump(self.__report_list, output_file, indent = 4)
@@ -0,0 +1,414 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# System management import:
+import os
+
+# Cache-related import:
+from functools import cached_property
+
+# Arcade library import:
+import arcade
+from arcade import Rect, Texture
+
+# Image library import:
+from PIL import Image
+
+# Card- and texture-related directory variables import:
+from game.directory import DIR_TEXTURES_CARD_BACK_PATH
+
+# Related settings import:
+from game.settings import (
+
+    # Deck render coordinates:
+    DECK_RENDER_COORDINATE_X,
+    DECK_RENDER_COORDINATE_Y,
+    DECK_RENDER_COORDINATE_SHIFT_X,
+    DECK_RENDER_COORDINATE_SHIFT_Y,
+    DECK_RENDER_SHIFT_THRESHOLD_DEFAULT,
+
+    # Card texture settings:
+    CARD_TEXTURE_WIDTH_SCALED,
+    CARD_TEXTURE_HEIGHT_SCALED,
+    )
+
+# Collections import:
+from game.collections.texturepack import Texture_Pack
+
+# Scripts import:
+from game.scripts.cache import clear_cached_property_list
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+DECK STACK CLASS OBJECT BLOCK
+
+"""
+
+
+class Deck_Stack_Controller:
+
+    # Precomposed stack textures, shared between deck controllers and keyed by back texture filepath
+    # and number of visible layers:
+    STACK_TEXTURE_CACHE: dict[tuple[str, int], Texture] = {}
+
+    def __init__(self) -> None:
+
+        # Stack attributes:
+        self.__stack_count: int = 0
+        self.__stack_shift: int = DECK_RENDER_SHIFT_THRESHOLD_DEFAULT
+
+        # Texture attributes:
+        self.__texture_pack_back: Texture_Pack | None = None
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CACHE METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @cached_property
+    def __cached_layer_property_list(self) -> tuple[str, ...]:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Generating cached property list:
+        cached_property_list: tuple[str, ...] = (
+            "stack_layer_count",
+            "stack_texture_object",
+            "render_rect_object",
+            "boundary_x_range",
+            "boundary_y_range",
+            )
+
+        # Returning:
+        return cached_property_list
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    STACK METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def stack_count(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__stack_count
+
+
+    @cached_property
+    def stack_layer_count(self) -> int:
+        """
+        Number of visible card layers; one layer is drawn per stack shift threshold, so the value only
+        changes when the card count crosses a shift boundary.
+
+        :return int: ...
+        """
+
+        # Calculating (one layer, plus one more per full shift threshold):
+        stack_layer_count: int = self.__calculate_layer_count(self.__stack_count, self.__stack_shift)
+
+        # Returning:
+        return stack_layer_count
+
+
+    @staticmethod
+    def __calculate_layer_count(stack_count: int, stack_shift: int) -> int:
+        """
+        Layer count of the original per card rendering: every card shifted the next one by a layer
+        each shift threshold, so a stack of a multiple of shift cards keeps its extra layer.
+
+        :param int stack_count: ...
+        :param int stack_shift: ...
+
+        :return int: ...
+        """
+
+        # Returning (no layers for an empty stack):
+        return stack_count // stack_shift + 1 if stack_count > 0 else 0
+
+
+    def set_stack_count(self, stack_count: int) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int stack_count: ...
+        """
+
+        # Updating attribute:
+        stack_layer_count: int = self.stack_layer_count
+        self.__stack_count: int = max(0, stack_count)
+
+        # Clearing cache only if the number of visible layers has changed:
+        stack_layer_count_next: int = self.__calculate_layer_count(self.__stack_count, self.__stack_shift)
+        if stack_layer_count_next != stack_layer_count:
+            clear_cached_property_list(
+                target_object = self,
+                target_attribute_list = self.__cached_layer_property_list
+                )
+
+
+    def create_stack(self,
+                     stack_count: int,
+                     stack_shift: int,
+                     texture_pack_back: Texture_Pack
+                     ) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param int stack_count: ...
+        :param int stack_shift: ...
+        :param Texture_Pack texture_pack_back: ...
+        """
+
+        # Updating attributes:
+        self.__stack_count: int = max(0, stack_count)
+        self.__stack_shift: int = max(1, stack_shift)
+        self.__texture_pack_back: Texture_Pack = texture_pack_back
+
+        # Clearing cache (layers):
+        clear_cached_property_list(
+            target_object = self,
+            target_attribute_list = self.__cached_layer_property_list
+            )
+
+
+    def remove_card(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Removing one card from the stack:
+        self.set_stack_count(
+            stack_count = self.__stack_count - 1
+            )
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TEXTURE METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def texture_back_filepath(self) -> str:
+        """
+        TODO: Create a docstring.
+
+        :return str: ...
+        """
+
+        # Generating texture back filepath:
+        texture_back_filepath: str = os.path.join(
+            DIR_TEXTURES_CARD_BACK_PATH,
+            self.__texture_pack_back.pack_color.lower(),
+            "{pack_style}.png".format(
+                pack_style = self.__texture_pack_back.pack_style.lower()
+                ),
+            )
+
+        # Returning:
+        return texture_back_filepath
+
+
+    @cached_property
+    def stack_texture_object(self) -> Texture | None:
+        """
+        Single precomposed texture of the whole stack. Generated once per back texture and layer count,
+        then shared through the class texture cache.
+
+        :return Texture: ...
+        :return None: ...
+        """
+
+        # Checking if there is anything to compose:
+        stack_texture: Texture | None = None
+        if self.stack_layer_count > 0 and self.__texture_pack_back is not None:
+
+            # Looking up a previously composed texture:
+            texture_back_filepath: str = self.texture_back_filepath
+            stack_texture_key: tuple[str, int] = (
+                texture_back_filepath,
+                self.stack_layer_count,
+                )
+            stack_texture: Texture | None = self.STACK_TEXTURE_CACHE.get(stack_texture_key)
+
+            # Composing new texture:
+            if stack_texture is None:
+                stack_texture: Texture = self.__compose_stack_texture(
+                    texture_back_filepath = texture_back_filepath,
+                    stack_layer_count = self.stack_layer_count,
+                    )
+                self.STACK_TEXTURE_CACHE[stack_texture_key] = stack_texture
+
+        # Returning:
+        return stack_texture
+
+
+    def set_texture_pack_back(self, texture_pack: Texture_Pack) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Texture_Pack texture_pack: ...
+        """
+
+        # Updating attribute:
+        self.__texture_pack_back: Texture_Pack = texture_pack
+
+        # Clearing cache (layers):
+        clear_cached_property_list(
+            target_object = self,
+            target_attribute_list = self.__cached_layer_property_list
+            )
+
+
+    @staticmethod
+    def __compose_stack_texture(texture_back_filepath: str, stack_layer_count: int) -> Texture:
+        """
+        TODO: Create a docstring.
+
+        :param str texture_back_filepath: ...
+        :param int stack_layer_count: ...
+
+        :return Texture: ...
+        """
+
+        # Loading and scaling card back image (nearest, to keep the pixelated look):
+        card_image: Image.Image = Image.open(texture_back_filepath).convert("RGBA")
+        card_image: Image.Image = card_image.resize(
+            size = (CARD_TEXTURE_WIDTH_SCALED, CARD_TEXTURE_HEIGHT_SCALED),
+            resample = Image.Resampling.NEAREST,
+            )
+
+        # Calculating canvas size (image Y axis is flipped compared to screen):
+        stack_shift_x: int = DECK_RENDER_COORDINATE_SHIFT_X * (stack_layer_count - 1)
+        stack_shift_y: int = -DECK_RENDER_COORDINATE_SHIFT_Y * (stack_layer_count - 1)
+        stack_image: Image.Image = Image.new(
+            mode = "RGBA",
+            size = (
+                CARD_TEXTURE_WIDTH_SCALED + abs(stack_shift_x),
+                CARD_TEXTURE_HEIGHT_SCALED + abs(stack_shift_y),
+                ),
+            color = (0, 0, 0, 0),
+            )
+
+        # Composing layers from the bottom one to the top one:
+        for layer_index in range(stack_layer_count):
+            layer_x: int = DECK_RENDER_COORDINATE_SHIFT_X * layer_index - min(0, stack_shift_x)
+            layer_y: int = -DECK_RENDER_COORDINATE_SHIFT_Y * layer_index - min(0, stack_shift_y)
+            stack_image.alpha_composite(
+                im = card_image,
+                dest = (layer_x, layer_y),
+                )
+
+        # Creating texture object:
+        stack_texture: Texture = Texture(
+            stack_image,
+            hash = "deck_stack:{filepath}:{count}".format(
+                filepath = texture_back_filepath,
+                count = stack_layer_count,
+                ),
+            hit_box_algorithm = arcade.hitbox.algo_bounding_box,
+            )
+
+        # Returning:
+        return stack_texture
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    BOUNDARY AND RENDER METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @cached_property
+    def render_rect_object(self) -> Rect | None:
+        """
+        TODO: Create a docstring.
+
+        :return Rect: ...
+        :return None: ...
+        """
+
+        # Creating render rectangle object, centered between bottom and top layers:
+        render_rect: Rect | None = None
+        if self.stack_layer_count > 0:
+            stack_shift_x: int = DECK_RENDER_COORDINATE_SHIFT_X * (self.stack_layer_count - 1)
+            stack_shift_y: int = DECK_RENDER_COORDINATE_SHIFT_Y * (self.stack_layer_count - 1)
+            render_rect: Rect = arcade.XYWH(
+                x = DECK_RENDER_COORDINATE_X + stack_shift_x / 2,
+                y = DECK_RENDER_COORDINATE_Y + stack_shift_y / 2,
+                width = CARD_TEXTURE_WIDTH_SCALED + abs(stack_shift_x),
+                height = CARD_TEXTURE_HEIGHT_SCALED + abs(stack_shift_y),
+                )
+
+        # Returning:
+        return render_rect
+
+
+    @cached_property
+    def boundary_x_range(self) -> range:
+        """
+        TODO: Create a docstring.
+
+        :return range: ...
+        """
+
+        # Generating range (empty, if there is nothing rendered):
+        boundary_x_range: range = range(0)
+        if self.render_rect_object is not None:
+            boundary_x_range: range = range(
+                int(self.render_rect_object.left),
+                int(self.render_rect_object.right),
+                )
+
+        # Returning:
+        return boundary_x_range
+
+
+    @cached_property
+    def boundary_y_range(self) -> range:
+        """
+        TODO: Create a docstring.
+
+        :return range: ...
+        """
+
+        # Generating range (empty, if there is nothing rendered):
+        boundary_y_range: range = range(0)
+        if self.render_rect_object is not None:
+            boundary_y_range: range = range(
+                int(self.render_rect_object.bottom),
+                int(self.render_rect_object.top),
+                )
+
+        # Returning:
+        return boundary_y_range
+
+
+    def render(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Rendering the whole stack in one draw call:
+        stack_texture: Texture | None = self.stack_texture_object
+        if stack_texture is not None:
+            arcade.draw_texture_rect(
+                texture = stack_texture,
+                rect = self.render_rect_object,
+                pixelated = True,
+                )
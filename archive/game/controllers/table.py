@@ -9,6 +9,7 @@ from functools import cached_property
 
 # Controllers import:
 from game.controllers.card import Card_Object
+from game.controllers.culling import Culling_Controller
 
 # Settings import:
 from game.settings import (
@@ -357,24 +358,15 @@ class Table_Controller:
             coordinate_y_default + TABLE_COORDINATE_SHIFT_Y
             )
 
-        # Updating coordinates:
-        card_object.set_coordinates_default(
-            set_container = coordinates_default,
-            ignore_assertion = ignore_assertion
-            )
-        card_object.set_coordinates_slide(
-            set_container = coordinates_slide,
+        # Updating coordinates and resetting card attributes (single cache clear):
+        card_object.update(
+            coordinates_default = coordinates_default,
+            coordinates_slide = coordinates_slide,
+            coordinates_current = coordinates_default if reset_coordinates else None,
+            reset_boundary = True,
+            reset_state = True,
             ignore_assertion = ignore_assertion,
             )
-        if reset_coordinates:
-            card_object.set_coordinates_current(
-                set_container = coordinates_default,
-                ignore_assertion = ignore_assertion
-                )
-
-        # Resetting card attributes:
-        card_object.reset_boundary()
-        card_object.reset_state()
 
         # Clearing cache:
         clear_cached_property_list(
@@ -396,9 +388,12 @@ class Table_Controller:
             stack_index: int = card_object.position_index
             self.__table_map[position_index][stack_index] = None
 
-            # Resetting card attributes:
-            card_object.reset_state()
-            card_object.reset_position()
+            # Resetting card attributes (single cache clear):
+            card_object.update(
+                reset_state = True,
+                reset_position = True,
+                ignore_assertion = True,
+                )
 
             # Clearing cache:
             if clear_cache:
@@ -462,18 +457,25 @@ class Table_Controller:
     """
 
 
-    def render(self) -> None:
+    def render(self, card_culling: Culling_Controller | None = None) -> None:
         """
         TODO: Create a docstring.
+
+        :param Culling_Controller | None card_culling: Skips cards hidden under top cards.
         """
 
-        # Collecting and ordering card containers:
-        card_container_list: tuple[tuple[Card_Object], ...] = (
-            self.table_container_bottom, 
-            self.table_container_top
-            )
+        # Collecting cards in draw order (bottom cards first):
+        card_render_list: list[Card_Object] = [
+            *self.table_container_bottom, 
+            *self.table_container_top,
+            ]
+
+        # Culling hidden cards:
+        if card_culling is not None:
+            card_render_list: list[Card_Object] = card_culling.cull_card_list(
+                card_list = card_render_list,
+                )
         
         # Rendering cards in order:
-        for card_container in card_container_list:
-            for card_object in card_container:
-                card_object.render()
+        for card_object in card_render_list:
+            card_object.render()
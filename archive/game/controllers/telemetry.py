@@ -0,0 +1,255 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any, TextIO
+
+# Threading, time and data import:
+import collections
+import json
+import os
+import threading
+import time
+
+# Related settings import:
+from game.settings import (
+    TELEMETRY_QUEUE_SIZE,
+    TELEMETRY_WRITE_INTERVAL,
+    TELEMETRY_FILE_SIZE_MAX,
+    TELEMETRY_FILE_BACKUP_COUNT,
+    TELEMETRY_OUTPUT_PATH_DEFAULT,
+    )
+
+# Session-related import:
+from game.session import SESSION_ENABLE_ECHO
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TELEMETRY CLASS OBJECT BLOCK
+
+"""
+
+
+class Telemetry_Controller:
+    """
+    Opt-in telemetry sink for game events (deals, plays, beats, pickups, discards, turn switches).
+    Recording only appends a tuple to a bounded buffer (a full buffer drops the record and counts
+    it), a background writer thread serializes records to compact JSON Lines and writes them to a
+    rotating file every TELEMETRY_WRITE_INTERVAL seconds, so disk I/O never runs on the game thread.
+
+    Every record has an event name ("e") and seconds since telemetry start ("t"), plus event data.
+    Recording does nothing while telemetry is not running.
+    """
+
+    def __init__(self) -> None:
+
+        # Record buffer (game thread appends, writer thread pops) and writer thread:
+        self.__record_buffer: collections.deque[tuple[str, float, dict[str, Any] | None]] = collections.deque()
+        self.__writer_thread: threading.Thread | None = None
+        self.__writer_stop: threading.Event = threading.Event()
+
+        # Output file:
+        self.__output_path: str = TELEMETRY_OUTPUT_PATH_DEFAULT
+        self.__output_file: TextIO | None = None
+        self.__output_size: int = 0
+
+        # Statistics (since start):
+        self.__time_start:     float = 0.0
+        self.__record_count:   int = 0
+        self.__dropped_count:  int = 0
+        self.__written_count:  int = 0
+        self.__rotation_count: int = 0
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TELEMETRY PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def telemetry_running(self) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return self.__writer_thread is not None
+
+
+    @property
+    def telemetry_stats(self) -> dict[str, int]:
+        """
+        Records accepted, dropped (buffer was full), written to file, and file rotations.
+
+        :return dict[str, int]: ...
+        """
+
+        # Packing up:
+        telemetry_stats: dict[str, int] = {
+            "recorded": self.__record_count,
+            "dropped": self.__dropped_count,
+            "written": self.__written_count,
+            "rotated": self.__rotation_count,
+            }
+
+        # Returning:
+        return telemetry_stats
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    START AND STOP METHODS BLOCK
+
+    """
+
+
+    def start(self, output_path: str = TELEMETRY_OUTPUT_PATH_DEFAULT) -> None:
+        """
+        Opens output file (appending) and starts the writer thread, if not running.
+
+        :param str output_path: ...
+        """
+
+        # Starting, if not running:
+        if not self.telemetry_running:
+            self.__output_path: str = output_path
+            self.__output_file: TextIO = open(output_path, "a", encoding = "utf-8")
+            self.__output_size: int = self.__output_file.tell()
+            self.__record_buffer.clear()
+            self.__record_count: int = 0
+            self.__dropped_count: int = 0
+            self.__written_count: int = 0
+            self.__rotation_count: int = 0
+            self.__time_start: float = time.perf_counter()
+            self.__writer_stop.clear()
+            self.__writer_thread: threading.Thread = threading.Thread(
+                target = self.__run_writer,
+                name = "telemetry_writer",
+                daemon = True,
+                )
+            self.__writer_thread.start()
+
+
+    def stop(self) -> dict[str, int] | None:
+        """
+        Stops the writer thread (buffered records are written first) and closes output file.
+
+        :return dict[str, int] | None: Telemetry statistics, None if telemetry was not running.
+        """
+
+        # Skipping, if not running:
+        if not self.telemetry_running:
+            return None
+
+        # Stopping writer thread:
+        self.__writer_stop.set()
+        self.__writer_thread.join()
+        self.__writer_thread: threading.Thread | None = None
+        self.__output_file.close()
+        self.__output_file: TextIO | None = None
+
+        # Echoing:
+        telemetry_stats: dict[str, int] = self.telemetry_stats
+        if SESSION_ENABLE_ECHO:
+            print(f"Telemetry stopped, {telemetry_stats} written to {self.__output_path}.")
+
+        # Returning:
+        return telemetry_stats
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    RECORD METHODS BLOCK
+
+    """
+
+
+    def record(self, event_name: str, event_data: dict[str, Any] | None = None) -> None:
+        """
+        Buffers a record (game thread, nothing is serialized or written here). Dropped and counted,
+        if buffer is full.
+
+        :param str event_name: ...
+        :param dict[str, Any] | None event_data: JSON-friendly values only.
+        """
+
+        # Buffering, if running:
+        if self.__writer_thread is not None:
+            if len(self.__record_buffer) < TELEMETRY_QUEUE_SIZE:
+                self.__record_buffer.append((event_name, time.perf_counter() - self.__time_start, event_data))
+                self.__record_count += 1
+            else:
+                self.__dropped_count += 1
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    WRITER METHODS BLOCK (WRITER THREAD)
+
+    """
+
+
+    def __run_writer(self) -> None:
+        """
+        Writer thread loop: writes buffered records every write interval, and once more on stop.
+        """
+
+        # Writing until stopped:
+        while not self.__writer_stop.wait(TELEMETRY_WRITE_INTERVAL):
+            self.__write_buffer()
+        self.__write_buffer()
+
+
+    def __write_buffer(self) -> None:
+        """
+        Serializes buffered records to JSON Lines and writes them, rotating file if it grew past
+        the size limit.
+        """
+
+        # Serializing:
+        record_line_list: list[str] = []
+        while self.__record_buffer:
+            event_name, event_time, event_data = self.__record_buffer.popleft()
+            record_index: dict[str, Any] = {"e": event_name, "t": round(event_time, 4)}
+            if event_data:
+                record_index.update(event_data)
+            record_line_list.append(
+                json.dumps(record_index, separators = (",", ":"))
+                )
+
+        # Writing:
+        if record_line_list:
+            record_text: str = "\n".join(record_line_list) + "\n"
+            self.__output_file.write(record_text)
+            self.__output_file.flush()
+            self.__output_size += len(record_text.encode("utf-8"))
+            self.__written_count += len(record_line_list)
+
+            # Rotating:
+            if self.__output_size >= TELEMETRY_FILE_SIZE_MAX:
+                self.__rotate_file()
+
+
+    def __rotate_file(self) -> None:
+        """
+        Shifts rotated files (oldest is removed), moves output file to ".1" and opens a new one.
+        """
+
+        # Shifting rotated files:
+        self.__output_file.close()
+        for backup_index in range(TELEMETRY_FILE_BACKUP_COUNT - 1, 0, -1):
+            backup_path: str = f"{self.__output_path}.{backup_index}"
+            if os.path.isfile(backup_path):
+                os.replace(backup_path, f"{self.__output_path}.{backup_index + 1}")
+        if TELEMETRY_FILE_BACKUP_COUNT > 0:
+            os.replace(self.__output_path, f"{self.__output_path}.1")
+        else:
+            os.remove(self.__output_path)
+
+        # Opening new file:
+        self.__output_file: TextIO = open(self.__output_path, "w", encoding = "utf-8")
+        self.__output_size: int = 0
+        self.__rotation_count += 1
@@ -0,0 +1,200 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Arcade library import:
+from arcade import Text
+from arcade.types import Color
+
+# Pyglet (arcade backend) import:
+from pyglet.graphics import Batch
+
+# Related settings import:
+from game.settings import (
+    TEXT_FONT_NAME_DEFAULT,
+    TEXT_FONT_SIZE_DEFAULT,
+    TEXT_COLOR_DEFAULT,
+    )
+
+# Session-related import:
+from game.session import SESSION_ENABLE_ASSERTION
+
+# Scripts import:
+from game.scripts.assertion import assert_value_is_valid_type
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TEXT CLASS OBJECT BLOCK
+
+"""
+
+
+class Text_Controller:
+
+    def __init__(self) -> None:
+
+        # Shared batch, every label is drawn with a single call:
+        self.__text_batch: Batch = Batch()
+
+        # Label containers:
+        self.__text_label_map: dict[str, Text] = {}
+        self.__text_value_map: dict[str, str] = {}
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    LABEL METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def text_label_count(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Calculating:
+        text_label_count: int = len(self.__text_label_map)
+
+        # Returning:
+        return text_label_count
+
+
+    def create_label(self,
+                     label_name: str,
+                     label_text: str,
+                     coordinate_x: int,
+                     coordinate_y: int,
+                     text_color: Color = TEXT_COLOR_DEFAULT,
+                     font_name: str = TEXT_FONT_NAME_DEFAULT,
+                     font_size: int = TEXT_FONT_SIZE_DEFAULT,
+                     anchor_x: str = "left",
+                     anchor_y: str = "center",
+                     ignore_assertion: bool = False,
+                     ) -> Text:
+        """
+        TODO: Create a docstring.
+
+        :param str label_name: ...
+        :param str label_text: ...
+        :param int coordinate_x: ...
+        :param int coordinate_y: ...
+        :param Color text_color: ...
+        :param str font_name: ...
+        :param int font_size: ...
+        :param str anchor_x: ...
+        :param str anchor_y: ...
+        :param bool ignore_assertion: ...
+
+        :raise AssertionError: ...
+        :raise ValueError: if label with the same name already exists.
+
+        :return Text: ...
+        """
+
+        # Assertion control:
+        if SESSION_ENABLE_ASSERTION and not ignore_assertion:
+
+            # Asserting value is valid type (name):
+            default_type: type = str
+            assert_value_is_valid_type(
+                check_value = label_name,
+                check_type = default_type,
+                raise_error = True,
+                )
+
+        # Checking if label already exists:
+        if label_name in self.__text_label_map:
+            error_message: str = f"Text label \"{label_name}\" already exists."
+            raise ValueError(error_message)
+
+        # Creating a Text object within the shared batch:
+        text_label: Text = Text(
+            text      = label_text,
+            x         = coordinate_x,
+            y         = coordinate_y,
+            color     = text_color,
+            font_name = font_name,
+            font_size = font_size,
+            anchor_x  = anchor_x,
+            anchor_y  = anchor_y,
+            batch     = self.__text_batch,
+            )
+
+        # Updating containers:
+        self.__text_label_map[label_name] = text_label
+        self.__text_value_map[label_name] = label_text
+
+        # Returning:
+        return text_label
+
+
+    def update_label(self, label_name: str, label_text: str) -> bool:
+        """
+        Updates label's text. Label is laid out again only if the text value has changed.
+
+        :param str label_name: ...
+        :param str label_text: ...
+
+        :raise KeyError: if label does not exist.
+
+        :return bool: True, if label was updated.
+        """
+
+        # Checking if value has changed:
+        label_updated: bool = self.__text_value_map[label_name] != label_text
+        if label_updated:
+            self.__text_label_map[label_name].text = label_text
+            self.__text_value_map[label_name] = label_text
+
+        # Returning:
+        return label_updated
+
+
+    def set_label_visible(self, label_name: str, set_value: bool) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str label_name: ...
+        :param bool set_value: ...
+
+        :raise KeyError: if label does not exist.
+        """
+
+        # Updating visibility, if changed:
+        text_label: Text = self.__text_label_map[label_name]
+        if text_label.visible != set_value:
+            text_label.visible = set_value
+
+
+    def remove_label(self, label_name: str) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param str label_name: ...
+        """
+
+        # Removing label from the batch and containers:
+        text_label: Text | None = self.__text_label_map.pop(label_name, None)
+        if text_label is not None:
+            self.__text_value_map.pop(label_name)
+            text_label.batch = None
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    RENDER METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    def render(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Rendering all labels in one call:
+        self.__text_batch.draw()
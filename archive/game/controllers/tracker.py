@@ -0,0 +1,472 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Variables import:
+from game.variables import (
+    EVENT_TABLE_CARD_ADDED,
+    EVENT_TABLE_CARD_REMOVED,
+    EVENT_HAND_CARD_ADDED,
+    EVENT_HAND_CARD_REMOVED,
+    EVENT_DISCARD_CARD_ADDED,
+    )
+
+# Controllers import:
+from game.controllers.card import Card_Object
+from game.controllers.player import Player_Controller
+from game.controllers.deck import Deck_Controller
+from game.controllers.table import Table_Controller
+from game.controllers.discard import Discard_Controller
+from game.controllers.event import Event_Controller
+
+# Collections import:
+from game.collections.event import Game_Event
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TRACKER CONTROLLER CLASS OBJECT BLOCK
+
+"""
+
+
+class Tracker_Controller:
+    """
+    Tracks what every player could know about cards, from game events, as bitsets of card uids
+    (see Card_Object.card_uid):
+
+    - known cards of a hand: cards everyone saw entering it (picked up from the table, or the trump
+      showcase card drawn last), until they are played;
+    - table and discard: public;
+    - hidden cards: never seen (still in the deck, or drawn and not played yet), per player count
+      of hidden cards in hand.
+
+    Every event is a few bit operations, queries about a single card are O(1). Probabilities are
+    from a player's point of view: their own hand is known to them, every hidden card they do not
+    hold is equally likely to be in any hidden hand slot or in the deck.
+
+    Tracker is idle (events are ignored) until rebuilt for a game. Rebuilding from a restored game
+    treats every hand card as hidden (history is not stored).
+    """
+
+    def __init__(self) -> None:
+
+        # Tracked players (set on rebuild):
+        self.__player_list: tuple[Player_Controller, ...] = ()
+        self.__tracker_active: bool = False
+
+        # Hands (actual cards, cards known to everyone and count of hidden cards per player):
+        self.__hand_mask_map:    dict[Player_Controller, int] = {}
+        self.__known_mask_map:   dict[Player_Controller, int] = {}
+        self.__hidden_count_map: dict[Player_Controller, int] = {}
+
+        # Public cards (table, cards swept from the table, not placed yet, discard, showcase card):
+        self.__table_mask:      int = 0
+        self.__sweep_mask:      int = 0
+        self.__discard_mask:    int = 0
+        self.__deck_known_mask: int = 0
+
+        # Hidden cards (deck and hands):
+        self.__hidden_mask:  int = 0
+        self.__hidden_count: int = 0
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    STATE PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def tracker_active(self) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return self.__tracker_active
+
+
+    @property
+    def table_mask(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__table_mask
+
+
+    @property
+    def discard_mask(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__discard_mask
+
+
+    @property
+    def hidden_mask(self) -> int:
+        """
+        Cards nobody saw yet (in the deck, or in hands).
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__hidden_mask
+
+
+    def find_known_mask(self, player_controller: Player_Controller) -> int:
+        """
+        Cards in player's hand everyone knows about.
+
+        :param Player_Controller player_controller: ...
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__known_mask_map.get(player_controller, 0)
+
+
+    def find_unknown_mask(self, player_observer: Player_Controller) -> int:
+        """
+        Cards observer does not know the place of (hidden cards not in their hand).
+
+        :param Player_Controller player_observer: ...
+
+        :return int: ...
+        """
+
+        # Returning:
+        return self.__hidden_mask & ~self.__hand_mask_map.get(player_observer, 0)
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    PROBABILITY METHODS BLOCK
+
+    """
+
+
+    def calculate_card_probability(self,
+                                   card_uid: int,
+                                   player_controller: Player_Controller,
+                                   player_observer: Player_Controller
+                                   ) -> float:
+        """
+        Probability of the card being in player's hand, from observer's point of view.
+
+        :param int card_uid: ...
+        :param Player_Controller player_controller: Hand to check.
+        :param Player_Controller player_observer: ...
+
+        :return float: ...
+        """
+
+        # Observer's own hand and known cards:
+        card_bit: int = 1 << card_uid
+        if player_controller is player_observer or self.__known_mask_map[player_controller] & card_bit:
+            return float(bool(self.__hand_mask_map[player_controller] & card_bit))
+
+        # Public cards and cards observer holds:
+        if not self.__hidden_mask & card_bit or self.__hand_mask_map[player_observer] & card_bit:
+            return 0.0
+
+        # Hidden card (hidden slots of player's hand out of every place observer does not know):
+        card_probability: float = (
+            self.__hidden_count_map[player_controller] /
+            (self.__hidden_count - self.__hidden_count_map[player_observer])
+            )
+
+        # Returning:
+        return card_probability
+
+
+    def calculate_probability_list(self,
+                                   player_controller: Player_Controller,
+                                   player_observer: Player_Controller,
+                                   card_count: int
+                                   ) -> list[float]:
+        """
+        Probabilities of every card (by card uid) being in player's hand, from observer's point of
+        view.
+
+        :param Player_Controller player_controller: Hand to check.
+        :param Player_Controller player_observer: ...
+        :param int card_count: Card uids to cover (see DECK_CARD_COUNT_MAX).
+
+        :return list[float]: ...
+        """
+
+        # Calculating:
+        probability_list: list[float] = [
+            self.calculate_card_probability(
+                card_uid = card_uid,
+                player_controller = player_controller,
+                player_observer = player_observer,
+                )
+            for card_uid in range(card_count)
+            ]
+
+        # Returning:
+        return probability_list
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SETUP METHODS BLOCK
+
+    """
+
+
+    def subscribe(self, event_controller: Event_Controller) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Event_Controller event_controller: ...
+        """
+
+        # Subscribing handlers:
+        handler_map: tuple[tuple[str, object], ...] = (
+            (EVENT_TABLE_CARD_ADDED,   self.__handle_table_card_added),
+            (EVENT_TABLE_CARD_REMOVED, self.__handle_table_card_removed),
+            (EVENT_HAND_CARD_ADDED,    self.__handle_hand_card_added),
+            (EVENT_HAND_CARD_REMOVED,  self.__handle_hand_card_removed),
+            (EVENT_DISCARD_CARD_ADDED, self.__handle_discard_card_added),
+            )
+        for event_type, event_handler in handler_map:
+            event_controller.subscribe(
+                event_type = event_type,
+                event_handler = event_handler,
+                )
+
+
+    def reset(self) -> None:
+        """
+        Stops tracking (game is being created or restored), events are ignored until rebuilt.
+        """
+
+        # Resetting attributes:
+        self.__player_list: tuple[Player_Controller, ...] = ()
+        self.__tracker_active: bool = False
+        self.__hand_mask_map.clear()
+        self.__known_mask_map.clear()
+        self.__hidden_count_map.clear()
+        self.__table_mask: int = 0
+        self.__sweep_mask: int = 0
+        self.__discard_mask: int = 0
+        self.__deck_known_mask: int = 0
+        self.__hidden_mask: int = 0
+        self.__hidden_count: int = 0
+
+
+    def rebuild(self,
+                player_list: list[Player_Controller],
+                deck_controller: Deck_Controller,
+                table_controller: Table_Controller,
+                discard_controller: Discard_Controller
+                ) -> None:
+        """
+        Starts tracking a game from containers: table and discard are public, showcase card is
+        known while in the deck, every other card is hidden.
+
+        :param list[Player_Controller] player_list: ...
+        :param Deck_Controller deck_controller: ...
+        :param Table_Controller table_controller: ...
+        :param Discard_Controller discard_controller: ...
+        """
+
+        # Updating attributes:
+        self.reset()
+        self.__player_list: tuple[Player_Controller, ...] = tuple(player_list)
+        self.__tracker_active: bool = True
+
+        # Collecting public cards:
+        self.__table_mask: int = self.__create_mask(table_controller.table_container)
+        self.__discard_mask: int = self.__create_mask(discard_controller.discard_container)
+        deck_showcase_card: Card_Object | None = deck_controller.deck_showcase_card
+        if deck_showcase_card is not None and deck_showcase_card in deck_controller.deck_container:
+            self.__deck_known_mask: int = 1 << deck_showcase_card.card_uid
+
+        # Collecting hidden cards (deck, then hands):
+        self.__hidden_mask: int = self.__create_mask(deck_controller.deck_container) & ~self.__deck_known_mask
+        for player_controller in self.__player_list:
+            hand_mask: int = self.__create_mask(player_controller.hand.hand_container)
+            self.__hand_mask_map[player_controller] = hand_mask
+            self.__known_mask_map[player_controller] = 0
+            self.__hidden_count_map[player_controller] = hand_mask.bit_count()
+            self.__hidden_mask |= hand_mask
+        self.__hidden_count: int = self.__hidden_mask.bit_count()
+
+
+    @staticmethod
+    def __create_mask(card_list: list[Card_Object]) -> int:
+        """
+        TODO: Create a docstring.
+
+        :param list[Card_Object] card_list: ...
+
+        :return int: ...
+        """
+
+        # Setting bits:
+        card_mask: int = 0
+        for card_object in card_list:
+            card_mask |= 1 << card_object.card_uid
+
+        # Returning:
+        return card_mask
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    EVENT HANDLERS BLOCK
+
+    """
+
+
+    def __handle_table_card_added(self, game_event: Game_Event) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Updating table:
+        if self.__tracker_active:
+            self.__table_mask |= 1 << game_event.card_object.card_uid
+
+
+    def __handle_table_card_removed(self, game_event: Game_Event) -> None:
+        """
+        Card swept from the table goes to a hand (picked up) or to discard next.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Moving card to sweep:
+        if self.__tracker_active:
+            card_bit: int = 1 << game_event.card_object.card_uid
+            self.__table_mask &= ~card_bit
+            self.__sweep_mask |= card_bit
+
+
+    def __handle_hand_card_added(self, game_event: Game_Event) -> None:
+        """
+        Picked up and showcase cards are known to everyone, drawn cards stay hidden.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Skipping, if idle or player is not tracked:
+        player_controller: Player_Controller = game_event.player_controller
+        if not self.__tracker_active or player_controller not in self.__hand_mask_map:
+            return
+
+        # Updating hand:
+        card_bit: int = 1 << game_event.card_object.card_uid
+        self.__hand_mask_map[player_controller] |= card_bit
+        if self.__sweep_mask & card_bit:
+            self.__sweep_mask &= ~card_bit
+            self.__known_mask_map[player_controller] |= card_bit
+        elif self.__deck_known_mask & card_bit:
+            self.__deck_known_mask &= ~card_bit
+            self.__known_mask_map[player_controller] |= card_bit
+        else:
+            self.__hidden_count_map[player_controller] += 1
+
+
+    def __handle_hand_card_removed(self, game_event: Game_Event) -> None:
+        """
+        Played card is revealed, if it was hidden.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Skipping, if idle or player is not tracked:
+        player_controller: Player_Controller = game_event.player_controller
+        if not self.__tracker_active or player_controller not in self.__hand_mask_map:
+            return
+
+        # Updating hand:
+        card_bit: int = 1 << game_event.card_object.card_uid
+        self.__hand_mask_map[player_controller] &= ~card_bit
+        if self.__known_mask_map[player_controller] & card_bit:
+            self.__known_mask_map[player_controller] &= ~card_bit
+        else:
+            self.__hidden_count_map[player_controller] -= 1
+            self.__hidden_mask &= ~card_bit
+            self.__hidden_count -= 1
+
+
+    def __handle_discard_card_added(self, game_event: Game_Event) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Game_Event game_event: ...
+        """
+
+        # Moving card from sweep to discard:
+        if self.__tracker_active:
+            card_bit: int = 1 << game_event.card_object.card_uid
+            self.__sweep_mask &= ~card_bit
+            self.__discard_mask |= card_bit
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    VERIFICATION METHODS BLOCK
+
+    """
+
+
+    def verify_state(self, deck_controller: Deck_Controller, table_controller: Table_Controller) -> None:
+        """
+        Compares tracked cards with containers: hands and table match, known cards are in hands,
+        hidden counts add up to hidden hand cards and deck.
+
+        :param Deck_Controller deck_controller: ...
+        :param Table_Controller table_controller: ...
+
+        :raise AssertionError: If tracked state differs from containers.
+        """
+
+        # Skipping, if idle:
+        if not self.__tracker_active:
+            return
+
+        # Comparing table and hands:
+        if self.__table_mask != self.__create_mask(table_controller.table_container):
+            error_message: str = "Card tracker's table differs from table."
+            raise AssertionError(error_message)
+        hidden_hand_count: int = 0
+        for player_controller in self.__player_list:
+            hand_mask: int = self.__create_mask(player_controller.hand.hand_container)
+            known_mask: int = self.__known_mask_map[player_controller]
+            hidden_count: int = self.__hidden_count_map[player_controller]
+            tracker_valid: bool = bool(
+                hand_mask == self.__hand_mask_map[player_controller] and
+                known_mask & ~hand_mask == 0 and
+                hidden_count == hand_mask.bit_count() - known_mask.bit_count() and
+                hand_mask & ~known_mask & ~self.__hidden_mask == 0
+                )
+            if not tracker_valid:
+                error_message: str = f"Card tracker's hand differs from hand ({player_controller=})."
+                raise AssertionError(error_message)
+            hidden_hand_count += hidden_count
+
+        # Comparing hidden cards:
+        deck_hidden_count: int = deck_controller.deck_count - self.__deck_known_mask.bit_count()
+        if self.__hidden_count != self.__hidden_mask.bit_count() or self.__hidden_count != hidden_hand_count + deck_hidden_count:
+            error_message: str = "Card tracker's hidden cards do not add up."
+            raise AssertionError(error_message)
@@ -0,0 +1,284 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+
+# Flat array import:
+from array import array
+
+# Related settings import:
+from game.settings import TWEEN_TABLE_SIZE
+
+# Variables import:
+from game.variables import TWEEN_EASING_CUBIC_OUT
+
+# Controllers import:
+from game.controllers.card import Card_Object
+
+# Scripts import:
+from game.scripts.easing import EASING_TABLE_INDEX
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TWEEN SETTINGS BLOCK
+
+"""
+
+
+# Flat easing table (every curve, one after another) and curve offsets in it:
+TWEEN_EASING_TABLE: tuple[float, ...] = tuple(
+    easing_value for easing_table in EASING_TABLE_INDEX.values() for easing_value in easing_table
+    )
+TWEEN_EASING_OFFSET_INDEX: dict[str, int] = {
+    tween_easing: easing_index * TWEEN_TABLE_SIZE
+    for easing_index, tween_easing in enumerate(EASING_TABLE_INDEX)
+    }
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TWEEN CLASS OBJECT BLOCK
+
+"""
+
+
+class Tween_Controller:
+    """
+    Moves cards from start to end coordinates over a duration, with an easing curve. Tween state is
+    kept in flat arrays (a slot per card, same slot in every column), all tweens are advanced in
+    one pass per logic step: a table read and a lerp per card, then coordinates are written back
+    with a single Card_Object.update per card. Easing curves are precomputed tables (see
+    scripts.easing), concatenated into one flat table.
+
+    Tweens are registered once per move. Card's default coordinates are checked during the pass, if
+    they changed (card was moved again mid-flight), its tween restarts from where the card is.
+    """
+
+    def __init__(self) -> None:
+
+        # Tween cards and index (card object to slot):
+        self.__tween_card_list: list[Card_Object] = []
+        self.__tween_index_map: dict[Card_Object, int] = {}
+
+        # Tween state columns (same slot per tween):
+        self.__tween_start_x:  array = array("l")
+        self.__tween_start_y:  array = array("l")
+        self.__tween_end_x:    array = array("l")
+        self.__tween_end_y:    array = array("l")
+        self.__tween_time:     array = array("d")
+        self.__tween_duration: array = array("d")
+        self.__tween_easing:   array = array("l")  # <- Easing table offset in TWEEN_EASING_TABLE
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TWEEN METHODS AND PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def tween_count(self) -> int:
+        """
+        TODO: Create a docstring.
+
+        :return int: ...
+        """
+
+        # Returning:
+        return len(self.__tween_card_list)
+
+
+    @property
+    def __tween_column_list(self) -> tuple[array, ...]:
+        """
+        TODO: Create a docstring.
+
+        :return tuple[array, ...]: State columns, same slot per tween.
+        """
+
+        # Returning:
+        return (
+            self.__tween_start_x,
+            self.__tween_start_y,
+            self.__tween_end_x,
+            self.__tween_end_y,
+            self.__tween_time,
+            self.__tween_duration,
+            self.__tween_easing,
+            )
+
+
+    def has_tween(self, card_object: Card_Object) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :param Card_Object card_object: ...
+
+        :return bool: ...
+        """
+
+        # Returning:
+        return card_object in self.__tween_index_map
+
+
+    def add_tween(self,
+                  card_object: Card_Object,
+                  target_coordinates: tuple[int, int],
+                  tween_duration: float,
+                  tween_easing: str = TWEEN_EASING_CUBIC_OUT,
+                  tween_delay: float = 0.0
+                  ) -> bool:
+        """
+        Starts a tween from card's current coordinates. If card is already moving to the same
+        target, nothing changes; if target is different, tween restarts from where card is now.
+
+        :param Card_Object card_object: ...
+        :param tuple[int, int] target_coordinates: ...
+        :param float tween_duration: Seconds, zero moves card on the next update.
+        :param str tween_easing: ...
+        :param float tween_delay: Seconds before card starts moving.
+
+        :raise KeyError: if easing is not recognized.
+
+        :return bool: True, if tween was started (or restarted).
+        """
+
+        # Checking existing tween:
+        target_x, target_y = target_coordinates
+        tween_index: int | None = self.__tween_index_map.get(card_object)
+        if tween_index is not None:
+            if self.__tween_end_x[tween_index] == target_x and self.__tween_end_y[tween_index] == target_y:
+                return False
+
+        # Preparing values:
+        tween_value_list: tuple[int | float, ...] = (
+            card_object.coordinate_x_current,
+            card_object.coordinate_y_current,
+            target_x,
+            target_y,
+            -tween_delay,
+            tween_duration,
+            TWEEN_EASING_OFFSET_INDEX[tween_easing],
+            )
+
+        # Restarting existing tween:
+        if tween_index is not None:
+            for tween_column, tween_value in zip(self.__tween_column_list, tween_value_list):
+                tween_column[tween_index] = tween_value
+
+        # Adding new tween:
+        else:
+            self.__tween_index_map[card_object] = len(self.__tween_card_list)
+            self.__tween_card_list.append(card_object)
+            for tween_column, tween_value in zip(self.__tween_column_list, tween_value_list):
+                tween_column.append(tween_value)
+
+        # Returning:
+        return True
+
+
+    def remove_tween(self, card_object: Card_Object) -> None:
+        """
+        Stops tween where card currently is. Last tween takes the removed one's slot, so removal
+        does not shift the arrays.
+
+        :param Card_Object card_object: ...
+        """
+
+        # Checking if card is tweening:
+        tween_index: int | None = self.__tween_index_map.pop(card_object, None)
+        if tween_index is None:
+            return
+
+        # Moving last tween into removed slot:
+        card_object_last: Card_Object = self.__tween_card_list.pop()
+        if card_object_last is not card_object:
+            self.__tween_card_list[tween_index] = card_object_last
+            self.__tween_index_map[card_object_last] = tween_index
+            for tween_column in self.__tween_column_list:
+                tween_column[tween_index] = tween_column.pop()
+        else:
+            for tween_column in self.__tween_column_list:
+                tween_column.pop()
+
+
+    def clear_tweens(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Clearing containers:
+        self.__tween_card_list.clear()
+        self.__tween_index_map.clear()
+        for tween_column in self.__tween_column_list:
+            del tween_column[:]
+
+
+    def update(self, delta_time: float) -> int:
+        """
+        Advances all tweens by delta time (one logic step). Finished tweens place their card exactly
+        at the end coordinates and are removed.
+
+        :param float delta_time: ...
+
+        :return int: Number of tweens finished.
+        """
+
+        # Preparing values (columns are read as locals in the pass):
+        table_last: int = TWEEN_TABLE_SIZE - 1
+        easing_table: tuple[float, ...] = TWEEN_EASING_TABLE
+        start_x_column, start_y_column, end_x_column, end_y_column, time_column, duration_column, easing_column = (
+            self.__tween_column_list
+            )
+        tween_move_list: list[tuple[Card_Object, tuple[int, int]]] = []
+        tween_finished_list: list[Card_Object] = []
+
+        # Advancing tweens (one pass):
+        for tween_index, card_object in enumerate(self.__tween_card_list):
+            tween_time: float = time_column[tween_index] + delta_time
+
+            # Restarting from current coordinates, if card was moved again:
+            end_x: int = card_object.coordinate_x_default
+            end_y: int = card_object.coordinate_y_default
+            if end_x != end_x_column[tween_index] or end_y != end_y_column[tween_index]:
+                start_x_column[tween_index] = card_object.coordinate_x_current
+                start_y_column[tween_index] = card_object.coordinate_y_current
+                end_x_column[tween_index] = end_x
+                end_y_column[tween_index] = end_y
+                tween_time: float = delta_time
+            time_column[tween_index] = tween_time
+            if tween_time <= 0:
+                continue
+
+            # Reading easing table and interpolating:
+            tween_duration: float = duration_column[tween_index]
+            if tween_time >= tween_duration:
+                tween_move_list.append((card_object, (end_x, end_y)))
+                tween_finished_list.append(card_object)
+            else:
+                tween_eased: float = easing_table[
+                    easing_column[tween_index] + int(tween_time / tween_duration * table_last)
+                    ]
+                start_x: int = start_x_column[tween_index]
+                start_y: int = start_y_column[tween_index]
+                tween_move_list.append((card_object, (
+                    int(start_x + (end_x - start_x) * tween_eased),
+                    int(start_y + (end_y - start_y) * tween_eased),
+                    )))
+
+        # Moving cards (single update and cache clear per card):
+        for card_object, tween_coordinates in tween_move_list:
+            card_object.update(
+                coordinates_current = tween_coordinates,
+                move_step = True,
+                ignore_assertion = True,
+                )
+
+        # Removing finished tweens:
+        for card_object in tween_finished_list:
+            self.remove_tween(
+                card_object = card_object
+                )
+
+        # Returning:
+        return len(tween_finished_list)
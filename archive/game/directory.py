@@ -76,3 +76,17 @@ DIR_TEXTURES_CARD_BACK_PATH: str = os.path.join(
     DIR_TEXTURES_CARD_PATH,
     DIR_TEXTURES_CARD_BACK_NAME
     )
+
+# ../game/assets/atlas (generated by game.scripts.atlas, not tracked)
+DIR_ATLAS_NAME: str = "atlas"
+DIR_ATLAS_PATH: str = os.path.join(
+    DIR_ASSETS_PATH,
+    DIR_ATLAS_NAME
+    )
+
+# ../game/assets/cache (decoded textures, written on first run, not tracked)
+DIR_TEXTURE_CACHE_NAME: str = "cache"
+DIR_TEXTURE_CACHE_PATH: str = os.path.join(
+    DIR_ASSETS_PATH,
+    DIR_TEXTURE_CACHE_NAME
+    )
@@ -22,6 +22,17 @@ from game.settings import (
 
     # Deck size:
     DECK_LOWEST_VALUE_DEFAULT,
+
+    # Hint and HUD text settings:
+    TEXT_FONT_SIZE_HINT,
+    TEXT_HINT_HAND_PLAYER_ONE_COORDINATE_X,
+    TEXT_HINT_HAND_PLAYER_ONE_COORDINATE_Y,
+    TEXT_HINT_HAND_PLAYER_TWO_COORDINATE_X,
+    TEXT_HINT_HAND_PLAYER_TWO_COORDINATE_Y,
+    TEXT_HINT_DISCARD_COORDINATE_X,
+    TEXT_HINT_DISCARD_COORDINATE_Y,
+    TEXT_HUD_DECK_COORDINATE_X,
+    TEXT_HUD_DECK_COORDINATE_Y,
     )
 
 # Gameshell-related settings import:
@@ -47,9 +58,19 @@ from game.collections.keyboard import Keyboard_Mapping
 # Controllers import:
 from game.controllers.game import Game_Controller
 from game.controllers.player import Player_Controller
+from game.controllers.text import Text_Controller
+from game.controllers.input import Input_Controller
+from game.controllers.clock import Clock_Controller
+from game.controllers.culling import Culling_Controller
 
 # Session variables import:
-from game.session import SESSION_ENABLE_DEBUG
+from game.session import (
+    SESSION_ENABLE_ECHO,
+    SESSION_ENABLE_DEBUG,
+    SESSION_ENABLE_PROFILER,
+    SESSION_ENABLE_TELEMETRY,
+    SESSION_ENABLE_INPUT_REPORT,
+    )
 
 # Scripts import:
 from game.scripts.convert import (
@@ -96,6 +117,18 @@ class Gameshell(arcade.Window):
             ZONE_DISCARD,
             )
         
+        # Text controller (zone labels, hints and HUD counters):
+        self.__text_controller: Text_Controller = None
+        self.__initialize_text_controller()
+
+        # Input controller (events are queued and handled once per frame):
+        self.__input_controller: Input_Controller = None
+        self.__initialize_input_controller()
+
+        # Clock controller (fixed logic step, independent from render rate):
+        self.__clock_controller: Clock_Controller = None
+        self.__initialize_clock_controller()
+        
     
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -132,8 +165,17 @@ class Gameshell(arcade.Window):
         # Creating game controller:
         self.__game_controller: Game_Controller = Game_Controller()
 
-        # Creating session and starting a default game:
+        # Starting memory profiler before the first game, if enabled:
+        if SESSION_ENABLE_PROFILER:
+            self.__game_controller.profiler.start()
+
+        # Starting telemetry before the first game (first deal is recorded), if enabled:
+        if SESSION_ENABLE_TELEMETRY:
+            self.__game_controller.telemetry.start()
+
+        # Creating session, loading textures and starting a default game:
         self.__game_controller.create_session()
+        self.__game_controller.preload_textures()
         self.__game_controller.create_game_default()
 
         # Clearing cache:
@@ -144,6 +186,246 @@ class Gameshell(arcade.Window):
             )
         
         
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TEXT METHODS AND PROPERTIES BLOCK
+    
+    """
+
+
+    @cached_property
+    def text(self) -> Text_Controller:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return self.__text_controller
+    
+
+    def __initialize_text_controller(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Creating text controller:
+        text_controller: Text_Controller = Text_Controller()
+
+        # Debugging, adding zone labels:
+        if SESSION_ENABLE_DEBUG:
+            for zone in self.__zones:
+                zone.create_text_label(
+                    text_controller = text_controller
+                    )
+                
+        # Creating hint labels (hand value):
+        text_controller.create_label(
+            label_name   = "HINT_HAND_PLAYER_ONE",
+            label_text   = "",
+            coordinate_x = TEXT_HINT_HAND_PLAYER_ONE_COORDINATE_X,
+            coordinate_y = TEXT_HINT_HAND_PLAYER_ONE_COORDINATE_Y,
+            font_size    = TEXT_FONT_SIZE_HINT,
+            anchor_x     = "center",
+            )
+        text_controller.create_label(
+            label_name   = "HINT_HAND_PLAYER_TWO",
+            label_text   = "",
+            coordinate_x = TEXT_HINT_HAND_PLAYER_TWO_COORDINATE_X,
+            coordinate_y = TEXT_HINT_HAND_PLAYER_TWO_COORDINATE_Y,
+            font_size    = TEXT_FONT_SIZE_HINT,
+            anchor_x     = "center",
+            )
+        
+        # Creating hint labels (discard value):
+        text_controller.create_label(
+            label_name   = "HINT_DISCARD",
+            label_text   = "",
+            coordinate_x = TEXT_HINT_DISCARD_COORDINATE_X,
+            coordinate_y = TEXT_HINT_DISCARD_COORDINATE_Y,
+            font_size    = TEXT_FONT_SIZE_HINT,
+            anchor_x     = "center",
+            )
+        
+        # Creating HUD labels (deck counter):
+        text_controller.create_label(
+            label_name   = "HUD_DECK",
+            label_text   = "",
+            coordinate_x = TEXT_HUD_DECK_COORDINATE_X,
+            coordinate_y = TEXT_HUD_DECK_COORDINATE_Y,
+            font_size    = TEXT_FONT_SIZE_HINT,
+            anchor_x     = "center",
+            )
+        
+        # Updating attribute:
+        self.__text_controller: Text_Controller = text_controller
+
+        # Clearing cache:
+        cached_property: str = "text"
+        clear_cached_property(
+            target_object = self,
+            target_attribute = cached_property
+            )
+        
+
+    def __update_text_labels(self) -> None:
+        """
+        Updates hint and HUD labels. Labels are laid out again only when their string changes, so
+        most frames end up being a few string comparisons.
+        """
+
+        # Updating hint labels (hand value):
+        enable_hint_hand_value: bool = self.game.session.enable_hint_hand_value
+        self.text.set_label_visible(
+            label_name = "HINT_HAND_PLAYER_ONE",
+            set_value = enable_hint_hand_value,
+            )
+        self.text.set_label_visible(
+            label_name = "HINT_HAND_PLAYER_TWO",
+            set_value = enable_hint_hand_value,
+            )
+        if enable_hint_hand_value:
+            self.text.update_label(
+                label_name = "HINT_HAND_PLAYER_ONE",
+                label_text = str(self.game.player_one.hand.hand_value),
+                )
+            self.text.update_label(
+                label_name = "HINT_HAND_PLAYER_TWO",
+                label_text = str(self.game.player_two.hand.hand_value),
+                )
+        
+        # Updating hint labels (discard value):
+        enable_hint_discard_value: bool = self.game.session.enable_hint_discard_value
+        self.text.set_label_visible(
+            label_name = "HINT_DISCARD",
+            set_value = enable_hint_discard_value,
+            )
+        if enable_hint_discard_value:
+            self.text.update_label(
+                label_name = "HINT_DISCARD",
+                label_text = str(self.game.discard.discard_value),
+                )
+        
+        # Updating HUD labels (deck counter):
+        self.text.update_label(
+            label_name = "HUD_DECK",
+            label_text = str(self.game.deck.deck_count),
+            )
+        
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    INPUT METHODS AND PROPERTIES BLOCK
+    
+    """
+
+
+    @cached_property
+    def input(self) -> Input_Controller:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return self.__input_controller
+    
+
+    def __initialize_input_controller(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Creating input controller:
+        self.__input_controller: Input_Controller = Input_Controller(
+            event_handler_map = {
+                INPUT_EVENT_MOTION: self.__handle_mouse_motion,
+                INPUT_EVENT_CLICK: self.__handle_mouse_click,
+                INPUT_EVENT_KEY: self.__handle_key_pressed,
+                }
+            )
+
+        # Clearing cache:
+        cached_property: str = "input"
+        clear_cached_property(
+            target_object = self,
+            target_attribute = cached_property
+            )
+        
+
+    def __handle_mouse_motion(self, motion_coordinates: tuple[int, int]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int] motion_coordinates: ...
+        """
+
+        # Handling mouse motion (hover):
+        self.game.handle_mouse_motion(
+            motion_coordinates = motion_coordinates
+            )
+        
+
+    def __handle_mouse_click(self, click_coordinates: tuple[int, int]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int] click_coordinates: ...
+        """
+
+        # Handling mouse click:
+        self.game.handle_mouse_click(
+            click_coordinates = click_coordinates
+            )
+        
+
+    def __handle_key_pressed(self, key_event: tuple[int, int, bool]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param tuple[int, int, bool] key_event: Key pressed, modifiers and repeat flag.
+        """
+
+        # Executing command bound to key (unbound keys are ignored):
+        key_pressed, key_modifiers, key_repeat = key_event
+        self.game.handle_key_pressed(
+            key_pressed = key_pressed,
+            key_modifiers = key_modifiers,
+            key_repeat = key_repeat,
+            )
+                
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CLOCK METHODS AND PROPERTIES BLOCK
+    
+    """
+
+
+    @cached_property
+    def clock(self) -> Clock_Controller:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return self.__clock_controller
+    
+
+    def __initialize_clock_controller(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Creating clock controller:
+        self.__clock_controller: Clock_Controller = Clock_Controller()
+
+        # Clearing cache:
+        cached_property: str = "clock"
+        clear_cached_property(
+            target_object = self,
+            target_attribute = cached_property
+            )
+        
+
     """
     %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
     NATIVE METHODS BLOCK
@@ -154,10 +436,18 @@ class Gameshell(arcade.Window):
     def on_update(self, delta_time: float) -> None:
         """
         TODO: Create a docstring.
+
+        :param float delta_time: ...
         """
 
-        # Nothing to do, yet.
-        self.game.handle_slide()
+        # Queueing repeats for held keys:
+        self.input.update_key_repeat(
+            delta_time = delta_time
+            )
+
+        # Running logic in fixed steps (none, one or several per frame):
+        for _ in range(self.clock.advance(delta_time)):
+            self.game.handle_slide()
 
 
     def on_draw(self):
@@ -165,6 +455,9 @@ class Gameshell(arcade.Window):
         TODO: Create a docstring.
         """
 
+        # Handling input queued since the previous frame (hover is updated once per frame):
+        self.input.process_events()
+
         # Clearing previous frame:
         self.clear()
 
@@ -172,47 +465,69 @@ class Gameshell(arcade.Window):
         for zone in self.__zones:
             zone.render()
 
-        # Rendering containers:
-        self.game.deck.render()
-        self.game.table.render()
+        # Getting interpolation between the last two logic steps:
+        render_alpha: float = self.clock.step_alpha
+
+        # Starting culling statistics of this frame:
+        card_culling: Culling_Controller = self.game.culling
+        card_culling.start_frame()
+
+        # Rendering containers (deck stack is one precomposed texture, nothing to cull):
+        self.game.deck.render(
+            render_alpha = render_alpha
+            )
+        self.game.table.render(
+            card_culling = card_culling
+            )
 
         # Rendering player controller's hand containers:
-        self.game.player_one.hand.render()
-        self.game.player_two.hand.render()
+        for player_controller in self.game.player_list:
+            player_controller.hand.render(
+                render_alpha = render_alpha,
+                card_culling = card_culling,
+                )
 
         # Rendering discard:
-        self.game.discard.render()        # <- TODO: Implement
+        self.game.discard.render(
+            card_culling = card_culling
+            )
+
+        # Rendering text layer (zone labels, hints and HUD) in one call:
+        self.__update_text_labels()
+        self.text.render()
+
+        # Profiling (every few frames, while running):
+        self.game.profiler.update_frame()
 
     
-    def on_key_press(self, key_pressed: Any, key_modifiers):
+    def on_key_press(self, key_pressed: Any, key_modifiers: Any):
         """
         TODO: Create a docstring.
         """
 
-        # Asserting key is registered and recognized:
-        if key_pressed in self.game.keyboard.key_list:
-
-            # Checking if key pressed was a debug command:
-            if key_pressed in self.game.keyboard.key_debug_list:
+        # Queueing key pressed:
+        self.input.push_key(
+            key_pressed = key_pressed,
+            key_modifiers = key_modifiers,
+            )
+        
+        # Holding key, if it repeats:
+        if key_pressed in self.game.keyboard.key_repeat_list:
+            self.input.hold_key(
+                key_pressed = key_pressed,
+                key_modifiers = key_modifiers,
+                )
+            
 
-                # Warning debug mode was not enabled:
-                if not SESSION_ENABLE_DEBUG:
-                    warning_message: str = "Unable to execute command. Enable debug mode in session."
-                    print(warning_message)
+    def on_key_release(self, key_released: Any, key_modifiers: Any):
+        """
+        TODO: Create a docstring.
+        """
 
-                # Executing debug command:
-                else:
-                    self.game.handle_debug_key_pressed(
-                        key_pressed = key_pressed
-                        )
-            
-            # Otherwise, handling key pressed:
-            else:
-                
-                # Executing command:
-                self.game.handle_key_pressed(
-                    key_pressed = key_pressed
-                    )
+        # Releasing held key:
+        self.input.release_key(
+            key_pressed = key_released
+            )
                 
 
     def on_mouse_motion(self, 
@@ -236,8 +551,8 @@ class Gameshell(arcade.Window):
             motion_coordinate_y
             )
 
-        # Handling mouse motion:
-        self.game.handle_mouse_motion(
+        # Queueing mouse motion (merged with motion already queued this frame):
+        self.input.push_motion(
             motion_coordinates = motion_coordinates
             )
     
@@ -263,8 +578,27 @@ class Gameshell(arcade.Window):
             click_coordinate_y
             )
         
-        # Handling mouse click:
-        self.game.handle_mouse_click(
+        # Queueing mouse click:
+        self.input.push_click(
             click_coordinates = click_coordinates
             )
+
+
+    def on_close(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Echoing input metrics (opt-in):
+        if SESSION_ENABLE_INPUT_REPORT and SESSION_ENABLE_ECHO:
+            print(self.input.create_report())
+
+        # Stopping memory profiler (writes reports to file):
+        self.game.profiler.stop()
+
+        # Stopping telemetry (buffered records are written):
+        self.game.telemetry.stop()
+
+        # Closing window:
+        super().on_close()
         
\ No newline at end of file
@@ -1,5 +1,12 @@
 # Typing import:
-from typing import Any
+from typing import Any, Callable
+
+# Function tools import:
+import functools
+import inspect
+
+# Session-related import:
+from game.session import SESSION_ENABLE_ASSERTION
 
 
 def assert_value_is_valid_type(check_value: Any, 
@@ -99,3 +106,46 @@ def assert_container_is_valid_size(check_container: tuple[Any, ...] | list[Any],
 
     # Returning (if reached):
     return assert_eval
+
+
+def bind_setter_validation(validate_function: Callable[..., None]) -> Callable:
+    """
+    Decorator, binds setter validation once, when the class is created (at startup). In debug mode
+    setter is wrapped and validated with the given function (unless called with ignore_assertion),
+    in production mode the setter itself is returned, with no flag test or extra call per set.
+
+    Validate function receives setter's arguments matching its own parameter names.
+
+    :param Callable validate_function: ...
+
+    :return Callable: ...
+    """
+
+    def bind_setter(setter_function: Callable[..., None]) -> Callable[..., None]:
+
+        # Production mode (unchecked setter):
+        if not SESSION_ENABLE_ASSERTION:
+            return setter_function
+        
+        # Reading signatures once (validated parameters, with their positional index in setter):
+        setter_parameter_list: list[str] = list(inspect.signature(setter_function).parameters)
+        validate_parameter_list: tuple[tuple[str, int], ...] = tuple(
+            (parameter_name, setter_parameter_list.index(parameter_name))
+            for parameter_name in inspect.signature(validate_function).parameters
+            )
+
+        # Debug mode (validated setter, ignore_assertion is expected as keyword argument):
+        @functools.wraps(setter_function)
+        def setter_validated(*args: Any, **kwargs: Any) -> None:
+            if not kwargs.get("ignore_assertion", False):
+                validate_function(*(
+                    kwargs[parameter_name] if parameter_name in kwargs else args[parameter_index]
+                    for parameter_name, parameter_index in validate_parameter_list
+                    ))
+            return setter_function(*args, **kwargs)
+        
+        # Returning:
+        return setter_validated
+    
+    # Returning:
+    return bind_setter
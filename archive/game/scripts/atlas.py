@@ -0,0 +1,289 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management, hashing and data import:
+import argparse
+import hashlib
+import json
+import os
+
+# Image library import (no display needed):
+from PIL import Image
+
+# Directory variables import:
+from game.directory import (
+    DIR_TEXTURES_CARD_PATH,
+    DIR_ATLAS_PATH,
+    )
+
+# Related settings import:
+from game.settings import (
+    ATLAS_FORMAT_VERSION,
+    ATLAS_COLUMN_COUNT,
+    ATLAS_PADDING,
+    ATLAS_INDEX_FILENAME,
+    ATLAS_SOURCE_EXTENSION,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ATLAS SOURCE FUNCTIONS BLOCK
+
+"""
+
+
+def find_pack_list(source_path: str = DIR_TEXTURES_CARD_PATH) -> dict[str, list[str]]:
+    """
+    Finds texture packs: every directory with source images is a pack, keyed by its path relative
+    to source path ("front/light/duo_1", "back/white").
+
+    :param str source_path: ...
+
+    :return dict[str, list[str]]: Pack key to sorted source filenames.
+    """
+
+    # Walking source directory:
+    pack_index: dict[str, list[str]] = {}
+    for dir_path, _, filename_list in os.walk(source_path):
+        source_filename_list: list[str] = sorted(
+            filename for filename in filename_list
+            if filename.endswith(ATLAS_SOURCE_EXTENSION)
+            )
+        if source_filename_list:
+            pack_key: str = os.path.relpath(dir_path, source_path).replace(os.sep, "/")
+            pack_index[pack_key] = source_filename_list
+
+    # Returning (sorted, so index is stable):
+    return dict(sorted(pack_index.items()))
+
+
+def calculate_pack_hash(pack_path: str, source_filename_list: list[str]) -> str:
+    """
+    Hashes pack content (layout settings, filenames and file bytes), so unchanged packs are skipped
+    regardless of file times.
+
+    :param str pack_path: ...
+    :param list[str] source_filename_list: ...
+
+    :return str: ...
+    """
+
+    # Hashing layout and sources:
+    pack_hash: Any = hashlib.sha256()
+    pack_hash.update(f"{ATLAS_FORMAT_VERSION}:{ATLAS_COLUMN_COUNT}:{ATLAS_PADDING}".encode())
+    for source_filename in source_filename_list:
+        pack_hash.update(source_filename.encode())
+        with open(os.path.join(pack_path, source_filename), "rb") as source_file:
+            pack_hash.update(source_file.read())
+
+    # Returning:
+    return pack_hash.hexdigest()
+
+
+def convert_filename_to_key(source_filename: str) -> tuple[str | None, str]:
+    """
+    Converts source filename to suit and rank: "hearts_10.png" is ("hearts", "10"), back textures
+    have no suit ("plain.png" is (None, "plain")).
+
+    :param str source_filename: ...
+
+    :return tuple[str | None, str]: ...
+    """
+
+    # Splitting filename:
+    source_name: str = os.path.splitext(source_filename)[0]
+    if "_" in source_name:
+        texture_suit, texture_rank = source_name.split("_", 1)
+    else:
+        texture_suit, texture_rank = None, source_name
+
+    # Returning:
+    return texture_suit, texture_rank
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ATLAS BUILD FUNCTIONS BLOCK
+
+"""
+
+
+def build_pack_atlas(pack_key: str,
+                     pack_path: str,
+                     source_filename_list: list[str],
+                     atlas_path: str
+                     ) -> dict[str, Any]:
+    """
+    Packs pack textures into one atlas image (grid of equal cells, padded) and returns its index
+    entry with a pixel rect and UV rect (0.0 to 1.0, top-left origin) per texture.
+
+    :param str pack_key: ...
+    :param str pack_path: ...
+    :param list[str] source_filename_list: ...
+    :param str atlas_path: Atlas image file to write.
+
+    :return dict[str, Any]: ...
+    """
+
+    # Loading sources:
+    source_image_list: list[Image.Image] = []
+    for source_filename in source_filename_list:
+        with Image.open(os.path.join(pack_path, source_filename)) as source_image:
+            source_image_list.append(source_image.convert("RGBA"))
+
+    # Calculating grid:
+    cell_width: int = max(source_image.width for source_image in source_image_list) + ATLAS_PADDING * 2
+    cell_height: int = max(source_image.height for source_image in source_image_list) + ATLAS_PADDING * 2
+    column_count: int = min(ATLAS_COLUMN_COUNT, len(source_image_list))
+    row_count: int = -(-len(source_image_list) // column_count)
+    atlas_size: tuple[int, int] = (cell_width * column_count, cell_height * row_count)
+
+    # Packing:
+    atlas_image: Image.Image = Image.new("RGBA", atlas_size, (0, 0, 0, 0))
+    texture_list: list[dict[str, Any]] = []
+    for source_position, (source_filename, source_image) in enumerate(zip(source_filename_list, source_image_list)):
+        row_index, column_index = divmod(source_position, column_count)
+        rect_x: int = column_index * cell_width + ATLAS_PADDING
+        rect_y: int = row_index * cell_height + ATLAS_PADDING
+        atlas_image.paste(source_image, (rect_x, rect_y))
+
+        # Indexing texture:
+        texture_suit, texture_rank = convert_filename_to_key(
+            source_filename = source_filename,
+            )
+        texture_list.append({
+            "suit": texture_suit,
+            "rank": texture_rank,
+            "source": f"{pack_key}/{source_filename}",
+            "rect": [rect_x, rect_y, source_image.width, source_image.height],
+            "uv": [
+                rect_x / atlas_size[0],
+                rect_y / atlas_size[1],
+                (rect_x + source_image.width) / atlas_size[0],
+                (rect_y + source_image.height) / atlas_size[1],
+                ],
+            })
+
+    # Writing atlas image:
+    atlas_image.save(atlas_path, optimize = True)
+
+    # Packing up:
+    pack_entry: dict[str, Any] = {
+        "atlas": os.path.basename(atlas_path),
+        "size": list(atlas_size),
+        "texture_list": texture_list,
+        }
+
+    # Returning:
+    return pack_entry
+
+
+def build_atlas_collection(source_path: str = DIR_TEXTURES_CARD_PATH,
+                           output_path: str = DIR_ATLAS_PATH,
+                           force_rebuild: bool = False
+                           ) -> dict[str, int]:
+    """
+    Builds atlases for every texture pack and writes the atlas index. Packs whose content hash
+    matches the index (and whose atlas file exists) are skipped, atlases of removed packs are
+    deleted.
+
+    :param str source_path: ...
+    :param str output_path: ...
+    :param bool force_rebuild: Rebuilds every atlas, even if unchanged.
+
+    :return dict[str, int]: Number of atlases built, skipped and removed.
+    """
+
+    # Loading previous index:
+    os.makedirs(output_path, exist_ok = True)
+    index_path: str = os.path.join(output_path, ATLAS_INDEX_FILENAME)
+    pack_index_previous: dict[str, Any] = {}
+    if os.path.isfile(index_path):
+        with open(index_path, "r", encoding = "utf-8") as index_file:
+            atlas_index_previous: dict[str, Any] = json.load(index_file)
+        if atlas_index_previous.get("format") == ATLAS_FORMAT_VERSION:
+            pack_index_previous: dict[str, Any] = atlas_index_previous["pack_index"]
+
+    # Building packs:
+    pack_index: dict[str, Any] = {}
+    build_report: dict[str, int] = {"built": 0, "skipped": 0, "removed": 0}
+    for pack_key, source_filename_list in find_pack_list(source_path).items():
+        pack_path: str = os.path.join(source_path, *pack_key.split("/"))
+        pack_hash: str = calculate_pack_hash(
+            pack_path = pack_path,
+            source_filename_list = source_filename_list,
+            )
+        atlas_path: str = os.path.join(output_path, f"{pack_key.replace('/', '_')}.png")
+
+        # Skipping unchanged pack:
+        pack_entry_previous: dict[str, Any] | None = pack_index_previous.get(pack_key)
+        pack_unchanged: bool = bool(
+            not force_rebuild and
+            pack_entry_previous is not None and
+            pack_entry_previous["hash"] == pack_hash and
+            os.path.isfile(atlas_path)
+            )
+        if pack_unchanged:
+            pack_index[pack_key] = pack_entry_previous
+            build_report["skipped"] += 1
+            continue
+
+        # Building atlas:
+        pack_entry: dict[str, Any] = build_pack_atlas(
+            pack_key = pack_key,
+            pack_path = pack_path,
+            source_filename_list = source_filename_list,
+            atlas_path = atlas_path,
+            )
+        pack_entry["hash"] = pack_hash
+        pack_index[pack_key] = pack_entry
+        build_report["built"] += 1
+
+    # Removing atlases of packs that no longer exist:
+    for pack_key, pack_entry_previous in pack_index_previous.items():
+        if pack_key not in pack_index:
+            atlas_path: str = os.path.join(output_path, pack_entry_previous["atlas"])
+            if os.path.isfile(atlas_path):
+                os.remove(atlas_path)
+            build_report["removed"] += 1
+
+    # Writing index (only if something changed):
+    if build_report["built"] > 0 or build_report["removed"] > 0 or not os.path.isfile(index_path):
+        atlas_index: dict[str, Any] = {
+            "format": ATLAS_FORMAT_VERSION,
+            "pack_index": pack_index,
+            }
+        with open(index_path, "w", encoding = "utf-8") as index_file:
+            json.dump(atlas_index, index_file, indent = 1)
+
+    # Returning:
+    return build_report
+
+
+def run_atlas_build() -> None:
+    """
+    Command line entry point, e.g. "python -m game.scripts.atlas --force".
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Packs card texture packs into atlas images with an index of texture rects."
+        )
+    argument_parser.add_argument("--source", type = str, default = DIR_TEXTURES_CARD_PATH)
+    argument_parser.add_argument("--output", type = str, default = DIR_ATLAS_PATH)
+    argument_parser.add_argument("--force", action = "store_true", help = "Rebuild unchanged packs too.")
+    argument_namespace: argparse.Namespace = argument_parser.parse_args()
+
+    # Building:
+    build_report: dict[str, int] = build_atlas_collection(
+        source_path = argument_namespace.source,
+        output_path = argument_namespace.output,
+        force_rebuild = argument_namespace.force,
+        )
+    print(json.dumps(build_report))
+
+
+if __name__ == "__main__":
+    run_atlas_build()
@@ -0,0 +1,60 @@
+# Card identifier and beats table variables import:
+from game.variables import (
+    CARD_ID_SUIT_ORDER,
+    CARD_ID_TYPE_ORDER,
+    CARD_BEATS_FLAG_GREATER,
+    CARD_BEATS_FLAG_LESS,
+    )
+
+
+# Card count (every card id, filtered decks use the same ids):
+CARD_ID_COUNT: int = len(CARD_ID_SUIT_ORDER) * len(CARD_ID_TYPE_ORDER)
+
+
+def create_beats_table(deck_trump: str) -> bytearray:
+    """
+    Creates a beats table for a trump suit, flat bytearray indexed by card id * card id count +
+    other card id. Flags follow card comparison: greater, if suits match or card is a trump, and
+    card value is higher (trumps are always higher than other suits); less, if suits match and card
+    value is lower.
+
+    :param str deck_trump: ...
+
+    :raise ValueError: if trump suit is not recognized.
+
+    :return bytearray: ...
+    """
+
+    # Validating trump suit:
+    if deck_trump not in CARD_ID_SUIT_ORDER:
+        error_message: str = f"Unable to create beats table, unknown trump suit ({deck_trump=})."
+        raise ValueError(error_message)
+
+    # Preparing suits and values (type index already follows value order):
+    type_count: int = len(CARD_ID_TYPE_ORDER)
+    trump_index: int = CARD_ID_SUIT_ORDER.index(deck_trump)
+    card_suit_list: list[int] = [card_id // type_count for card_id in range(CARD_ID_COUNT)]
+    card_value_list: list[int] = [
+        card_id % type_count + (type_count if card_id // type_count == trump_index else 0)
+        for card_id in range(CARD_ID_COUNT)
+        ]
+
+    # Filling table:
+    beats_table: bytearray = bytearray(CARD_ID_COUNT * CARD_ID_COUNT)
+    for card_id in range(CARD_ID_COUNT):
+        card_suit: int = card_suit_list[card_id]
+        card_value: int = card_value_list[card_id]
+        card_trump: bool = card_suit == trump_index
+        table_row: int = card_id * CARD_ID_COUNT
+        for card_id_other in range(CARD_ID_COUNT):
+            suit_match: bool = card_suit == card_suit_list[card_id_other]
+            card_value_other: int = card_value_list[card_id_other]
+            beats_flag: int = 0
+            if (suit_match or card_trump) and card_value > card_value_other:
+                beats_flag |= CARD_BEATS_FLAG_GREATER
+            if suit_match and card_value < card_value_other:
+                beats_flag |= CARD_BEATS_FLAG_LESS
+            beats_table[table_row + card_id_other] = beats_flag
+
+    # Returning:
+    return beats_table
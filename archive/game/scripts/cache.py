@@ -5,9 +5,8 @@ def clear_cached_property(target_object: object,
     TODO: Create a docstring.
     """
 
-    # Clearing cached property:
-    if hasattr(target_object, target_attribute):
-        delattr(target_object, target_attribute)
+    # Clearing cached property (popped from instance dictionary, hasattr would compute the value):
+    vars(target_object).pop(target_attribute, None)
 
 
 def clear_cached_property_list(target_object: object, 
@@ -1,3 +1,8 @@
+# Card identifier variables import:
+from game.variables import (
+    CARD_ID_SUIT_ORDER,
+    CARD_ID_TYPE_ORDER,
+    )
 
 
 def convert_attribute_to_repr(attribute_value: str, attribute_tag: str) -> str:
@@ -38,4 +43,57 @@ def convert_value_to_integer(convert_value: float) -> int:
         raise ValueError(error_message)
     
     # Returning:
-    return position_index_f
\ No newline at end of file
+    return position_index_f
+
+def convert_card_to_id(card_suit: str, card_type: str) -> int:
+    """
+    Converts card suit and type into a stable integer identifier (0 to 51).
+
+    :param str card_suit: ...
+    :param str card_type: ...
+
+    :raise ValueError: if suit or type is not recognized.
+
+    :return int: ...
+    """
+
+    # Calculating identifier:
+    try:
+        card_id: int = int(
+            CARD_ID_SUIT_ORDER.index(card_suit) * len(CARD_ID_TYPE_ORDER) +
+            CARD_ID_TYPE_ORDER.index(card_type)
+            )
+    except ValueError:
+        error_message: str = f"Unable to convert {card_suit=}, {card_type=} to card id."
+        raise ValueError(error_message)
+
+    # Returning:
+    return card_id
+
+
+def convert_id_to_card(card_id: int) -> tuple[str, str]:
+    """
+    Converts card identifier back into card suit and type.
+
+    :param int card_id: ...
+
+    :raise ValueError: if identifier is out of range.
+
+    :return tuple[str, str]: Card suit and card type.
+    """
+
+    # Checking identifier range:
+    card_id_max: int = len(CARD_ID_SUIT_ORDER) * len(CARD_ID_TYPE_ORDER)
+    if not 0 <= card_id < card_id_max:
+        error_message: str = f"Card id is out of range ({card_id=})."
+        raise ValueError(error_message)
+
+    # Splitting identifier:
+    suit_index, type_index = divmod(card_id, len(CARD_ID_TYPE_ORDER))
+    card_container: tuple[str, str] = (
+        CARD_ID_SUIT_ORDER[suit_index],
+        CARD_ID_TYPE_ORDER[type_index],
+        )
+
+    # Returning:
+    return card_container
@@ -0,0 +1,147 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Callable
+
+# Settings import:
+from game.settings import TWEEN_TABLE_SIZE
+
+# Variables import:
+from game.variables import (
+    TWEEN_EASING_LINEAR,
+    TWEEN_EASING_QUAD_IN,
+    TWEEN_EASING_QUAD_OUT,
+    TWEEN_EASING_QUAD_IN_OUT,
+    TWEEN_EASING_CUBIC_OUT,
+    TWEEN_EASING_BACK_OUT,
+    )
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EASING FUNCTION BLOCK
+
+"""
+
+
+def ease_linear(progress: float) -> float:
+    """
+    TODO: Create a docstring.
+
+    :param float progress: 0.0 to 1.0.
+
+    :return float: ...
+    """
+
+    # Returning:
+    return progress
+
+
+def ease_quad_in(progress: float) -> float:
+    """
+    TODO: Create a docstring.
+
+    :param float progress: 0.0 to 1.0.
+
+    :return float: ...
+    """
+
+    # Returning:
+    return progress * progress
+
+
+def ease_quad_out(progress: float) -> float:
+    """
+    TODO: Create a docstring.
+
+    :param float progress: 0.0 to 1.0.
+
+    :return float: ...
+    """
+
+    # Returning:
+    return 1 - (1 - progress) * (1 - progress)
+
+
+def ease_quad_in_out(progress: float) -> float:
+    """
+    TODO: Create a docstring.
+
+    :param float progress: 0.0 to 1.0.
+
+    :return float: ...
+    """
+
+    # Returning:
+    if progress < 0.5:
+        return 2 * progress * progress
+    return 1 - (-2 * progress + 2) ** 2 / 2
+
+
+def ease_cubic_out(progress: float) -> float:
+    """
+    TODO: Create a docstring.
+
+    :param float progress: 0.0 to 1.0.
+
+    :return float: ...
+    """
+
+    # Returning:
+    return 1 - (1 - progress) ** 3
+
+
+def ease_back_out(progress: float) -> float:
+    """
+    Overshoots the target slightly and settles back.
+
+    :param float progress: 0.0 to 1.0.
+
+    :return float: ...
+    """
+
+    # Returning:
+    overshoot: float = 1.70158
+    return 1 + (overshoot + 1) * (progress - 1) ** 3 + overshoot * (progress - 1) ** 2
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EASING TABLE BLOCK
+
+"""
+
+
+def create_easing_table(easing_function: Callable[[float], float], 
+                        table_size: int = TWEEN_TABLE_SIZE
+                        ) -> tuple[float, ...]:
+    """
+    Samples easing function into a lookup table. First entry is always 0.0, last is always 1.0,
+    so tweens start and end exactly at their coordinates.
+
+    :param Callable easing_function: ...
+    :param int table_size: ...
+
+    :return tuple[float, ...]: ...
+    """
+
+    # Sampling:
+    table_last: int = table_size - 1
+    easing_table: list[float] = [
+        easing_function(table_index / table_last) for table_index in range(table_size)
+        ]
+    easing_table[0] = 0.0
+    easing_table[table_last] = 1.0
+
+    # Returning:
+    return tuple(easing_table)
+
+
+# Easing tables (computed once on import):
+EASING_TABLE_INDEX: dict[str, tuple[float, ...]] = {
+    TWEEN_EASING_LINEAR:      create_easing_table(ease_linear),
+    TWEEN_EASING_QUAD_IN:     create_easing_table(ease_quad_in),
+    TWEEN_EASING_QUAD_OUT:    create_easing_table(ease_quad_out),
+    TWEEN_EASING_QUAD_IN_OUT: create_easing_table(ease_quad_in_out),
+    TWEEN_EASING_CUBIC_OUT:   create_easing_table(ease_cubic_out),
+    TWEEN_EASING_BACK_OUT:    create_easing_table(ease_back_out),
+    }
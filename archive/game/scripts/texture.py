@@ -0,0 +1,455 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# System management and data import:
+import json
+import mmap
+import os
+
+# Thread pool import:
+from concurrent.futures import ThreadPoolExecutor
+
+# Arcade library import:
+import arcade
+from arcade import Texture
+from arcade.texture import ImageData
+
+# Image library import:
+from PIL import Image
+
+# Directory variables import:
+from game.directory import (
+    DIR_TEXTURES_CARD_PATH,
+    DIR_ATLAS_PATH,
+    DIR_TEXTURE_CACHE_PATH,
+    )
+
+# Related settings import:
+from game.settings import (
+    ATLAS_FORMAT_VERSION,
+    ATLAS_INDEX_FILENAME,
+    ATLAS_SOURCE_EXTENSION,
+    TEXTURE_CACHE_FORMAT_VERSION,
+    TEXTURE_CACHE_RAW_EXTENSION,
+    TEXTURE_CACHE_INDEX_EXTENSION,
+    TEXTURE_PRELOAD_WORKER_COUNT,
+    )
+
+# Scripts import:
+from game.scripts.atlas import calculate_pack_hash
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TEXTURE CACHE BLOCK
+
+"""
+
+
+# Loaded textures, by source file path (cards with the same face share one texture):
+TEXTURE_CACHE: dict[str, Texture] = {}
+
+# Decoded pack images, pack key to source filename to RGBA image:
+__pack_image_cache: dict[str, dict[str, Image.Image]] = {}
+
+# Memory maps backing cached pack images (kept open while their images are in use):
+__pack_mmap_cache: dict[str, mmap.mmap] = {}
+
+# Atlas index, source path (relative to card textures) to pack key and pixel rect; None until read:
+__atlas_source_index: dict[str, tuple[str, tuple[int, int, int, int]]] | None = None
+__atlas_file_index: dict[str, str] = {}
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ATLAS FUNCTIONS BLOCK
+
+"""
+
+
+def __read_atlas_index() -> dict[str, tuple[str, tuple[int, int, int, int]]]:
+    """
+    Reads atlas index (once). Missing or outdated index means there are no atlases, textures are
+    then decoded from source files.
+
+    :return dict[str, tuple[str, tuple[int, int, int, int]]]: ...
+    """
+
+    # Reading index:
+    global __atlas_source_index
+    if __atlas_source_index is None:
+        __atlas_source_index = {}
+        index_path: str = os.path.join(DIR_ATLAS_PATH, ATLAS_INDEX_FILENAME)
+        if os.path.isfile(index_path):
+            with open(index_path, "r", encoding = "utf-8") as index_file:
+                atlas_index: dict[str, Any] = json.load(index_file)
+            if atlas_index.get("format") == ATLAS_FORMAT_VERSION:
+                for pack_key, pack_entry in atlas_index["pack_index"].items():
+                    __atlas_file_index[pack_key] = os.path.join(DIR_ATLAS_PATH, pack_entry["atlas"])
+                    for texture_entry in pack_entry["texture_list"]:
+                        __atlas_source_index[texture_entry["source"]] = (pack_key, tuple(texture_entry["rect"]))
+
+    # Returning:
+    return __atlas_source_index
+
+
+def __decode_pack(pack_key: str, pack_path: str, source_filename_list: list[str]) -> dict[str, Image.Image]:
+    """
+    Decodes pack images: cut out of the pack atlas (one file open), if it is built, otherwise
+    decoded from every source file.
+
+    :param str pack_key: ...
+    :param str pack_path: ...
+    :param list[str] source_filename_list: ...
+
+    :return dict[str, Image.Image]: ...
+    """
+
+    # Checking atlas:
+    atlas_source_index: dict[str, tuple[str, tuple[int, int, int, int]]] = __read_atlas_index()
+    atlas_path: str | None = __atlas_file_index.get(pack_key)
+    atlas_ready: bool = bool(
+        atlas_path is not None and os.path.isfile(atlas_path) and
+        all(f"{pack_key}/{source_filename}" in atlas_source_index for source_filename in source_filename_list)
+        )
+
+    # Cutting images out of atlas:
+    pack_image_index: dict[str, Image.Image] = {}
+    if atlas_ready:
+        with Image.open(atlas_path) as atlas_file:
+            atlas_image: Image.Image = atlas_file.convert("RGBA")
+        for source_filename in source_filename_list:
+            _, (rect_x, rect_y, rect_width, rect_height) = atlas_source_index[f"{pack_key}/{source_filename}"]
+            pack_image_index[source_filename] = atlas_image.crop(
+                (rect_x, rect_y, rect_x + rect_width, rect_y + rect_height)
+                )
+
+    # Decoding source files:
+    else:
+        for source_filename in source_filename_list:
+            with Image.open(os.path.join(pack_path, source_filename)) as source_image:
+                pack_image_index[source_filename] = source_image.convert("RGBA")
+
+    # Returning:
+    return pack_image_index
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+RAW CACHE FUNCTIONS BLOCK
+
+"""
+
+
+def __find_cache_path(pack_key: str) -> tuple[str, str]:
+    """
+    TODO: Create a docstring.
+
+    :param str pack_key: ...
+
+    :return tuple[str, str]: Raw buffer path and index path.
+    """
+
+    # Generating paths:
+    cache_name: str = pack_key.replace("/", "_")
+    cache_raw_path: str = os.path.join(DIR_TEXTURE_CACHE_PATH, f"{cache_name}{TEXTURE_CACHE_RAW_EXTENSION}")
+    cache_index_path: str = os.path.join(DIR_TEXTURE_CACHE_PATH, f"{cache_name}{TEXTURE_CACHE_INDEX_EXTENSION}")
+
+    # Returning:
+    return cache_raw_path, cache_index_path
+
+
+def __read_pack_raw(pack_key: str, pack_hash: str) -> tuple[dict[str, Image.Image], mmap.mmap] | None:
+    """
+    Maps cached raw RGBA buffer of a pack into memory. Images are created over the mapped buffer
+    (no decode, no copy). Missing, outdated or damaged cache returns None.
+
+    :param str pack_key: ...
+    :param str pack_hash: Current source hash of the pack.
+
+    :return tuple[dict[str, Image.Image], mmap.mmap] | None: Images and the memory map behind them.
+    """
+
+    # Reading cache index:
+    cache_raw_path, cache_index_path = __find_cache_path(pack_key)
+    try:
+        with open(cache_index_path, "r", encoding = "utf-8") as cache_index_file:
+            cache_index: dict[str, Any] = json.load(cache_index_file)
+    except (OSError, ValueError):
+        return None
+    cache_valid: bool = bool(
+        cache_index.get("format") == TEXTURE_CACHE_FORMAT_VERSION and
+        cache_index.get("hash") == pack_hash
+        )
+    if not cache_valid:
+        return None
+
+    # Mapping raw buffer:
+    try:
+        with open(cache_raw_path, "rb") as cache_raw_file:
+            cache_mmap: mmap.mmap = mmap.mmap(cache_raw_file.fileno(), 0, access = mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(cache_mmap) != cache_index["size"]:
+        cache_mmap.close()
+        return None
+
+    # Creating images over buffer:
+    cache_view: memoryview = memoryview(cache_mmap)
+    pack_image_index: dict[str, Image.Image] = {}
+    for source_filename, buffer_offset, image_width, image_height in cache_index["texture_list"]:
+        buffer_size: int = image_width * image_height * 4
+        pack_image_index[source_filename] = Image.frombuffer(
+            "RGBA",
+            (image_width, image_height),
+            cache_view[buffer_offset:buffer_offset + buffer_size],
+            "raw",
+            "RGBA",
+            0,
+            1,
+            )
+
+    # Returning:
+    return pack_image_index, cache_mmap
+
+
+def __write_pack_raw(pack_key: str, pack_hash: str, pack_image_index: dict[str, Image.Image]) -> None:
+    """
+    Writes decoded pack images as one raw RGBA buffer and its index. Files are replaced atomically,
+    a read-only install simply runs without cache.
+
+    :param str pack_key: ...
+    :param str pack_hash: ...
+    :param dict[str, Image.Image] pack_image_index: ...
+    """
+
+    # Preparing buffer and index:
+    cache_raw_path, cache_index_path = __find_cache_path(pack_key)
+    cache_buffer: bytearray = bytearray()
+    texture_list: list[list[Any]] = []
+    for source_filename, pack_image in pack_image_index.items():
+        texture_list.append([source_filename, len(cache_buffer), pack_image.width, pack_image.height])
+        cache_buffer += pack_image.tobytes()
+    cache_index: dict[str, Any] = {
+        "format": TEXTURE_CACHE_FORMAT_VERSION,
+        "hash": pack_hash,
+        "size": len(cache_buffer),
+        "texture_list": texture_list,
+        }
+
+    # Writing (raw buffer first, index makes it valid):
+    try:
+        os.makedirs(DIR_TEXTURE_CACHE_PATH, exist_ok = True)
+        with open(f"{cache_raw_path}.tmp", "wb") as cache_raw_file:
+            cache_raw_file.write(cache_buffer)
+        os.replace(f"{cache_raw_path}.tmp", cache_raw_path)
+        with open(f"{cache_index_path}.tmp", "w", encoding = "utf-8") as cache_index_file:
+            json.dump(cache_index, cache_index_file)
+        os.replace(f"{cache_index_path}.tmp", cache_index_path)
+    except OSError:
+        pass
+
+
+def __read_pack(pack_key: str) -> tuple[dict[str, Image.Image], mmap.mmap | None]:
+    """
+    Reads pack images: from the raw cache, if it matches source hash, otherwise decoded (atlas or
+    source files) and written to cache for the next run. Shared caches are not touched, so packs
+    can be read in worker threads (atlas index must be read before).
+
+    :param str pack_key: ...
+
+    :return tuple[dict[str, Image.Image], mmap.mmap | None]: ...
+    """
+
+    # Hashing sources:
+    pack_path: str = os.path.join(DIR_TEXTURES_CARD_PATH, *pack_key.split("/"))
+    source_filename_list: list[str] = sorted(
+        filename for filename in os.listdir(pack_path)
+        if filename.endswith(ATLAS_SOURCE_EXTENSION)
+        )
+    pack_hash: str = calculate_pack_hash(
+        pack_path = pack_path,
+        source_filename_list = source_filename_list,
+        )
+
+    # Reading cache:
+    pack_raw: tuple[dict[str, Image.Image], mmap.mmap] | None = __read_pack_raw(
+        pack_key = pack_key,
+        pack_hash = pack_hash,
+        )
+    if pack_raw is not None:
+        return pack_raw
+
+    # Decoding and writing cache:
+    pack_image_index: dict[str, Image.Image] = __decode_pack(
+        pack_key = pack_key,
+        pack_path = pack_path,
+        source_filename_list = source_filename_list,
+        )
+    __write_pack_raw(
+        pack_key = pack_key,
+        pack_hash = pack_hash,
+        pack_image_index = pack_image_index,
+        )
+
+    # Returning:
+    return pack_image_index, None
+
+
+def __load_pack(pack_key: str) -> dict[str, Image.Image]:
+    """
+    Reads pack images and keeps them (and their memory map) in pack cache.
+
+    :param str pack_key: ...
+
+    :return dict[str, Image.Image]: ...
+    """
+
+    # Reading pack:
+    __read_atlas_index()
+    pack_image_index, cache_mmap = __read_pack(pack_key)
+
+    # Updating caches:
+    __pack_image_cache[pack_key] = pack_image_index
+    if cache_mmap is not None:
+        __pack_mmap_cache[pack_key] = cache_mmap
+
+    # Returning:
+    return pack_image_index
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TEXTURE LOAD FUNCTIONS BLOCK
+
+"""
+
+
+def __create_texture(file_path: str, source_key: str, texture_image: Image.Image) -> Texture:
+    """
+    Creates texture from pack image. Source path is unique, so pixels are not hashed.
+
+    :param str file_path: ...
+    :param str source_key: Source path, relative to card textures.
+    :param Image.Image texture_image: ...
+
+    :return Texture: ...
+    """
+
+    # Creating texture:
+    texture_object: Texture = Texture(
+        ImageData(texture_image, hash = source_key),
+        hit_box_algorithm = arcade.hitbox.algo_bounding_box,
+        )
+    texture_object.file_path = file_path
+
+    # Returning:
+    return texture_object
+
+
+def load_texture_cached(file_path: str) -> Texture:
+    """
+    Loads card texture. Textures are loaded per pack, on first use: from the decoded raw cache,
+    from the pack atlas (see game.scripts.atlas), or from source files, in that order. Files outside
+    of card textures are loaded as is.
+
+    :param str file_path: Source file path.
+
+    :return Texture: ...
+    """
+
+    # Returning cached texture:
+    texture_object: Texture | None = TEXTURE_CACHE.get(file_path)
+    if texture_object is not None:
+        return texture_object
+
+    # Finding pack:
+    source_key: str = os.path.relpath(file_path, DIR_TEXTURES_CARD_PATH).replace(os.sep, "/")
+    pack_key, _, source_filename = source_key.rpartition("/")
+    texture_image: Image.Image | None = None
+    if pack_key and not source_key.startswith(".."):
+        pack_image_index: dict[str, Image.Image] | None = __pack_image_cache.get(pack_key)
+        if pack_image_index is None:
+            pack_image_index: dict[str, Image.Image] = __load_pack(pack_key)
+        texture_image: Image.Image | None = pack_image_index.get(source_filename)
+
+    # Creating texture:
+    if texture_image is not None:
+        texture_object: Texture = __create_texture(
+            file_path = file_path,
+            source_key = source_key,
+            texture_image = texture_image,
+            )
+    else:
+        texture_object: Texture = arcade.load_texture(
+            file_path = file_path
+            )
+    TEXTURE_CACHE[file_path] = texture_object
+
+    # Returning:
+    return texture_object
+
+
+def preload_texture_pack_list(pack_key_list: list[str],
+                              worker_count: int = TEXTURE_PRELOAD_WORKER_COUNT
+                              ) -> int:
+    """
+    Reads texture packs ahead of use into the pack cache (cache map, or decode). Packs are read in a
+    thread pool, image decoding releases the interpreter lock, so packs decode side by side. No
+    textures are created or uploaded, cards create them on first use (see load_texture_cached).
+    Packs already loaded are skipped.
+
+    :param list[str] pack_key_list: Pack keys, as in Texture_Pack.pack_key.
+    :param int worker_count: Worker threads, 1 reads packs one by one.
+
+    :return int: Number of packs read.
+    """
+
+    # Selecting packs to read (once each, existing only):
+    pack_key_pending_list: list[str] = []
+    for pack_key in pack_key_list:
+        pack_pending: bool = bool(
+            pack_key not in __pack_image_cache and
+            pack_key not in pack_key_pending_list and
+            os.path.isdir(os.path.join(DIR_TEXTURES_CARD_PATH, *pack_key.split("/")))
+            )
+        if pack_pending:
+            pack_key_pending_list.append(pack_key)
+
+    # Reading packs (atlas index is read first, workers only read it):
+    __read_atlas_index()
+    pack_worker_count: int = min(worker_count, len(pack_key_pending_list))
+    if pack_worker_count > 1:
+        with ThreadPoolExecutor(max_workers = pack_worker_count) as pack_executor:
+            pack_read_list: list[tuple[dict[str, Image.Image], mmap.mmap | None]] = list(
+                pack_executor.map(__read_pack, pack_key_pending_list)
+                )
+    else:
+        pack_read_list: list[tuple[dict[str, Image.Image], mmap.mmap | None]] = [
+            __read_pack(pack_key) for pack_key in pack_key_pending_list
+            ]
+
+    # Updating caches (calling thread):
+    for pack_key, (pack_image_index, cache_mmap) in zip(pack_key_pending_list, pack_read_list):
+        __pack_image_cache[pack_key] = pack_image_index
+        if cache_mmap is not None:
+            __pack_mmap_cache[pack_key] = cache_mmap
+
+    # Returning:
+    return len(pack_key_pending_list)
+
+
+def clear_texture_cache() -> None:
+    """
+    Clears loaded textures and pack images (memory maps are closed once nothing uses them), atlas
+    index is read again on next load.
+    """
+
+    # Clearing:
+    global __atlas_source_index
+    TEXTURE_CACHE.clear()
+    __pack_image_cache.clear()
+    __pack_mmap_cache.clear()
+    __atlas_file_index.clear()
+    __atlas_source_index = None
@@ -0,0 +1,1283 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any
+
+# Asynchronous library import:
+import asyncio
+
+# System management, time and data import:
+import argparse
+import collections
+import json
+import os
+import time
+
+# Settings import:
+from game.settings import (
+
+    # Server connection settings:
+    SERVER_HOST_DEFAULT,
+    SERVER_PORT_DEFAULT,
+    SERVER_MESSAGE_SIZE_MAX,
+
+    # Server tick settings:
+    SERVER_TICK_RATE,
+    SERVER_TICK_ACTION_LIMIT,
+
+    # Server backpressure settings:
+    SERVER_MATCH_QUEUE_SIZE,
+    SERVER_CLIENT_QUEUE_SIZE,
+    SERVER_CLIENT_DRAIN_TIMEOUT,
+    SERVER_MATCH_JOIN_TIMEOUT,
+
+    # Server metrics settings:
+    SERVER_METRICS_SAMPLE_SIZE,
+
+    # Hand settings:
+    HAND_CARD_COUNT_DEFAULT,
+
+    # Table settings:
+    TABLE_STACK_BOTTOM_INDEX,
+    TABLE_STACK_TOP_INDEX,
+    )
+
+# Variables import:
+from game.variables import (
+
+    # Server request variables:
+    SERVER_REQUEST_CREATE,
+    SERVER_REQUEST_JOIN,
+    SERVER_REQUEST_ACTION,
+    SERVER_REQUEST_STATE,
+    SERVER_REQUEST_CLOSE,
+    SERVER_REQUEST_METRICS,
+
+    # Server action variables:
+    SERVER_ACTION_ATTACK,
+    SERVER_ACTION_DEFEND,
+    SERVER_ACTION_TAKE,
+    SERVER_ACTION_DISCARD,
+    )
+
+# Controllers import:
+from game.controllers.card import Card_Object
+from game.controllers.game import Game_Controller
+from game.controllers.player import Player_Controller
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+MATCH CLASS OBJECT BLOCK
+
+"""
+
+
+class Match_Controller:
+    """
+    Single headless match. Every match owns its own game controller and session controller (and
+    therefore its own texture packs), nothing is shared between matches but read-only settings.
+    """
+
+    def __init__(self, match_id: int) -> None:
+
+        # Core attributes:
+        self.__match_id: int = match_id
+        self.__match_finished: bool = False
+
+        # Creating isolated game controller:
+        self.__game_controller: Game_Controller = Game_Controller()
+        self.__game_controller.create_session()
+        self.__game_controller.create_game_default()
+
+        # Pending actions (created lazily, within the server's event loop):
+        self.__match_queue: asyncio.Queue | None = None
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    MATCH PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def match_id(self) -> int:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return self.__match_id
+
+
+    @property
+    def match_finished(self) -> bool:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return self.__match_finished
+
+
+    @property
+    def match_queue(self) -> asyncio.Queue:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Creating bounded queue on first access:
+        if self.__match_queue is None:
+            self.__match_queue: asyncio.Queue = asyncio.Queue(
+                maxsize = SERVER_MATCH_QUEUE_SIZE
+                )
+
+        # Returning:
+        return self.__match_queue
+
+
+    @property
+    def game(self) -> Game_Controller:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return self.__game_controller
+
+
+    def find_player(self, player_seat: int) -> Player_Controller:
+        """
+        TODO: Create a docstring.
+
+        :param int player_seat: 0 for player one, 1 for player two.
+
+        :raise ValueError: if seat is not recognized.
+
+        :return Player_Controller: ...
+        """
+
+        # Selecting player controller:
+        if player_seat not in (0, 1):
+            error_message: str = f"Unknown player seat ({player_seat=})."
+            raise ValueError(error_message)
+        player_controller: Player_Controller = self.game.player_list[player_seat]
+
+        # Returning:
+        return player_controller
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    RULE METHODS BLOCK
+
+    """
+
+
+    @staticmethod
+    def __card_beats(card_object: Card_Object, card_object_table: Card_Object) -> bool:
+        """
+        TODO: Create a docstring.
+
+        :param Card_Object card_object: ...
+        :param Card_Object card_object_table: ...
+
+        :return bool: ...
+        """
+
+        # Comparing cards (type value already includes trump modifier):
+        card_beats: bool = bool(
+            bool(card_object.suit == card_object_table.suit or card_object.state_trump) and
+            card_object.type_value > card_object_table.type_value
+            )
+
+        # Returning:
+        return card_beats
+
+
+    def legal_action_list(self, player_seat: int) -> list[dict[str, Any]]:
+        """
+        TODO: Create a docstring.
+
+        :param int player_seat: ...
+
+        :return list[dict[str, Any]]: ...
+        """
+
+        # Preparing containers:
+        legal_action_list: list[dict[str, Any]] = []
+        player_controller: Player_Controller = self.find_player(
+            player_seat = player_seat
+            )
+        if self.match_finished or not player_controller.state_active:
+            return legal_action_list
+
+        # Collecting table information:
+        table_map: dict = self.game.table.table_map
+        table_type_list: set[str] = {
+            card_object.type_f for card_object
+            in self.game.table.table_container
+            }
+        table_undefended_list: list[int] = [
+            position_index for position_index in table_map
+            if table_map[position_index][TABLE_STACK_BOTTOM_INDEX] is not None and
+            table_map[position_index][TABLE_STACK_TOP_INDEX] is None
+            ]
+
+        # Attacking actions:
+        if player_controller.state_attacking:
+            defender_hand_count: int = self.game.player_list[1 - player_seat].hand.hand_count
+            attack_allowed: bool = bool(
+                self.game.table.find_empty_position() is not None and
+                len(table_undefended_list) < defender_hand_count
+                )
+            if attack_allowed:
+                for hand_index, card_object in enumerate(player_controller.hand.hand_container):
+                    if len(table_type_list) == 0 or card_object.type_f in table_type_list:
+                        legal_action_list.append({
+                            "action": SERVER_ACTION_ATTACK,
+                            "index": hand_index,
+                            })
+
+            # Ending the round (all cards defended):
+            if self.game.table.table_container_count > 0 and len(table_undefended_list) == 0:
+                legal_action_list.append({
+                    "action": SERVER_ACTION_DISCARD,
+                    })
+
+        # Defending actions:
+        elif player_controller.state_defending and len(table_undefended_list) > 0:
+            for position_index in table_undefended_list:
+                card_object_table: Card_Object = table_map[position_index][TABLE_STACK_BOTTOM_INDEX]
+                for hand_index, card_object in enumerate(player_controller.hand.hand_container):
+                    if self.__card_beats(card_object, card_object_table):
+                        legal_action_list.append({
+                            "action": SERVER_ACTION_DEFEND,
+                            "index": hand_index,
+                            "position": position_index,
+                            })
+            legal_action_list.append({
+                "action": SERVER_ACTION_TAKE,
+                })
+
+        # Returning:
+        return legal_action_list
+
+
+    def apply_action(self, player_seat: int, action_request: dict[str, Any]) -> None:
+        """
+        Applies a player action. Actions are validated against the legal action list, so clients
+        cannot push the game controller into an inconsistent state.
+
+        :param int player_seat: ...
+        :param dict[str, Any] action_request: ...
+
+        :raise ValueError: if action is not legal.
+        """
+
+        # Validating action:
+        action_legal: dict[str, Any] = {
+            action_key: action_request[action_key]
+            for action_key in ("action", "index", "position")
+            if action_key in action_request
+            }
+        if action_legal not in self.legal_action_list(player_seat = player_seat):
+            error_message: str = f"Illegal action ({action_legal})."
+            raise ValueError(error_message)
+
+        # Acquiring players:
+        player_controller: Player_Controller = self.find_player(
+            player_seat = player_seat
+            )
+        action_type: str = action_legal["action"]
+
+        # Attacking (card goes to the first empty bottom stack position):
+        if action_type == SERVER_ACTION_ATTACK:
+            card_object: Card_Object = player_controller.hand.hand_container[action_legal["index"]]
+            self.game.task_play_card(
+                card_object = card_object,
+                player_controller = player_controller,
+                position_index = self.game.table.find_empty_position(),
+                stack_index = TABLE_STACK_BOTTOM_INDEX,
+                )
+            self.game.switch_players_active()
+
+        # Defending (card covers selected position):
+        elif action_type == SERVER_ACTION_DEFEND:
+            card_object: Card_Object = player_controller.hand.hand_container[action_legal["index"]]
+            self.game.task_play_card(
+                card_object = card_object,
+                player_controller = player_controller,
+                position_index = action_legal["position"],
+                stack_index = TABLE_STACK_TOP_INDEX,
+                )
+            self.game.switch_players_active()
+
+        # Taking all cards from the table (attacker keeps attacking):
+        elif action_type == SERVER_ACTION_TAKE:
+            self.game.task_sweep_cards_hand(
+                player_controller = player_controller
+                )
+            self.__fill_hands()
+            self.game.switch_players_active()
+
+        # Discarding defended cards (defender becomes attacker):
+        elif action_type == SERVER_ACTION_DISCARD:
+            self.game.task_sweep_cards_discard()
+            self.__fill_hands()
+            self.game.switch_players_focus()
+            self.game.switch_players_active()
+
+        # Updating playable state and checking if match is finished:
+        for player_controller_update in self.game.player_list:
+            self.game.task_update_hand(
+                player_controller = player_controller_update,
+                update_position = False,
+                update_state = True,
+                table_map = self.game.table.table_map,
+                )
+        self.__update_match_finished()
+
+
+    def __fill_hands(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Filling attacker's hand first, defender's second:
+        player_fill_list: tuple[Player_Controller, ...] = (
+            self.game.player_attacking,
+            self.game.player_defending,
+            )
+        for player_controller in player_fill_list:
+            if player_controller.hand.hand_count < HAND_CARD_COUNT_DEFAULT:
+                self.game.task_fill_hand(
+                    player_controller = player_controller
+                    )
+                self.game.task_update_hand(
+                    player_controller = player_controller,
+                    update_position = True,
+                    update_state = False,
+                    )
+
+
+    def __update_match_finished(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Match is finished once the deck is empty and one of the hands is empty:
+        match_finished: bool = bool(
+            self.game.deck.deck_count == 0 and
+            any(
+                player_controller.hand.hand_count == 0
+                for player_controller in self.game.player_list
+                ) and
+            self.game.table.table_container_count == 0
+            )
+        self.__match_finished: bool = match_finished
+
+
+    def create_state(self, player_seat: int) -> dict[str, Any]:
+        """
+        Generates a JSON-friendly state, as seen by the player (opponent's hand is hidden).
+
+        :param int player_seat: ...
+
+        :return dict[str, Any]: ...
+        """
+
+        # Collecting state:
+        player_controller: Player_Controller = self.find_player(
+            player_seat = player_seat
+            )
+        opponent_controller: Player_Controller = self.find_player(
+            player_seat = 1 - player_seat
+            )
+        table_map: dict = self.game.table.table_map
+        match_state: dict[str, Any] = {
+            "match": self.match_id,
+            "finished": self.match_finished,
+            "active": player_controller.state_active,
+            "attacking": player_controller.state_attacking,
+            "trump": self.game.deck.deck_trump_repr,
+            "deck": self.game.deck.deck_count,
+            "discard": self.game.discard.discard_count,
+            "hand": [repr(card_object) for card_object in player_controller.hand.hand_container],
+            "opponent": opponent_controller.hand.hand_count,
+            "table": [
+                [
+                    repr(table_map[position_index][stack_index])
+                    if table_map[position_index][stack_index] is not None else None
+                    for stack_index in (TABLE_STACK_BOTTOM_INDEX, TABLE_STACK_TOP_INDEX)
+                    ]
+                for position_index in table_map
+                ],
+            "actions": self.legal_action_list(
+                player_seat = player_seat
+                ),
+            }
+
+        # Returning:
+        return match_state
+
+
+    def tick(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Advancing card slide logic:
+        self.game.handle_slide()
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SERVER METRICS CLASS OBJECT BLOCK
+
+"""
+
+
+class Server_Metrics:
+
+    def __init__(self) -> None:
+
+        # Samples (bounded):
+        self.__latency_sample_list: collections.deque[float] = collections.deque(
+            maxlen = SERVER_METRICS_SAMPLE_SIZE
+            )
+        self.__tick_sample_list: collections.deque[float] = collections.deque(
+            maxlen = SERVER_METRICS_SAMPLE_SIZE
+            )
+
+        # Counters:
+        self.action_count: int = 0
+        self.action_error_count: int = 0
+        self.match_error_count: int = 0
+        self.match_closed_count: int = 0
+        self.client_dropped_count: int = 0
+        self.match_count_peak: int = 0
+        self.tick_count: int = 0
+        self.tick_overrun_count: int = 0
+
+
+    @staticmethod
+    def __calculate_percentile(sample_list: collections.deque[float], percentile: float) -> float:
+        """
+        TODO: Create a docstring.
+
+        :param deque[float] sample_list: ...
+        :param float percentile: 0.0 to 1.0.
+
+        :return float: ...
+        """
+
+        # Calculating nearest-rank percentile:
+        percentile_value: float = 0.0
+        if len(sample_list) > 0:
+            sample_sorted: list[float] = sorted(sample_list)
+            sample_index: int = min(
+                len(sample_sorted) - 1,
+                int(percentile * len(sample_sorted))
+                )
+            percentile_value: float = sample_sorted[sample_index]
+
+        # Returning:
+        return percentile_value
+
+
+    def record_latency(self, latency: float) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param float latency: Seconds between receiving an action and sending its response.
+        """
+
+        # Adding sample:
+        self.__latency_sample_list.append(latency)
+        self.action_count += 1
+
+
+    def record_tick(self, tick_duration: float) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param float tick_duration: Seconds spent processing one tick.
+        """
+
+        # Adding sample:
+        self.__tick_sample_list.append(tick_duration)
+        self.tick_count += 1
+        if tick_duration > SERVER_TICK_RATE:
+            self.tick_overrun_count += 1
+
+
+    def create_report(self, match_count: int) -> dict[str, Any]:
+        """
+        TODO: Create a docstring.
+
+        :param int match_count: ...
+
+        :return dict[str, Any]: ...
+        """
+
+        # Calculating tick load (share of tick interval spent working, one loop uses one core):
+        tick_mean: float = 0.0
+        if len(self.__tick_sample_list) > 0:
+            tick_mean: float = sum(self.__tick_sample_list) / len(self.__tick_sample_list)
+        tick_load: float = tick_mean / SERVER_TICK_RATE
+
+        # Estimating matches one core could hold at the current per-match cost (peak count is used,
+        # as tick samples are collected over the whole run):
+        match_capacity: float = 0.0
+        if tick_load > 0 and self.match_count_peak > 0:
+            match_capacity: float = self.match_count_peak / tick_load
+
+        # Packing up:
+        metrics_report: dict[str, Any] = {
+            "matches": match_count,
+            "matches_peak": self.match_count_peak,
+            "matches_per_core": round(match_count / (os.cpu_count() or 1), 3),
+            "matches_per_core_capacity": round(match_capacity, 1),
+            "tick_load": round(tick_load, 4),
+            "tick_count": self.tick_count,
+            "tick_overrun_count": self.tick_overrun_count,
+            "action_count": self.action_count,
+            "action_error_count": self.action_error_count,
+            "match_error_count": self.match_error_count,
+            "match_closed_count": self.match_closed_count,
+            "action_latency_p50_ms": round(
+                self.__calculate_percentile(self.__latency_sample_list, 0.50) * 1000, 3
+                ),
+            "action_latency_p99_ms": round(
+                self.__calculate_percentile(self.__latency_sample_list, 0.99) * 1000, 3
+                ),
+            "client_dropped_count": self.client_dropped_count,
+            }
+
+        # Returning:
+        return metrics_report
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SERVER CONNECTION CLASS OBJECT BLOCK
+
+"""
+
+
+class Server_Connection:
+    """
+    Client connection with a bounded response queue. Responses are written by a separate task, so a
+    slow reader never stalls the tick loop; if its queue overflows, the client is dropped.
+
+    Connection is bound to a single match and seat on join, it can only act and read state there.
+    """
+
+    def __init__(self,
+                 stream_reader: asyncio.StreamReader,
+                 stream_writer: asyncio.StreamWriter,
+                 server_metrics: Server_Metrics,
+                 ) -> None:
+
+        # Streams:
+        self.stream_reader: asyncio.StreamReader = stream_reader
+        self.stream_writer: asyncio.StreamWriter = stream_writer
+
+        # Response queue and state:
+        self.__response_queue: asyncio.Queue = asyncio.Queue(
+            maxsize = SERVER_CLIENT_QUEUE_SIZE
+            )
+        self.__server_metrics: Server_Metrics = server_metrics
+        self.connection_closed: bool = False
+
+        # Joined match and seat (None until joined):
+        self.match_id: int | None = None
+        self.player_seat: int | None = None
+
+        self.__writer_task: asyncio.Task = asyncio.create_task(self.__write_responses())
+
+
+    def send(self, response: dict[str, Any]) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param dict[str, Any] response: ...
+        """
+
+        # Queueing response, dropping slow client on overflow:
+        if not self.connection_closed:
+            response_line: bytes = json.dumps(response, separators = (",", ":")).encode() + b"\n"
+            try:
+                self.__response_queue.put_nowait(response_line)
+            except asyncio.QueueFull:
+                self.__server_metrics.client_dropped_count += 1
+                self.close()
+
+
+    async def send_last(self, response: dict[str, Any]) -> None:
+        """
+        Writes queued responses and a final one, before the connection is closed.
+
+        :param dict[str, Any] response: ...
+        """
+
+        # Writing directly (writer task is stopped first, so responses are not written twice):
+        if not self.connection_closed:
+            self.__writer_task.cancel()
+            try:
+                while not self.__response_queue.empty():
+                    self.stream_writer.write(self.__response_queue.get_nowait())
+                self.stream_writer.write(json.dumps(response, separators = (",", ":")).encode() + b"\n")
+                await asyncio.wait_for(
+                    self.stream_writer.drain(),
+                    timeout = SERVER_CLIENT_DRAIN_TIMEOUT,
+                    )
+            except (ConnectionError, asyncio.TimeoutError):
+                pass
+
+
+    async def __write_responses(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Writing responses, waiting for the socket to drain (with timeout):
+        try:
+            while not self.connection_closed:
+                response_line: bytes = await self.__response_queue.get()
+                self.stream_writer.write(response_line)
+                await asyncio.wait_for(
+                    self.stream_writer.drain(),
+                    timeout = SERVER_CLIENT_DRAIN_TIMEOUT,
+                    )
+        except asyncio.TimeoutError:
+            self.__server_metrics.client_dropped_count += 1
+            self.close()
+        except (ConnectionError, asyncio.CancelledError):
+            self.close()
+
+
+    def close(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Closing connection:
+        if not self.connection_closed:
+            self.connection_closed: bool = True
+            self.stream_writer.close()
+            if self.__writer_task is not asyncio.current_task():
+                self.__writer_task.cancel()
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+GAME SERVER CLASS OBJECT BLOCK
+
+"""
+
+
+class Game_Server:
+
+    def __init__(self,
+                 server_host: str = SERVER_HOST_DEFAULT,
+                 server_port: int = SERVER_PORT_DEFAULT
+                 ) -> None:
+
+        # Connection attributes:
+        self.__server_host: str = server_host
+        self.__server_port: int = server_port
+        self.__server: asyncio.Server | None = None
+
+        # Matches and joined seats ((match id, seat) to connection):
+        self.__match_map: dict[int, Match_Controller] = {}
+        self.__match_id_next: int = 0
+        self.__seat_map: dict[tuple[int, int], Server_Connection] = {}
+        self.__match_unjoined_map: dict[int, float] = {}    # <- Match id to creation time, until first join
+
+        # Tick loop and metrics:
+        self.__tick_task: asyncio.Task | None = None
+        self.__server_metrics: Server_Metrics = Server_Metrics()
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SERVER PROPERTIES BLOCK
+
+    """
+
+
+    @property
+    def server_port(self) -> int:
+        """
+        Actual port (useful, when started with port 0).
+        """
+
+        # Reading bound socket port:
+        server_port: int = self.__server_port
+        if self.__server is not None:
+            server_port: int = self.__server.sockets[0].getsockname()[1]
+
+        # Returning:
+        return server_port
+
+
+    @property
+    def server_metrics(self) -> Server_Metrics:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return self.__server_metrics
+
+
+    @property
+    def match_count(self) -> int:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Returning:
+        return len(self.__match_map)
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    SERVER LIFECYCLE METHODS BLOCK
+
+    """
+
+
+    async def start(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Starting socket server and tick loop:
+        self.__server: asyncio.Server = await asyncio.start_server(
+            self.__handle_connection,
+            host = self.__server_host,
+            port = self.__server_port,
+            limit = SERVER_MESSAGE_SIZE_MAX,
+            )
+        self.__tick_task: asyncio.Task = asyncio.create_task(self.__run_tick_loop())
+
+
+    async def stop(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Stopping tick loop and socket server:
+        if self.__tick_task is not None:
+            self.__tick_task.cancel()
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+
+    async def serve_forever(self) -> None:
+        """
+        TODO: Create a docstring.
+        """
+
+        # Starting and serving:
+        await self.start()
+        async with self.__server:
+            await self.__server.serve_forever()
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    TICK LOOP METHODS BLOCK
+
+    """
+
+
+    async def __run_tick_loop(self) -> None:
+        """
+        Fixed-rate logic tick. Pending actions are applied per match, then every match advances by
+        one logic step; late ticks are not replayed, the schedule is resynchronized instead. Finished
+        matches and matches nobody joined in time are closed.
+        """
+
+        # Scheduling ticks:
+        event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        tick_next: float = event_loop.time()
+        while True:
+            tick_started: float = time.perf_counter()
+            for match_controller in tuple(self.__match_map.values()):
+                try:
+                    self.__process_match_queue(
+                        match_controller = match_controller
+                        )
+                    match_controller.tick()
+
+                    # Closing finished match (last action's response already carries final state):
+                    if match_controller.match_finished:
+                        self.__close_match(
+                            match_id = match_controller.match_id,
+                            close_reason = "Match finished before action was applied.",
+                            )
+
+                # Closing match on unexpected error (its state can not be trusted, other matches
+                # keep running):
+                except Exception as match_error:
+                    self.__server_metrics.match_error_count += 1
+                    self.__close_match(
+                        match_id = match_controller.match_id,
+                        close_reason = f"Match closed on server error ({match_error!r}).",
+                        )
+
+            # Closing matches nobody joined in time:
+            for match_id, match_created in tuple(self.__match_unjoined_map.items()):
+                if tick_started - match_created > SERVER_MATCH_JOIN_TIMEOUT:
+                    self.__close_match(
+                        match_id = match_id,
+                        close_reason = "Match closed, nobody joined.",
+                        )
+            self.__server_metrics.record_tick(
+                tick_duration = time.perf_counter() - tick_started
+                )
+
+            # Sleeping until next tick:
+            tick_next += SERVER_TICK_RATE
+            tick_delay: float = tick_next - event_loop.time()
+            if tick_delay < 0:
+                tick_next: float = event_loop.time()
+                tick_delay: float = 0
+            await asyncio.sleep(tick_delay)
+
+
+    def __process_match_queue(self, match_controller: Match_Controller) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Match_Controller match_controller: ...
+        """
+
+        # Applying limited number of actions per tick:
+        action_processed: int = 0
+        match_queue: asyncio.Queue = match_controller.match_queue
+        while action_processed < SERVER_TICK_ACTION_LIMIT and not match_queue.empty():
+            server_connection, player_seat, action_request, action_received = match_queue.get_nowait()
+            action_processed += 1
+
+            # Applying action (seat connection had joined, when action was queued):
+            try:
+                match_controller.apply_action(
+                    player_seat = player_seat,
+                    action_request = action_request,
+                    )
+                response: dict[str, Any] = {
+                    "id": action_request.get("id"),
+                    "ok": True,
+                    "state": match_controller.create_state(
+                        player_seat = player_seat
+                        ),
+                    }
+            except (ValueError, IndexError) as action_error:
+                self.__server_metrics.action_error_count += 1
+                response: dict[str, Any] = {
+                    "id": action_request.get("id"),
+                    "ok": False,
+                    "error": str(action_error),
+                    }
+            except Exception as action_error:
+                self.__server_metrics.action_error_count += 1
+                server_connection.send({
+                    "id": action_request.get("id"),
+                    "ok": False,
+                    "error": f"Server error ({action_error!r}).",
+                    })
+                raise
+
+            # Responding:
+            server_connection.send(response)
+            self.__server_metrics.record_latency(
+                latency = time.perf_counter() - action_received
+                )
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    CONNECTION HANDLER METHODS BLOCK
+
+    """
+
+
+    async def __handle_connection(self,
+                                  stream_reader: asyncio.StreamReader,
+                                  stream_writer: asyncio.StreamWriter
+                                  ) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param StreamReader stream_reader: ...
+        :param StreamWriter stream_writer: ...
+        """
+
+        # Creating connection:
+        server_connection: Server_Connection = Server_Connection(
+            stream_reader = stream_reader,
+            stream_writer = stream_writer,
+            server_metrics = self.__server_metrics,
+            )
+
+        # Reading requests, one line per request:
+        try:
+            while not server_connection.connection_closed:
+
+                # Reading line (oversized line closes the connection, the rest of it can not be
+                # told apart from the next request):
+                try:
+                    request_line: bytes = await stream_reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    await server_connection.send_last({
+                        "id": None,
+                        "ok": False,
+                        "error": f"Request line is longer than {SERVER_MESSAGE_SIZE_MAX} bytes.",
+                        })
+                    break
+                if not request_line:
+                    break
+                request_received: float = time.perf_counter()
+                request: Any = None
+                try:
+                    request: dict[str, Any] = json.loads(request_line)
+                    await self.__handle_request(
+                        server_connection = server_connection,
+                        request = request,
+                        request_received = request_received,
+                        )
+                except (ValueError, KeyError, TypeError) as request_error:
+                    server_connection.send({
+                        "id": request.get("id") if isinstance(request, dict) else None,
+                        "ok": False,
+                        "error": str(request_error),
+                        })
+        except (
+            ConnectionError,
+            asyncio.CancelledError,
+            asyncio.LimitOverrunError,
+            asyncio.IncompleteReadError,
+            ):
+            pass
+        finally:
+            self.__leave_match(
+                server_connection = server_connection
+                )
+            server_connection.close()
+
+
+    async def __handle_request(self,
+                               server_connection: Server_Connection,
+                               request: dict[str, Any],
+                               request_received: float,
+                               ) -> None:
+        """
+        TODO: Create a docstring.
+
+        :param Server_Connection server_connection: ...
+        :param dict[str, Any] request: ...
+        :param float request_received: ...
+
+        :raise KeyError: if match does not exist.
+        :raise ValueError: if request is not recognized, or not allowed for the connection.
+        """
+
+        # Acquiring request type:
+        request_type: str = request["op"]
+        request_id: Any = request.get("id")
+
+        # Creating a match (built on the loop thread, random state and class caches are shared):
+        if request_type == SERVER_REQUEST_CREATE:
+            match_id: int = self.__match_id_next
+            self.__match_id_next += 1
+            match_controller: Match_Controller = Match_Controller(
+                match_id = match_id
+                )
+            self.__match_map[match_id] = match_controller
+            self.__match_unjoined_map[match_id] = time.perf_counter()
+            self.__server_metrics.match_count_peak = max(
+                self.__server_metrics.match_count_peak,
+                self.match_count,
+                )
+            server_connection.send({
+                "id": request_id,
+                "ok": True,
+                "match": match_id,
+                })
+
+        # Joining a match seat:
+        elif request_type == SERVER_REQUEST_JOIN:
+            self.__join_match(
+                server_connection = server_connection,
+                match_id = request["match"],
+                player_seat = request["seat"],
+                )
+            server_connection.send({
+                "id": request_id,
+                "ok": True,
+                "match": server_connection.match_id,
+                "seat": server_connection.player_seat,
+                })
+
+        # Queueing an action (awaiting free space applies backpressure to the client):
+        elif request_type == SERVER_REQUEST_ACTION:
+            match_controller: Match_Controller = self.__find_joined_match(
+                server_connection = server_connection,
+                request = request,
+                )
+            await match_controller.match_queue.put(
+                (server_connection, server_connection.player_seat, request, request_received)
+                )
+
+            # Answering, if match was closed while waiting for free space:
+            if self.__match_map.get(match_controller.match_id) is not match_controller:
+                self.__answer_match_queue(
+                    match_controller = match_controller,
+                    close_reason = "Match closed before action was applied.",
+                    )
+
+        # Responding with match state:
+        elif request_type == SERVER_REQUEST_STATE:
+            match_controller: Match_Controller = self.__find_joined_match(
+                server_connection = server_connection,
+                request = request,
+                )
+            server_connection.send({
+                "id": request_id,
+                "ok": True,
+                "state": match_controller.create_state(
+                    player_seat = server_connection.player_seat
+                    ),
+                })
+
+        # Closing a match (pending actions are answered with an error):
+        elif request_type == SERVER_REQUEST_CLOSE:
+            match_controller: Match_Controller = self.__find_joined_match(
+                server_connection = server_connection,
+                request = request,
+                )
+            self.__close_match(
+                match_id = match_controller.match_id,
+                close_reason = "Match closed before action was applied.",
+                )
+            server_connection.send({
+                "id": request_id,
+                "ok": True,
+                })
+
+        # Responding with server metrics:
+        elif request_type == SERVER_REQUEST_METRICS:
+            server_connection.send({
+                "id": request_id,
+                "ok": True,
+                "metrics": self.__server_metrics.create_report(
+                    match_count = self.match_count
+                    ),
+                })
+
+        # Raising error, if request type is not recognized:
+        else:
+            error_message: str = f"Unknown request ({request_type=})."
+            raise ValueError(error_message)
+
+
+    """
+    %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+    MATCH SEAT METHODS BLOCK
+
+    """
+
+
+    def __join_match(self, server_connection: Server_Connection, match_id: int, player_seat: int) -> None:
+        """
+        Binds connection to a free seat of a match.
+
+        :param Server_Connection server_connection: ...
+        :param int match_id: ...
+        :param int player_seat: ...
+
+        :raise KeyError: if match does not exist.
+        :raise ValueError: if connection already joined, seat is not recognized or taken.
+        """
+
+        # Checking connection, match and seat:
+        if server_connection.match_id is not None:
+            error_message: str = f"Connection already joined a match ({server_connection.match_id=})."
+            raise ValueError(error_message)
+        self.__match_map[match_id].find_player(
+            player_seat = player_seat
+            )
+        if (match_id, player_seat) in self.__seat_map:
+            error_message: str = f"Seat is taken ({match_id=}, {player_seat=})."
+            raise ValueError(error_message)
+
+        # Binding:
+        self.__match_unjoined_map.pop(match_id, None)
+        self.__seat_map[(match_id, player_seat)] = server_connection
+        server_connection.match_id: int = match_id
+        server_connection.player_seat: int = player_seat
+
+
+    def __leave_match(self, server_connection: Server_Connection) -> None:
+        """
+        Frees connection's seat (connection closed or match closed). Match is closed, once its last
+        seat is free.
+
+        :param Server_Connection server_connection: ...
+        """
+
+        # Unbinding:
+        match_id: int | None = server_connection.match_id
+        if match_id is not None:
+            self.__seat_map.pop((match_id, server_connection.player_seat), None)
+            server_connection.match_id: int | None = None
+            server_connection.player_seat: int | None = None
+
+            # Closing abandoned match (if not closed already):
+            match_abandoned: bool = bool(
+                match_id in self.__match_map and
+                (match_id, 0) not in self.__seat_map and
+                (match_id, 1) not in self.__seat_map
+                )
+            if match_abandoned:
+                self.__close_match(
+                    match_id = match_id,
+                    close_reason = "Match closed, every player left.",
+                    )
+
+
+    def __find_joined_match(self, server_connection: Server_Connection, request: dict[str, Any]) -> Match_Controller:
+        """
+        Match connection joined. Match and seat in request are optional, but must be the joined ones.
+
+        :param Server_Connection server_connection: ...
+        :param dict[str, Any] request: ...
+
+        :raise ValueError: if connection has not joined, or request names another match or seat.
+
+        :return Match_Controller: ...
+        """
+
+        # Checking binding:
+        if server_connection.match_id is None:
+            error_message: str = "Connection has not joined a match."
+            raise ValueError(error_message)
+        request_other: bool = bool(
+            request.get("match", server_connection.match_id) != server_connection.match_id or
+            request.get("seat", server_connection.player_seat) != server_connection.player_seat
+            )
+        if request_other:
+            error_message: str = (
+                f"Connection is joined to another match or seat "
+                f"({server_connection.match_id=}, {server_connection.player_seat=})."
+                )
+            raise ValueError(error_message)
+
+        # Returning:
+        return self.__match_map[server_connection.match_id]
+
+
+    def __close_match(self, match_id: int, close_reason: str) -> None:
+        """
+        Removes match, frees its seats and answers its pending actions with an error.
+
+        :param int match_id: ...
+        :param str close_reason: Error sent for every pending action.
+        """
+
+        # Removing match and seats:
+        match_controller: Match_Controller | None = self.__match_map.pop(match_id, None)
+        if match_controller is None:
+            return
+        self.__match_unjoined_map.pop(match_id, None)
+        self.__server_metrics.match_closed_count += 1
+        for player_seat in (0, 1):
+            server_connection: Server_Connection | None = self.__seat_map.get((match_id, player_seat))
+            if server_connection is not None:
+                self.__leave_match(
+                    server_connection = server_connection
+                    )
+
+        # Answering pending actions:
+        self.__answer_match_queue(
+            match_controller = match_controller,
+            close_reason = close_reason,
+            )
+
+
+    def __answer_match_queue(self, match_controller: Match_Controller, close_reason: str) -> None:
+        """
+        Answers every pending action of a closed match with an error.
+
+        :param Match_Controller match_controller: ...
+        :param str close_reason: ...
+        """
+
+        # Answering:
+        match_queue: asyncio.Queue = match_controller.match_queue
+        while not match_queue.empty():
+            server_connection, _, action_request, _ = match_queue.get_nowait()
+            self.__server_metrics.action_error_count += 1
+            server_connection.send({
+                "id": action_request.get("id"),
+                "ok": False,
+                "error": close_reason,
+                })
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+RUN FUNCTION BLOCK
+
+"""
+
+
+def run_server() -> None:
+    """
+    Runs the headless server (python -m game.server), or a loopback test with --loopback.
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Headless multi-match game server."
+        )
+    argument_parser.add_argument("--host", default = SERVER_HOST_DEFAULT)
+    argument_parser.add_argument("--port", type = int, default = SERVER_PORT_DEFAULT)
+    argument_parser.add_argument(
+        "--loopback",
+        type = int,
+        default = 0,
+        metavar = "MATCHES",
+        help = "Run a loopback test with given number of matches and print metrics.",
+        )
+    argument_parser.add_argument("--actions", type = int, default = 50)
+    arguments: argparse.Namespace = argument_parser.parse_args()
+
+    # Running loopback test:
+    if arguments.loopback > 0:
+        from game.client import run_loopback
+        metrics_report: dict[str, Any] = asyncio.run(
+            run_loopback(
+                match_count = arguments.loopback,
+                action_count = arguments.actions,
+                )
+            )
+        print(json.dumps(metrics_report, indent = 4))
+
+    # Running server:
+    else:
+        game_server: Game_Server = Game_Server(
+            server_host = arguments.host,
+            server_port = arguments.port,
+            )
+        asyncio.run(game_server.serve_forever())
+
+
+if __name__ == "__main__":
+    run_server()
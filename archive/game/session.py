@@ -1,5 +1,8 @@
 # Dataclass import:
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+# System management import:
+import os
 
 # Collections import:
 from game.collections.texturepack import (
@@ -26,7 +29,21 @@ from game.variables import (
     TEXTURE_PACK_MODE_DARK,
 
     # Sort-related variables:
-    HAND_SORT_METHOD_BY_VALUE_DEFAULT
+    HAND_SORT_METHOD_BY_VALUE_DEFAULT,
+
+    # Validation mode variables:
+    SESSION_VALIDATION_ENVIRON,
+    SESSION_VALIDATION_MODE_DEBUG,
+    SESSION_VALIDATION_MODE_PRODUCTION,
+
+    # Memory profiler variables:
+    SESSION_PROFILER_ENVIRON,
+
+    # Telemetry variables:
+    SESSION_TELEMETRY_ENVIRON,
+
+    # Input report variables:
+    SESSION_INPUT_REPORT_ENVIRON,
     )
 
 # Settings import:
@@ -37,6 +54,10 @@ from game.settings import (
     DECK_LOWEST_VALUE_EXTENDED,
     DECK_RENDER_SHIFT_THRESHOLD_DEFAULT,
     DECK_RENDER_SHIFT_THRESHOLD_EXTENDED,
+    DECK_COPY_COUNT_DEFAULT,
+
+    # Player settings:
+    PLAYER_COUNT_DEFAULT,
     )
 
 
@@ -47,11 +68,29 @@ SESSION GLOBAL VARIABLES BLOCK
 """
 
 
+# Validation mode (chosen once at startup, "python -O" always runs in production mode):
+SESSION_VALIDATION_MODE: str = os.environ.get(
+    SESSION_VALIDATION_ENVIRON, 
+    SESSION_VALIDATION_MODE_DEBUG,
+    ).lower()
+if SESSION_VALIDATION_MODE not in (SESSION_VALIDATION_MODE_DEBUG, SESSION_VALIDATION_MODE_PRODUCTION):
+    error_message: str = f"Unknown validation mode ({SESSION_VALIDATION_ENVIRON}={SESSION_VALIDATION_MODE})."
+    raise ValueError(error_message)
+
 # Global (debug) session variables:
-SESSION_ENABLE_ASSERTION: bool = True
+SESSION_ENABLE_ASSERTION: bool = __debug__ and SESSION_VALIDATION_MODE == SESSION_VALIDATION_MODE_DEBUG
 SESSION_ENABLE_ECHO:      bool = True
 SESSION_ENABLE_DEBUG:     bool = True
 
+# Memory profiler (opt-in, can also be toggled with a debug key):
+SESSION_ENABLE_PROFILER:  bool = os.environ.get(SESSION_PROFILER_ENVIRON, "0") not in ("", "0")
+
+# Telemetry (opt-in, game events are written to a JSON Lines file):
+SESSION_ENABLE_TELEMETRY: bool = os.environ.get(SESSION_TELEMETRY_ENVIRON, "0") not in ("", "0")
+
+# Input latency report (opt-in, printed when the window is closed):
+SESSION_ENABLE_INPUT_REPORT: bool = os.environ.get(SESSION_INPUT_REPORT_ENVIRON, "0") not in ("", "0")
+
 
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -62,11 +101,11 @@ SESSION DATACLASS OBJECT BLOCK
 @dataclass(order = True)
 class Session_Controller:
 
-    # Texture pack session variables:
-    texture_pack_front_default: Texture_Pack = TEXTURE_PACK_FRONT_LIGHT_DEFAULT
-    texture_pack_front:         Texture_Pack = TEXTURE_PACK_FRONT_LIGHT_DEFAULT
-    texture_pack_back_default:  Texture_Pack = TEXTURE_PACK_BACK_LIGHT_DEFAULT
-    texture_pack_back:          Texture_Pack = TEXTURE_PACK_BACK_LIGHT_DEFAULT
+    # Texture pack session variables (copied per session, switching packs mutates them in place):
+    texture_pack_front_default: Texture_Pack = field(default_factory = TEXTURE_PACK_FRONT_LIGHT_DEFAULT.create_copy)
+    texture_pack_front:         Texture_Pack = field(default_factory = TEXTURE_PACK_FRONT_LIGHT_DEFAULT.create_copy)
+    texture_pack_back_default:  Texture_Pack = field(default_factory = TEXTURE_PACK_BACK_LIGHT_DEFAULT.create_copy)
+    texture_pack_back:          Texture_Pack = field(default_factory = TEXTURE_PACK_BACK_LIGHT_DEFAULT.create_copy)
 
     # Player name session variables:
     player_one_name_default: str = PLAYER_ONE_NAME_DEFAULT
@@ -77,6 +116,10 @@ class Session_Controller:
     # Game session variables:
     deck_lowest_value_default: int = DECK_LOWEST_VALUE_DEFAULT
     deck_lowest_value:         int = DECK_LOWEST_VALUE_DEFAULT
+    deck_copy_count_default:   int = DECK_COPY_COUNT_DEFAULT
+    deck_copy_count:           int = DECK_COPY_COUNT_DEFAULT
+    player_count_default:      int = PLAYER_COUNT_DEFAULT
+    player_count:              int = PLAYER_COUNT_DEFAULT
 
     # Sort methods:
     sort_method_default: str = HAND_SORT_METHOD_BY_VALUE_DEFAULT
@@ -77,6 +77,7 @@ CARD_SLIDE_TABLE_DISTANCE_Y: int = 0
 # Slide speed settings:
 CARD_SLIDE_SPEED_DEFAULT: int = int(CARD_TEXTURE_HEIGHT_DEFAULT / 5)
 CARD_SLIDE_SPEED_THROTTLE: float = 0.75             # <- Fine-tuned modifier for 1/60 delta time
+CARD_SLIDE_SPEED_BASE_RATE: float = 1 / 60          # <- Logic step rate slide speeds are tuned for
 CARD_SLIDE_SPEED_MODIFIER_DEFAULT: float = 1.00
 CARD_SLIDE_SPEED_MODIFIER_SLOW: float = 0.45
 CARD_SLIDE_SPEED_MODIFIER_FAST: float = 5.00
@@ -197,6 +198,11 @@ DECK_LOWEST_VALUE_DEFAULT: int = 6              # <- Default lowest size, perfec
 DECK_LOWEST_VALUE_EXTENDED: int = 2             # <- Extended size for longer games, or 3+ players
 DECK_SIZE_MAX: int = 52                         # <- Max size, if lowest value is 2
 
+# Deck copy settings (several decks shuffled together):
+DECK_COPY_COUNT_DEFAULT: int = 1
+DECK_COPY_COUNT_MAX: int = 2                    # <- Double deck, up to 104 cards
+DECK_CARD_COUNT_MAX: int = DECK_SIZE_MAX * DECK_COPY_COUNT_MAX
+
 
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -254,6 +260,60 @@ HAND_WIDTH_ALLOWED: int = int(
 # Hand size default:
 HAND_CARD_COUNT_DEFAULT: int = 6
 
+# Opponent hands layout (3+ players share the top zone, one slot per opponent, right of the hint):
+HAND_OPPONENT_AREA_X_LEFT: int = int(GAME_AREA_PLAY_WIDTH * HAND_SIDE_WIDTH_MOD)
+HAND_OPPONENT_AREA_WIDTH: int = GAME_AREA_PLAY_WIDTH - HAND_OPPONENT_AREA_X_LEFT
+HAND_OPPONENT_SLOT_GAP: int = int(CARD_TEXTURE_WIDTH_SCALED / 4)
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PLAYER SETTINGS 
+
+"""
+
+
+PLAYER_COUNT_DEFAULT: int = 2
+PLAYER_COUNT_MIN: int = 2
+PLAYER_COUNT_MAX: int = 6                       # <- Every player is dealt a full hand
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TEXT SETTINGS 
+
+"""
+
+
+# Text default settings:
+TEXT_FONT_NAME_DEFAULT: str = "Verdana"
+TEXT_FONT_SIZE_DEFAULT: int = 10
+TEXT_FONT_SIZE_HINT: int = 12
+TEXT_COLOR_DEFAULT: Color = Color(15, 15, 15, 255)
+TEXT_ZONE_LABEL_SHIFT: int = 4                  # <- Distance from zone's top left corner
+
+# Hint text coordinates (hand value):
+TEXT_HINT_HAND_PLAYER_ONE_COORDINATE_X: int = int(GAME_AREA_PLAY_WIDTH * HAND_SIDE_WIDTH_MOD / 2)
+TEXT_HINT_HAND_PLAYER_ONE_COORDINATE_Y: int = HAND_PLAYER_ONE_COORDINATE_Y
+TEXT_HINT_HAND_PLAYER_TWO_COORDINATE_X: int = int(GAME_AREA_PLAY_WIDTH * HAND_SIDE_WIDTH_MOD / 2)
+TEXT_HINT_HAND_PLAYER_TWO_COORDINATE_Y: int = HAND_PLAYER_TWO_COORDINATE_Y
+
+# Hint text coordinates (discard value):
+TEXT_HINT_DISCARD_COORDINATE_X: int = GAME_AREA_SIDE_COORDINATE_X
+TEXT_HINT_DISCARD_COORDINATE_Y: int = int(
+    ZONE_DISCARD_COORDINATE_Y -
+    ZONE_DISCARD_HEIGHT / 2 + 
+    TEXT_FONT_SIZE_HINT * 1.5
+    )
+
+# HUD text coordinates (deck counter):
+TEXT_HUD_DECK_COORDINATE_X: int = GAME_AREA_SIDE_COORDINATE_X
+TEXT_HUD_DECK_COORDINATE_Y: int = int(
+    ZONE_DECK_COORDINATE_Y + 
+    ZONE_DECK_HEIGHT / 2 - 
+    TEXT_FONT_SIZE_HINT * 1.5
+    )
+
 
 """
 %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
@@ -267,6 +327,9 @@ GAME_WINDOW_HEIGHT: int = GAME_AREA_HEIGHT
 GAME_WINDOW_FULLSCREEN: bool = False
 GAME_WINDOW_RESIZABLE: bool = False
 GAME_WINDOW_UPDATE_RATE: float = 1 / 60
+GAME_LOGIC_UPDATE_RATE: float = 1 / 60          # <- Fixed logic step, may be lower than render rate
+GAME_LOGIC_STEP_LIMIT: int = 8                  # <- Logic steps per frame, backlog beyond is dropped
+GAME_LOGIC_SLIDE_MOD: float = GAME_LOGIC_UPDATE_RATE / CARD_SLIDE_SPEED_BASE_RATE
 GAME_WINDOW_ANTIALIASING: bool = True
 GAME_WINDOW_TITLE: str = "{game_name} v{game_version} ({game_window_information})".format(
     game_name = PROJECT_NAME,
@@ -278,4 +341,194 @@ GAME_WINDOW_TITLE: str = "{game_name} v{game_version} ({game_window_information}
         game_window_width = GAME_WINDOW_WIDTH,
         game_window_height = GAME_WINDOW_HEIGHT,
         )
-    )
\ No newline at end of file
+    )
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+ATLAS SETTINGS 
+
+"""
+
+
+# Atlas layout settings:
+ATLAS_FORMAT_VERSION: int = 1                   # <- Bump to rebuild every atlas
+ATLAS_COLUMN_COUNT: int = 13                    # <- Textures per atlas row
+ATLAS_PADDING: int = 1                          # <- Transparent pixels around every texture
+
+# Atlas file settings:
+ATLAS_INDEX_FILENAME: str = "atlas_index.json"
+ATLAS_SOURCE_EXTENSION: str = ".png"
+
+# Decoded texture cache settings (raw RGBA buffers, memory-mapped on load):
+TEXTURE_CACHE_FORMAT_VERSION: int = 1
+TEXTURE_CACHE_RAW_EXTENSION: str = ".rgba"
+TEXTURE_CACHE_INDEX_EXTENSION: str = ".json"
+
+# Texture preload settings (packs are decoded in worker threads, textures are created after):
+TEXTURE_PRELOAD_WORKER_COUNT: int = 4           # <- 1 decodes packs one by one
+
+# Texture warm-up settings (front textures of dealt cards, loaded while cards are moving):
+TEXTURE_WARMUP_CARD_COUNT: int = 2              # <- Cards per logic step, 0 disables warm-up
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TWEEN SETTINGS 
+
+"""
+
+
+# Tween easing table settings:
+TWEEN_TABLE_SIZE: int = 256                     # <- Samples per easing curve
+
+# Tween duration settings (seconds):
+TWEEN_DURATION_HAND: float = 0.30               # <- Deal and sweep to hand
+TWEEN_DURATION_TABLE: float = 0.20              # <- Card played from hand
+TWEEN_DURATION_DISCARD: float = 0.40            # <- Sweep to discard
+TWEEN_STAGGER_DELAY: float = 0.03               # <- Delay between cards started on the same step
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+CULLING SETTINGS 
+
+"""
+
+
+# Occlusion culling settings:
+CULLING_ENABLE: bool = True
+CULLING_CORNER_CHAMFER: int = int(2 * CARD_TEXTURE_WIDTH_SCALED / CARD_TEXTURE_WIDTH_DEFAULT)   # <- Transparent card corners
+CULLING_AREA_EPSILON: float = 0.001            # <- Visible pieces below this area are rounding errors
+CULLING_PIECE_LIMIT: int = 64                   # <- Visible pieces per card before culling gives up
+CULLING_CACHE_SIZE: int = 16                    # <- Card layouts kept (cleared when full)
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PLAYABLE SETTINGS 
+
+"""
+
+
+# Playable state tracker settings:
+PLAYABLE_TRACKER_ENABLE: bool = True            # <- Updates playable state per game event (False, full hand scans)
+PLAYABLE_TRACKER_VERIFY: bool = False           # <- Compares tracked state with a full scan after every task
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+INPUT SETTINGS 
+
+"""
+
+
+# Input metrics settings:
+INPUT_LATENCY_SAMPLE_SIZE: int = 1024           # <- Motion-to-hover latency samples kept
+
+# Key repeat settings (seconds):
+INPUT_KEY_REPEAT_DELAY: float = 0.40            # <- Held key starts repeating after
+INPUT_KEY_REPEAT_INTERVAL: float = 0.06         # <- Held key repeats every
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+PROFILER SETTINGS 
+
+"""
+
+
+# Memory profiler settings (tracemalloc):
+PROFILER_FRAME_INTERVAL: int = 60               # <- Frames between frame snapshots
+PROFILER_TRACEBACK_DEPTH: int = 16              # <- Frames stored per allocation (to reach game code)
+PROFILER_TOP_COUNT: int = 15                    # <- Allocators listed per report
+PROFILER_OUTPUT_PATH_DEFAULT: str = "memory_profile.json"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TELEMETRY SETTINGS 
+
+"""
+
+
+# Telemetry settings (JSON Lines, written by a background thread):
+TELEMETRY_QUEUE_SIZE: int = 8192                # <- Records buffered, new records are dropped when full
+TELEMETRY_WRITE_INTERVAL: float = 0.25          # <- Seconds between writer passes
+TELEMETRY_FILE_SIZE_MAX: int = 4 * 1024 * 1024  # <- Bytes per file before rotation
+TELEMETRY_FILE_BACKUP_COUNT: int = 3            # <- Rotated files kept (telemetry.jsonl.1, ...)
+TELEMETRY_OUTPUT_PATH_DEFAULT: str = "telemetry.jsonl"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SERVER SETTINGS 
+
+"""
+
+
+# Server connection settings (local socket protocol, newline-delimited JSON):
+SERVER_HOST_DEFAULT: str = "127.0.0.1"
+SERVER_PORT_DEFAULT: int = 8765
+SERVER_MESSAGE_SIZE_MAX: int = 4096             # <- Bytes per request line
+
+# Server tick settings:
+SERVER_TICK_RATE: float = GAME_WINDOW_UPDATE_RATE
+SERVER_TICK_ACTION_LIMIT: int = 8               # <- Actions processed per match, per tick
+
+# Server backpressure settings:
+SERVER_MATCH_QUEUE_SIZE: int = 32               # <- Pending actions per match
+SERVER_CLIENT_QUEUE_SIZE: int = 256             # <- Pending responses per client
+SERVER_CLIENT_DRAIN_TIMEOUT: float = 5.0        # <- Seconds before a slow client is dropped
+SERVER_MATCH_JOIN_TIMEOUT: float = 30.0         # <- Seconds a created match waits for its first seat
+
+# Server metrics settings:
+SERVER_METRICS_SAMPLE_SIZE: int = 10_000
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TOURNAMENT SETTINGS 
+
+"""
+
+
+# Tournament run settings:
+TOURNAMENT_GAME_COUNT_DEFAULT: int = 1000
+TOURNAMENT_MOVE_LIMIT: int = 2000               # <- Moves before a game is stopped as unfinished
+TOURNAMENT_SHARD_PER_WORKER: int = 4            # <- Worker tasks per worker (consecutive seeds each)
+TOURNAMENT_SHARD_SIZE_MAX: int = 250            # <- Games per worker task (results are written per task)
+TOURNAMENT_OUTPUT_PATH_DEFAULT: str = "tournament.jsonl"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SOLVER SETTINGS 
+
+"""
+
+
+# Endgame solver settings:
+SOLVER_TABLE_SIZE_POWER: int = 18               # <- Transposition table entries (power of two)
+SOLVER_NODE_LIMIT: int = 100_000                # <- Nodes per solve before it gives up (~0.4 s)
+SOLVER_ZOBRIST_SEED: int = 0
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EVALUATOR SETTINGS 
+
+"""
+
+
+# Position evaluator feature weights (score is from the point of view of the evaluated player,
+# tuned on evaluator against lowest tournaments):
+EVALUATOR_WEIGHT_CARD: float = -1.0             # <- Per card in hand (fewer cards is better)
+EVALUATOR_WEIGHT_CARD_ENDGAME: float = -3.0     # <- Per card in hand, once the deck is empty
+EVALUATOR_WEIGHT_OPPONENT_CARD: float = 0.5     # <- Per card in opponent's hand
+EVALUATOR_WEIGHT_TRUMP: float = 1.0             # <- Per trump in hand
+EVALUATOR_WEIGHT_TRUMP_TYPE: float = 0.1        # <- Per trump type index (high trumps)
+EVALUATOR_WEIGHT_LOW_BURDEN: float = -0.5       # <- Per type below threshold, non-trump cards only
+EVALUATOR_WEIGHT_SUIT_COVERAGE: float = 0.5     # <- Per suit held
+EVALUATOR_WEIGHT_TABLE_DEFENDING: float = -0.25 # <- Per card on table while defending
+EVALUATOR_WEIGHT_ATTACKING: float = 0.5
+EVALUATOR_LOW_TYPE_THRESHOLD: int = 8           # <- Type index cards below are a burden (ten)
@@ -0,0 +1,501 @@
+# Annotations, typing etc. import:
+from __future__ import annotations
+from typing import Any, Callable
+
+# Parallel execution import:
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+# System management, random, time and data import:
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+# Settings import:
+from game.settings import (
+
+    # Tournament settings:
+    TOURNAMENT_GAME_COUNT_DEFAULT,
+    TOURNAMENT_MOVE_LIMIT,
+    TOURNAMENT_SHARD_PER_WORKER,
+    TOURNAMENT_SHARD_SIZE_MAX,
+    TOURNAMENT_OUTPUT_PATH_DEFAULT,
+
+    # Deck settings:
+    DECK_LOWEST_VALUE_DEFAULT,
+    )
+
+# Variables import:
+from game.variables import (
+
+    # Tournament variables:
+    TOURNAMENT_STRATEGY_RANDOM,
+    TOURNAMENT_STRATEGY_LOWEST,
+    TOURNAMENT_STRATEGY_AGGRESSIVE,
+    TOURNAMENT_STRATEGY_ENDGAME,
+    TOURNAMENT_STRATEGY_EVALUATOR,
+    TOURNAMENT_RESULT_DRAW,
+    TOURNAMENT_RESULT_UNFINISHED,
+
+    # Action variables:
+    SERVER_ACTION_ATTACK,
+    SERVER_ACTION_DEFEND,
+    SERVER_ACTION_TAKE,
+    SERVER_ACTION_DISCARD,
+    )
+
+# Collections import (game state only, tournament never creates controllers or a window):
+from game.collections.state import (
+    Game_State,
+    State_Move,
+    STATE_TYPE_COUNT,
+    STATE_WINNER_DRAW,
+    )
+from game.collections.solver import State_Solver
+from game.collections.evaluator import State_Evaluator, EVALUATOR_AVAILABLE
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+STRATEGY FUNCTION BLOCK
+
+"""
+
+
+def calculate_card_cost(game_state: Game_State, card_id: int) -> int:
+    """
+    Card's worth for the player holding it: type index, trumps are worth more than any other suit.
+
+    :param Game_State game_state: ...
+    :param int card_id: ...
+
+    :return int: ...
+    """
+
+    # Calculating:
+    card_cost: int = card_id % STATE_TYPE_COUNT
+    if card_id // STATE_TYPE_COUNT == game_state.deck_trump_index:
+        card_cost += STATE_TYPE_COUNT
+
+    # Returning:
+    return card_cost
+
+
+def select_move_random(game_state: Game_State,
+                       legal_move_list: list[State_Move],
+                       random_generator: random.Random
+                       ) -> State_Move:
+    """
+    Any legal move.
+
+    :param Game_State game_state: ...
+    :param list[State_Move] legal_move_list: ...
+    :param random.Random random_generator: ...
+
+    :return State_Move: ...
+    """
+
+    # Returning:
+    return random_generator.choice(legal_move_list)
+
+
+def select_move_lowest(game_state: Game_State,
+                       legal_move_list: list[State_Move],
+                       random_generator: random.Random,
+                       attack_trump: bool = False
+                       ) -> State_Move:
+    """
+    Plays the cheapest card available. Attacker opens with any card, but only adds trumps to the
+    table if attack_trump is set; defender takes, if no card beats the table.
+
+    :param Game_State game_state: ...
+    :param list[State_Move] legal_move_list: ...
+    :param random.Random random_generator: Not used, strategies share signature.
+    :param bool attack_trump: ...
+
+    :return State_Move: ...
+    """
+
+    # Splitting moves (card moves and the rest):
+    card_move_list: list[State_Move] = []
+    fallback_move: State_Move | None = None
+    for state_move in legal_move_list:
+        if state_move.action in (SERVER_ACTION_ATTACK, SERVER_ACTION_DEFEND):
+            card_move_list.append(state_move)
+        else:
+            fallback_move: State_Move = state_move
+
+    # Skipping trumps, if table is already open:
+    if not attack_trump and len(game_state.table_list) > 0 and fallback_move is not None:
+        card_move_list: list[State_Move] = [
+            state_move for state_move in card_move_list
+            if state_move.action == SERVER_ACTION_DEFEND or
+            state_move.card_id // STATE_TYPE_COUNT != game_state.deck_trump_index
+            ]
+
+    # Selecting move:
+    selected_move: State_Move | None = fallback_move
+    if len(card_move_list) > 0:
+        selected_move: State_Move = min(
+            card_move_list,
+            key = lambda state_move: calculate_card_cost(game_state, state_move.card_id)
+            )
+
+    # Returning:
+    return selected_move
+
+
+def select_move_aggressive(game_state: Game_State,
+                           legal_move_list: list[State_Move],
+                           random_generator: random.Random
+                           ) -> State_Move:
+    """
+    Same as lowest, but keeps attacking with trumps as long as there is anything to add.
+
+    :param Game_State game_state: ...
+    :param list[State_Move] legal_move_list: ...
+    :param random.Random random_generator: ...
+
+    :return State_Move: ...
+    """
+
+    # Returning:
+    return select_move_lowest(
+        game_state = game_state,
+        legal_move_list = legal_move_list,
+        random_generator = random_generator,
+        attack_trump = True,
+        )
+
+
+def select_move_endgame(game_state: Game_State,
+                         legal_move_list: list[State_Move],
+                         random_generator: random.Random
+                         ) -> State_Move:
+    """
+    Same as lowest, until the deck is empty, then plays the endgame perfectly (see State_Solver).
+    Falls back to lowest, if solver gives up.
+
+    :param Game_State game_state: ...
+    :param list[State_Move] legal_move_list: ...
+    :param random.Random random_generator: ...
+
+    :return State_Move: ...
+    """
+
+    # Solving endgame:
+    selected_move: State_Move | None = None
+    if game_state.deck_count == 0:
+        selected_move: State_Move | None = TOURNAMENT_ENDGAME_SOLVER.find_move(game_state)
+
+    # Falling back:
+    if selected_move is None:
+        selected_move: State_Move = select_move_lowest(
+            game_state = game_state,
+            legal_move_list = legal_move_list,
+            random_generator = random_generator,
+            )
+
+    # Returning:
+    return selected_move
+
+
+def select_move_evaluator(game_state: Game_State,
+                          legal_move_list: list[State_Move],
+                          random_generator: random.Random
+                          ) -> State_Move:
+    """
+    Plays the move leading to the best evaluated position (one move lookahead, see State_Evaluator).
+
+    :param Game_State game_state: ...
+    :param list[State_Move] legal_move_list: ...
+    :param random.Random random_generator: Not used, strategies share signature.
+
+    :return State_Move: ...
+    """
+
+    # Returning:
+    return TOURNAMENT_EVALUATOR.find_move(game_state)
+
+
+# Endgame solver (one per worker process, table is kept between games):
+TOURNAMENT_ENDGAME_SOLVER: State_Solver = State_Solver()
+
+# Position evaluator (only if NumPy is installed):
+TOURNAMENT_EVALUATOR: State_Evaluator | None = State_Evaluator() if EVALUATOR_AVAILABLE else None
+
+# Strategy index (name to move selector):
+TOURNAMENT_STRATEGY_INDEX: dict[str, Callable[..., State_Move]] = {
+    TOURNAMENT_STRATEGY_RANDOM: select_move_random,
+    TOURNAMENT_STRATEGY_LOWEST: select_move_lowest,
+    TOURNAMENT_STRATEGY_AGGRESSIVE: select_move_aggressive,
+    TOURNAMENT_STRATEGY_ENDGAME: select_move_endgame,
+    }
+if EVALUATOR_AVAILABLE:
+    TOURNAMENT_STRATEGY_INDEX[TOURNAMENT_STRATEGY_EVALUATOR] = select_move_evaluator
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+GAME FUNCTION BLOCK
+
+"""
+
+
+def play_game(strategy_list: tuple[str, str],
+              random_seed: int,
+              deck_lowest_value: int
+              ) -> dict[str, Any]:
+    """
+    Plays a single game between two strategies (by seat). Deal and strategy choices depend only on
+    the seed, so any game can be replayed from its result.
+
+    :param tuple[str, str] strategy_list: Strategy names, player one first.
+    :param int random_seed: ...
+    :param int deck_lowest_value: ...
+
+    :return dict[str, Any]: Game result.
+    """
+
+    # Creating game:
+    random_generator: random.Random = random.Random(random_seed)
+    game_state: Game_State = Game_State.create_new(
+        deck_lowest_value = deck_lowest_value,
+        random_seed = random_seed,
+        )
+    select_move_list: tuple[Callable[..., State_Move], ...] = tuple(
+        TOURNAMENT_STRATEGY_INDEX[strategy_name] for strategy_name in strategy_list
+        )
+
+    # Playing until someone is out of cards (or move limit is reached):
+    move_count: int = 0
+    round_count: int = 0
+    while not game_state.state_terminal and move_count < TOURNAMENT_MOVE_LIMIT:
+        state_move: State_Move = select_move_list[game_state.player_active](
+            game_state,
+            game_state.legal_move_list(),
+            random_generator,
+            )
+        game_state: Game_State = game_state.apply_move(state_move)
+        move_count += 1
+        if state_move.action in (SERVER_ACTION_TAKE, SERVER_ACTION_DISCARD):
+            round_count += 1
+
+    # Selecting winner:
+    winner_seat: int | None = game_state.winner
+    if winner_seat is None:
+        winner: str = TOURNAMENT_RESULT_UNFINISHED
+    elif winner_seat == STATE_WINNER_DRAW:
+        winner: str = TOURNAMENT_RESULT_DRAW
+    else:
+        winner: str = strategy_list[winner_seat]
+
+    # Packing up:
+    game_result: dict[str, Any] = {
+        "seed": random_seed,
+        "strategy_list": list(strategy_list),
+        "winner": winner,
+        "winner_seat": winner_seat,
+        "move_count": move_count,
+        "round_count": round_count,
+        }
+
+    # Returning:
+    return game_result
+
+
+def play_shard(strategy_list: tuple[str, str],
+               seed_start: int,
+               game_count: int,
+               deck_lowest_value: int
+               ) -> dict[str, Any]:
+    """
+    Plays games for consecutive seeds in a worker process. Seats are swapped on odd seeds, so both
+    strategies play first equally often.
+
+    :param tuple[str, str] strategy_list: ...
+    :param int seed_start: ...
+    :param int game_count: ...
+    :param int deck_lowest_value: ...
+
+    :return dict[str, Any]: Worker id, time spent and game results.
+    """
+
+    # Playing games:
+    shard_time_start: float = time.perf_counter()
+    game_result_list: list[dict[str, Any]] = []
+    for random_seed in range(seed_start, seed_start + game_count):
+        game_result: dict[str, Any] = play_game(
+            strategy_list = strategy_list if random_seed % 2 == 0 else strategy_list[::-1],
+            random_seed = random_seed,
+            deck_lowest_value = deck_lowest_value,
+            )
+        game_result["slot_swapped"] = random_seed % 2 == 1
+        game_result_list.append(game_result)
+
+    # Packing up:
+    shard_result: dict[str, Any] = {
+        "worker": os.getpid(),
+        "time": time.perf_counter() - shard_time_start,
+        "game_result_list": game_result_list,
+        }
+
+    # Returning:
+    return shard_result
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TOURNAMENT FUNCTION BLOCK
+
+"""
+
+
+def play_tournament(strategy_list: tuple[str, str],
+                    game_count: int,
+                    worker_count: int,
+                    output_path: str,
+                    seed_start: int = 0,
+                    deck_lowest_value: int = DECK_LOWEST_VALUE_DEFAULT,
+                    ) -> dict[str, Any]:
+    """
+    Plays games across a process pool, sharded by seed. Results are written to output file (JSON
+    lines) as soon as their shard completes, aggregates are returned as a report.
+
+    :param tuple[str, str] strategy_list: ...
+    :param int game_count: ...
+    :param int worker_count: ...
+    :param str output_path: ...
+    :param int seed_start: ...
+    :param int deck_lowest_value: ...
+
+    :raise ValueError: if strategy is not recognized.
+
+    :return dict[str, Any]: ...
+    """
+
+    # Checking strategies:
+    for strategy_name in strategy_list:
+        if strategy_name not in TOURNAMENT_STRATEGY_INDEX:
+            error_message: str = f"Unknown strategy ({strategy_name=})."
+            raise ValueError(error_message)
+
+    # Labelling strategy slots (mirror matches need distinct labels):
+    slot_label_list: list[str] = list(strategy_list)
+    if strategy_list[0] == strategy_list[1]:
+        slot_label_list: list[str] = [
+            f"{strategy_name}#{slot_index + 1}"
+            for slot_index, strategy_name in enumerate(strategy_list)
+            ]
+
+    # Preparing counters:
+    slot_win_count_list: list[int] = [0, 0]
+    draw_count: int = 0
+    unfinished_count: int = 0
+    move_count_total: int = 0
+    worker_time_map: dict[int, float] = {}
+    worker_game_count_map: dict[int, int] = {}
+
+    # Calculating shard size (several shards per worker, so none sits idle while others finish):
+    shard_size: int = max(1, min(
+        TOURNAMENT_SHARD_SIZE_MAX,
+        math.ceil(game_count / (worker_count * TOURNAMENT_SHARD_PER_WORKER)),
+        ))
+
+    # Playing shards:
+    tournament_time_start: float = time.perf_counter()
+    with ProcessPoolExecutor(max_workers = worker_count) as process_executor, open(output_path, "w") as output_file:
+        shard_future_list: list[Future] = [
+            process_executor.submit(
+                play_shard,
+                strategy_list,
+                shard_seed,
+                min(shard_size, seed_start + game_count - shard_seed),
+                deck_lowest_value,
+                )
+            for shard_seed in range(seed_start, seed_start + game_count, shard_size)
+            ]
+
+        # Streaming results:
+        for shard_future in as_completed(shard_future_list):
+            shard_result: dict[str, Any] = shard_future.result()
+            shard_worker: int = shard_result["worker"]
+            shard_game_count: int = len(shard_result["game_result_list"])
+            worker_time_map[shard_worker] = worker_time_map.get(shard_worker, 0.0) + shard_result["time"]
+            worker_game_count_map[shard_worker] = worker_game_count_map.get(shard_worker, 0) + shard_game_count
+            for game_result in shard_result["game_result_list"]:
+                slot_swapped: bool = game_result.pop("slot_swapped")
+                winner_seat: int | None = game_result["winner_seat"]
+                if winner_seat is None:
+                    unfinished_count += 1
+                elif winner_seat == STATE_WINNER_DRAW:
+                    draw_count += 1
+                else:
+                    slot_win_count_list[winner_seat ^ slot_swapped] += 1
+                move_count_total += game_result["move_count"]
+                output_file.write(json.dumps(game_result, separators = (",", ":")) + "\n")
+            output_file.flush()
+    tournament_time: float = time.perf_counter() - tournament_time_start
+
+    # Packing up:
+    tournament_report: dict[str, Any] = {
+        "games": game_count,
+        "workers": len(worker_time_map),
+        "win_rate": {
+            slot_label: round(slot_win_count / max(game_count, 1), 4)
+            for slot_label, slot_win_count in zip(slot_label_list, slot_win_count_list)
+            },
+        "draw_rate": round(draw_count / max(game_count, 1), 4),
+        "unfinished_count": unfinished_count,
+        "game_length_average": round(move_count_total / max(game_count, 1), 2),
+        "games_per_second": round(game_count / tournament_time, 1),
+        "games_per_second_per_worker": {
+            str(worker_id): round(worker_game_count_map[worker_id] / worker_time, 1)
+            for worker_id, worker_time in worker_time_map.items()
+            },
+        "output_path": output_path,
+        }
+
+    # Returning:
+    return tournament_report
+
+
+def run_tournament() -> None:
+    """
+    Runs a headless tournament between computer strategies (python -m game.tournament).
+    """
+
+    # Parsing arguments:
+    argument_parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description = "Headless AI-vs-AI tournament."
+        )
+    argument_parser.add_argument(
+        "strategies",
+        nargs = 2,
+        choices = tuple(TOURNAMENT_STRATEGY_INDEX),
+        metavar = "STRATEGY",
+        help = f"Two of: {', '.join(TOURNAMENT_STRATEGY_INDEX)}.",
+        )
+    argument_parser.add_argument("--games", type = int, default = TOURNAMENT_GAME_COUNT_DEFAULT)
+    argument_parser.add_argument("--workers", type = int, default = os.cpu_count() or 1)
+    argument_parser.add_argument("--seed", type = int, default = 0, help = "First seed.")
+    argument_parser.add_argument("--deck-lowest-value", type = int, default = DECK_LOWEST_VALUE_DEFAULT)
+    argument_parser.add_argument("--output", default = TOURNAMENT_OUTPUT_PATH_DEFAULT)
+    arguments: argparse.Namespace = argument_parser.parse_args()
+
+    # Playing tournament:
+    tournament_report: dict[str, Any] = play_tournament(
+        strategy_list = tuple(arguments.strategies),
+        game_count = arguments.games,
+        worker_count = arguments.workers,
+        output_path = arguments.output,
+        seed_start = arguments.seed,
+        deck_lowest_value = arguments.deck_lowest_value,
+        )
+    print(json.dumps(tournament_report, indent = 4))
+
+
+if __name__ == "__main__":
+    run_tournament()
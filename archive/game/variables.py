@@ -81,6 +81,34 @@ CARD_TYPE_QUEEN: str = f"{CARD_TYPE_TAG}_QUEEN"
 CARD_TYPE_KING: str = f"{CARD_TYPE_TAG}_KING"
 CARD_TYPE_ACE: str = f"{CARD_TYPE_TAG}_ACE"
 
+# Card identifier order (card id = suit index * type count + type index, never reorder):
+CARD_ID_SUIT_ORDER: tuple[str, ...] = (
+    CARD_SUIT_HEARTS,
+    CARD_SUIT_DIAMONDS,
+    CARD_SUIT_CLUBS,
+    CARD_SUIT_SPADES,
+    )
+CARD_ID_TYPE_ORDER: tuple[str, ...] = (
+    CARD_TYPE_TWO,
+    CARD_TYPE_THREE,
+    CARD_TYPE_FOUR,
+    CARD_TYPE_FIVE,
+    CARD_TYPE_SIX,
+    CARD_TYPE_SEVEN,
+    CARD_TYPE_EIGHT,
+    CARD_TYPE_NINE,
+    CARD_TYPE_TEN,
+    CARD_TYPE_JACK,
+    CARD_TYPE_QUEEN,
+    CARD_TYPE_KING,
+    CARD_TYPE_ACE,
+    )
+CARD_ID_NOT_SET: int = 0xFF
+
+# Card beats table flags (per pair of card ids):
+CARD_BEATS_FLAG_GREATER: int = 0b01
+CARD_BEATS_FLAG_LESS: int = 0b10
+
 # Card location variables:
 CARD_LOCATION_TAG: str = "CARD_LOCATION"
 CARD_LOCATION_NOT_SET: str = f"{CARD_LOCATION_TAG}_NOT_SET"
@@ -129,3 +157,114 @@ HAND_SORT_METHOD_BY_VALUE: str = f"{HAND_SORT_METHOD_TAG}_BY_VALUE"
 HAND_SORT_METHOD_BY_VALUE_DEFAULT: str = f"{HAND_SORT_METHOD_TAG}_BY_VALUE_DEFAULT"
 HAND_SORT_METHOD_BY_TIME_ADDED: str = f"{HAND_SORT_METHOD_TAG}_BY_TIME_ADDED"
 HAND_SORT_METHOD_BY_SUIT: str = f"{HAND_SORT_METHOD_TAG}_BY_SUIT"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SESSION VARIBALES
+
+"""
+
+
+# Validation mode variables (environment variable and its values):
+SESSION_VALIDATION_ENVIRON: str = "FOOL_VALIDATION_MODE"
+SESSION_VALIDATION_MODE_DEBUG: str = "debug"
+SESSION_VALIDATION_MODE_PRODUCTION: str = "production"
+
+# Memory profiler variables (environment variable, any value except "0" starts profiler):
+SESSION_PROFILER_ENVIRON: str = "FOOL_MEMORY_PROFILE"
+
+# Telemetry variables (environment variable, any value except "0" starts telemetry):
+SESSION_TELEMETRY_ENVIRON: str = "FOOL_TELEMETRY"
+
+# Input report variables (environment variable, any value except "0" prints report on close):
+SESSION_INPUT_REPORT_ENVIRON: str = "FOOL_INPUT_REPORT"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+SERVER VARIBALES
+
+"""
+
+
+# Server request variables (local socket protocol):
+SERVER_REQUEST_CREATE: str = "create"
+SERVER_REQUEST_JOIN: str = "join"
+SERVER_REQUEST_ACTION: str = "action"
+SERVER_REQUEST_STATE: str = "state"
+SERVER_REQUEST_CLOSE: str = "close"
+SERVER_REQUEST_METRICS: str = "metrics"
+
+# Server action variables:
+SERVER_ACTION_ATTACK: str = "attack"
+SERVER_ACTION_DEFEND: str = "defend"
+SERVER_ACTION_TAKE: str = "take"
+SERVER_ACTION_DISCARD: str = "discard"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TWEEN VARIBALES
+
+"""
+
+
+# Tween easing variables (see scripts.easing):
+TWEEN_EASING_TAG: str = "TWEEN_EASING"
+TWEEN_EASING_LINEAR: str = f"{TWEEN_EASING_TAG}_LINEAR"
+TWEEN_EASING_QUAD_IN: str = f"{TWEEN_EASING_TAG}_QUAD_IN"
+TWEEN_EASING_QUAD_OUT: str = f"{TWEEN_EASING_TAG}_QUAD_OUT"
+TWEEN_EASING_QUAD_IN_OUT: str = f"{TWEEN_EASING_TAG}_QUAD_IN_OUT"
+TWEEN_EASING_CUBIC_OUT: str = f"{TWEEN_EASING_TAG}_CUBIC_OUT"
+TWEEN_EASING_BACK_OUT: str = f"{TWEEN_EASING_TAG}_BACK_OUT"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+INPUT VARIBALES
+
+"""
+
+
+# Input event variables (input controller's queue):
+INPUT_EVENT_TAG: str = "INPUT_EVENT"
+INPUT_EVENT_MOTION: str = f"{INPUT_EVENT_TAG}_MOTION"
+INPUT_EVENT_CLICK: str = f"{INPUT_EVENT_TAG}_CLICK"
+INPUT_EVENT_KEY: str = f"{INPUT_EVENT_TAG}_KEY"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+EVENT VARIBALES
+
+"""
+
+
+# Game event variables (game controller's event bus):
+EVENT_TAG: str = "EVENT"
+EVENT_TABLE_CARD_ADDED: str = f"{EVENT_TAG}_TABLE_CARD_ADDED"
+EVENT_TABLE_CARD_REMOVED: str = f"{EVENT_TAG}_TABLE_CARD_REMOVED"
+EVENT_HAND_CARD_ADDED: str = f"{EVENT_TAG}_HAND_CARD_ADDED"
+EVENT_HAND_CARD_REMOVED: str = f"{EVENT_TAG}_HAND_CARD_REMOVED"
+EVENT_DISCARD_CARD_ADDED: str = f"{EVENT_TAG}_DISCARD_CARD_ADDED"
+EVENT_ROLES_SWITCHED: str = f"{EVENT_TAG}_ROLES_SWITCHED"
+
+
+"""
+%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+TOURNAMENT VARIBALES
+
+"""
+
+
+# Tournament strategy variables (computer players):
+TOURNAMENT_STRATEGY_RANDOM: str = "random"
+TOURNAMENT_STRATEGY_LOWEST: str = "lowest"
+TOURNAMENT_STRATEGY_AGGRESSIVE: str = "aggressive"
+TOURNAMENT_STRATEGY_ENDGAME: str = "endgame"
+TOURNAMENT_STRATEGY_EVALUATOR: str = "evaluator"
+
+# Tournament result variables:
+TOURNAMENT_RESULT_DRAW: str = "draw"
+TOURNAMENT_RESULT_UNFINISHED: str = "unfinished"